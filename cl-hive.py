@@ -37,7 +37,7 @@ import signal
 import threading
 import time
 import secrets
-from typing import Dict, Optional, Any, List
+from typing import Callable, Dict, Optional, Any, List
 
 from pyln.client import Plugin, RpcError
 
@@ -95,6 +95,8 @@ from modules.routing_intelligence import HiveRoutingMap
 from modules.peer_reputation import PeerReputationManager
 from modules.routing_pool import RoutingPool
 from modules.settlement import SettlementManager
+from modules.settlement_executor import SettlementPaymentExecutor
+from modules.cycle_pipeline import CyclePipeline, CycleSnapshot, CycleStep, utc_day, utc_week
 from modules.yield_metrics import YieldMetricsManager
 from modules.fee_coordination import FeeCoordinationManager
 from modules.cost_reduction import CostReductionManager
@@ -106,6 +108,9 @@ from modules.splice_manager import SpliceManager
 from modules.relay import RelayManager
 from modules.idempotency import check_and_record, generate_event_id
 from modules.outbox import OutboxManager
+from modules.policy_reconciler import PolicyReconciler
+from modules.intel_snapshot import IntelSnapshotManager
+from modules.graph_centrality import GraphCentralityEngine
 from modules import network_metrics
 from modules.rpc_commands import (
     HiveContext,
@@ -125,6 +130,7 @@ from modules.rpc_commands import (
     pending_bans as rpc_pending_bans,
     # Phase 4: Topology, Planner, and Query Commands
     reinit_bridge as rpc_reinit_bridge,
+    reconcile_policies as rpc_reconcile_policies,
     topology as rpc_topology,
     planner_log as rpc_planner_log,
     intent_status as rpc_intent_status,
@@ -316,6 +322,7 @@ gossip_mgr: Optional[GossipManager] = None
 intent_mgr: Optional[IntentManager] = None
 bridge: Optional[Bridge] = None
 membership_mgr: Optional[MembershipManager] = None
+policy_reconciler: Optional[PolicyReconciler] = None
 contribution_mgr: Optional[ContributionManager] = None
 planner: Optional[Planner] = None
 clboss_bridge: Optional[CLBossBridge] = None
@@ -330,6 +337,8 @@ routing_map: Optional[HiveRoutingMap] = None
 peer_reputation_mgr: Optional[PeerReputationManager] = None
 routing_pool: Optional[RoutingPool] = None
 settlement_mgr: Optional[SettlementManager] = None
+settlement_executor: Optional[SettlementPaymentExecutor] = None
+fee_intel_pipeline: Optional[CyclePipeline] = None
 yield_metrics_mgr: Optional[YieldMetricsManager] = None
 fee_coordination_mgr: Optional[FeeCoordinationManager] = None
 cost_reduction_mgr: Optional[CostReductionManager] = None
@@ -340,6 +349,8 @@ task_mgr: Optional[TaskManager] = None
 splice_mgr: Optional[SpliceManager] = None
 relay_mgr: Optional[RelayManager] = None
 outbox_mgr: Optional[OutboxManager] = None
+intel_snapshot_mgr: Optional[IntelSnapshotManager] = None
+centrality_engine: Optional[GraphCentralityEngine] = None
 our_pubkey: Optional[str] = None
 
 # Fee tracking for real-time gossip (Settlement Phase)
@@ -659,6 +670,7 @@ def _get_hive_context() -> HiveContext:
         rationalization_mgr=_rationalization_mgr,
         strategic_positioning_mgr=_strategic_positioning_mgr,
         anticipatory_manager=_anticipatory_liquidity_mgr,
+        policy_reconciler=policy_reconciler,
         our_id=_our_pubkey or "",
         log=_log,
     )
@@ -1184,14 +1196,14 @@ def init(options: Dict[str, Any], configuration: Dict[str, Any], plugin: Plugin,
     membership_thread.start()
     plugin.log("cl-hive: Membership maintenance thread started")
 
-    # Sync bridge policies with database state on startup
-    # This ensures members have correct 0 ppm policy even if previous set_tier failed
-    try:
-        synced = membership_mgr.sync_bridge_policies()
-        if synced > 0:
-            plugin.log(f"cl-hive: Synced bridge policies for {synced} members")
-    except Exception as e:
-        plugin.log(f"cl-hive: Failed to sync bridge policies: {e}", level="warn")
+    # Bulk policy reconciliation between membership and cl-revenue-ops.
+    # The startup pass (_sync_member_policies) ensures members have the
+    # correct 0 ppm policy even if a previous set_tier bridge call failed.
+    global policy_reconciler
+    policy_reconciler = PolicyReconciler(
+        bridge, database, our_pubkey,
+        log_fn=lambda msg, level='info': safe_plugin.log(f"cl-hive: {msg}", level=level)
+    )
 
     # Sync uptime from presence data to hive_members on startup
     try:
@@ -1258,6 +1270,13 @@ def init(options: Dict[str, Any], configuration: Dict[str, Any], plugin: Plugin,
     else:
         plugin.log("cl-hive: VPN transport configured (mode=any, not enforcing)")
 
+    # Initialize Graph Centrality Engine (fed by the planner's listchannels cache)
+    global centrality_engine
+    centrality_engine = GraphCentralityEngine(
+        plugin=safe_plugin,
+        database=database
+    )
+
     # Initialize Planner (Phase 6)
     global planner, clboss_bridge
     clboss_bridge = CLBossBridge(safe_plugin.rpc, safe_plugin)
@@ -1268,7 +1287,8 @@ def init(options: Dict[str, Any], configuration: Dict[str, Any], plugin: Plugin,
         clboss_bridge=clboss_bridge,
         plugin=safe_plugin,
         intent_manager=intent_mgr,
-        decision_engine=decision_engine
+        decision_engine=decision_engine,
+        centrality_engine=centrality_engine
     )
     plugin.log("cl-hive: Planner initialized")
 
@@ -1377,8 +1397,8 @@ def init(options: Dict[str, Any], configuration: Dict[str, Any], plugin: Plugin,
         plugin=safe_plugin,
         our_pubkey=our_pubkey
     )
-    # Load existing probes from database
-    routing_map.aggregate_from_database()
+    # Path stats are restored from the intel snapshot once fee coordination
+    # is up (see below) instead of replaying every probe row here
     plugin.log("cl-hive: Routing map initialized")
 
     # Initialize Peer Reputation Manager (Phase 5 - Advanced Cooperation)
@@ -1388,8 +1408,6 @@ def init(options: Dict[str, Any], configuration: Dict[str, Any], plugin: Plugin,
         plugin=safe_plugin,
         our_pubkey=our_pubkey
     )
-    # Load existing reputation data from database
-    peer_reputation_mgr.aggregate_from_database()
     plugin.log("cl-hive: Peer reputation manager initialized")
 
     # Initialize Routing Pool (Phase 0 - Collective Economics)
@@ -1406,7 +1424,8 @@ def init(options: Dict[str, Any], configuration: Dict[str, Any], plugin: Plugin,
     network_metrics.init_calculator(
         state_manager=state_manager,
         database=database,
-        plugin=safe_plugin
+        plugin=safe_plugin,
+        centrality_engine=centrality_engine
     )
     plugin.log("cl-hive: Network metrics calculator initialized")
 
@@ -1420,6 +1439,23 @@ def init(options: Dict[str, Any], configuration: Dict[str, Any], plugin: Plugin,
     settlement_mgr.initialize_tables()
     plugin.log("cl-hive: Settlement manager initialized (BOLT12 payouts)")
 
+    # Durable payment executor for distributed settlement payments
+    global settlement_executor
+    settlement_executor = SettlementPaymentExecutor(
+        database=database,
+        rpc=safe_plugin.rpc,
+        get_offer_fn=settlement_mgr.get_offer,
+        log_fn=lambda msg, level='info': safe_plugin.log(msg, level=level),
+    )
+    settlement_mgr.payment_executor = settlement_executor
+    settlement_executor_thread = threading.Thread(
+        target=settlement_executor_loop,
+        name="cl-hive-settlement-executor",
+        daemon=True
+    )
+    settlement_executor_thread.start()
+    plugin.log("cl-hive: Settlement payment executor started")
+
     # Initialize Yield Metrics Manager (Phase 1 - Metrics & Measurement)
     global yield_metrics_mgr
     yield_metrics_mgr = YieldMetricsManager(
@@ -1442,6 +1478,27 @@ def init(options: Dict[str, Any], configuration: Dict[str, Any], plugin: Plugin,
     fee_coordination_mgr.set_our_pubkey(our_pubkey)
     plugin.log("cl-hive: Fee coordination manager initialized (Phase 2)")
 
+    # Restore routing intelligence from the last snapshot; rows newer than
+    # its watermark are replayed in the background so init doesn't wait
+    global intel_snapshot_mgr
+    intel_snapshot_mgr = IntelSnapshotManager(
+        database=database,
+        plugin=safe_plugin,
+        snapshot_path=os.path.splitext(database.db_path)[0] + ".intel.snap",
+        routing_map=routing_map,
+        reputation_mgr=peer_reputation_mgr,
+        fee_coordination_mgr=fee_coordination_mgr
+    )
+    restore_status = intel_snapshot_mgr.restore()
+    intel_snapshot_mgr.start_background_catch_up()
+    if restore_status["restored_from_snapshot"]:
+        plugin.log(
+            f"cl-hive: Intel snapshot restored in {restore_status['restore_ms']}ms "
+            f"({restore_status['restored']}), catching up in background"
+        )
+    else:
+        plugin.log("cl-hive: No usable intel snapshot, rebuilding from database in background")
+
     # Initialize Cost Reduction Manager (Phase 3 - Cost Reduction)
     global cost_reduction_mgr
     cost_reduction_mgr = CostReductionManager(
@@ -1488,7 +1545,8 @@ def init(options: Dict[str, Any], configuration: Dict[str, Any], plugin: Plugin,
         state_manager=state_manager,
         fee_coordination_mgr=fee_coordination_mgr,
         yield_metrics_mgr=yield_metrics_mgr,
-        planner=planner
+        planner=planner,
+        centrality_engine=centrality_engine
     )
     strategic_positioning_mgr.set_our_pubkey(our_pubkey)
     plugin.log("cl-hive: Strategic positioning manager initialized (Phase 5)")
@@ -2247,6 +2305,11 @@ def handle_gossip(peer_id: str, payload: Dict, plugin: Plugin) -> Dict:
         plugin.log(f"cl-hive: GOSSIP accepted from {sender_id[:16]}...{relay_info} "
                    f"(v{payload.get('version', '?')})", level='debug')
 
+        # Patch the fleet topology snapshot for this member only
+        calculator = network_metrics.get_calculator()
+        if calculator:
+            calculator.update_member_topology(sender_id)
+
         # Store addresses for auto-connect (Issue #38)
         addresses = payload.get("addresses", [])
         if addresses and database:
@@ -3506,6 +3569,32 @@ def outbox_retry_loop():
         shutdown_event.wait(RETRY_INTERVAL)
 
 
+def settlement_executor_loop():
+    """
+    Background thread for settlement payment jobs.
+
+    Runs every 60 seconds so retries follow the executor's backoff rather
+    than the hourly settlement loop; jobs left mid-payment by a restart are
+    reconciled on the first pass.
+    """
+    EXECUTOR_INTERVAL = 60
+
+    # Startup delay
+    shutdown_event.wait(30)
+
+    while not shutdown_event.is_set():
+        try:
+            if settlement_executor:
+                settlement_executor.run_pending()
+        except Exception as e:
+            if safe_plugin:
+                safe_plugin.log(f"Settlement executor error: {e}", level='warn')
+        shutdown_event.wait(EXECUTOR_INTERVAL)
+
+    if settlement_executor:
+        settlement_executor.shutdown()
+
+
 def _broadcast_promotion_vote(target_peer_id: str, voter_peer_id: str) -> bool:
     """
     Broadcast a promotion vote as a VOUCH message for cross-node sync.
@@ -3676,47 +3765,28 @@ def _sync_member_policies(plugin: Plugin) -> None:
     fee policies set in cl-revenue-ops. This handles the case where
     the plugin was restarted or policies were reset.
 
+    Runs one PolicyReconciler pass: the full policy set is fetched once
+    and only drifted policies are changed.
+
     Policy assignment:
-    - Admin: HIVE strategy (0 PPM fees)
     - Member: HIVE strategy (0 PPM fees)
-    - Neophyte: dynamic strategy (normal fee behavior)
+    - Neophyte: left as is (admitted with HIVE by the handshake)
+    - Non-member: no HIVE strategy (reverted to dynamic)
     """
-    if not database or not bridge or bridge.status != BridgeStatus.ENABLED:
+    if not policy_reconciler or not bridge or bridge.status != BridgeStatus.ENABLED:
         return
 
-    members = database.get_all_members()
-    synced = 0
-
-    for member in members:
-        peer_id = member["peer_id"]
-        tier = member.get("tier")
-
-        # Skip ourselves
-        if peer_id == our_pubkey:
-            continue
-
-        # Determine if this peer should have HIVE strategy
-        # Both admin and member tiers get HIVE strategy
-        is_hive_member = tier in (MembershipTier.MEMBER.value, MembershipTier.NEOPHYTE.value)
-
-        try:
-            # Use bypass_rate_limit=True for startup sync
-            success = bridge.set_hive_policy(peer_id, is_member=is_hive_member, bypass_rate_limit=True)
-            if success:
-                synced += 1
-                plugin.log(
-                    f"cl-hive: Synced policy for {peer_id[:16]}... "
-                    f"({'hive' if is_hive_member else 'dynamic'})",
-                    level='debug'
-                )
-        except Exception as e:
-            plugin.log(
-                f"cl-hive: Failed to sync policy for {peer_id[:16]}...: {e}",
-                level='debug'
-            )
+    try:
+        # Use bypass_rate_limit=True for startup sync
+        report = policy_reconciler.reconcile(verify_fees=False, bypass_rate_limit=True)
+    except Exception as e:
+        plugin.log(f"cl-hive: Failed to sync member policies: {e}", level='warn')
+        return
 
-    if synced > 0:
-        plugin.log(f"cl-hive: Synced fee policies for {synced} member(s)")
+    if report.error:
+        plugin.log(f"cl-hive: Policy sync skipped: {report.error}", level='debug')
+    elif report.applied > 0:
+        plugin.log(f"cl-hive: Synced fee policies for {report.applied} member(s)")
 
 
 def _sync_membership_on_startup(plugin: Plugin) -> None:
@@ -8239,288 +8309,184 @@ HEALTH_REPORT_INTERVAL = 3600
 FEE_INTELLIGENCE_MAX_AGE_HOURS = 168
 
 
-def fee_intelligence_loop():
-    """
-    Background thread for cooperative fee coordination.
-
-    Runs periodically to:
-    1. Collect and broadcast our fee observations to hive members
-    2. Aggregate received fee intelligence into peer profiles
-    3. Broadcast our health report for NNLB coordination
-    4. Clean up old fee intelligence records
-    """
-    # Wait for initialization
-    shutdown_event.wait(60)
-
-    while not shutdown_event.is_set():
-        try:
-            if not fee_intel_mgr or not database or not safe_plugin or not our_pubkey:
-                shutdown_event.wait(60)
-                continue
-
-            # Step 1: Collect and broadcast our fee intelligence
-            _broadcast_our_fee_intelligence()
-
-            # Step 2: Aggregate all received fee intelligence
-            try:
-                updated = fee_intel_mgr.aggregate_fee_profiles()
-                if updated > 0:
-                    safe_plugin.log(
-                        f"cl-hive: Aggregated {updated} peer fee profiles",
-                        level='debug'
-                    )
-            except Exception as e:
-                safe_plugin.log(f"cl-hive: Fee aggregation error: {e}", level='warn')
-
-            # Step 3: Broadcast our health report
-            _broadcast_health_report()
-
-            # Step 4: Cleanup old records
-            try:
-                deleted = database.cleanup_old_fee_intelligence(FEE_INTELLIGENCE_MAX_AGE_HOURS)
-                if deleted > 0:
-                    safe_plugin.log(
-                        f"cl-hive: Cleaned up {deleted} old fee intelligence records",
-                        level='debug'
-                    )
-            except Exception as e:
-                safe_plugin.log(f"cl-hive: Fee intelligence cleanup error: {e}", level='warn')
-
-            # Step 5: Broadcast liquidity needs
-            # NOTE: Small delays (50ms) between broadcasts reduce RPC lock contention
-            # and allow incoming RPC requests (e.g., hive-deposit-marker) to be processed
-            _broadcast_liquidity_needs()
-            shutdown_event.wait(0.05)  # Yield to allow other RPC processing
-
-            # Step 5a: Broadcast stigmergic markers (Phase 13 - Fleet Learning)
-            _broadcast_our_stigmergic_markers()
-            shutdown_event.wait(0.05)
-
-            # Step 5b: Broadcast pheromones (Phase 13 - Fleet Learning)
-            _broadcast_our_pheromones()
-            shutdown_event.wait(0.05)
-
-            # Step 5c: Broadcast yield metrics (Phase 14 - Daily, only once per day)
-            # Check if we've already broadcast today
-            try:
-                from datetime import datetime, timezone
-                today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-                last_yield_broadcast = getattr(_broadcast_our_yield_metrics, '_last_broadcast', None)
-                if last_yield_broadcast != today:
-                    _broadcast_our_yield_metrics()
-                    _broadcast_our_yield_metrics._last_broadcast = today
-                    shutdown_event.wait(0.05)
-            except Exception as e:
-                safe_plugin.log(f"cl-hive: Yield metrics broadcast check error: {e}", level='debug')
+def _cleanup_step(label: str, cleanup: Callable[[], int]) -> Callable[[CycleSnapshot], None]:
+    """Wrap a cleanup call as a cycle step that logs how much it removed."""
+    def run(snapshot: CycleSnapshot) -> None:
+        removed = cleanup()
+        if removed and removed > 0:
+            safe_plugin.log(f"cl-hive: Cleaned up {removed} {label}", level='debug')
+    return run
 
-            # Step 5d: Broadcast circular flow alerts (Phase 14 - Event-driven)
-            _broadcast_circular_flow_alerts()
-            shutdown_event.wait(0.05)
 
-            # Step 5e: Broadcast temporal patterns (Phase 14 - Weekly)
-            try:
-                from datetime import datetime, timezone
-                current_week = datetime.now(timezone.utc).strftime("%Y-W%W")
-                last_temporal_broadcast = getattr(_broadcast_our_temporal_patterns, '_last_broadcast', None)
-                if last_temporal_broadcast != current_week:
-                    _broadcast_our_temporal_patterns()
-                    _broadcast_our_temporal_patterns._last_broadcast = current_week
-                    shutdown_event.wait(0.05)
-            except Exception as e:
-                safe_plugin.log(f"cl-hive: Temporal patterns broadcast check error: {e}", level='debug')
+def _aggregate_fee_profiles_step(snapshot: CycleSnapshot) -> None:
+    """Aggregate all received fee intelligence into peer profiles."""
+    updated = fee_intel_mgr.aggregate_fee_profiles()
+    if updated > 0:
+        safe_plugin.log(f"cl-hive: Aggregated {updated} peer fee profiles", level='debug')
 
-            # Step 5f: Broadcast corridor values (Phase 14.2 - Weekly)
-            try:
-                from datetime import datetime, timezone
-                current_week = datetime.now(timezone.utc).strftime("%Y-W%W")
-                last_corridor_broadcast = getattr(_broadcast_our_corridor_values, '_last_broadcast', None)
-                if last_corridor_broadcast != current_week:
-                    _broadcast_our_corridor_values()
-                    _broadcast_our_corridor_values._last_broadcast = current_week
-                    shutdown_event.wait(0.05)
-            except Exception as e:
-                safe_plugin.log(f"cl-hive: Corridor values broadcast check error: {e}", level='debug')
 
-            # Step 5g: Broadcast positioning proposals (Phase 14.2 - Event-driven)
-            _broadcast_our_positioning_proposals()
-            shutdown_event.wait(0.05)
+def _cleanup_route_probes_step(snapshot: CycleSnapshot) -> None:
+    """Clean old route probes from the database and stale routing map paths."""
+    if not routing_map:
+        return
+    _cleanup_step("old route probes from database",
+                  lambda: database.cleanup_old_route_probes(max_age_hours=24))(snapshot)
+    _cleanup_step("stale paths from routing map", routing_map.cleanup_stale_data)(snapshot)
 
-            # Step 5h: Broadcast Physarum recommendations (Phase 14.2 - Event-driven)
-            _broadcast_our_physarum_recommendations()
-            shutdown_event.wait(0.05)
 
-            # Step 5i: Broadcast coverage analysis (Phase 14.2 - Weekly)
-            try:
-                from datetime import datetime, timezone
-                current_week = datetime.now(timezone.utc).strftime("%Y-W%W")
-                last_coverage_broadcast = getattr(_broadcast_our_coverage_analysis, '_last_broadcast', None)
-                if last_coverage_broadcast != current_week:
-                    _broadcast_our_coverage_analysis()
-                    _broadcast_our_coverage_analysis._last_broadcast = current_week
-                    shutdown_event.wait(0.05)
-            except Exception as e:
-                safe_plugin.log(f"cl-hive: Coverage analysis broadcast check error: {e}", level='debug')
+def _cleanup_peer_reputation_step(snapshot: CycleSnapshot) -> None:
+    """Clean old peer reputation records and stale in-memory aggregations."""
+    if not peer_reputation_mgr:
+        return
+    _cleanup_step("old peer reputation records",
+                  lambda: database.cleanup_old_peer_reputation(max_age_hours=168))(snapshot)
+    _cleanup_step("stale peer reputations", peer_reputation_mgr.cleanup_stale_data)(snapshot)
 
-            # Step 5j: Broadcast close proposals (Phase 14.2 - Event-driven)
-            _broadcast_our_close_proposals()
-            shutdown_event.wait(0.05)
 
-            # Step 6: Cleanup old liquidity needs
-            try:
-                deleted_needs = database.cleanup_old_liquidity_needs(max_age_hours=24)
-                if deleted_needs > 0:
-                    safe_plugin.log(
-                        f"cl-hive: Cleaned up {deleted_needs} old liquidity needs",
-                        level='debug'
-                    )
-            except Exception as e:
-                safe_plugin.log(f"cl-hive: Liquidity needs cleanup error: {e}", level='warn')
+def _reconcile_policies_step(snapshot: CycleSnapshot) -> None:
+    """Report policy drift and verify the zero-fee policy (security check) in bulk."""
+    # Report only: policies are applied by the startup sync, tier changes
+    # and hive-policy-reconcile dry_run=false. Warnings are logged by the
+    # reconciler.
+    if policy_reconciler and bridge and bridge.status == BridgeStatus.ENABLED:
+        policy_reconciler.reconcile(dry_run=True)
 
-            # Step 7: Cleanup old route probes
-            try:
-                if routing_map:
-                    # Clean database
-                    deleted_probes = database.cleanup_old_route_probes(max_age_hours=24)
-                    if deleted_probes > 0:
-                        safe_plugin.log(
-                            f"cl-hive: Cleaned up {deleted_probes} old route probes from database",
-                            level='debug'
-                        )
-                    # Clean in-memory stats
-                    cleaned_paths = routing_map.cleanup_stale_data()
-                    if cleaned_paths > 0:
-                        safe_plugin.log(
-                            f"cl-hive: Cleaned up {cleaned_paths} stale paths from routing map",
-                            level='debug'
-                        )
-            except Exception as e:
-                safe_plugin.log(f"cl-hive: Route probe cleanup error: {e}", level='warn')
 
-            # Step 8: Cleanup stale peer states (memory management)
-            try:
-                if state_manager:
-                    cleaned_states = state_manager.cleanup_stale_states()
-                    if cleaned_states > 0:
-                        safe_plugin.log(
-                            f"cl-hive: Cleaned up {cleaned_states} stale peer states",
-                            level='debug'
-                        )
-            except Exception as e:
-                safe_plugin.log(f"cl-hive: State cleanup error: {e}", level='warn')
+def _save_intel_snapshot_step(snapshot: CycleSnapshot) -> None:
+    """Persist the routing intelligence snapshot (fast restart)."""
+    if not intel_snapshot_mgr:
+        return
+    saved = intel_snapshot_mgr.maybe_save_snapshot()
+    if saved:
+        safe_plugin.log(
+            f"cl-hive: Saved intel snapshot ({saved['bytes']} bytes, "
+            f"{saved['duration_ms']}ms)",
+            level='debug'
+        )
 
-            # Step 8a: Verify hive channel zero-fee policy (security check)
-            try:
-                if bridge and membership_mgr:
-                    # Get all current hive members
-                    members = membership_mgr.get_all_members()
-                    violations = []
-                    for member in members:
-                        peer_id = member.get('peer_id')
-                        if peer_id and peer_id != our_pubkey:
-                            is_valid, reason = bridge.verify_hive_channel_zero_fees(peer_id)
-                            if not is_valid and reason not in ('no_channel', 'our_direction_not_found'):
-                                violations.append((peer_id[:16], reason))
-                    if violations:
-                        safe_plugin.log(
-                            f"cl-hive: SECURITY WARNING - Hive channels with non-zero fees: {violations}",
-                            level='warn'
-                        )
-            except Exception as e:
-                safe_plugin.log(f"cl-hive: Zero-fee verification error: {e}", level='debug')
 
-            # Step 9: Cleanup old peer reputation (Phase 5 - Advanced Cooperation)
-            try:
-                if peer_reputation_mgr:
-                    # Clean database
-                    deleted_reps = database.cleanup_old_peer_reputation(max_age_hours=168)
-                    if deleted_reps > 0:
-                        safe_plugin.log(
-                            f"cl-hive: Cleaned up {deleted_reps} old peer reputation records",
-                            level='debug'
-                        )
-                    # Clean in-memory aggregations
-                    cleaned_reps = peer_reputation_mgr.cleanup_stale_data()
-                    if cleaned_reps > 0:
-                        safe_plugin.log(
-                            f"cl-hive: Cleaned up {cleaned_reps} stale peer reputations",
-                            level='debug'
-                        )
-            except Exception as e:
-                safe_plugin.log(f"cl-hive: Peer reputation cleanup error: {e}", level='warn')
+def _build_fee_intelligence_pipeline() -> CyclePipeline:
+    """
+    Build the fee intelligence step graph.
+
+    Sharing steps run side by side, but building messages is not read-only:
+    fee coordination expires pheromones and markers as it reads them, and
+    forward events and gossip update the same structures from other threads,
+    so those managers lock their own state. Steps sharing a manager are
+    also ordered after one another, cleanups of remote data wait for the
+    step sharing the same manager's data, and the intel snapshot save runs
+    last.
+    """
+    shares = [
+        CycleStep("fee_intelligence", _build_fee_intelligence_messages, needs_funds=True),
+        CycleStep("health_report", _build_health_report_messages, needs_funds=True),
+        CycleStep("liquidity_needs", _build_liquidity_need_messages, needs_funds=True),
+        CycleStep("stigmergic_markers", _build_stigmergic_marker_messages),
+        CycleStep("pheromones", _build_pheromone_messages, needs_funds=True,
+                  after=("stigmergic_markers",)),
+        CycleStep("yield_metrics", _build_yield_metrics_messages, period=utc_day),
+        CycleStep("circular_flow_alerts", _build_circular_flow_alert_messages),
+        CycleStep("temporal_patterns", _build_temporal_pattern_messages, period=utc_week),
+        CycleStep("corridor_values", _build_corridor_value_messages, period=utc_week),
+        CycleStep("positioning_proposals", _build_positioning_proposal_messages,
+                  after=("corridor_values",)),
+        CycleStep("physarum_recommendations", _build_physarum_recommendation_messages,
+                  after=("positioning_proposals",)),
+        CycleStep("coverage_analysis", _build_coverage_analysis_messages, period=utc_week),
+        CycleStep("close_proposals", _build_close_proposal_messages,
+                  after=("coverage_analysis",)),
+    ]
+    maintenance = [
+        CycleStep("aggregate_fee_profiles", _aggregate_fee_profiles_step),
+        CycleStep("cleanup_fee_intelligence", _cleanup_step(
+            "old fee intelligence records",
+            lambda: database.cleanup_old_fee_intelligence(FEE_INTELLIGENCE_MAX_AGE_HOURS)),
+            after=("aggregate_fee_profiles",)),
+        CycleStep("cleanup_liquidity_needs", _cleanup_step(
+            "old liquidity needs",
+            lambda: database.cleanup_old_liquidity_needs(max_age_hours=24))),
+        CycleStep("cleanup_route_probes", _cleanup_route_probes_step),
+        CycleStep("cleanup_peer_states", _cleanup_step(
+            "stale peer states",
+            lambda: state_manager.cleanup_stale_states() if state_manager else 0)),
+        CycleStep("reconcile_policies", _reconcile_policies_step),
+        CycleStep("cleanup_peer_reputation", _cleanup_peer_reputation_step),
+        CycleStep("cleanup_remote_pheromones", _cleanup_step(
+            "old remote pheromones",
+            lambda: fee_coordination_mgr.adaptive_controller.cleanup_old_remote_pheromones(
+                max_age_hours=48) if fee_coordination_mgr else 0),
+            after=("pheromones",)),
+        CycleStep("cleanup_remote_yield_metrics", _cleanup_step(
+            "old remote yield metrics",
+            lambda: yield_metrics_mgr.cleanup_old_remote_yield_metrics(
+                max_age_days=30) if yield_metrics_mgr else 0),
+            after=("yield_metrics",)),
+        CycleStep("cleanup_remote_temporal_patterns", _cleanup_step(
+            "old remote temporal patterns",
+            lambda: anticipatory_liquidity_mgr.cleanup_old_remote_patterns(
+                max_age_days=14) if anticipatory_liquidity_mgr else 0),
+            after=("temporal_patterns",)),
+        CycleStep("cleanup_remote_positioning", _cleanup_step(
+            "old remote positioning data",
+            lambda: strategic_positioning_mgr.cleanup_old_remote_data(
+                max_age_days=7) if strategic_positioning_mgr else 0),
+            after=("corridor_values", "positioning_proposals", "physarum_recommendations")),
+        CycleStep("cleanup_remote_rationalization", _cleanup_step(
+            "old remote rationalization data",
+            lambda: rationalization_mgr.cleanup_old_remote_data(
+                max_age_days=7) if rationalization_mgr else 0),
+            after=("coverage_analysis", "close_proposals")),
+    ]
+    steps = shares + maintenance
+    steps.append(CycleStep("save_intel_snapshot", _save_intel_snapshot_step,
+                           after=tuple(s.name for s in steps)))
+    return CyclePipeline(
+        steps,
+        send_fn=_outbox_send_fn,
+        log_fn=lambda msg, level='info': safe_plugin.log(msg, level=level),
+        # Yield between peers so queued RPC requests (e.g. hive-deposit-marker)
+        # are not starved by the broadcast
+        pause_fn=lambda: shutdown_event.wait(0.05),
+    )
 
-            # Step 10: Cleanup old remote pheromones (Phase 13 - Fleet Learning)
-            try:
-                if fee_coordination_mgr:
-                    cleaned_pheromones = fee_coordination_mgr.adaptive_controller.cleanup_old_remote_pheromones(
-                        max_age_hours=48
-                    )
-                    if cleaned_pheromones > 0:
-                        safe_plugin.log(
-                            f"cl-hive: Cleaned up {cleaned_pheromones} old remote pheromones",
-                            level='debug'
-                        )
-            except Exception as e:
-                safe_plugin.log(f"cl-hive: Remote pheromone cleanup error: {e}", level='warn')
 
-            # Step 10a: Evaporate local pheromones (time-based decay for idle channels)
-            try:
-                if fee_coordination_mgr:
-                    evaporated = fee_coordination_mgr.adaptive_controller.evaporate_all_pheromones()
-                    if evaporated > 0:
-                        safe_plugin.log(
-                            f"cl-hive: Applied time-based decay to {evaporated} channel pheromones",
-                            level='debug'
-                        )
-            except Exception as e:
-                safe_plugin.log(f"cl-hive: Local pheromone evaporation error: {e}", level='warn')
+def fee_intelligence_loop():
+    """
+    Background thread for cooperative fee coordination.
 
-            # Step 11: Cleanup old remote yield metrics (Phase 14)
-            try:
-                if yield_metrics_mgr:
-                    cleaned_yields = yield_metrics_mgr.cleanup_old_remote_yield_metrics(max_age_days=30)
-                    if cleaned_yields > 0:
-                        safe_plugin.log(
-                            f"cl-hive: Cleaned up {cleaned_yields} old remote yield metrics",
-                            level='debug'
-                        )
-            except Exception as e:
-                safe_plugin.log(f"cl-hive: Remote yield metrics cleanup error: {e}", level='warn')
+    Each cycle gathers one input snapshot (channels, forwards, members,
+    health) and runs the fee intelligence step graph over it:
+    1. Share our fee observations, health report, liquidity needs and
+       fleet-learning data (markers, pheromones, yield, patterns, ...)
+    2. Aggregate received fee intelligence into peer profiles
+    3. Clean up old local and remote records
+    4. Persist the routing intelligence snapshot
+    Independent steps run concurrently; every message is sent in one
+    broadcast phase at the end of the cycle.
+    """
+    global fee_intel_pipeline
 
-            # Step 12: Cleanup old remote temporal patterns (Phase 14)
-            try:
-                if anticipatory_liquidity_mgr:
-                    cleaned_patterns = anticipatory_liquidity_mgr.cleanup_old_remote_patterns(max_age_days=14)
-                    if cleaned_patterns > 0:
-                        safe_plugin.log(
-                            f"cl-hive: Cleaned up {cleaned_patterns} old remote temporal patterns",
-                            level='debug'
-                        )
-            except Exception as e:
-                safe_plugin.log(f"cl-hive: Remote temporal patterns cleanup error: {e}", level='warn')
+    # Wait for initialization
+    shutdown_event.wait(60)
 
-            # Step 13: Cleanup old remote strategic positioning data (Phase 14.2)
-            try:
-                if strategic_positioning_mgr:
-                    cleaned_positioning = strategic_positioning_mgr.cleanup_old_remote_data(max_age_days=7)
-                    if cleaned_positioning > 0:
-                        safe_plugin.log(
-                            f"cl-hive: Cleaned up {cleaned_positioning} old remote positioning data",
-                            level='debug'
-                        )
-            except Exception as e:
-                safe_plugin.log(f"cl-hive: Remote positioning cleanup error: {e}", level='warn')
+    while not shutdown_event.is_set():
+        try:
+            if not fee_intel_mgr or not database or not safe_plugin or not our_pubkey:
+                shutdown_event.wait(60)
+                continue
 
-            # Step 14: Cleanup old remote rationalization data (Phase 14.2)
-            try:
-                if rationalization_mgr:
-                    cleaned_rationalization = rationalization_mgr.cleanup_old_remote_data(max_age_days=7)
-                    if cleaned_rationalization > 0:
-                        safe_plugin.log(
-                            f"cl-hive: Cleaned up {cleaned_rationalization} old remote rationalization data",
-                            level='debug'
-                        )
-            except Exception as e:
-                safe_plugin.log(f"cl-hive: Remote rationalization cleanup error: {e}", level='warn')
+            if fee_intel_pipeline is None:
+                fee_intel_pipeline = _build_fee_intelligence_pipeline()
+            report = fee_intel_pipeline.run(_gather_cycle_snapshot())
+            slowest, slowest_result = max(report.steps.items(),
+                                          key=lambda item: item[1].duration_ms)
+            safe_plugin.log(
+                f"cl-hive: Fee intelligence cycle took {report.duration_ms:.0f}ms "
+                f"(steps {report.steps_ms:.0f}ms, slowest {slowest} "
+                f"{slowest_result.duration_ms:.0f}ms; broadcast {report.broadcast_ms:.0f}ms, "
+                f"{report.messages_sent} sends)",
+                level='debug'
+            )
 
         except Exception as e:
             if safe_plugin:
@@ -8529,6 +8495,17 @@ def fee_intelligence_loop():
         # Wait for next cycle
         shutdown_event.wait(FEE_INTELLIGENCE_INTERVAL)
 
+    if fee_intel_pipeline:
+        fee_intel_pipeline.shutdown()
+
+    # Persist latest aggregates on shutdown so the next start is warm
+    try:
+        if intel_snapshot_mgr:
+            intel_snapshot_mgr.maybe_save_snapshot(force=True)
+    except Exception as e:
+        if safe_plugin:
+            safe_plugin.log(f"cl-hive: Intel snapshot save on shutdown failed: {e}", level='debug')
+
 
 # =============================================================================
 # PHASE 12: DISTRIBUTED SETTLEMENT BACKGROUND LOOP
@@ -9357,1059 +9334,678 @@ def _broadcast_mcf_ack(ack_msg: bytes):
         safe_plugin.log(f"cl-hive: Failed to send MCF ACK: {e}", level='debug')
 
 
-def _broadcast_our_fee_intelligence():
+def _gather_cycle_snapshot() -> CycleSnapshot:
     """
-    Collect fee observations from our channels and broadcast to hive.
+    Gather the inputs shared by every fee intelligence cycle step.
 
-    Gathers fee and performance data for each external peer we have
-    channels with and broadcasts a single FEE_INTELLIGENCE_SNAPSHOT message
-    containing all peer observations.
+    One listfunds, one listforwards and one member/health read per cycle
+    replace the fetches each broadcast used to make on its own. A failed
+    listfunds leaves funds empty and sets funds_error, so only the steps
+    that read our channels are skipped.
     """
-    if not fee_intel_mgr or not safe_plugin or not database or not our_pubkey:
-        return
-
+    funds_error = None
     try:
-        # Get our channels
         funds = safe_plugin.rpc.listfunds()
-        channels = funds.get("channels", [])
-
-        # Get list of hive members (to exclude from external peer reporting)
-        members = database.get_all_members()
-        member_ids = {m.get("peer_id") for m in members}
+    except Exception as e:
+        safe_plugin.log(f"cl-hive: listfunds failed, skipping channel steps: {e}",
+                        level='warn')
+        funds, funds_error = {}, str(e)
+    try:
+        forwards = safe_plugin.rpc.listforwards(status="settled").get("forwards", [])
+    except Exception:
+        forwards = []
+    return CycleSnapshot(
+        now=int(time.time()),
+        our_pubkey=our_pubkey,
+        funds=funds,
+        funds_error=funds_error,
+        forwards=forwards,
+        members=database.get_all_members(),
+        member_health=database.get_all_member_health(),
+    )
 
-        # Get forwarding stats if available
-        try:
-            forwards = safe_plugin.rpc.listforwards(status="settled")
-            forwards_list = forwards.get("forwards", [])
-        except Exception:
-            forwards_list = []
-
-        # Build forward stats by peer
-        peer_forwards = {}
-        seven_days_ago = int(time.time()) - (7 * 24 * 3600)
-        for fwd in forwards_list:
-            # Filter to last 7 days
-            received_time = fwd.get("received_time", 0)
-            if received_time < seven_days_ago:
-                continue
 
-            out_channel = fwd.get("out_channel")
-            if out_channel:
-                if out_channel not in peer_forwards:
-                    peer_forwards[out_channel] = {
-                        "count": 0,
-                        "volume_msat": 0,
-                        "fee_msat": 0
-                    }
-                peer_forwards[out_channel]["count"] += 1
-                peer_forwards[out_channel]["volume_msat"] += fwd.get("out_msat", 0)
-                peer_forwards[out_channel]["fee_msat"] += fwd.get("fee_msat", 0)
-
-        # Collect fee intelligence for each external peer into a list
-        peers_data = []
-        for channel in channels:
-            if channel.get("state") != "CHANNELD_NORMAL":
-                continue
+def _send_cycle_messages(snapshot: CycleSnapshot, messages: List[bytes]) -> int:
+    """Send messages to every member in the snapshot outside a cycle run."""
+    sent = 0
+    for peer_id in snapshot.broadcast_targets:
+        for msg in messages:
+            if _outbox_send_fn(peer_id, msg):
+                sent += 1
+    return sent
 
-            peer_id = channel.get("peer_id")
-            if not peer_id or peer_id in member_ids:
-                # Skip hive members - only report on external peers
-                continue
 
-            short_channel_id = channel.get("short_channel_id")
-            if not short_channel_id:
-                continue
+def _broadcast_our_fee_intelligence():
+    """Collect fee observations from our channels and broadcast them now."""
+    if not fee_intel_mgr or not safe_plugin or not database or not our_pubkey:
+        return
+    snapshot = _gather_cycle_snapshot()
+    if snapshot.funds_error:
+        return
+    _send_cycle_messages(snapshot, _build_fee_intelligence_messages(snapshot))
 
-            # Get channel capacity and balance
-            amount_msat = channel.get("amount_msat", 0)
-            our_amount_msat = channel.get("our_amount_msat", 0)
-            capacity_sats = amount_msat // 1000
-            available_sats = our_amount_msat // 1000
 
-            if capacity_sats == 0:
-                continue
+def _broadcast_health_report():
+    """Calculate our health report and broadcast it now."""
+    if not fee_intel_mgr or not safe_plugin or not database or not our_pubkey:
+        return
+    snapshot = _gather_cycle_snapshot()
+    if snapshot.funds_error:
+        return
+    _send_cycle_messages(snapshot, _build_health_report_messages(snapshot))
 
-            utilization_pct = available_sats / capacity_sats if capacity_sats > 0 else 0
 
-            # Determine flow direction based on balance
-            if utilization_pct > 0.7:
-                flow_direction = "source"  # We have excess, liquidity flows out
-            elif utilization_pct < 0.3:
-                flow_direction = "sink"  # We need liquidity, flows in
-            else:
-                flow_direction = "balanced"
+def _build_fee_intelligence_messages(snapshot: CycleSnapshot) -> List[bytes]:
+    """
+    Collect fee observations from our channels for the hive.
 
-            # Get forward stats for this channel
-            stats = peer_forwards.get(short_channel_id, {})
-            forward_count = stats.get("count", 0)
-            forward_volume_sats = stats.get("volume_msat", 0) // 1000
-            revenue_sats = stats.get("fee_msat", 0) // 1000
+    Gathers fee and performance data for each external peer we have
+    channels with into a single FEE_INTELLIGENCE_SNAPSHOT message
+    containing all peer observations.
+    """
+    if not fee_intel_mgr:
+        return []
 
-            # Get our fee rate for this channel (simplified - would need listpeerchannels)
-            our_fee_ppm = 100  # Default, would query actual fee
+    # Hive members are excluded from external peer reporting
+    member_ids = snapshot.member_ids
 
-            # Add peer data to snapshot list
-            peers_data.append({
-                "peer_id": peer_id,
-                "our_fee_ppm": our_fee_ppm,
-                "their_fee_ppm": 0,  # Would need to look up
-                "forward_count": forward_count,
-                "forward_volume_sats": forward_volume_sats,
-                "revenue_sats": revenue_sats,
-                "flow_direction": flow_direction,
-                "utilization_pct": round(utilization_pct, 4),
-                "days_observed": 7
-            })
+    # Build forward stats by peer
+    peer_forwards = {}
+    seven_days_ago = snapshot.now - (7 * 24 * 3600)
+    for fwd in snapshot.forwards:
+        # Filter to last 7 days
+        received_time = fwd.get("received_time", 0)
+        if received_time < seven_days_ago:
+            continue
 
-        if not peers_data:
-            return
+        out_channel = fwd.get("out_channel")
+        if out_channel:
+            if out_channel not in peer_forwards:
+                peer_forwards[out_channel] = {
+                    "count": 0,
+                    "volume_msat": 0,
+                    "fee_msat": 0
+                }
+            peer_forwards[out_channel]["count"] += 1
+            peer_forwards[out_channel]["volume_msat"] += fwd.get("out_msat", 0)
+            peer_forwards[out_channel]["fee_msat"] += fwd.get("fee_msat", 0)
+
+    # Collect fee intelligence for each external peer into a list
+    peers_data = []
+    for channel in snapshot.normal_channels:
+        peer_id = channel.get("peer_id")
+        if not peer_id or peer_id in member_ids:
+            # Skip hive members - only report on external peers
+            continue
 
-        # Create single snapshot message with all peer data
-        try:
-            msg = fee_intel_mgr.create_fee_intelligence_snapshot_message(
-                peers=peers_data,
-                rpc=safe_plugin.rpc
-            )
+        short_channel_id = channel.get("short_channel_id")
+        if not short_channel_id:
+            continue
 
-            if msg:
-                # Broadcast single snapshot to all hive members
-                broadcast_count = 0
-                for member in members:
-                    member_id = member.get("peer_id")
-                    if not member_id or member_id == our_pubkey:
-                        continue
-                    try:
-                        safe_plugin.rpc.call("sendcustommsg", {
-                            "node_id": member_id,
-                            "msg": msg.hex()
-                        })
-                        broadcast_count += 1
-                    except Exception:
-                        pass  # Peer might be offline
+        # Get channel capacity and balance
+        amount_msat = channel.get("amount_msat", 0)
+        our_amount_msat = channel.get("our_amount_msat", 0)
+        capacity_sats = amount_msat // 1000
+        available_sats = our_amount_msat // 1000
 
-                if broadcast_count > 0:
-                    safe_plugin.log(
-                        f"cl-hive: Broadcast fee intelligence snapshot "
-                        f"({len(peers_data)} peers to {broadcast_count} members)",
-                        level='debug'
-                    )
+        if capacity_sats == 0:
+            continue
 
-        except Exception as e:
-            safe_plugin.log(
-                f"cl-hive: Failed to create fee intelligence snapshot: {e}",
-                level='debug'
-            )
+        utilization_pct = available_sats / capacity_sats if capacity_sats > 0 else 0
 
-    except Exception as e:
-        if safe_plugin:
-            safe_plugin.log(f"cl-hive: Fee intelligence broadcast error: {e}", level='warn')
+        # Determine flow direction based on balance
+        if utilization_pct > 0.7:
+            flow_direction = "source"  # We have excess, liquidity flows out
+        elif utilization_pct < 0.3:
+            flow_direction = "sink"  # We need liquidity, flows in
+        else:
+            flow_direction = "balanced"
 
+        # Get forward stats for this channel
+        stats = peer_forwards.get(short_channel_id, {})
+        forward_count = stats.get("count", 0)
+        forward_volume_sats = stats.get("volume_msat", 0) // 1000
+        revenue_sats = stats.get("fee_msat", 0) // 1000
 
-def _broadcast_our_stigmergic_markers():
-    """
-    Broadcast our stigmergic markers to hive members for fleet-wide learning.
+        # Get our fee rate for this channel (simplified - would need listpeerchannels)
+        our_fee_ppm = 100  # Default, would query actual fee
 
-    Stigmergic markers are signals left after routing attempts that encode
-    success/failure, fee levels, and volume. Sharing these enables the fleet
-    to learn from each other's routing outcomes without direct coordination.
-    """
-    if not fee_coordination_mgr or not safe_plugin or not database or not our_pubkey:
-        return
-
-    try:
-        from modules.protocol import (
-            create_stigmergic_marker_batch,
-            get_stigmergic_marker_batch_signing_payload,
-            MIN_MARKER_STRENGTH,
-            MAX_MARKER_AGE_HOURS,
-            MAX_MARKERS_IN_BATCH
-        )
-
-        # Get shareable markers from our stigmergic coordinator
-        shareable_markers = fee_coordination_mgr.stigmergic_coord.get_shareable_markers(
-            our_pubkey=our_pubkey,
-            min_strength=MIN_MARKER_STRENGTH,
-            max_age_hours=MAX_MARKER_AGE_HOURS,
-            max_markers=MAX_MARKERS_IN_BATCH
-        )
+        # Add peer data to snapshot list
+        peers_data.append({
+            "peer_id": peer_id,
+            "our_fee_ppm": our_fee_ppm,
+            "their_fee_ppm": 0,  # Would need to look up
+            "forward_count": forward_count,
+            "forward_volume_sats": forward_volume_sats,
+            "revenue_sats": revenue_sats,
+            "flow_direction": flow_direction,
+            "utilization_pct": round(utilization_pct, 4),
+            "days_observed": 7
+        })
 
-        if not shareable_markers:
-            return
+    if not peers_data:
+        return []
 
-        # Build payload and sign it
-        timestamp = int(time.time())
-        payload = {
-            "reporter_id": our_pubkey,
-            "timestamp": timestamp,
-            "markers": shareable_markers
-        }
+    # Single snapshot message with all peer data
+    msg = fee_intel_mgr.create_fee_intelligence_snapshot_message(
+        peers=peers_data,
+        rpc=safe_plugin.rpc
+    )
+    return [msg] if msg else []
 
-        signing_payload = get_stigmergic_marker_batch_signing_payload(payload)
-        try:
-            sig_result = safe_plugin.rpc.signmessage(signing_payload)
-            signature = sig_result["zbase"]
-        except Exception as e:
-            safe_plugin.log(f"cl-hive: Failed to sign stigmergic marker batch: {e}", level='warn')
-            return
 
-        # Create signed batch message
-        msg = create_stigmergic_marker_batch(
-            reporter_id=our_pubkey,
-            timestamp=timestamp,
-            signature=signature,
-            markers=shareable_markers
-        )
+def _build_stigmergic_marker_messages(snapshot: CycleSnapshot) -> List[bytes]:
+    """
+    Share our stigmergic markers with hive members for fleet-wide learning.
 
-        if not msg:
-            return
+    Stigmergic markers are signals left after routing attempts that encode
+    success/failure, fee levels, and volume. Sharing these enables the fleet
+    to learn from each other's routing outcomes without direct coordination.
+    """
+    if not fee_coordination_mgr:
+        return []
 
-        # Get hive members to broadcast to
-        members = database.get_all_members()
-        broadcast_count = 0
+    from modules.protocol import (
+        create_stigmergic_marker_batch,
+        get_stigmergic_marker_batch_signing_payload,
+        MIN_MARKER_STRENGTH,
+        MAX_MARKER_AGE_HOURS,
+        MAX_MARKERS_IN_BATCH
+    )
 
-        for member in members:
-            member_id = member.get("peer_id")
-            if not member_id or member_id == our_pubkey:
-                continue
+    # Get shareable markers from our stigmergic coordinator
+    shareable_markers = fee_coordination_mgr.stigmergic_coord.get_shareable_markers(
+        our_pubkey=our_pubkey,
+        min_strength=MIN_MARKER_STRENGTH,
+        max_age_hours=MAX_MARKER_AGE_HOURS,
+        max_markers=MAX_MARKERS_IN_BATCH
+    )
 
-            try:
-                safe_plugin.rpc.call("sendcustommsg", {
-                    "node_id": member_id,
-                    "msg": msg.hex()
-                })
-                broadcast_count += 1
-            except Exception:
-                pass  # Peer might be offline
+    if not shareable_markers:
+        return []
 
-        if broadcast_count > 0:
-            safe_plugin.log(
-                f"cl-hive: Broadcast {len(shareable_markers)} stigmergic markers "
-                f"to {broadcast_count} members",
-                level='debug'
-            )
+    # Build payload and sign it
+    timestamp = int(time.time())
+    payload = {
+        "reporter_id": our_pubkey,
+        "timestamp": timestamp,
+        "markers": shareable_markers
+    }
 
+    signing_payload = get_stigmergic_marker_batch_signing_payload(payload)
+    try:
+        sig_result = safe_plugin.rpc.signmessage(signing_payload)
+        signature = sig_result["zbase"]
     except Exception as e:
-        if safe_plugin:
-            safe_plugin.log(f"cl-hive: Stigmergic marker broadcast error: {e}", level='warn')
+        safe_plugin.log(f"cl-hive: Failed to sign stigmergic marker batch: {e}", level='warn')
+        return []
+
+    # Create signed batch message
+    msg = create_stigmergic_marker_batch(
+        reporter_id=our_pubkey,
+        timestamp=timestamp,
+        signature=signature,
+        markers=shareable_markers
+    )
+    return [msg] if msg else []
 
 
-def _broadcast_our_pheromones():
+def _build_pheromone_messages(snapshot: CycleSnapshot) -> List[bytes]:
     """
-    Broadcast our pheromone levels to hive members for fleet-wide learning.
+    Share our pheromone levels with hive members for fleet-wide learning.
 
     Pheromones are the "memory" of successful fee levels for specific channels/peers.
     Sharing these enables the fleet to learn from each other's fee experiments
     without direct coordination.
     """
-    if not fee_coordination_mgr or not safe_plugin or not database or not our_pubkey:
-        return
-
-    try:
-        from modules.protocol import (
-            create_pheromone_batch,
-            MIN_PHEROMONE_LEVEL,
-            MAX_PHEROMONES_IN_BATCH
-        )
-
-        # Get our channels and update the channel-to-peer mapping
-        funds = safe_plugin.rpc.listfunds()
-        channels = funds.get("channels", [])
-
-        # Update channel-to-peer mappings in the adaptive controller
-        channel_infos = []
-        for ch in channels:
-            if ch.get("state") == "CHANNELD_NORMAL":
-                channel_infos.append({
-                    "short_channel_id": ch.get("short_channel_id"),
-                    "peer_id": ch.get("peer_id")
-                })
-        fee_coordination_mgr.adaptive_controller.update_channel_peer_mappings(channel_infos)
-
-        # Get hive member IDs to exclude from sharing
-        members = database.get_all_members()
-        member_ids = {m.get("peer_id") for m in members}
-
-        # Get shareable pheromones (excluding hive members)
-        shareable_pheromones = fee_coordination_mgr.adaptive_controller.get_shareable_pheromones(
-            min_level=MIN_PHEROMONE_LEVEL,
-            max_pheromones=MAX_PHEROMONES_IN_BATCH,
-            exclude_peer_ids=member_ids
-        )
-
-        if not shareable_pheromones:
-            return
-
-        # Create signed batch message
-        msg = create_pheromone_batch(
-            pheromones=shareable_pheromones,
-            rpc=safe_plugin.rpc,
-            our_pubkey=our_pubkey
-        )
-
-        if not msg:
-            return
+    if not fee_coordination_mgr:
+        return []
 
-        # Broadcast to all hive members
-        broadcast_count = 0
+    from modules.protocol import (
+        create_pheromone_batch,
+        MIN_PHEROMONE_LEVEL,
+        MAX_PHEROMONES_IN_BATCH
+    )
 
-        for member in members:
-            member_id = member.get("peer_id")
-            if not member_id or member_id == our_pubkey:
-                continue
+    # Update channel-to-peer mappings in the adaptive controller
+    channel_infos = [
+        {"short_channel_id": ch.get("short_channel_id"), "peer_id": ch.get("peer_id")}
+        for ch in snapshot.normal_channels
+    ]
+    fee_coordination_mgr.adaptive_controller.update_channel_peer_mappings(channel_infos)
 
-            try:
-                safe_plugin.rpc.call("sendcustommsg", {
-                    "node_id": member_id,
-                    "msg": msg.hex()
-                })
-                broadcast_count += 1
-            except Exception:
-                pass  # Peer might be offline
+    # Get shareable pheromones (excluding hive members)
+    shareable_pheromones = fee_coordination_mgr.adaptive_controller.get_shareable_pheromones(
+        min_level=MIN_PHEROMONE_LEVEL,
+        max_pheromones=MAX_PHEROMONES_IN_BATCH,
+        exclude_peer_ids=snapshot.member_ids
+    )
 
-        if broadcast_count > 0:
-            safe_plugin.log(
-                f"cl-hive: Broadcast {len(shareable_pheromones)} pheromones "
-                f"to {broadcast_count} members",
-                level='debug'
-            )
+    if not shareable_pheromones:
+        return []
 
-    except Exception as e:
-        if safe_plugin:
-            safe_plugin.log(f"cl-hive: Pheromone broadcast error: {e}", level='warn')
+    # Create signed batch message
+    msg = create_pheromone_batch(
+        pheromones=shareable_pheromones,
+        rpc=safe_plugin.rpc,
+        our_pubkey=our_pubkey
+    )
+    return [msg] if msg else []
 
 
-def _broadcast_our_yield_metrics():
+def _build_yield_metrics_messages(snapshot: CycleSnapshot) -> List[bytes]:
     """
-    Broadcast our yield metrics to hive members for fleet-wide learning.
+    Share our yield metrics with hive members for fleet-wide learning.
 
     Yield metrics include per-channel ROI, capital efficiency, and profitability
     tier. Sharing these enables the fleet to learn which external peers are
     profitable and which should be avoided.
     """
-    if not yield_metrics_mgr or not safe_plugin or not database or not our_pubkey:
-        return
-
-    try:
-        from modules.protocol import create_yield_metrics_batch, MAX_YIELD_METRICS_IN_BATCH
-
-        # Get hive member IDs to exclude from sharing
-        members = database.get_all_members()
-        member_ids = {m.get("peer_id") for m in members}
-
-        # Get shareable yield metrics (excluding hive members)
-        shareable_metrics = yield_metrics_mgr.get_shareable_yield_metrics(
-            period_days=30,
-            exclude_peer_ids=member_ids,
-            max_metrics=MAX_YIELD_METRICS_IN_BATCH
-        )
-
-        if not shareable_metrics:
-            return
-
-        # Create signed batch message
-        msg = create_yield_metrics_batch(
-            metrics=shareable_metrics,
-            rpc=safe_plugin.rpc,
-            our_pubkey=our_pubkey
-        )
-
-        if not msg:
-            return
-
-        # Broadcast to all hive members
-        broadcast_count = 0
+    if not yield_metrics_mgr:
+        return []
 
-        for member in members:
-            member_id = member.get("peer_id")
-            if not member_id or member_id == our_pubkey:
-                continue
+    from modules.protocol import create_yield_metrics_batch, MAX_YIELD_METRICS_IN_BATCH
 
-            try:
-                safe_plugin.rpc.call("sendcustommsg", {
-                    "node_id": member_id,
-                    "msg": msg.hex()
-                })
-                broadcast_count += 1
-            except Exception:
-                pass  # Peer might be offline
+    # Get shareable yield metrics (excluding hive members)
+    shareable_metrics = yield_metrics_mgr.get_shareable_yield_metrics(
+        period_days=30,
+        exclude_peer_ids=snapshot.member_ids,
+        max_metrics=MAX_YIELD_METRICS_IN_BATCH
+    )
 
-        if broadcast_count > 0:
-            safe_plugin.log(
-                f"cl-hive: Broadcast {len(shareable_metrics)} yield metrics "
-                f"to {broadcast_count} members",
-                level='debug'
-            )
+    if not shareable_metrics:
+        return []
 
-    except Exception as e:
-        if safe_plugin:
-            safe_plugin.log(f"cl-hive: Yield metrics broadcast error: {e}", level='warn')
+    # Create signed batch message
+    msg = create_yield_metrics_batch(
+        metrics=shareable_metrics,
+        rpc=safe_plugin.rpc,
+        our_pubkey=our_pubkey
+    )
+    return [msg] if msg else []
 
 
-def _broadcast_circular_flow_alerts():
+def _build_circular_flow_alert_messages(snapshot: CycleSnapshot) -> List[bytes]:
     """
-    Broadcast detected circular flow alerts to hive members.
+    Alert hive members to detected circular flows.
 
     Circular flows (A→B→C→A rebalancing patterns) waste fees without
     improving liquidity. Sharing detected flows enables fleet-wide
     prevention and coordination.
     """
-    if not cost_reduction_mgr or not safe_plugin or not database or not our_pubkey:
-        return
-
-    try:
-        from modules.protocol import (
-            create_circular_flow_alert,
-            MIN_CIRCULAR_FLOW_SATS,
-            MIN_CIRCULAR_FLOW_COST_SATS
-        )
-
-        # Get shareable circular flows
-        shareable_flows = cost_reduction_mgr.circular_detector.get_shareable_circular_flows(
-            min_cost_sats=MIN_CIRCULAR_FLOW_COST_SATS,
-            min_amount_sats=MIN_CIRCULAR_FLOW_SATS
-        )
-
-        if not shareable_flows:
-            return
-
-        members = database.get_all_members()
-
-        # Broadcast each flow as a separate alert (event-driven)
-        total_broadcast = 0
-
-        for flow in shareable_flows:
-            msg = create_circular_flow_alert(
-                members_involved=flow["members_involved"],
-                total_amount_sats=flow["total_amount_sats"],
-                total_cost_sats=flow["total_cost_sats"],
-                cycle_count=flow["cycle_count"],
-                detection_window_hours=flow["detection_window_hours"],
-                recommendation=flow["recommendation"],
-                rpc=safe_plugin.rpc,
-                our_pubkey=our_pubkey
-            )
-
-            if not msg:
-                continue
-
-            for member in members:
-                member_id = member.get("peer_id")
-                if not member_id or member_id == our_pubkey:
-                    continue
-
-                try:
-                    safe_plugin.rpc.call("sendcustommsg", {
-                        "node_id": member_id,
-                        "msg": msg.hex()
-                    })
-                    total_broadcast += 1
-                except Exception:
-                    pass
-
-        if total_broadcast > 0:
-            safe_plugin.log(
-                f"cl-hive: Broadcast {len(shareable_flows)} circular flow alerts",
-                level='info'
-            )
-
-    except Exception as e:
-        if safe_plugin:
-            safe_plugin.log(f"cl-hive: Circular flow alert broadcast error: {e}", level='warn')
-
-
-def _broadcast_our_temporal_patterns():
-    """
-    Broadcast our temporal patterns to hive members for fleet-wide learning.
-
-    Temporal patterns include hour/day flow patterns that enable coordinated
-    liquidity positioning and proactive fee optimization.
-    """
-    if not anticipatory_liquidity_mgr or not safe_plugin or not database or not our_pubkey:
-        return
-
-    try:
-        from modules.protocol import (
-            create_temporal_pattern_batch,
-            MAX_TEMPORAL_PATTERNS_IN_BATCH,
-            MIN_TEMPORAL_PATTERN_CONFIDENCE,
-            MIN_TEMPORAL_PATTERN_SAMPLES
-        )
-
-        # Get hive member IDs to exclude from sharing
-        members = database.get_all_members()
-        member_ids = {m.get("peer_id") for m in members}
-
-        # Get shareable temporal patterns (excluding hive members)
-        shareable_patterns = anticipatory_liquidity_mgr.get_shareable_patterns(
-            min_confidence=MIN_TEMPORAL_PATTERN_CONFIDENCE,
-            min_samples=MIN_TEMPORAL_PATTERN_SAMPLES,
-            exclude_peer_ids=member_ids,
-            max_patterns=MAX_TEMPORAL_PATTERNS_IN_BATCH
-        )
-
-        if not shareable_patterns:
-            return
-
-        # Create signed batch message
-        msg = create_temporal_pattern_batch(
-            patterns=shareable_patterns,
-            rpc=safe_plugin.rpc,
-            our_pubkey=our_pubkey
-        )
-
-        if not msg:
-            return
-
-        # Broadcast to all hive members
-        broadcast_count = 0
-
-        for member in members:
-            member_id = member.get("peer_id")
-            if not member_id or member_id == our_pubkey:
-                continue
-
-            try:
-                safe_plugin.rpc.call("sendcustommsg", {
-                    "node_id": member_id,
-                    "msg": msg.hex()
-                })
-                broadcast_count += 1
-            except Exception:
-                pass  # Peer might be offline
-
-        if broadcast_count > 0:
-            safe_plugin.log(
-                f"cl-hive: Broadcast {len(shareable_patterns)} temporal patterns "
-                f"to {broadcast_count} members",
-                level='debug'
-            )
-
-    except Exception as e:
-        if safe_plugin:
-            safe_plugin.log(f"cl-hive: Temporal patterns broadcast error: {e}", level='warn')
-
-
-# ============================================================================
-# Phase 14.2: Strategic Positioning & Rationalization Broadcasts
-# ============================================================================
-
-
-def _broadcast_our_corridor_values():
-    """
-    Broadcast our high-value corridor discoveries to hive members.
-
-    Corridors are routing paths with high volume, margin, and low competition.
-    Sharing enables coordinated strategic positioning across the fleet.
-    """
-    if not strategic_positioning_mgr or not safe_plugin or not database or not our_pubkey:
-        return
-
-    try:
-        from modules.protocol import (
-            create_corridor_value_batch,
-            MAX_CORRIDORS_IN_BATCH,
-            MIN_CORRIDOR_VALUE_SCORE
-        )
+    if not cost_reduction_mgr:
+        return []
 
-        # Get shareable corridor values
-        shareable_corridors = strategic_positioning_mgr.get_shareable_corridors(
-            min_value_score=MIN_CORRIDOR_VALUE_SCORE,
-            max_corridors=MAX_CORRIDORS_IN_BATCH
-        )
+    from modules.protocol import (
+        create_circular_flow_alert,
+        MIN_CIRCULAR_FLOW_SATS,
+        MIN_CIRCULAR_FLOW_COST_SATS
+    )
 
-        if not shareable_corridors:
-            return
+    # Get shareable circular flows
+    shareable_flows = cost_reduction_mgr.circular_detector.get_shareable_circular_flows(
+        min_cost_sats=MIN_CIRCULAR_FLOW_COST_SATS,
+        min_amount_sats=MIN_CIRCULAR_FLOW_SATS
+    )
 
-        # Create signed batch message
-        msg = create_corridor_value_batch(
-            corridors=shareable_corridors,
+    # Each flow is a separate alert (event-driven)
+    messages = []
+    for flow in shareable_flows or []:
+        msg = create_circular_flow_alert(
+            members_involved=flow["members_involved"],
+            total_amount_sats=flow["total_amount_sats"],
+            total_cost_sats=flow["total_cost_sats"],
+            cycle_count=flow["cycle_count"],
+            detection_window_hours=flow["detection_window_hours"],
+            recommendation=flow["recommendation"],
             rpc=safe_plugin.rpc,
             our_pubkey=our_pubkey
         )
+        if msg:
+            messages.append(msg)
 
-        if not msg:
-            return
-
-        # Broadcast to all hive members
-        members = database.get_all_members()
-        broadcast_count = 0
-
-        for member in members:
-            member_id = member.get("peer_id")
-            if not member_id or member_id == our_pubkey:
-                continue
-
-            try:
-                safe_plugin.rpc.call("sendcustommsg", {
-                    "node_id": member_id,
-                    "msg": msg.hex()
-                })
-                broadcast_count += 1
-            except Exception:
-                pass
-
-        if broadcast_count > 0:
-            safe_plugin.log(
-                f"cl-hive: Broadcast {len(shareable_corridors)} corridor values "
-                f"to {broadcast_count} members",
-                level='debug'
-            )
-
-    except Exception as e:
-        if safe_plugin:
-            safe_plugin.log(f"cl-hive: Corridor values broadcast error: {e}", level='warn')
-
-
-def _broadcast_our_positioning_proposals():
-    """
-    Broadcast our channel open recommendations to hive members.
-
-    Positioning proposals suggest strategic channel targets for optimal
-    fleet placement based on exchange coverage and corridor value analysis.
-    """
-    if not strategic_positioning_mgr or not safe_plugin or not database or not our_pubkey:
-        return
-
-    try:
-        from modules.protocol import create_positioning_proposal, MAX_POSITIONING_PROPOSALS_PER_CYCLE
-
-        # Get shareable positioning recommendations
-        shareable_proposals = strategic_positioning_mgr.get_shareable_positioning_recommendations(
-            max_recommendations=MAX_POSITIONING_PROPOSALS_PER_CYCLE
+    if messages:
+        safe_plugin.log(
+            f"cl-hive: Queued {len(messages)} circular flow alerts for broadcast",
+            level='info'
         )
+    return messages
 
-        if not shareable_proposals:
-            return
-
-        members = database.get_all_members()
-        total_broadcast = 0
-
-        # Broadcast each proposal separately (they're targeted recommendations)
-        for proposal in shareable_proposals:
-            msg = create_positioning_proposal(
-                target_pubkey=proposal["target_pubkey"],
-                target_alias=proposal.get("target_alias", ""),
-                reason=proposal["reason"],
-                score=proposal["score"],
-                suggested_amount_sats=proposal.get("suggested_amount_sats", 0),
-                priority=proposal.get("priority", "medium"),
-                rpc=safe_plugin.rpc,
-                our_pubkey=our_pubkey
-            )
-
-            if not msg:
-                continue
-
-            for member in members:
-                member_id = member.get("peer_id")
-                if not member_id or member_id == our_pubkey:
-                    continue
-
-                try:
-                    safe_plugin.rpc.call("sendcustommsg", {
-                        "node_id": member_id,
-                        "msg": msg.hex()
-                    })
-                    total_broadcast += 1
-                except Exception:
-                    pass
-
-        if total_broadcast > 0:
-            safe_plugin.log(
-                f"cl-hive: Broadcast {len(shareable_proposals)} positioning proposals",
-                level='debug'
-            )
 
-    except Exception as e:
-        if safe_plugin:
-            safe_plugin.log(f"cl-hive: Positioning proposals broadcast error: {e}", level='warn')
-
-
-def _broadcast_our_physarum_recommendations():
+def _build_temporal_pattern_messages(snapshot: CycleSnapshot) -> List[bytes]:
     """
-    Broadcast our Physarum (flow-based) channel lifecycle recommendations.
+    Share our temporal patterns with hive members for fleet-wide learning.
 
-    Physarum recommendations use slime mold optimization principles:
-    - strengthen: High flow channels that should be spliced larger
-    - atrophy: Low flow channels that should be closed
-    - stimulate: Young low flow channels that need fee reduction
+    Temporal patterns include hour/day flow patterns that enable coordinated
+    liquidity positioning and proactive fee optimization.
     """
-    if not strategic_positioning_mgr or not safe_plugin or not database or not our_pubkey:
-        return
-
-    try:
-        from modules.protocol import create_physarum_recommendation, MAX_PHYSARUM_RECOMMENDATIONS_PER_CYCLE
-
-        # Get shareable Physarum recommendations (exclude 'hold')
-        shareable_recommendations = strategic_positioning_mgr.get_shareable_physarum_recommendations(
-            exclude_hold=True
-        )
-
-        if not shareable_recommendations:
-            return
-
-        # Limit to max per cycle
-        shareable_recommendations = shareable_recommendations[:MAX_PHYSARUM_RECOMMENDATIONS_PER_CYCLE]
+    if not anticipatory_liquidity_mgr:
+        return []
 
-        members = database.get_all_members()
-        total_broadcast = 0
-
-        # Broadcast each recommendation separately
-        for rec in shareable_recommendations:
-            msg = create_physarum_recommendation(
-                channel_id=rec.get("channel_id", ""),
-                peer_id=rec["peer_id"],
-                action=rec["action"],
-                flow_intensity=rec["flow_intensity"],
-                reason=rec["reason"],
-                expected_yield_change_pct=rec.get("expected_yield_change_pct", 0.0),
-                rpc=safe_plugin.rpc,
-                our_pubkey=our_pubkey,
-                splice_amount_sats=rec.get("splice_amount_sats", 0)
-            )
+    from modules.protocol import (
+        create_temporal_pattern_batch,
+        MAX_TEMPORAL_PATTERNS_IN_BATCH,
+        MIN_TEMPORAL_PATTERN_CONFIDENCE,
+        MIN_TEMPORAL_PATTERN_SAMPLES
+    )
 
-            if not msg:
-                continue
+    # Get shareable temporal patterns (excluding hive members)
+    shareable_patterns = anticipatory_liquidity_mgr.get_shareable_patterns(
+        min_confidence=MIN_TEMPORAL_PATTERN_CONFIDENCE,
+        min_samples=MIN_TEMPORAL_PATTERN_SAMPLES,
+        exclude_peer_ids=snapshot.member_ids,
+        max_patterns=MAX_TEMPORAL_PATTERNS_IN_BATCH
+    )
 
-            for member in members:
-                member_id = member.get("peer_id")
-                if not member_id or member_id == our_pubkey:
-                    continue
+    if not shareable_patterns:
+        return []
 
-                try:
-                    safe_plugin.rpc.call("sendcustommsg", {
-                        "node_id": member_id,
-                        "msg": msg.hex()
-                    })
-                    total_broadcast += 1
-                except Exception:
-                    pass
+    # Create signed batch message
+    msg = create_temporal_pattern_batch(
+        patterns=shareable_patterns,
+        rpc=safe_plugin.rpc,
+        our_pubkey=our_pubkey
+    )
+    return [msg] if msg else []
 
-        if total_broadcast > 0:
-            safe_plugin.log(
-                f"cl-hive: Broadcast {len(shareable_recommendations)} Physarum recommendations",
-                level='debug'
-            )
 
-    except Exception as e:
-        if safe_plugin:
-            safe_plugin.log(f"cl-hive: Physarum recommendations broadcast error: {e}", level='warn')
+# ============================================================================
+# Phase 14.2: Strategic Positioning & Rationalization Broadcasts
+# ============================================================================
 
 
-def _broadcast_our_coverage_analysis():
+def _build_corridor_value_messages(snapshot: CycleSnapshot) -> List[bytes]:
     """
-    Broadcast our peer coverage analysis to hive members.
+    Share our high-value corridor discoveries with hive members.
 
-    Coverage analysis shows which peers the fleet has channels to,
-    ownership determination based on routing activity (stigmergic markers),
-    and identifies redundant coverage for rationalization.
+    Corridors are routing paths with high volume, margin, and low competition.
+    Sharing enables coordinated strategic positioning across the fleet.
     """
-    if not rationalization_mgr or not safe_plugin or not database or not our_pubkey:
-        return
+    if not strategic_positioning_mgr:
+        return []
 
-    try:
-        from modules.protocol import (
-            create_coverage_analysis_batch,
-            MAX_COVERAGE_ENTRIES_IN_BATCH,
-            MIN_COVERAGE_OWNERSHIP_CONFIDENCE
-        )
+    from modules.protocol import (
+        create_corridor_value_batch,
+        MAX_CORRIDORS_IN_BATCH,
+        MIN_CORRIDOR_VALUE_SCORE
+    )
 
-        # Get shareable coverage analysis
-        shareable_coverage = rationalization_mgr.get_shareable_coverage_analysis(
-            min_ownership_confidence=MIN_COVERAGE_OWNERSHIP_CONFIDENCE,
-            max_entries=MAX_COVERAGE_ENTRIES_IN_BATCH
-        )
+    # Get shareable corridor values
+    shareable_corridors = strategic_positioning_mgr.get_shareable_corridors(
+        min_value_score=MIN_CORRIDOR_VALUE_SCORE,
+        max_corridors=MAX_CORRIDORS_IN_BATCH
+    )
 
-        if not shareable_coverage:
-            return
+    if not shareable_corridors:
+        return []
 
-        # Create signed batch message
-        msg = create_coverage_analysis_batch(
-            coverage_entries=shareable_coverage,
-            rpc=safe_plugin.rpc,
-            our_pubkey=our_pubkey
-        )
+    # Create signed batch message
+    msg = create_corridor_value_batch(
+        corridors=shareable_corridors,
+        rpc=safe_plugin.rpc,
+        our_pubkey=our_pubkey
+    )
+    return [msg] if msg else []
 
-        if not msg:
-            return
 
-        # Broadcast to all hive members
-        members = database.get_all_members()
-        broadcast_count = 0
+def _build_positioning_proposal_messages(snapshot: CycleSnapshot) -> List[bytes]:
+    """
+    Share our channel open recommendations with hive members.
 
-        for member in members:
-            member_id = member.get("peer_id")
-            if not member_id or member_id == our_pubkey:
-                continue
+    Positioning proposals suggest strategic channel targets for optimal
+    fleet placement based on exchange coverage and corridor value analysis.
+    """
+    if not strategic_positioning_mgr:
+        return []
 
-            try:
-                safe_plugin.rpc.call("sendcustommsg", {
-                    "node_id": member_id,
-                    "msg": msg.hex()
-                })
-                broadcast_count += 1
-            except Exception:
-                pass
+    from modules.protocol import create_positioning_proposal, MAX_POSITIONING_PROPOSALS_PER_CYCLE
 
-        if broadcast_count > 0:
-            safe_plugin.log(
-                f"cl-hive: Broadcast {len(shareable_coverage)} coverage entries "
-                f"to {broadcast_count} members",
-                level='debug'
-            )
+    # Get shareable positioning recommendations
+    shareable_proposals = strategic_positioning_mgr.get_shareable_positioning_recommendations(
+        max_recommendations=MAX_POSITIONING_PROPOSALS_PER_CYCLE
+    )
 
-    except Exception as e:
-        if safe_plugin:
-            safe_plugin.log(f"cl-hive: Coverage analysis broadcast error: {e}", level='warn')
+    # Each proposal is a separate message (they're targeted recommendations)
+    messages = []
+    for proposal in shareable_proposals or []:
+        msg = create_positioning_proposal(
+            target_pubkey=proposal["target_pubkey"],
+            target_alias=proposal.get("target_alias", ""),
+            reason=proposal["reason"],
+            score=proposal["score"],
+            suggested_amount_sats=proposal.get("suggested_amount_sats", 0),
+            priority=proposal.get("priority", "medium"),
+            rpc=safe_plugin.rpc,
+            our_pubkey=our_pubkey
+        )
+        if msg:
+            messages.append(msg)
+    return messages
 
 
-def _broadcast_our_close_proposals():
+def _build_physarum_recommendation_messages(snapshot: CycleSnapshot) -> List[bytes]:
     """
-    Broadcast our channel close recommendations to hive members.
+    Share our Physarum (flow-based) channel lifecycle recommendations.
 
-    Close proposals suggest redundant channels that should be closed
-    based on coverage analysis and ownership determination. The channel
-    owner with less routing activity should close to improve capital efficiency.
+    Physarum recommendations use slime mold optimization principles:
+    - strengthen: High flow channels that should be spliced larger
+    - atrophy: Low flow channels that should be closed
+    - stimulate: Young low flow channels that need fee reduction
     """
-    if not rationalization_mgr or not safe_plugin or not database or not our_pubkey:
-        return
+    if not strategic_positioning_mgr:
+        return []
 
-    try:
-        from modules.protocol import create_close_proposal, MAX_CLOSE_PROPOSALS_PER_CYCLE
+    from modules.protocol import create_physarum_recommendation, MAX_PHYSARUM_RECOMMENDATIONS_PER_CYCLE
+
+    # Get shareable Physarum recommendations (exclude 'hold')
+    shareable_recommendations = strategic_positioning_mgr.get_shareable_physarum_recommendations(
+        exclude_hold=True
+    )
 
-        # Get shareable close recommendations
-        shareable_proposals = rationalization_mgr.get_shareable_close_recommendations(
-            max_recommendations=MAX_CLOSE_PROPOSALS_PER_CYCLE
+    # Each recommendation is a separate message, limited per cycle
+    messages = []
+    for rec in (shareable_recommendations or [])[:MAX_PHYSARUM_RECOMMENDATIONS_PER_CYCLE]:
+        msg = create_physarum_recommendation(
+            channel_id=rec.get("channel_id", ""),
+            peer_id=rec["peer_id"],
+            action=rec["action"],
+            flow_intensity=rec["flow_intensity"],
+            reason=rec["reason"],
+            expected_yield_change_pct=rec.get("expected_yield_change_pct", 0.0),
+            rpc=safe_plugin.rpc,
+            our_pubkey=our_pubkey,
+            splice_amount_sats=rec.get("splice_amount_sats", 0)
         )
+        if msg:
+            messages.append(msg)
+    return messages
 
-        if not shareable_proposals:
-            return
 
-        members = database.get_all_members()
-        total_broadcast = 0
-
-        # Broadcast each proposal separately (targeted to specific member)
-        for proposal in shareable_proposals:
-            msg = create_close_proposal(
-                target_member=proposal["target_member"],
-                target_peer=proposal["target_peer"],
-                reason=proposal["reason"],
-                our_routing_share=proposal["our_routing_share"],
-                their_routing_share=proposal["their_routing_share"],
-                suggested_action=proposal.get("suggested_action", "close"),
-                rpc=safe_plugin.rpc,
-                our_pubkey=our_pubkey
-            )
+def _build_coverage_analysis_messages(snapshot: CycleSnapshot) -> List[bytes]:
+    """
+    Share our peer coverage analysis with hive members.
 
-            if not msg:
-                continue
+    Coverage analysis shows which peers the fleet has channels to,
+    ownership determination based on routing activity (stigmergic markers),
+    and identifies redundant coverage for rationalization.
+    """
+    if not rationalization_mgr:
+        return []
 
-            for member in members:
-                member_id = member.get("peer_id")
-                if not member_id or member_id == our_pubkey:
-                    continue
+    from modules.protocol import (
+        create_coverage_analysis_batch,
+        MAX_COVERAGE_ENTRIES_IN_BATCH,
+        MIN_COVERAGE_OWNERSHIP_CONFIDENCE
+    )
 
-                try:
-                    safe_plugin.rpc.call("sendcustommsg", {
-                        "node_id": member_id,
-                        "msg": msg.hex()
-                    })
-                    total_broadcast += 1
-                except Exception:
-                    pass
+    # Get shareable coverage analysis
+    shareable_coverage = rationalization_mgr.get_shareable_coverage_analysis(
+        min_ownership_confidence=MIN_COVERAGE_OWNERSHIP_CONFIDENCE,
+        max_entries=MAX_COVERAGE_ENTRIES_IN_BATCH
+    )
 
-        if total_broadcast > 0:
-            safe_plugin.log(
-                f"cl-hive: Broadcast {len(shareable_proposals)} close proposals",
-                level='debug'
-            )
+    if not shareable_coverage:
+        return []
 
-    except Exception as e:
-        if safe_plugin:
-            safe_plugin.log(f"cl-hive: Close proposals broadcast error: {e}", level='warn')
+    # Create signed batch message
+    msg = create_coverage_analysis_batch(
+        coverage_entries=shareable_coverage,
+        rpc=safe_plugin.rpc,
+        our_pubkey=our_pubkey
+    )
+    return [msg] if msg else []
 
 
-def _broadcast_health_report():
-    """
-    Calculate and broadcast our health report for NNLB coordination.
+def _build_close_proposal_messages(snapshot: CycleSnapshot) -> List[bytes]:
     """
-    if not fee_intel_mgr or not safe_plugin or not database or not our_pubkey:
-        return
-
-    try:
-        # Get our channel data
-        funds = safe_plugin.rpc.listfunds()
-        channels = funds.get("channels", [])
-
-        capacity_sats = sum(
-            ch.get("amount_msat", 0) // 1000
-            for ch in channels if ch.get("state") == "CHANNELD_NORMAL"
-        )
-        available_sats = sum(
-            ch.get("our_amount_msat", 0) // 1000
-            for ch in channels if ch.get("state") == "CHANNELD_NORMAL"
-        )
-        channel_count = len([ch for ch in channels if ch.get("state") == "CHANNELD_NORMAL"])
-
-        # Calculate actual daily revenue from forwarding stats
-        daily_revenue_sats = 0
-        try:
-            forwards = safe_plugin.rpc.listforwards(status="settled")
-            forwards_list = forwards.get("forwards", [])
-            one_day_ago = time.time() - (24 * 3600)
-            daily_revenue_sats = sum(
-                fwd.get("fee_msat", 0) // 1000
-                for fwd in forwards_list
-                if fwd.get("received_time", 0) > one_day_ago
-            )
-        except Exception:
-            pass
+    Share our channel close recommendations with hive members.
 
-        # Get hive averages for comparison
-        all_health = database.get_all_member_health()
-        if all_health:
-            hive_avg_capacity = sum(
-                h.get("capacity_score", 50) for h in all_health
-            ) / len(all_health) * 200000
-            # Estimate hive average revenue from revenue scores
-            hive_avg_revenue = sum(
-                h.get("revenue_score", 50) for h in all_health
-            ) / len(all_health) * 20  # Scale factor for reasonable default
-        else:
-            hive_avg_capacity = 10_000_000
-            hive_avg_revenue = 1000  # Default 1000 sats/day
+    Close proposals suggest redundant channels that should be closed
+    based on coverage analysis and ownership determination. The channel
+    owner with less routing activity should close to improve capital efficiency.
+    """
+    if not rationalization_mgr:
+        return []
 
-        # Calculate our health
-        health = fee_intel_mgr.calculate_our_health(
-            capacity_sats=capacity_sats,
-            available_sats=available_sats,
-            channel_count=channel_count,
-            daily_revenue_sats=daily_revenue_sats,
-            hive_avg_capacity=int(hive_avg_capacity),
-            hive_avg_revenue=int(max(1, hive_avg_revenue))  # Avoid division by zero
-        )
+    from modules.protocol import create_close_proposal, MAX_CLOSE_PROPOSALS_PER_CYCLE
 
-        # Store our own health record
-        database.update_member_health(
-            peer_id=our_pubkey,
-            overall_health=health["overall_health"],
-            capacity_score=health["capacity_score"],
-            revenue_score=health["revenue_score"],
-            connectivity_score=health["connectivity_score"],
-            tier=health["tier"],
-            needs_help=health["needs_help"],
-            can_help_others=health["can_help_others"],
-            needs_inbound=available_sats < capacity_sats * 0.3 if capacity_sats > 0 else False,
-            needs_outbound=available_sats > capacity_sats * 0.7 if capacity_sats > 0 else False,
-            needs_channels=channel_count < 5
-        )
+    # Get shareable close recommendations
+    shareable_proposals = rationalization_mgr.get_shareable_close_recommendations(
+        max_recommendations=MAX_CLOSE_PROPOSALS_PER_CYCLE
+    )
 
-        # Create and broadcast health report
-        msg = fee_intel_mgr.create_health_report_message(
-            overall_health=health["overall_health"],
-            capacity_score=health["capacity_score"],
-            revenue_score=health["revenue_score"],
-            connectivity_score=health["connectivity_score"],
+    # Each proposal is a separate message (targeted to specific member)
+    messages = []
+    for proposal in shareable_proposals or []:
+        msg = create_close_proposal(
+            target_member=proposal["target_member"],
+            target_peer=proposal["target_peer"],
+            reason=proposal["reason"],
+            our_routing_share=proposal["our_routing_share"],
+            their_routing_share=proposal["their_routing_share"],
+            suggested_action=proposal.get("suggested_action", "close"),
             rpc=safe_plugin.rpc,
-            needs_inbound=available_sats < capacity_sats * 0.3 if capacity_sats > 0 else False,
-            needs_outbound=available_sats > capacity_sats * 0.7 if capacity_sats > 0 else False,
-            needs_channels=channel_count < 5,
-            can_provide_assistance=health["can_help_others"]
+            our_pubkey=our_pubkey
         )
-
         if msg:
-            members = database.get_all_members()
-            broadcast_count = 0
-            for member in members:
-                member_id = member.get("peer_id")
-                if not member_id or member_id == our_pubkey:
-                    continue
-                try:
-                    safe_plugin.rpc.call("sendcustommsg", {
-                        "node_id": member_id,
-                        "msg": msg.hex()
-                    })
-                    broadcast_count += 1
-                except Exception:
-                    pass
-
-            if broadcast_count > 0:
-                safe_plugin.log(
-                    f"cl-hive: Broadcast health report (health={health['overall_health']}, "
-                    f"tier={health['tier']}, to {broadcast_count} members)",
-                    level='debug'
-                )
-
-    except Exception as e:
-        if safe_plugin:
-            safe_plugin.log(f"cl-hive: Health report broadcast error: {e}", level='warn')
+            messages.append(msg)
+    return messages
 
 
-def _broadcast_liquidity_needs():
+def _build_health_report_messages(snapshot: CycleSnapshot) -> List[bytes]:
     """
-    Assess and broadcast our liquidity needs to hive members.
-
-    Identifies channels that need rebalancing and broadcasts
-    LIQUIDITY_NEED messages for cooperative assistance.
+    Calculate and store our health report for NNLB coordination.
     """
-    if not liquidity_coord or not safe_plugin or not database or not our_pubkey:
-        return
+    if not fee_intel_mgr:
+        return []
 
-    try:
-        # Get our channel data
-        funds = safe_plugin.rpc.listfunds()
+    # Our channel data
+    channels = snapshot.normal_channels
+    capacity_sats = sum(ch.get("amount_msat", 0) // 1000 for ch in channels)
+    available_sats = sum(ch.get("our_amount_msat", 0) // 1000 for ch in channels)
+    channel_count = len(channels)
+
+    # Actual daily revenue from forwarding stats
+    one_day_ago = snapshot.now - (24 * 3600)
+    daily_revenue_sats = sum(
+        fwd.get("fee_msat", 0) // 1000
+        for fwd in snapshot.forwards
+        if fwd.get("received_time", 0) > one_day_ago
+    )
 
-        # Assess our liquidity needs
-        needs = liquidity_coord.assess_our_liquidity_needs(funds)
+    # Get hive averages for comparison
+    all_health = snapshot.member_health
+    if all_health:
+        hive_avg_capacity = sum(
+            h.get("capacity_score", 50) for h in all_health
+        ) / len(all_health) * 200000
+        # Estimate hive average revenue from revenue scores
+        hive_avg_revenue = sum(
+            h.get("revenue_score", 50) for h in all_health
+        ) / len(all_health) * 20  # Scale factor for reasonable default
+    else:
+        hive_avg_capacity = 10_000_000
+        hive_avg_revenue = 1000  # Default 1000 sats/day
 
-        if not needs:
-            return
+    # Calculate our health
+    health = fee_intel_mgr.calculate_our_health(
+        capacity_sats=capacity_sats,
+        available_sats=available_sats,
+        channel_count=channel_count,
+        daily_revenue_sats=daily_revenue_sats,
+        hive_avg_capacity=int(hive_avg_capacity),
+        hive_avg_revenue=int(max(1, hive_avg_revenue))  # Avoid division by zero
+    )
 
-        # Get hive members
-        members = database.get_all_members()
+    # Store our own health record
+    database.update_member_health(
+        peer_id=our_pubkey,
+        overall_health=health["overall_health"],
+        capacity_score=health["capacity_score"],
+        revenue_score=health["revenue_score"],
+        connectivity_score=health["connectivity_score"],
+        tier=health["tier"],
+        needs_help=health["needs_help"],
+        can_help_others=health["can_help_others"],
+        needs_inbound=available_sats < capacity_sats * 0.3 if capacity_sats > 0 else False,
+        needs_outbound=available_sats > capacity_sats * 0.7 if capacity_sats > 0 else False,
+        needs_channels=channel_count < 5
+    )
 
-        # Note: Cooperative rebalancing removed - we don't transfer funds between nodes.
-        # Set can_provide values to 0 since we're information-only.
-        # Broadcasting liquidity needs is still useful for fee coordination.
+    # Create health report
+    msg = fee_intel_mgr.create_health_report_message(
+        overall_health=health["overall_health"],
+        capacity_score=health["capacity_score"],
+        revenue_score=health["revenue_score"],
+        connectivity_score=health["connectivity_score"],
+        rpc=safe_plugin.rpc,
+        needs_inbound=available_sats < capacity_sats * 0.3 if capacity_sats > 0 else False,
+        needs_outbound=available_sats > capacity_sats * 0.7 if capacity_sats > 0 else False,
+        needs_channels=channel_count < 5,
+        can_provide_assistance=health["can_help_others"]
+    )
 
-        broadcast_count = 0
-        for need in needs[:3]:  # Broadcast top 3 needs
-            msg = liquidity_coord.create_liquidity_need_message(
-                need_type=need["need_type"],
-                target_peer_id=need["target_peer_id"],
-                amount_sats=need["amount_sats"],
-                urgency=need["urgency"],
-                max_fee_ppm=100,  # Willing to pay 100ppm
-                reason=need["reason"],
-                current_balance_pct=need["current_balance_pct"],
-                can_provide_inbound=0,   # No cooperative rebalancing
-                can_provide_outbound=0,  # No cooperative rebalancing
-                rpc=safe_plugin.rpc
-            )
+    safe_plugin.log(
+        f"cl-hive: Health report (health={health['overall_health']}, tier={health['tier']})",
+        level='debug'
+    )
+    return [msg] if msg else []
 
-            if msg:
-                for member in members:
-                    member_id = member.get("peer_id")
-                    if not member_id or member_id == our_pubkey:
-                        continue
-                    try:
-                        safe_plugin.rpc.call("sendcustommsg", {
-                            "node_id": member_id,
-                            "msg": msg.hex()
-                        })
-                        broadcast_count += 1
-                    except Exception:
-                        pass
 
-        if broadcast_count > 0:
-            safe_plugin.log(
-                f"cl-hive: Broadcast {len(needs[:3])} liquidity needs to hive",
-                level='debug'
-            )
+def _build_liquidity_need_messages(snapshot: CycleSnapshot) -> List[bytes]:
+    """
+    Assess our liquidity needs for hive members.
 
-    except Exception as e:
-        if safe_plugin:
-            safe_plugin.log(f"cl-hive: Liquidity needs broadcast error: {e}", level='warn')
+    Identifies channels that need rebalancing and creates LIQUIDITY_NEED
+    messages for cooperative assistance.
+    """
+    if not liquidity_coord:
+        return []
+
+    # Assess our liquidity needs
+    needs = liquidity_coord.assess_our_liquidity_needs(snapshot.funds)
+
+    # Note: Cooperative rebalancing removed - we don't transfer funds between nodes.
+    # Set can_provide values to 0 since we're information-only.
+    # Broadcasting liquidity needs is still useful for fee coordination.
+
+    messages = []
+    for need in (needs or [])[:3]:  # Broadcast top 3 needs
+        msg = liquidity_coord.create_liquidity_need_message(
+            need_type=need["need_type"],
+            target_peer_id=need["target_peer_id"],
+            amount_sats=need["amount_sats"],
+            urgency=need["urgency"],
+            max_fee_ppm=100,  # Willing to pay 100ppm
+            reason=need["reason"],
+            current_balance_pct=need["current_balance_pct"],
+            can_provide_inbound=0,   # No cooperative rebalancing
+            can_provide_outbound=0,  # No cooperative rebalancing
+            rpc=safe_plugin.rpc
+        )
+        if msg:
+            messages.append(msg)
+    return messages
 
 
 # =============================================================================
@@ -10512,6 +10108,27 @@ def hive_reinit_bridge(plugin: Plugin):
     return rpc_reinit_bridge(_get_hive_context())
 
 
+@plugin.method("hive-policy-reconcile")
+def hive_policy_reconcile(plugin: Plugin, dry_run: bool = True):
+    """
+    Reconcile cl-revenue-ops fee policies with hive membership.
+
+    Reports policy drift (members without the HIVE strategy, non-members
+    still holding it) and non-zero fees on member channels. With
+    dry_run=false the drifted policies are fixed.
+
+    Example:
+        lightning-cli hive-policy-reconcile
+        lightning-cli hive-policy-reconcile dry_run=false
+
+    Returns:
+        Dict with drift, applied/failed counts and fee violations.
+
+    Permission: Member only (dry_run=false)
+    """
+    return rpc_reconcile_policies(_get_hive_context(), dry_run=dry_run)
+
+
 @plugin.method("hive-vpn-status")
 def hive_vpn_status(plugin: Plugin, peer_id: str = None):
     """
@@ -12307,6 +11924,19 @@ def hive_trigger_all(plugin: Plugin):
     return results
 
 
+@plugin.method("hive-fee-intel-cycle")
+def hive_fee_intel_cycle(plugin: Plugin):
+    """
+    Get per-step timings of the last fee intelligence cycle.
+
+    Returns:
+        Dict with each step's status and duration, and broadcast totals.
+    """
+    if not fee_intel_pipeline or not fee_intel_pipeline.last_report:
+        return {"status": "no cycle has run yet"}
+    return fee_intel_pipeline.last_report.to_dict()
+
+
 @plugin.method("hive-nnlb-status")
 def hive_nnlb_status(plugin: Plugin):
     """
@@ -14549,6 +14179,82 @@ def hive_settlement_period_details(plugin: Plugin, period_id: int):
     return settlement_mgr.get_period_details(period_id)
 
 
+@plugin.method("hive-settlement-audit")
+def hive_settlement_audit(plugin: Plugin, period: str = None, period_id: int = None):
+    """
+    Replay a past settlement period and diff it against recorded history.
+
+    Re-runs the fair share and payment plan calculation from the recorded
+    inputs and compares the result with what was proposed, voted and paid.
+
+    Args:
+        period: Distributed settlement period (YYYY-WW). Default: previous week.
+        period_id: Legacy settlement period ID (takes precedence over period)
+
+    Returns:
+        Dict with recorded vs replayed plan and findings (mismatches,
+        rounding drift, missing payments).
+    """
+    from modules.settlement_audit import SettlementAuditor
+
+    if not settlement_mgr:
+        return {"error": "Settlement manager not initialized"}
+    auditor = SettlementAuditor(settlement_mgr, our_pubkey)
+    if period_id is not None:
+        return auditor.audit_legacy_period(int(period_id))
+    return auditor.audit_period(period or SettlementManager.get_previous_period())
+
+
+@plugin.method("hive-settlement-audit-all")
+def hive_settlement_audit_all(plugin: Plugin, include_legacy: bool = True,
+                              only_failures: bool = False):
+    """
+    Replay and audit every recorded settlement period.
+
+    Args:
+        include_legacy: Also audit legacy settlement periods (default: True)
+        only_failures: Only return periods with mismatches or missing payments
+
+    Returns:
+        Dict with fleet-wide totals and per-period audit reports.
+    """
+    from modules.settlement_audit import SettlementAuditor
+
+    if not settlement_mgr:
+        return {"error": "Settlement manager not initialized"}
+    auditor = SettlementAuditor(settlement_mgr, our_pubkey)
+    return auditor.audit_all(include_legacy=include_legacy, only_failures=only_failures)
+
+
+@plugin.method("hive-settlement-payments")
+def hive_settlement_payments(plugin: Plugin, proposal_id: str = None, retry: bool = False):
+    """
+    Show durable settlement payment jobs, optionally retrying failed ones.
+
+    Args:
+        proposal_id: Only show (or retry) this proposal's payments
+        retry: Give permanently failed payments a fresh set of attempts
+
+    Returns:
+        Dict with payment jobs and, when proposal_id is given, its status.
+    """
+    if not settlement_executor or not database:
+        return {"error": "Settlement executor not initialized"}
+    result: Dict[str, Any] = {}
+    if retry:
+        perm_error = _check_permission('member')
+        if perm_error:
+            return perm_error
+        result["reset"] = settlement_executor.retry_failed(proposal_id)
+    jobs = database.get_settlement_payment_jobs(proposal_id=proposal_id)
+    for job in jobs:
+        job.pop("bolt12_invoice", None)
+    result["jobs"] = jobs
+    if proposal_id:
+        result["status"] = settlement_executor.proposal_status(proposal_id)
+    return result
+
+
 # =============================================================================
 # DISTRIBUTED SETTLEMENT RPC METHODS (Phase 12)
 # =============================================================================
@@ -14,9 +14,10 @@ This prevents cascading failures when a dependency hangs or crashes.
 Author: Lightning Goats Team
 """
 
+import codecs
 import json
 import re
-import shutil
+import socket
 import subprocess
 import threading
 import time
@@ -35,6 +36,8 @@ RESET_TIMEOUT = 60        # Seconds to wait before probing (OPEN -> HALF_OPEN)
 RPC_TIMEOUT = 5           # Timeout for RPC calls (seconds)
 HALF_OPEN_SUCCESS_THRESHOLD = 3  # Consecutive successes needed to close circuit (Issue #10)
 
+RPC_READ_CHUNK = 65536    # Bytes per recv() on the lightning-rpc socket
+
 # Minimum required version of cl-revenue-ops
 MIN_REVENUE_OPS_VERSION = (1, 4, 0)
 
@@ -193,6 +196,153 @@ class CircuitBreaker:
             }
 
 
+# =============================================================================
+# SOCKET RPC CLIENT
+# =============================================================================
+
+class SocketRpcClient:
+    """
+    Persistent JSON-RPC client over the lightning-rpc unix socket.
+
+    Replaces forking lightning-cli per call while keeping a hard timeout:
+    one connection is opened lazily, reused for every call and serialized
+    by its own lock. Any transport error or timeout drops the connection
+    (its stream position is unknown) and the next call reconnects.
+
+    A request is only resent when writing it to a reused connection
+    fails, i.e. when lightningd cannot have seen it, so non-idempotent
+    calls such as rebalances are never executed twice.
+    """
+
+    def __init__(self, socket_path: str, timeout: float = RPC_TIMEOUT):
+        """
+        Initialize the client. No connection is made until the first call.
+
+        Args:
+            socket_path: Path to lightningd's lightning-rpc socket
+            timeout: Hard timeout per call in seconds
+        """
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._sock: Optional[socket.socket] = None
+        self._buffer = ""
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._next_id = 0
+        self.connects = 0
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self._buffer = ""
+        self._utf8.reset()
+        self.connects += 1
+        return sock
+
+    def _drop(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._buffer = ""
+
+    def _send(self, data: bytes) -> None:
+        """Write a request, reconnecting once if a reused connection went stale."""
+        reused = self._sock is not None
+        if self._sock is None:
+            self._sock = self._connect()
+        try:
+            self._sock.sendall(data)
+        except OSError:
+            self._drop()
+            if not reused:
+                raise
+            self._sock = self._connect()
+            self._sock.sendall(data)
+
+    def _read_response(self, request_id: int, deadline: float) -> Dict[str, Any]:
+        """Read messages until the reply to request_id arrives."""
+        while True:
+            text = self._buffer.lstrip()
+            # Only try to parse once a complete object may have arrived,
+            # so large replies are not re-scanned on every chunk
+            if text and text.rstrip().endswith("}"):
+                try:
+                    message, end = self._decoder.raw_decode(text)
+                except json.JSONDecodeError:
+                    message = None
+                if message is not None:
+                    self._buffer = text[end:]
+                    # Skip notifications and stale replies
+                    if isinstance(message, dict) and message.get("id") == request_id:
+                        return message
+                    continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise socket.timeout("timed out")
+            self._sock.settimeout(remaining)
+            chunk = self._sock.recv(RPC_READ_CHUNK)
+            if not chunk:
+                raise ConnectionError("lightning-rpc closed the connection")
+            self._buffer += self._utf8.decode(chunk)
+
+    def call(self, method: str, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Execute one RPC call.
+
+        Args:
+            method: RPC method name
+            payload: Optional named parameters
+
+        Returns:
+            The call's result object
+
+        Raises:
+            RpcError: If lightningd returns an error
+            TimeoutError: If no reply arrives within the timeout
+            OSError: If the socket is unreachable or the connection drops
+        """
+        params = {k: v for k, v in (payload or {}).items() if v is not None}
+        with self._lock:
+            self._next_id += 1
+            request_id = self._next_id
+            request = json.dumps({
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": method,
+                "params": params,
+            }).encode("utf-8")
+            deadline = time.monotonic() + self.timeout
+            try:
+                self._send(request)
+                response = self._read_response(request_id, deadline)
+            except socket.timeout:
+                self._drop()
+                raise TimeoutError(f"RPC call {method} timed out after {self.timeout}s")
+            except (OSError, UnicodeDecodeError):
+                self._drop()
+                raise
+
+        if "error" in response:
+            raise RpcError(method, payload or {}, response["error"])
+        result = response.get("result")
+        return result if result is not None else {}
+
+    def close(self) -> None:
+        """Close the connection; the next call reconnects."""
+        with self._lock:
+            self._drop()
+
+
 # =============================================================================
 # BRIDGE CLASS
 # =============================================================================
@@ -227,13 +377,15 @@ class Bridge:
         self._clboss_available = False
         self._clboss_unignore_supported = True
 
+        # Calls go over one persistent lightning-rpc connection with a hard
+        # timeout; the thread-safe proxy (no timeout) is the fallback
         self._rpc_socket_path = self._resolve_rpc_socket()
-        self._use_subprocess = bool(
-            self._rpc_socket_path and shutil.which("lightning-cli")
+        self._socket_client: Optional[SocketRpcClient] = (
+            SocketRpcClient(self._rpc_socket_path) if self._rpc_socket_path else None
         )
-        if not self._use_subprocess:
+        if not self._socket_client:
             self._log(
-                "Bridge RPC timeout disabled: lightning-cli or rpc socket unavailable",
+                "Bridge RPC timeout disabled: rpc socket unavailable",
                 level="warn"
             )
         
@@ -426,11 +578,16 @@ class Bridge:
     # SAFE CALL WRAPPER
     # =========================================================================
 
+    def _call_via_socket(self, method: str, payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Execute an RPC call over the persistent lightning-rpc connection."""
+        return self._socket_client.call(method, payload)
+
     def _call_via_lightning_cli(self, method: str, payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Execute an RPC call via lightning-cli with a hard timeout.
 
         Uses -k (keyword args) format to properly pass named parameters
-        to CLN methods.
+        to CLN methods. Forks one process per call; kept for comparison
+        with _call_via_socket() and for debugging.
         """
         if not self._rpc_socket_path:
             raise BridgeDisabledError("RPC socket path unavailable")
@@ -502,8 +659,8 @@ class Bridge:
             raise CircuitOpenError(f"Circuit {cb.name} is OPEN")
         
         try:
-            if self._use_subprocess:
-                result = self._call_via_lightning_cli(method, payload)
+            if self._socket_client:
+                result = self._call_via_socket(method, payload)
             else:
                 result = self._call_direct(method, payload)
 
@@ -672,6 +829,59 @@ class Bridge:
             self._log(f"Failed to verify fees for {peer_id[:16]}...: {e}", level='debug')
             return (False, f"error: {e}")
 
+    def verify_hive_channels_zero_fees(self, peer_ids) -> Dict[str, Tuple[bool, str]]:
+        """
+        Verify zero fees on the channels to many hive members at once.
+
+        Same checks and reasons as verify_hive_channel_zero_fees(), but
+        costs three RPCs in total (getinfo, listpeerchannels and
+        listchannels filtered to our own direction) instead of three per
+        member.
+
+        Args:
+            peer_ids: Hive members' node public keys
+
+        Returns:
+            Dict of peer_id -> (is_valid, reason)
+        """
+        peer_ids = list(peer_ids)
+        try:
+            our_pubkey = self.rpc.getinfo().get('id', '')
+
+            # One active SCID per peer, as _get_channel_scid() picks it
+            scids: Dict[str, str] = {}
+            for ch in self.rpc.listpeerchannels().get('channels', []):
+                peer_id = ch.get('peer_id')
+                scid = ch.get('short_channel_id')
+                if peer_id and scid and ch.get('state', '') == 'CHANNELD_NORMAL':
+                    scids.setdefault(peer_id, scid)
+
+            our_directions: Dict[str, Dict[str, Any]] = {}
+            for ch in self.rpc.listchannels(source=our_pubkey).get('channels', []):
+                if ch.get('source') == our_pubkey and ch.get('short_channel_id'):
+                    our_directions[ch['short_channel_id']] = ch
+        except Exception as e:
+            self._log(f"Failed to verify hive channel fees: {e}", level='debug')
+            return {peer_id: (False, f"error: {e}") for peer_id in peer_ids}
+
+        results: Dict[str, Tuple[bool, str]] = {}
+        for peer_id in peer_ids:
+            scid = scids.get(peer_id)
+            if not scid:
+                results[peer_id] = (False, "no_channel")
+                continue
+            ch = our_directions.get(scid)
+            if ch is None:
+                results[peer_id] = (False, "our_direction_not_found")
+                continue
+            base_fee = ch.get('base_fee_millisatoshi', 0)
+            fee_ppm = ch.get('fee_per_millionth', 0)
+            if base_fee != 0 or fee_ppm != 0:
+                results[peer_id] = (False, f"non_zero_fees: base={base_fee}msat, ppm={fee_ppm}")
+            else:
+                results[peer_id] = (True, "ok")
+        return results
+
     def _check_and_reserve_daily_rebalance_budget(self, amount_sats: int) -> bool:
         """
         Atomically check and reserve rebalance budget within daily limit.
@@ -813,6 +1023,35 @@ class Bridge:
         except Exception:
             return None
     
+    def list_policies(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Get every peer policy from cl-revenue-ops in one call.
+
+        Returns:
+            Dict of peer_id -> policy dict, or None if unavailable
+        """
+        if self._status == BridgeStatus.DISABLED:
+            return None
+
+        try:
+            result = self.safe_call("revenue-policy", {"action": "list"})
+        except Exception as e:
+            self._log(f"Failed to list policies: {e}", level='debug')
+            return None
+
+        # Accept {"policies": [...]}, a bare list or a dict keyed by peer
+        entries = result.get("policies", result) if isinstance(result, dict) else result
+        policies: Dict[str, Dict[str, Any]] = {}
+        if isinstance(entries, dict):
+            for peer_id, policy in entries.items():
+                if isinstance(policy, dict):
+                    policies[peer_id] = policy
+        elif isinstance(entries, list):
+            for policy in entries:
+                if isinstance(policy, dict) and policy.get("peer_id"):
+                    policies[policy["peer_id"]] = policy
+        return policies
+
     # =========================================================================
     # CLBOSS INTEGRATION
     # =========================================================================
@@ -914,11 +1153,17 @@ class Bridge:
     def status(self) -> BridgeStatus:
         """Get current bridge status."""
         return self._status
+
+    def close(self) -> None:
+        """Close the persistent RPC connection, if any."""
+        if self._socket_client:
+            self._socket_client.close()
     
     def get_stats(self) -> Dict[str, Any]:
         """Get bridge statistics including security limits."""
         return {
             "status": self._status.value,
+            "rpc_transport": "socket" if self._socket_client else "proxy",
             "revenue_ops": {
                 "version": self._revenue_ops_version,
                 "circuit_breaker": self._revenue_ops_cb.get_stats()
@@ -64,6 +64,12 @@ HIGH_HUB_SCORE_THRESHOLD = 0.6      # Score above this is "high" hub potential
 PREFER_HUB_SCORE_BONUS = 1.2        # 20% preference bonus for high-hub peers
 HUB_SCORE_WEIGHT_IN_PATH = 0.3      # 30% weight for hub score in path selection
 
+# Fleet path search
+MAX_FLEET_PATH_MEMBERS = 4          # Longest hub-aware path (member hops)
+MAX_CANDIDATE_PATHS = 8             # k for k-shortest path enumeration
+PATH_CACHE_TTL_SECONDS = 300        # Memoized paths expire with hub scores
+MAX_PATH_CACHE_ENTRIES = 4096       # Memo is cleared when it grows past this
+
 
 # =============================================================================
 # DATA CLASSES
@@ -434,6 +440,14 @@ class FleetRebalanceRouter:
         self._topology_cache_time: float = 0
         self._topology_cache_ttl: float = 300  # 5 minutes
 
+        # Derived from topology, rebuilt only when topology changes
+        self._peer_members: Dict[str, Set[str]] = {}      # peer -> members with channel
+        self._member_adjacency: Dict[str, Set[str]] = {}  # member -> members sharing a peer
+
+        # Memoized path searches keyed by (from_peer, to_peer)
+        self._shortest_path_cache: Dict[Tuple[str, str], Tuple[float, Optional[List[str]]]] = {}
+        self._candidate_path_cache: Dict[Tuple[str, str], Tuple[float, List[List[str]]]] = {}
+
     def set_our_pubkey(self, pubkey: str) -> None:
         """Set our node's pubkey."""
         self._our_pubkey = pubkey
@@ -470,10 +484,59 @@ class FleetRebalanceRouter:
             except Exception as e:
                 self._log(f"Error getting fleet topology: {e}", level="debug")
 
+        if topology != self._topology_cache or not self._member_adjacency:
+            self._rebuild_member_graph(topology)
         self._topology_cache = topology
         self._topology_cache_time = now
         return topology
 
+    def _rebuild_member_graph(self, topology: Dict[str, Set[str]]) -> None:
+        """
+        Precompute peer -> members and member adjacency for path search.
+
+        Two members are adjacent when they share at least one peer. Built
+        from the inverted index, so cost is sum(k^2) over peers shared by
+        k members instead of a set intersection per member pair per step.
+        """
+        peer_members: Dict[str, Set[str]] = defaultdict(set)
+        for member, peers in topology.items():
+            for peer in peers:
+                peer_members[peer].add(member)
+
+        adjacency: Dict[str, Set[str]] = {member: set() for member in topology}
+        for members in peer_members.values():
+            if len(members) < 2:
+                continue
+            for member in members:
+                adjacency[member].update(members)
+        for member, neighbors in adjacency.items():
+            neighbors.discard(member)
+
+        self._peer_members = dict(peer_members)
+        self._member_adjacency = adjacency
+        self._shortest_path_cache.clear()
+        self._candidate_path_cache.clear()
+
+    def invalidate_topology(self) -> None:
+        """Force topology, member graph and memoized paths to be rebuilt."""
+        self._topology_cache = {}
+        self._topology_cache_time = 0
+        self._member_adjacency = {}
+        self._shortest_path_cache.clear()
+        self._candidate_path_cache.clear()
+
+    def _cache_put(self, cache: Dict, key: Tuple[str, str], value: Any) -> None:
+        if len(cache) >= MAX_PATH_CACHE_ENTRIES:
+            cache.clear()
+        cache[key] = (time.time(), value)
+
+    @staticmethod
+    def _cache_get(cache: Dict, key: Tuple[str, str]) -> Tuple[bool, Any]:
+        entry = cache.get(key)
+        if entry and time.time() - entry[0] < PATH_CACHE_TTL_SECONDS:
+            return True, entry[1]
+        return False, None
+
     def _get_fleet_members(self) -> List[str]:
         """Get list of fleet member pubkeys."""
         if not self.state_manager:
@@ -502,73 +565,65 @@ class FleetRebalanceRouter:
             FleetPath if found, None otherwise
         """
         topology = self._get_fleet_topology()
-        members = set(topology.keys())
-
-        if not members:
-            return None
-
-        # BFS to find shortest path through fleet members
-        # Start: our node connected to from_peer
-        # End: any fleet member connected to to_peer
-
-        # Find members connected to from_peer
-        start_members = []
-        for member, peers in topology.items():
-            if from_peer in peers:
-                start_members.append(member)
-
-        if not start_members:
+        if not topology:
             return None
 
-        # Find members connected to to_peer
-        end_members = set()
-        for member, peers in topology.items():
-            if to_peer in peers:
-                end_members.add(member)
+        key = (from_peer, to_peer)
+        hit, path = self._cache_get(self._shortest_path_cache, key)
+        if not hit:
+            path = self._bfs_member_path(from_peer, to_peer)
+            self._cache_put(self._shortest_path_cache, key, path)
 
-        if not end_members:
+        if not path:
             return None
 
-        # If same member connects both peers, direct path
-        direct = set(start_members) & end_members
-        if direct:
-            member = list(direct)[0]
+        if len(path) == 1:
+            # Same member connects both peers, direct path
             return FleetPath(
-                path=[member],
+                path=list(path),
                 hops=1,
                 estimated_cost_sats=self._estimate_fleet_cost(amount_sats, 1),
                 estimated_time_seconds=30,
                 reliability_score=0.9
             )
 
-        # BFS for shortest path
-        visited = set()
-        queue = deque([(m, [m]) for m in start_members])
+        return FleetPath(
+            path=list(path),
+            hops=len(path),
+            estimated_cost_sats=self._estimate_fleet_cost(amount_sats, len(path)),
+            estimated_time_seconds=30 * len(path),
+            reliability_score=max(0.5, 1.0 - 0.1 * len(path))
+        )
 
-        while queue:
-            current, path = queue.popleft()
+    def _bfs_member_path(self, from_peer: str, to_peer: str) -> Optional[List[str]]:
+        """
+        Fewest-hops member path over the precomputed adjacency.
 
-            if current in visited:
-                continue
-            visited.add(current)
+        Start: any member connected to from_peer
+        End: any member connected to to_peer
+        """
+        start_members = self._peer_members.get(from_peer, set())
+        end_members = self._peer_members.get(to_peer, set())
+        if not start_members or not end_members:
+            return None
 
-            # Check if we reached an end member
-            if current in end_members:
-                return FleetPath(
-                    path=path,
-                    hops=len(path),
-                    estimated_cost_sats=self._estimate_fleet_cost(amount_sats, len(path)),
-                    estimated_time_seconds=30 * len(path),
-                    reliability_score=max(0.5, 1.0 - 0.1 * len(path))
-                )
+        direct = start_members & end_members
+        if direct:
+            return [min(direct)]
 
-            # Add neighbors (other fleet members this member is connected to)
-            current_peers = topology.get(current, set())
-            for member, member_peers in topology.items():
-                if member not in visited and member != current:
-                    # Check if there's a connection
-                    if current_peers & member_peers:  # Shared peers
-                        queue.append((member, path + [member]))
+        parent: Dict[str, Optional[str]] = {m: None for m in start_members}
+        queue = deque(sorted(start_members))
+        while queue:
+            current = queue.popleft()
+            if current in end_members:
+                path = [current]
+                while parent[path[-1]] is not None:
+                    path.append(parent[path[-1]])
+                return path[::-1]
+            for member in self._member_adjacency.get(current, ()):
+                if member not in parent:
+                    parent[member] = current
+                    queue.append(member)
 
         return None
 
@@ -727,7 +782,12 @@ class FleetRebalanceRouter:
         hubs.sort(key=lambda h: h["hub_score"], reverse=True)
         return hubs
 
-    def _score_path_with_hub_bonus(self, path: List[str], amount_sats: int) -> float:
+    def _score_path_with_hub_bonus(
+        self,
+        path: List[str],
+        amount_sats: int,
+        hub_scores: Optional[Dict[str, float]] = None
+    ) -> float:
         """
         Score a fleet path considering hub scores of members.
 
@@ -736,6 +796,7 @@ class FleetRebalanceRouter:
         Args:
             path: List of member pubkeys in the path
             amount_sats: Amount being routed
+            hub_scores: Precomputed hub scores (fetched if not given)
 
         Returns:
             Combined score (lower is better for routing)
@@ -743,7 +804,8 @@ class FleetRebalanceRouter:
         if not path:
             return float('inf')
 
-        hub_scores = self.get_member_hub_scores()
+        if hub_scores is None:
+            hub_scores = self.get_member_hub_scores()
 
         # Base cost component
         cost = self._estimate_fleet_cost(amount_sats, len(path))
@@ -787,8 +849,12 @@ class FleetRebalanceRouter:
         if not members:
             return None
 
-        # Find all candidate paths (limit search to reasonable depth)
-        all_paths = self._find_all_fleet_paths(from_peer, to_peer, max_depth=4)
+        hub_scores = self.get_member_hub_scores()
+
+        # Cheapest candidate paths (bounded depth, memoized)
+        all_paths = self._find_all_fleet_paths(
+            from_peer, to_peer, max_depth=MAX_FLEET_PATH_MEMBERS, hub_scores=hub_scores
+        )
 
         if not all_paths:
             # Fall back to regular path finding
@@ -797,7 +863,7 @@ class FleetRebalanceRouter:
         # Score each path with hub bonus
         scored_paths = []
         for path in all_paths:
-            score = self._score_path_with_hub_bonus(path, amount_sats)
+            score = self._score_path_with_hub_bonus(path, amount_sats, hub_scores)
             scored_paths.append((path, score))
 
         # Sort by score (lower is better)
@@ -805,7 +871,6 @@ class FleetRebalanceRouter:
 
         # Return best path
         best_path = scored_paths[0][0]
-        hub_scores = self.get_member_hub_scores()
         avg_hub = sum(hub_scores.get(m, 0.0) for m in best_path) / len(best_path)
 
         return FleetPath(
@@ -820,59 +885,151 @@ class FleetRebalanceRouter:
         self,
         from_peer: str,
         to_peer: str,
-        max_depth: int = 4
+        max_depth: int = MAX_FLEET_PATH_MEMBERS,
+        hub_scores: Optional[Dict[str, float]] = None
     ) -> List[List[str]]:
         """
-        Find all fleet paths between peers up to max_depth.
+        Find the cheapest fleet paths between peers up to max_depth members.
+
+        Uses Yen's k-shortest simple paths (k = MAX_CANDIDATE_PATHS) over
+        the member adjacency graph. Each member costs
+        1 + HUB_SCORE_WEIGHT_IN_PATH * (1 - hub_score), so fewer hops win
+        and high-hub members break ties. Results are memoized per
+        (from_peer, to_peer) until the topology changes or the TTL expires.
 
         Returns multiple paths for hub-aware selection.
         """
-        topology = self._get_fleet_topology()
-        all_paths = []
+        self._get_fleet_topology()
+        key = (from_peer, to_peer)
+        use_cache = max_depth == MAX_FLEET_PATH_MEMBERS
+        if use_cache:
+            hit, paths = self._cache_get(self._candidate_path_cache, key)
+            if hit:
+                return [list(p) for p in paths]
+
+        start_members = self._peer_members.get(from_peer, set())
+        end_members = self._peer_members.get(to_peer, set())
+        if not start_members or not end_members:
+            return []
 
-        # Find members connected to from_peer
-        start_members = []
-        for member, peers in topology.items():
-            if from_peer in peers:
-                start_members.append(member)
+        if hub_scores is None:
+            hub_scores = self.get_member_hub_scores()
+        weights = {
+            m: 1.0 + HUB_SCORE_WEIGHT_IN_PATH * (1.0 - hub_scores.get(m, 0.0))
+            for m in self._member_adjacency
+        }
 
-        if not start_members:
-            return []
+        paths = self._k_shortest_member_paths(
+            start_members, end_members, weights, max_depth, MAX_CANDIDATE_PATHS
+        )
+        if use_cache:
+            self._cache_put(self._candidate_path_cache, key, paths)
+        return [list(p) for p in paths]
 
-        # Find members connected to to_peer
-        end_members = set()
-        for member, peers in topology.items():
-            if to_peer in peers:
-                end_members.add(member)
+    def _layered_shortest_path(
+        self,
+        root: List[str],
+        start_members: Set[str],
+        end_members: Set[str],
+        weights: Dict[str, float],
+        max_members: int,
+        blocked_nodes: Set[str],
+        blocked_edges: Set[Tuple[Optional[str], str]]
+    ) -> Optional[Tuple[float, List[str]]]:
+        """
+        Cheapest simple path extending root to an end member.
+
+        Relaxes one layer (hop) at a time, keeping the best partial path
+        per member per layer, so the hop bound is exact. A path stops at
+        the first end member it reaches.
+
+        Args:
+            root: Fixed path prefix (empty = start at any start member)
+            blocked_nodes: Members that may not be used
+            blocked_edges: (from, to) steps that may not be taken; from is
+                None for the step into the first member
+        """
+        if root:
+            if len(root) > max_members:
+                return None
+            frontier = {root[-1]: (sum(weights.get(m, 1.0) for m in root), list(root))}
+        else:
+            frontier = {
+                m: (weights.get(m, 1.0), [m])
+                for m in start_members
+                if m not in blocked_nodes and (None, m) not in blocked_edges
+            }
 
-        if not end_members:
+        best: Optional[Tuple[float, List[str]]] = None
+        depth = max(1, len(root))
+        while frontier:
+            next_frontier: Dict[str, Tuple[float, List[str]]] = {}
+            for member, (cost, path) in frontier.items():
+                if member in end_members:
+                    if best is None or cost < best[0]:
+                        best = (cost, path)
+                    continue
+                if depth >= max_members:
+                    continue
+                for neighbor in self._member_adjacency.get(member, ()):
+                    if (neighbor in blocked_nodes or neighbor in path or
+                            (member, neighbor) in blocked_edges):
+                        continue
+                    new_cost = cost + weights.get(neighbor, 1.0)
+                    if best is not None and new_cost >= best[0]:
+                        continue
+                    current = next_frontier.get(neighbor)
+                    if current is None or new_cost < current[0]:
+                        next_frontier[neighbor] = (new_cost, path + [neighbor])
+            frontier = next_frontier
+            depth += 1
+
+        return best
+
+    def _k_shortest_member_paths(
+        self,
+        start_members: Set[str],
+        end_members: Set[str],
+        weights: Dict[str, float],
+        max_members: int,
+        k: int
+    ) -> List[List[str]]:
+        """Yen's algorithm on top of _layered_shortest_path."""
+        first = self._layered_shortest_path(
+            [], start_members, end_members, weights, max_members, set(), set()
+        )
+        if not first:
             return []
 
-        # DFS to find all paths
-        def dfs(current: str, path: List[str], visited: Set[str]):
-            if len(path) > max_depth:
-                return
+        found: List[Tuple[float, List[str]]] = [first]
+        candidates: List[Tuple[float, List[str]]] = []
+        seen = {tuple(first[1])}
+
+        while len(found) < k:
+            prev_path = found[-1][1]
+            for i in range(len(prev_path)):
+                root = prev_path[:i]
+                spur = root[-1] if root else None
+                blocked_edges = {
+                    (spur, path[i])
+                    for _, path in found
+                    if len(path) > i and path[:i] == root
+                }
+                blocked_nodes = set(root[:-1])
+                result = self._layered_shortest_path(
+                    root, start_members, end_members, weights, max_members,
+                    blocked_nodes, blocked_edges
+                )
+                if result and tuple(result[1]) not in seen:
+                    seen.add(tuple(result[1]))
+                    candidates.append(result)
 
-            if current in end_members:
-                all_paths.append(list(path))
-                return
-
-            current_peers = topology.get(current, set())
-            for member, member_peers in topology.items():
-                if member not in visited and member != current:
-                    # Check if connected
-                    if current_peers & member_peers:
-                        visited.add(member)
-                        path.append(member)
-                        dfs(member, path, visited)
-                        path.pop()
-                        visited.discard(member)
-
-        # Search from each start member
-        for start in start_members:
-            dfs(start, [start], {start})
-
-        return all_paths
+            if not candidates:
+                break
+            candidates.sort(key=lambda c: (c[0], c[1]))
+            found.append(candidates.pop(0))
+
+        return [path for _, path in found]
 
     def get_hub_enhanced_rebalance_path(
         self,
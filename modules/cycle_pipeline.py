@@ -0,0 +1,321 @@
+"""
+Single-pass cycle pipeline for cl-hive background loops.
+
+A cycle gathers its inputs once into a CycleSnapshot, runs a graph of steps
+with declared dependencies, and then delivers every message the steps
+produced in one coalesced broadcast phase.
+
+Design:
+- Steps read the shared snapshot instead of re-fetching channels, members
+  and forwards; each returns the messages it wants broadcast.
+- A step starts as soon as its dependencies finish, so independent steps
+  run concurrently (bounded by max_workers).
+- depends_on must succeed (otherwise the step is skipped); after only
+  orders steps, e.g. a cleanup that must not overlap the step sharing the
+  same data. A step gated by a period (daily/weekly) runs once per period
+  and is otherwise 'not_due'.
+- A step declared needs_funds is skipped when listfunds failed for this
+  cycle; the remaining steps still run on the rest of the snapshot.
+- The broadcast phase sends peer by peer in step declaration order, so the
+  same snapshot always produces the same sends regardless of which step
+  finished first. Snapshots round-trip through plain dicts so a recorded
+  cycle can be replayed.
+- Per-step timings are kept in the CycleReport.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+
+# Step outcomes
+STEP_OK = "ok"
+STEP_ERROR = "error"
+STEP_SKIPPED = "skipped"      # A dependency failed or was skipped
+STEP_NOT_DUE = "not_due"      # Already ran in the current period
+
+# Dependencies in these states let dependents run
+STEP_SATISFIED = (STEP_OK, STEP_NOT_DUE)
+
+
+def utc_day(now: int) -> str:
+    """Period key for steps that run once per UTC day."""
+    return datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%d")
+
+
+def utc_week(now: int) -> str:
+    """Period key for steps that run once per UTC week."""
+    return datetime.fromtimestamp(now, timezone.utc).strftime("%Y-W%W")
+
+
+@dataclass
+class CycleSnapshot:
+    """Inputs gathered once at the start of a cycle."""
+    now: int
+    our_pubkey: str
+    funds: Dict[str, Any] = field(default_factory=dict)      # listfunds result
+    forwards: List[Dict[str, Any]] = field(default_factory=list)  # settled forwards
+    members: List[Dict[str, Any]] = field(default_factory=list)
+    member_health: List[Dict[str, Any]] = field(default_factory=list)
+    funds_error: Optional[str] = None    # listfunds failed; funds is empty
+
+    @property
+    def channels(self) -> List[Dict[str, Any]]:
+        """All channels from listfunds."""
+        return self.funds.get("channels", [])
+
+    @property
+    def normal_channels(self) -> List[Dict[str, Any]]:
+        """Channels in CHANNELD_NORMAL."""
+        return [ch for ch in self.channels if ch.get("state") == "CHANNELD_NORMAL"]
+
+    @property
+    def member_ids(self) -> Set[str]:
+        """Peer ids of every hive member (including us)."""
+        return {m.get("peer_id") for m in self.members}
+
+    @property
+    def broadcast_targets(self) -> List[str]:
+        """Members a broadcast goes to, in member order."""
+        return [m["peer_id"] for m in self.members
+                if m.get("peer_id") and m["peer_id"] != self.our_pubkey]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CycleSnapshot":
+        return cls(**data)
+
+
+@dataclass(frozen=True)
+class CycleStep:
+    """
+    One node of the cycle graph.
+
+    run receives the snapshot and returns the messages (serialized bytes)
+    to broadcast, or None. period maps the snapshot time to a key such as
+    the UTC day; the step runs once per distinct key. needs_funds marks
+    steps that read our channels and must not run on empty funds.
+    """
+    name: str
+    run: Callable[[CycleSnapshot], Optional[List[bytes]]]
+    depends_on: Tuple[str, ...] = ()      # Must succeed first
+    after: Tuple[str, ...] = ()           # Must finish first, in any state
+    period: Optional[Callable[[int], str]] = None
+    needs_funds: bool = False             # Skipped if listfunds failed
+
+    @property
+    def waits_for(self) -> Tuple[str, ...]:
+        return self.depends_on + self.after
+
+
+@dataclass
+class StepResult:
+    """Outcome and timing of one step."""
+    status: str
+    duration_ms: float = 0.0
+    messages: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class CycleReport:
+    """Per-step outcomes, timings and broadcast totals for one cycle."""
+    started_at: int
+    steps: Dict[str, StepResult] = field(default_factory=dict)
+    outgoing: List[Tuple[str, bytes]] = field(default_factory=list)
+    steps_ms: float = 0.0
+    broadcast_ms: float = 0.0
+    duration_ms: float = 0.0
+    peers: int = 0
+    peers_unreachable: int = 0
+    messages_sent: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration_ms, 1),
+            "steps_ms": round(self.steps_ms, 1),
+            "broadcast_ms": round(self.broadcast_ms, 1),
+            "messages_queued": len(self.outgoing),
+            "messages_sent": self.messages_sent,
+            "peers": self.peers,
+            "peers_unreachable": self.peers_unreachable,
+            "steps": {
+                name: {**asdict(r), "duration_ms": round(r.duration_ms, 1)}
+                for name, r in self.steps.items()
+            },
+        }
+
+
+class CyclePipeline:
+    """Runs a step graph over a snapshot and broadcasts the results once."""
+
+    MAX_WORKERS = 4
+
+    def __init__(
+        self,
+        steps: List[CycleStep],
+        send_fn: Callable[[str, bytes], bool],
+        log_fn: Optional[Callable[..., None]] = None,
+        max_workers: Optional[int] = None,
+        pause_fn: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Args:
+            steps: Steps in declaration (and broadcast) order
+            send_fn: Callable(peer_id, msg_bytes) -> bool for sending messages
+            log_fn: Callable(msg, level) for logging
+            max_workers: Steps run concurrently (default MAX_WORKERS)
+            pause_fn: Called between peers in the broadcast phase, e.g. to
+                      let queued RPC requests through
+
+        Raises:
+            ValueError: On duplicate names, unknown dependencies or cycles
+        """
+        self.steps = list(steps)
+        self._by_name = {s.name: s for s in self.steps}
+        if len(self._by_name) != len(self.steps):
+            raise ValueError("Duplicate cycle step names")
+        for step in self.steps:
+            unknown = set(step.waits_for) - set(self._by_name)
+            if unknown:
+                raise ValueError(f"Step {step.name} depends on unknown steps: {sorted(unknown)}")
+        self._check_acyclic()
+
+        self._send_fn = send_fn
+        self._log = log_fn or (lambda msg, level="debug": None)
+        self._max_workers = max_workers or self.MAX_WORKERS
+        # Long-lived so worker threads (and their per-thread DB
+        # connections) survive from one cycle to the next
+        self._pool = ThreadPoolExecutor(max_workers=self._max_workers,
+                                        thread_name_prefix="cl-hive-cycle")
+        self._pause_fn = pause_fn
+        self._last_period: Dict[str, str] = {}
+        self.last_report: Optional[CycleReport] = None
+
+    def shutdown(self) -> None:
+        """Stop the step worker threads (plugin shutdown)."""
+        self._pool.shutdown(wait=False)
+
+    def _check_acyclic(self) -> None:
+        """Reject dependency cycles (depth-first search)."""
+        visiting, done = set(), set()
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Cycle step dependency loop through {name}")
+            visiting.add(name)
+            for dep in self._by_name[name].waits_for:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+
+        for step in self.steps:
+            visit(step.name)
+
+    def run(self, snapshot: CycleSnapshot) -> CycleReport:
+        """
+        Run every step, then broadcast their messages.
+
+        Args:
+            snapshot: Inputs for this cycle
+
+        Returns:
+            CycleReport (also kept as last_report)
+        """
+        started = time.monotonic()
+        report = CycleReport(started_at=snapshot.now)
+        messages = self._run_steps(snapshot, report)
+        report.steps_ms = (time.monotonic() - started) * 1000
+
+        report.outgoing = [(step.name, msg) for step in self.steps
+                           for msg in messages.get(step.name, [])]
+        broadcast_started = time.monotonic()
+        self._broadcast(snapshot, report)
+        report.broadcast_ms = (time.monotonic() - broadcast_started) * 1000
+        report.duration_ms = (time.monotonic() - started) * 1000
+        self.last_report = report
+        return report
+
+    def _run_steps(self, snapshot: CycleSnapshot,
+                   report: CycleReport) -> Dict[str, List[bytes]]:
+        """Schedule steps as their dependencies complete."""
+        results = report.steps
+        messages: Dict[str, List[bytes]] = {}
+        pending = list(self.steps)
+
+        running = {}
+        while pending or running:
+            progressed = False
+            for step in list(pending):
+                if any(dep not in results for dep in step.waits_for):
+                    continue
+                pending.remove(step)
+                progressed = True
+                if any(results[dep].status not in STEP_SATISFIED for dep in step.depends_on):
+                    results[step.name] = StepResult(STEP_SKIPPED)
+                elif step.needs_funds and snapshot.funds_error:
+                    results[step.name] = StepResult(
+                        STEP_SKIPPED, error=f"funds unavailable: {snapshot.funds_error}")
+                elif step.period and self._last_period.get(step.name) == step.period(snapshot.now):
+                    results[step.name] = StepResult(STEP_NOT_DUE)
+                else:
+                    running[self._pool.submit(self._run_step, step, snapshot)] = step
+            if progressed:
+                continue  # Skips may have unblocked further steps
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                step = running.pop(future)
+                result, step_messages = future.result()
+                results[step.name] = result
+                messages[step.name] = step_messages
+                if result.status == STEP_OK and step.period:
+                    self._last_period[step.name] = step.period(snapshot.now)
+        return messages
+
+    def _run_step(self, step: CycleStep,
+                  snapshot: CycleSnapshot) -> Tuple[StepResult, List[bytes]]:
+        """Run one step, capturing its timing and any error."""
+        started = time.monotonic()
+        try:
+            step_messages = [m for m in (step.run(snapshot) or []) if m]
+            result = StepResult(STEP_OK, messages=len(step_messages))
+        except Exception as e:
+            self._log(f"cl-hive: Cycle step {step.name} error: {e}", "warn")
+            step_messages = []
+            result = StepResult(STEP_ERROR, error=str(e))
+        result.duration_ms = (time.monotonic() - started) * 1000
+        return result, step_messages
+
+    def _broadcast(self, snapshot: CycleSnapshot, report: CycleReport) -> None:
+        """Send every queued message, peer by peer."""
+        if not report.outgoing:
+            return
+        targets = snapshot.broadcast_targets
+        report.peers = len(targets)
+        for i, peer_id in enumerate(targets):
+            if i and self._pause_fn:
+                self._pause_fn()
+            for _, msg in report.outgoing:
+                if not self._send_fn(peer_id, msg):
+                    # sendcustommsg only fails for unreachable peers; the
+                    # rest of this cycle's messages would fail the same way
+                    report.peers_unreachable += 1
+                    break
+                report.messages_sent += 1
+
+        counts: Dict[str, int] = {}
+        for name, _ in report.outgoing:
+            counts[name] = counts.get(name, 0) + 1
+        self._log(
+            f"cl-hive: Broadcast {len(report.outgoing)} cycle messages "
+            f"({', '.join(f'{k}={v}' for k, v in counts.items())}) to "
+            f"{report.peers - report.peers_unreachable}/{report.peers} members",
+            "debug"
+        )
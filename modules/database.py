@@ -24,6 +24,34 @@ from typing import Dict, List, Optional, Any, Tuple, Generator
 from pathlib import Path
 
 
+# Per-event contributions summed by the set-based peer event summaries.
+# "{e}" is the row reference: a table alias in the grouped query, NEW in
+# the daily rollup trigger, so both paths count events identically.
+_IS_CLOSE = "substr({e}.event_type, -6) = '_close'"
+PEER_EVENT_SUM_COLUMNS = (
+    ("event_count", "1"),
+    ("open_count", "CASE WHEN {e}.event_type = 'channel_open' THEN 1 ELSE 0 END"),
+    ("close_count", f"CASE WHEN {_IS_CLOSE} THEN 1 ELSE 0 END"),
+    ("remote_close_count", f"CASE WHEN {_IS_CLOSE} AND {{e}}.closer = 'remote' THEN 1 ELSE 0 END"),
+    ("local_close_count", f"CASE WHEN {_IS_CLOSE} AND {{e}}.closer = 'local' THEN 1 ELSE 0 END"),
+    ("mutual_close_count", f"CASE WHEN {_IS_CLOSE} AND {{e}}.closer = 'mutual' THEN 1 ELSE 0 END"),
+    ("total_revenue_sats", f"CASE WHEN {_IS_CLOSE} THEN COALESCE({{e}}.total_revenue_sats, 0) ELSE 0 END"),
+    ("total_rebalance_cost_sats",
+     f"CASE WHEN {_IS_CLOSE} THEN COALESCE({{e}}.total_rebalance_cost_sats, 0) ELSE 0 END"),
+    ("total_net_pnl_sats", f"CASE WHEN {_IS_CLOSE} THEN COALESCE({{e}}.net_pnl_sats, 0) ELSE 0 END"),
+    ("total_forward_count", f"CASE WHEN {_IS_CLOSE} THEN COALESCE({{e}}.forward_count, 0) ELSE 0 END"),
+    ("routing_score_sum", "CASE WHEN {e}.routing_score != 0 THEN {e}.routing_score ELSE 0 END"),
+    ("routing_score_count", "CASE WHEN {e}.routing_score != 0 THEN 1 ELSE 0 END"),
+    ("profitability_score_sum",
+     "CASE WHEN {e}.profitability_score != 0 THEN {e}.profitability_score ELSE 0 END"),
+    ("profitability_score_count", "CASE WHEN {e}.profitability_score != 0 THEN 1 ELSE 0 END"),
+    ("duration_days_sum",
+     f"CASE WHEN {_IS_CLOSE} AND {{e}}.duration_days != 0 THEN {{e}}.duration_days ELSE 0 END"),
+    ("duration_count", f"CASE WHEN {_IS_CLOSE} AND {{e}}.duration_days != 0 THEN 1 ELSE 0 END"),
+)
+SQL_IN_CLAUSE_CHUNK = 500  # ids per IN (...) clause, below SQLite's variable limit
+
+
 class HiveDatabase:
     """
     SQLite database manager for the Hive plugin.
@@ -475,6 +503,33 @@ class HiveDatabase:
             ON peer_events(reporter_id, timestamp DESC)
         """)
 
+        # Covering index for grouped peer event summaries: the summary
+        # query reads every column it needs from the index, not the table
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_peer_events_summary
+            ON peer_events(
+                peer_id, timestamp, reporter_id, event_type, closer,
+                total_revenue_sats, total_rebalance_cost_sats, net_pnl_sats,
+                forward_count, routing_score, profitability_score, duration_days
+            )
+        """)
+
+        # Optional per-peer/per-reporter/per-day rollup of peer_events,
+        # maintained by a trigger once enable_peer_event_rollup() is called
+        sum_columns = ",\n                ".join(
+            f"{name} {'REAL' if name.endswith('score_sum') else 'INTEGER'} DEFAULT 0"
+            for name, _ in PEER_EVENT_SUM_COLUMNS
+        )
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS peer_event_daily (
+                peer_id TEXT NOT NULL,
+                reporter_id TEXT NOT NULL,
+                day INTEGER NOT NULL,
+                {sum_columns},
+                PRIMARY KEY (peer_id, reporter_id, day)
+            )
+        """)
+
         # =====================================================================
         # BUDGET TRACKING TABLE (Phase 6 - Autonomous Mode Limits)
         # =====================================================================
@@ -810,6 +865,11 @@ class HiveDatabase:
             "CREATE INDEX IF NOT EXISTS idx_peer_reputation_reporter "
             "ON peer_reputation(reporter_id)"
         )
+        # Latest report per (peer, reporter) for reputation state loads
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_peer_reputation_latest "
+            "ON peer_reputation(peer_id, reporter_id, timestamp)"
+        )
 
         # =====================================================================
         # ROUTING POOL TABLES (Phase 0 - Collective Economics)
@@ -1082,6 +1142,38 @@ class HiveDatabase:
             )
         """)
 
+        # Settlement payment jobs - durable state for each payment we owe
+        # (see modules/settlement_executor.py for the state machine)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS settlement_payment_jobs (
+                job_id TEXT PRIMARY KEY,
+                proposal_id TEXT NOT NULL,
+                period TEXT NOT NULL,
+                from_peer_id TEXT NOT NULL,
+                to_peer_id TEXT NOT NULL,
+                amount_sats INTEGER NOT NULL,
+                bolt12_offer TEXT,
+                state TEXT NOT NULL,
+                bolt12_invoice TEXT,
+                payment_hash TEXT,
+                invoice_fetched_at INTEGER,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                created_at INTEGER NOT NULL,
+                updated_at INTEGER NOT NULL,
+                settled_at INTEGER
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_settlement_jobs_proposal "
+            "ON settlement_payment_jobs(proposal_id)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_settlement_jobs_state "
+            "ON settlement_payment_jobs(state, next_attempt_at)"
+        )
+
         # Fee reports from hive members - persisted for settlement calculations
         # This stores FEE_REPORT gossip data so it survives restarts
         conn.execute("""
@@ -1535,6 +1627,30 @@ class HiveDatabase:
         
         return {"forwarded": forwarded, "received": received}
     
+    def get_all_contribution_stats(self, window_days: int = 30) -> Dict[str, Dict[str, int]]:
+        """
+        Get contribution totals within the window for every peer in one query.
+
+        Returns:
+            Dict mapping peer_id to forwarded and received totals in sats
+        """
+        conn = self._get_connection()
+        cutoff = int(time.time()) - (window_days * 86400)
+        rows = conn.execute("""
+            SELECT peer_id, direction, SUM(amount_sats) as total
+            FROM contribution_ledger
+            WHERE timestamp > ?
+            GROUP BY peer_id, direction
+        """, (cutoff,)).fetchall()
+
+        stats: Dict[str, Dict[str, int]] = {}
+        for row in rows:
+            if row['direction'] not in ('forwarded', 'received'):
+                continue
+            entry = stats.setdefault(row['peer_id'], {"forwarded": 0, "received": 0})
+            entry[row['direction']] = row['total'] or 0
+        return stats
+
     def get_contribution_ratio(self, peer_id: str, window_days: int = 30) -> float:
         """
         Calculate contribution ratio: forwarded / received.
@@ -2812,85 +2928,174 @@ class HiveDatabase:
             - avg_duration_days: Average channel duration
             - reporters: List of unique hive members who reported
         """
-        conn = self._get_connection()
-        cutoff = int(time.time()) - (days * 86400)
+        return self.get_peer_event_summaries([peer_id], days=days)[peer_id]
 
-        # Get all events for this peer
-        rows = conn.execute("""
-            SELECT * FROM peer_events
-            WHERE peer_id = ? AND timestamp > ?
-            ORDER BY timestamp DESC
-        """, (peer_id, cutoff)).fetchall()
+    @staticmethod
+    def _empty_peer_event_summary(peer_id: str) -> Dict[str, Any]:
+        return {
+            "peer_id": peer_id,
+            "event_count": 0,
+            "open_count": 0,
+            "close_count": 0,
+            "remote_close_count": 0,
+            "local_close_count": 0,
+            "mutual_close_count": 0,
+            "total_revenue_sats": 0,
+            "total_rebalance_cost_sats": 0,
+            "total_net_pnl_sats": 0,
+            "total_forward_count": 0,
+            "avg_routing_score": 0.5,
+            "avg_profitability_score": 0.5,
+            "avg_duration_days": 0,
+            "reporters": []
+        }
 
-        events = [dict(row) for row in rows]
+    @staticmethod
+    def _build_peer_event_summary(peer_id: str, reporter_rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Combine per-reporter partial sums into one peer summary."""
+        totals = {name: sum(row[name] for row in reporter_rows) for name, _ in PEER_EVENT_SUM_COLUMNS}
 
-        if not events:
-            return {
-                "peer_id": peer_id,
-                "event_count": 0,
-                "open_count": 0,
-                "close_count": 0,
-                "remote_close_count": 0,
-                "local_close_count": 0,
-                "mutual_close_count": 0,
-                "total_revenue_sats": 0,
-                "total_rebalance_cost_sats": 0,
-                "total_net_pnl_sats": 0,
-                "total_forward_count": 0,
-                "avg_routing_score": 0.5,
-                "avg_profitability_score": 0.5,
-                "avg_duration_days": 0,
-                "reporters": []
+        reporter_scores = {}
+        for row in reporter_rows:
+            reporter_scores[row["reporter_id"]] = {
+                "event_count": row["event_count"],
+                "avg_routing_score": (row["routing_score_sum"] / row["routing_score_count"]
+                                      if row["routing_score_count"] else 0.5),
+                "avg_profitability_score": (row["profitability_score_sum"] / row["profitability_score_count"]
+                                            if row["profitability_score_count"] else 0.5),
             }
 
-        # Aggregate statistics
-        open_events = [e for e in events if e['event_type'] == 'channel_open']
-        close_events = [e for e in events if e['event_type'].endswith('_close')]
-        remote_closes = [e for e in close_events if e.get('closer') == 'remote']
-        local_closes = [e for e in close_events if e.get('closer') == 'local']
-        mutual_closes = [e for e in close_events if e.get('closer') == 'mutual']
+        return {
+            "peer_id": peer_id,
+            "event_count": totals["event_count"],
+            "open_count": totals["open_count"],
+            "close_count": totals["close_count"],
+            "remote_close_count": totals["remote_close_count"],
+            "local_close_count": totals["local_close_count"],
+            "mutual_close_count": totals["mutual_close_count"],
+            "total_revenue_sats": totals["total_revenue_sats"],
+            "total_rebalance_cost_sats": totals["total_rebalance_cost_sats"],
+            "total_net_pnl_sats": totals["total_net_pnl_sats"],
+            "total_forward_count": totals["total_forward_count"],
+            "avg_routing_score": (totals["routing_score_sum"] / totals["routing_score_count"]
+                                  if totals["routing_score_count"] else 0.5),
+            "avg_profitability_score": (totals["profitability_score_sum"] / totals["profitability_score_count"]
+                                        if totals["profitability_score_count"] else 0.5),
+            "avg_duration_days": (totals["duration_days_sum"] / totals["duration_count"]
+                                  if totals["duration_count"] else 0),
+            "reporters": list(reporter_scores),
+            "reporter_scores": reporter_scores
+        }
 
-        total_revenue = sum(e.get('total_revenue_sats', 0) for e in close_events)
-        total_rebalance = sum(e.get('total_rebalance_cost_sats', 0) for e in close_events)
-        total_pnl = sum(e.get('net_pnl_sats', 0) for e in close_events)
-        total_forwards = sum(e.get('forward_count', 0) for e in close_events)
+    def get_peer_event_summaries(self, peer_ids: Optional[List[str]] = None,
+                                 days: int = 90,
+                                 use_rollup: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Get aggregated event statistics for many peers with grouped queries.
 
-        routing_scores = [e.get('routing_score', 0.5) for e in events if e.get('routing_score')]
-        profit_scores = [e.get('profitability_score', 0.5) for e in events if e.get('profitability_score')]
-        durations = [e.get('duration_days', 0) for e in close_events if e.get('duration_days')]
+        Events are summed per (peer, reporter) in SQLite, served from the
+        idx_peer_events_summary covering index, and combined per peer here;
+        no event rows are loaded into Python. Summaries have the same shape
+        as get_peer_event_summary().
 
-        reporters = list(set(e['reporter_id'] for e in events))
+        Args:
+            peer_ids: Peers to summarize (default: every peer with events)
+            days: Only include events from last N days (default: 90)
+            use_rollup: Read the peer_event_daily rollup instead of raw
+                events. Day-granular: the oldest day in the window is
+                counted whole. Requires enable_peer_event_rollup().
 
-        # Calculate per-reporter scores for disagreement detection
-        reporter_scores = {}
-        for reporter_id in reporters:
-            reporter_events = [e for e in events if e['reporter_id'] == reporter_id]
-            r_routing = [e.get('routing_score', 0.5) for e in reporter_events if e.get('routing_score')]
-            r_profit = [e.get('profitability_score', 0.5) for e in reporter_events if e.get('profitability_score')]
-            reporter_scores[reporter_id] = {
-                "event_count": len(reporter_events),
-                "avg_routing_score": sum(r_routing) / len(r_routing) if r_routing else 0.5,
-                "avg_profitability_score": sum(r_profit) / len(r_profit) if r_profit else 0.5,
-            }
+        Returns:
+            Dict of peer_id -> summary; requested peers without events get
+            an empty summary
+        """
+        conn = self._get_connection()
+        cutoff = int(time.time()) - (days * 86400)
 
-        return {
-            "peer_id": peer_id,
-            "event_count": len(events),
-            "open_count": len(open_events),
-            "close_count": len(close_events),
-            "remote_close_count": len(remote_closes),
-            "local_close_count": len(local_closes),
-            "mutual_close_count": len(mutual_closes),
-            "total_revenue_sats": total_revenue,
-            "total_rebalance_cost_sats": total_rebalance,
-            "total_net_pnl_sats": total_pnl,
-            "total_forward_count": total_forwards,
-            "avg_routing_score": sum(routing_scores) / len(routing_scores) if routing_scores else 0.5,
-            "avg_profitability_score": sum(profit_scores) / len(profit_scores) if profit_scores else 0.5,
-            "avg_duration_days": sum(durations) / len(durations) if durations else 0,
-            "reporters": reporters,
-            "reporter_scores": reporter_scores
+        if use_rollup:
+            selects = ", ".join(f"SUM({name}) AS {name}" for name, _ in PEER_EVENT_SUM_COLUMNS)
+            source = "peer_event_daily WHERE day >= ?"
+            cutoff = cutoff // 86400
+        else:
+            selects = ", ".join(
+                f"SUM({expr.format(e='e')}) AS {name}" for name, expr in PEER_EVENT_SUM_COLUMNS
+            )
+            source = "peer_events AS e WHERE e.timestamp > ?"
+
+        if peer_ids is None:
+            chunks = [None]
+        else:
+            unique_ids = list(dict.fromkeys(peer_ids))
+            chunks = [unique_ids[i:i + SQL_IN_CLAUSE_CHUNK]
+                      for i in range(0, len(unique_ids), SQL_IN_CLAUSE_CHUNK)]
+
+        by_peer: Dict[str, List[Dict[str, Any]]] = {}
+        for chunk in chunks:
+            query = f"SELECT peer_id, reporter_id, {selects} FROM {source}"
+            params: List[Any] = [cutoff]
+            if chunk is not None:
+                query += f" AND peer_id IN ({','.join('?' * len(chunk))})"
+                params.extend(chunk)
+            query += " GROUP BY peer_id, reporter_id"
+            for row in conn.execute(query, params).fetchall():
+                by_peer.setdefault(row["peer_id"], []).append(dict(row))
+
+        summaries = {
+            peer_id: self._build_peer_event_summary(peer_id, rows)
+            for peer_id, rows in by_peer.items()
         }
+        for peer_id in peer_ids or ():
+            if peer_id not in summaries:
+                summaries[peer_id] = self._empty_peer_event_summary(peer_id)
+        return summaries
+
+    def enable_peer_event_rollup(self) -> int:
+        """
+        Start maintaining the peer_event_daily rollup on every insert.
+
+        Rebuilds the rollup from existing events and installs an insert
+        trigger, so both happen atomically. Safe to call repeatedly.
+
+        Returns:
+            Number of rollup rows after the rebuild
+        """
+        names = ", ".join(name for name, _ in PEER_EVENT_SUM_COLUMNS)
+        sums = ", ".join(f"SUM({expr.format(e='e')})" for _, expr in PEER_EVENT_SUM_COLUMNS)
+        values = ", ".join(expr.format(e="NEW") for _, expr in PEER_EVENT_SUM_COLUMNS)
+        updates = ", ".join(f"{name} = {name} + excluded.{name}" for name, _ in PEER_EVENT_SUM_COLUMNS)
+        with self.transaction() as conn:
+            conn.execute("DROP TRIGGER IF EXISTS trg_peer_event_daily")
+            conn.execute("DELETE FROM peer_event_daily")
+            conn.execute(f"""
+                INSERT INTO peer_event_daily (peer_id, reporter_id, day, {names})
+                SELECT e.peer_id, e.reporter_id, e.timestamp / 86400, {sums}
+                FROM peer_events AS e
+                GROUP BY e.peer_id, e.reporter_id, e.timestamp / 86400
+            """)
+            conn.execute(f"""
+                CREATE TRIGGER trg_peer_event_daily AFTER INSERT ON peer_events
+                BEGIN
+                    INSERT INTO peer_event_daily (peer_id, reporter_id, day, {names})
+                    VALUES (NEW.peer_id, NEW.reporter_id, NEW.timestamp / 86400, {values})
+                    ON CONFLICT(peer_id, reporter_id, day) DO UPDATE SET {updates};
+                END
+            """)
+            row = conn.execute("SELECT COUNT(*) AS n FROM peer_event_daily").fetchone()
+        return row["n"]
+
+    def disable_peer_event_rollup(self) -> None:
+        """Stop maintaining the peer_event_daily rollup and clear it."""
+        with self.transaction() as conn:
+            conn.execute("DROP TRIGGER IF EXISTS trg_peer_event_daily")
+            conn.execute("DELETE FROM peer_event_daily")
+
+    def is_peer_event_rollup_enabled(self) -> bool:
+        """Check whether the peer_event_daily rollup is being maintained."""
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'trg_peer_event_daily'"
+        ).fetchone()
+        return row is not None
 
     def get_recent_channel_events(self, event_types: List[str] = None,
                                    days: int = 7, limit: int = 100) -> List[Dict[str, Any]]:
@@ -2968,6 +3173,11 @@ class HiveDatabase:
             (cutoff,)
         )
         deleted = result.rowcount
+        # Rollup days entirely before the cutoff go with their events
+        conn.execute(
+            "DELETE FROM peer_event_daily WHERE day < ?",
+            (cutoff // 86400,)
+        )
         if deleted > 0:
             self.plugin.log(f"Pruned {deleted} old peer events", level='info')
         return deleted
@@ -3724,6 +3934,49 @@ class HiveDatabase:
             now, confidence
         ))
 
+    def update_peer_fee_profiles(self, profiles: List[Dict[str, Any]]) -> int:
+        """
+        Upsert many aggregated fee profiles in one transaction.
+
+        Args:
+            profiles: Dicts with the update_peer_fee_profile() fields
+
+        Returns:
+            Number of profiles written
+        """
+        if not profiles:
+            return 0
+        now = int(time.time())
+        rows = [(
+            p["peer_id"], p["reporter_count"], p["avg_fee_charged"],
+            p["min_fee_charged"], p["max_fee_charged"], p["total_hive_volume"],
+            p["total_hive_revenue"], p["avg_utilization"],
+            p.get("estimated_elasticity", 0.0), p.get("optimal_fee_estimate", 0),
+            now, p.get("confidence", 0.5)
+        ) for p in profiles]
+        with self.transaction() as conn:
+            conn.executemany("""
+                INSERT INTO peer_fee_profiles (
+                    peer_id, reporter_count, avg_fee_charged, min_fee_charged,
+                    max_fee_charged, total_hive_volume, total_hive_revenue,
+                    avg_utilization, estimated_elasticity, optimal_fee_estimate,
+                    last_update, confidence
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(peer_id) DO UPDATE SET
+                    reporter_count = excluded.reporter_count,
+                    avg_fee_charged = excluded.avg_fee_charged,
+                    min_fee_charged = excluded.min_fee_charged,
+                    max_fee_charged = excluded.max_fee_charged,
+                    total_hive_volume = excluded.total_hive_volume,
+                    total_hive_revenue = excluded.total_hive_revenue,
+                    avg_utilization = excluded.avg_utilization,
+                    estimated_elasticity = excluded.estimated_elasticity,
+                    optimal_fee_estimate = excluded.optimal_fee_estimate,
+                    last_update = excluded.last_update,
+                    confidence = excluded.confidence
+            """, rows)
+        return len(rows)
+
     def get_peer_fee_profile(self, peer_id: str) -> Optional[Dict[str, Any]]:
         """
         Get aggregated fee profile for an external peer.
@@ -4318,6 +4571,61 @@ class HiveDatabase:
 
         return results
 
+    def get_max_route_probe_id(self) -> int:
+        """
+        Get the highest route probe row id (snapshot watermark).
+
+        Returns:
+            Max id, or 0 if the table is empty
+        """
+        conn = self._get_connection()
+        row = conn.execute("SELECT MAX(id) AS max_id FROM route_probes").fetchone()
+        return (row["max_id"] or 0) if row else 0
+
+    def get_route_probes_in_id_range(
+        self,
+        after_id: int,
+        up_to_id: int,
+        max_age_hours: int = 24,
+        limit: int = 5000
+    ) -> List[Dict[str, Any]]:
+        """
+        Get route probes with after_id < id <= up_to_id, oldest id first.
+
+        Used to page through probes newer than a snapshot watermark without
+        loading the whole table at once.
+
+        Args:
+            after_id: Exclusive lower id bound
+            up_to_id: Inclusive upper id bound
+            max_age_hours: Maximum age to include
+            limit: Page size
+
+        Returns:
+            List of route probe dicts (with "id")
+        """
+        conn = self._get_connection()
+        cutoff = int(time.time()) - (max_age_hours * 3600)
+
+        rows = conn.execute("""
+            SELECT * FROM route_probes
+            WHERE id > ? AND id <= ? AND timestamp >= ?
+            ORDER BY id ASC
+            LIMIT ?
+        """, (after_id, up_to_id, cutoff, limit)).fetchall()
+
+        results = []
+        for row in rows:
+            probe = dict(row)
+            try:
+                probe["path"] = json.loads(probe.get("path", "[]"))
+            except (json.JSONDecodeError, TypeError):
+                probe["path"] = []
+            probe["success"] = bool(probe.get("success", 0))
+            results.append(probe)
+
+        return results
+
     def get_route_probe_stats(
         self,
         destination: str
@@ -4501,6 +4809,56 @@ class HiveDatabase:
 
         return reports
 
+    def get_latest_peer_reputation_reports(
+        self,
+        max_age_hours: int = 168,
+        peer_ids: Optional[List[str]] = None
+    ) -> list:
+        """
+        Get the most recent reputation report of every reporter for each peer.
+
+        Args:
+            max_age_hours: Maximum age of reports to include
+            peer_ids: Restrict to these peers (default: all peers)
+
+        Returns:
+            List of reputation report dicts, one per (peer, reporter)
+        """
+        conn = self._get_connection()
+        cutoff = int(time.time()) - (max_age_hours * 3600)
+
+        if peer_ids is None:
+            chunks = [None]
+        else:
+            unique_ids = list(dict.fromkeys(peer_ids))
+            chunks = [unique_ids[i:i + SQL_IN_CLAUSE_CHUNK]
+                      for i in range(0, len(unique_ids), SQL_IN_CLAUSE_CHUNK)]
+
+        reports = []
+        for chunk in chunks:
+            where = "timestamp > ?"
+            params: List[Any] = [cutoff]
+            if chunk is not None:
+                where += f" AND peer_id IN ({','.join('?' * len(chunk))})"
+                params.extend(chunk)
+            rows = conn.execute(f"""
+                SELECT * FROM (
+                    SELECT *, ROW_NUMBER() OVER (
+                        PARTITION BY peer_id, reporter_id
+                        ORDER BY timestamp DESC, id DESC
+                    ) AS report_rank
+                    FROM peer_reputation
+                    WHERE {where}
+                ) WHERE report_rank = 1
+            """, params).fetchall()
+            for row in rows:
+                report = dict(row)
+                del report["report_rank"]
+                report["warnings"] = json.loads(report.get("warnings") or "[]")
+                reports.append(report)
+
+        return reports
+
     def get_peer_reputation_reporters(self, peer_id: str) -> list:
         """
         Get list of reporters who have submitted reports for a peer.
@@ -4519,6 +4877,43 @@ class HiveDatabase:
 
         return [row["reporter_id"] for row in rows]
 
+    def get_max_peer_reputation_id(self) -> int:
+        """
+        Get the highest peer reputation row id (snapshot watermark).
+
+        Returns:
+            Max id, or 0 if the table is empty
+        """
+        conn = self._get_connection()
+        row = conn.execute("SELECT MAX(id) AS max_id FROM peer_reputation").fetchone()
+        return (row["max_id"] or 0) if row else 0
+
+    def get_peer_reputation_peers_in_id_range(
+        self,
+        after_id: int,
+        up_to_id: int,
+        max_age_hours: int = 168
+    ) -> List[str]:
+        """
+        Get peers that received reputation reports with after_id < id <= up_to_id.
+
+        Args:
+            after_id: Exclusive lower id bound
+            up_to_id: Inclusive upper id bound
+            max_age_hours: Maximum age of reports to include
+
+        Returns:
+            List of unique peer pubkeys
+        """
+        conn = self._get_connection()
+        cutoff = int(time.time()) - (max_age_hours * 3600)
+        rows = conn.execute("""
+            SELECT DISTINCT peer_id FROM peer_reputation
+            WHERE id > ? AND id <= ? AND timestamp > ?
+        """, (after_id, up_to_id, cutoff)).fetchall()
+
+        return [row["peer_id"] for row in rows]
+
     def cleanup_old_peer_reputation(self, max_age_hours: int = 168) -> int:
         """
         Remove old peer reputation records.
@@ -4674,6 +5069,37 @@ class HiveDatabase:
             self.plugin.log(f"Error recording pool contribution: {e}", level='error')
             return False
 
+    def record_pool_contributions(self, period: str, contributions: List[Dict[str, Any]]) -> int:
+        """
+        Record a whole period's contribution snapshot in one transaction.
+
+        Args:
+            period: Period string (e.g., "2025-W03")
+            contributions: Dicts with the record_pool_contribution() fields
+                           (member_id and the metric columns)
+
+        Returns:
+            Number of rows written
+        """
+        if not contributions:
+            return 0
+        now = int(time.time())
+        rows = [(
+            c["member_id"], period, c["total_capacity_sats"], c["weighted_capacity_sats"],
+            c["uptime_pct"], c["betweenness_centrality"], c["unique_peers"],
+            c["bridge_score"], c["routing_success_rate"], c["avg_response_time_ms"],
+            c["pool_share"], now
+        ) for c in contributions]
+        with self.transaction() as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO pool_contributions
+                (member_id, period, total_capacity_sats, weighted_capacity_sats,
+                 uptime_pct, betweenness_centrality, unique_peers, bridge_score,
+                 routing_success_rate, avg_response_time_ms, pool_share, recorded_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+        return len(rows)
+
     def get_pool_contributions(self, period: str) -> List[Dict[str, Any]]:
         """
         Get all member contributions for a period.
@@ -5655,6 +6081,15 @@ class HiveDatabase:
         """).fetchall()
         return [dict(row) for row in rows]
 
+    def get_all_settlement_proposals(self) -> List[Dict[str, Any]]:
+        """Get every settlement proposal regardless of status, oldest period first."""
+        conn = self._get_connection()
+        rows = conn.execute("""
+            SELECT * FROM settlement_proposals
+            ORDER BY period ASC
+        """).fetchall()
+        return [dict(row) for row in rows]
+
     def get_proposals_needing_rebroadcast(
         self,
         rebroadcast_interval_seconds: int,
@@ -5888,6 +6323,115 @@ class HiveDatabase:
         """, (limit,)).fetchall()
         return [dict(row) for row in rows]
 
+    # Columns a payment job transition may set besides its state
+    SETTLEMENT_JOB_MUTABLE_FIELDS = (
+        "bolt12_offer", "bolt12_invoice", "payment_hash", "invoice_fetched_at",
+        "attempts", "next_attempt_at", "last_error", "settled_at",
+    )
+
+    def add_settlement_payment_jobs(self, jobs: List[Dict[str, Any]]) -> int:
+        """
+        Create settlement payment jobs, ignoring ones that already exist.
+
+        Job ids are deterministic, so re-planning the same proposal is a no-op
+        and never resets a job that is already in progress.
+
+        Args:
+            jobs: Dicts with job_id, proposal_id, period, from_peer_id,
+                  to_peer_id, amount_sats, state and optional bolt12_offer
+
+        Returns:
+            Number of jobs created
+        """
+        now = int(time.time())
+        rows = [
+            (j["job_id"], j["proposal_id"], j["period"], j["from_peer_id"],
+             j["to_peer_id"], int(j["amount_sats"]), j.get("bolt12_offer"),
+             j["state"], now, now)
+            for j in jobs
+        ]
+        with self.transaction() as conn:
+            before = conn.total_changes
+            conn.executemany("""
+                INSERT OR IGNORE INTO settlement_payment_jobs
+                (job_id, proposal_id, period, from_peer_id, to_peer_id,
+                 amount_sats, bolt12_offer, state, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            return conn.total_changes - before
+
+    def get_settlement_payment_jobs(
+        self,
+        proposal_id: Optional[str] = None,
+        states: Optional[List[str]] = None,
+        due_before: Optional[int] = None,
+        limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """
+        Get settlement payment jobs, oldest first.
+
+        Args:
+            proposal_id: Only jobs for this proposal
+            states: Only jobs in one of these states
+            due_before: Only jobs whose next_attempt_at is at or before this time
+            limit: Maximum rows to return
+
+        Returns:
+            List of job dicts
+        """
+        clauses, params = [], []
+        if proposal_id is not None:
+            clauses.append("proposal_id = ?")
+            params.append(proposal_id)
+        if states:
+            clauses.append(f"state IN ({','.join('?' * len(states))})")
+            params.extend(states)
+        if due_before is not None:
+            clauses.append("next_attempt_at <= ?")
+            params.append(due_before)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        conn = self._get_connection()
+        rows = conn.execute(f"""
+            SELECT * FROM settlement_payment_jobs {where}
+            ORDER BY created_at, job_id
+            LIMIT ?
+        """, (*params, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def transition_settlement_payment_job(
+        self,
+        job_id: str,
+        from_states: List[str],
+        to_state: str,
+        **fields: Any
+    ) -> bool:
+        """
+        Move a payment job to a new state if it is still in an expected one.
+
+        The compare-and-set keeps two workers (or a worker and a restarted
+        process) from both advancing the same job.
+
+        Args:
+            job_id: Job to update
+            from_states: States the job must currently be in
+            to_state: New state
+            **fields: Other columns to set (see SETTLEMENT_JOB_MUTABLE_FIELDS)
+
+        Returns:
+            True if the job was updated
+        """
+        unknown = set(fields) - set(self.SETTLEMENT_JOB_MUTABLE_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown payment job fields: {sorted(unknown)}")
+        assignments = ["state = ?", "updated_at = ?"] + [f"{k} = ?" for k in fields]
+        conn = self._get_connection()
+        cursor = conn.execute(f"""
+            UPDATE settlement_payment_jobs
+            SET {', '.join(assignments)}
+            WHERE job_id = ? AND state IN ({','.join('?' * len(from_states))})
+        """, (to_state, int(time.time()), *fields.values(), job_id, *from_states))
+        return cursor.rowcount > 0
+
     def cleanup_expired_settlement_proposals(self) -> int:
         """
         Mark expired settlement proposals as 'expired'.
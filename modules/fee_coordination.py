@@ -12,10 +12,13 @@ This module integrates with cl-revenue-ops for fee execution while
 maintaining coordination at the cl-hive layer.
 """
 
+import heapq
 import math
+import threading
 import time
-from collections import defaultdict
-from dataclasses import dataclass, field
+from collections import OrderedDict, defaultdict
+from collections.abc import MutableMapping
+from dataclasses import dataclass, field, replace
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from . import network_metrics
@@ -39,10 +42,14 @@ MIN_EVAPORATION_RATE = 0.1        # Minimum evaporation
 MAX_EVAPORATION_RATE = 0.9        # Maximum evaporation
 PHEROMONE_EXPLOIT_THRESHOLD = 10.0  # Above this: exploit current fee
 PHEROMONE_DEPOSIT_SCALE = 0.001   # Scale factor for deposits
+PHEROMONE_MIN_LEVEL = 0.01        # At or below this, local pheromone is removed
 
 # Stigmergic markers
 MARKER_HALF_LIFE_HOURS = 24       # Markers decay with 24-hour half-life
 MARKER_MIN_STRENGTH = 0.1         # Below this, markers are ignored
+MARKER_MAX_PER_ROUTE = 50         # Weakest markers evicted beyond this
+MARKER_MAX_ROUTES = 5000          # Least recently marked routes evicted beyond this
+MARKER_REBASE_HALF_LIVES = 32     # Rebase route weights before they grow past 2**32
 
 # Mycelium defense
 DRAIN_RATIO_THRESHOLD = 5.0       # 5:1 outflow ratio = drain attack
@@ -290,6 +297,37 @@ class RouteMarker:
         }
 
 
+@dataclass
+class RouteAggregate:
+    """Current (decayed) summary of the markers on one route."""
+    marker_count: int
+    success_count: int
+    total_strength: float
+    success_strength: float
+    weighted_fee_ppm: float              # Strength-weighted fee over all markers
+    best_success_fee_ppm: Optional[int]  # Fee of the strongest successful marker
+    best_success_strength: float
+    avg_failed_fee_ppm: Optional[float]  # Unweighted mean fee of failed markers
+
+    @property
+    def success_ratio(self) -> float:
+        """Strength-weighted share of successful markers."""
+        if self.total_strength <= 0:
+            return 0.0
+        return self.success_strength / self.total_strength
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "marker_count": self.marker_count,
+            "success_count": self.success_count,
+            "total_strength": round(self.total_strength, 3),
+            "weighted_fee_ppm": round(self.weighted_fee_ppm, 1),
+            "success_ratio": round(self.success_ratio, 3),
+            "best_success_fee_ppm": self.best_success_fee_ppm,
+            "avg_failed_fee_ppm": self.avg_failed_fee_ppm,
+        }
+
+
 @dataclass
 class PeerWarning:
     """
@@ -627,6 +665,137 @@ class FlowCorridorManager:
 # ADAPTIVE FEE CONTROLLER (PHEROMONE-BASED)
 # =============================================================================
 
+class PheromoneStore(MutableMapping):
+    """
+    Local pheromone levels with decay computed on read.
+
+    Each channel keeps (level, reference_time, rate): the level as of
+    reference_time and the hourly evaporation rate in force since then, so
+    the current level is level * (1 - rate) ** hours_since_reference.
+    Readers always see exact values without a periodic sweep. Channels are
+    removed once they decay to PHEROMONE_MIN_LEVEL, driven by a min-heap of
+    projected expiry times; superseded heap entries are skipped lazily.
+
+    Levels written without a reference time (legacy data or direct
+    assignment) do not decay until their next update.
+    """
+
+    def __init__(self):
+        # channel_id -> (level, reference_time, rate, version)
+        self._entries: Dict[str, Tuple[float, Optional[float], float, int]] = {}
+        # (expiry_time, version, channel_id)
+        self._expiry_heap: List[Tuple[float, int, str]] = []
+        self._version = 0
+
+    @staticmethod
+    def _decay(level: float, reference_time: Optional[float], rate: float,
+               now: float) -> float:
+        if reference_time is None or now <= reference_time:
+            return level
+        return level * math.pow(1 - rate, (now - reference_time) / 3600.0)
+
+    def set(self, channel_id: str, level: float,
+            reference_time: Optional[float] = None, rate: float = 0.0) -> None:
+        """
+        Store a channel's level as of reference_time.
+
+        Args:
+            channel_id: Channel to update
+            level: Pheromone level at reference_time
+            reference_time: When the level was exact (None: never decays)
+            rate: Hourly evaporation rate applied from reference_time on
+        """
+        if reference_time is not None and level <= PHEROMONE_MIN_LEVEL:
+            self._entries.pop(channel_id, None)
+            return
+
+        self._version += 1
+        self._entries[channel_id] = (level, reference_time, rate, self._version)
+        if reference_time is None:
+            return
+
+        # Hours until level * (1 - rate) ** h reaches the threshold
+        hours = math.log(PHEROMONE_MIN_LEVEL / level) / math.log(1 - rate)
+        heapq.heappush(self._expiry_heap,
+                       (reference_time + hours * 3600.0, self._version, channel_id))
+        if len(self._expiry_heap) > 2 * len(self._entries) + 64:
+            self._compact()
+
+    def _version_of(self, channel_id: str) -> Optional[int]:
+        entry = self._entries.get(channel_id)
+        return entry[3] if entry else None
+
+    def _compact(self) -> None:
+        """Drop heap entries superseded by later updates."""
+        self._expiry_heap = [
+            item for item in self._expiry_heap
+            if self._version_of(item[2]) == item[1]
+        ]
+        heapq.heapify(self._expiry_heap)
+
+    def level(self, channel_id: str, now: Optional[float] = None) -> float:
+        """Get a channel's exact level at now (0.0 once evaporated)."""
+        entry = self._entries.get(channel_id)
+        if entry is None:
+            return 0.0
+        level, reference_time, rate, _ = entry
+        current = self._decay(level, reference_time, rate,
+                              time.time() if now is None else now)
+        if reference_time is not None and current <= PHEROMONE_MIN_LEVEL:
+            return 0.0
+        return current
+
+    def expire(self, now: Optional[float] = None) -> List[str]:
+        """
+        Remove channels whose pheromone has decayed to the threshold.
+
+        Returns:
+            Channel IDs removed
+        """
+        now = time.time() if now is None else now
+        expired = []
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, version, channel_id = heapq.heappop(self._expiry_heap)
+            if self._version_of(channel_id) == version:
+                del self._entries[channel_id]
+                expired.append(channel_id)
+        return expired
+
+    def levels(self, now: Optional[float] = None) -> Dict[str, float]:
+        """Get all current levels at now (channels past expiry excluded)."""
+        now = time.time() if now is None else now
+        levels = {}
+        for channel_id in self._entries:
+            level = self.level(channel_id, now)
+            if level > 0:
+                levels[channel_id] = level
+        return levels
+
+    def entry(self, channel_id: str) -> Optional[Tuple[float, Optional[float], float]]:
+        """Get the stored (level, reference_time, rate) for a channel."""
+        entry = self._entries.get(channel_id)
+        return entry[:3] if entry else None
+
+    # MutableMapping interface: channel_id -> current level
+
+    def __getitem__(self, channel_id: str) -> float:
+        if channel_id not in self._entries:
+            raise KeyError(channel_id)
+        return self.level(channel_id)
+
+    def __setitem__(self, channel_id: str, level: float) -> None:
+        self.set(channel_id, level)
+
+    def __delitem__(self, channel_id: str) -> None:
+        del self._entries[channel_id]
+
+    def __iter__(self):
+        return iter(list(self.levels()))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class AdaptiveFeeController:
     """
     Fee adjustment inspired by ant colony pheromone dynamics.
@@ -640,15 +809,12 @@ class AdaptiveFeeController:
         self.plugin = plugin
         self.our_pubkey: Optional[str] = None
 
-        # Pheromone levels per channel (fee memory)
-        self._pheromone: Dict[str, float] = defaultdict(float)
+        # Pheromone levels per channel (fee memory), decayed on read
+        self._pheromone = PheromoneStore()
 
         # Track the fee that earned each pheromone level
         self._pheromone_fee: Dict[str, int] = {}
 
-        # Track when each pheromone was last updated (for time-based decay)
-        self._pheromone_last_update: Dict[str, float] = {}
-
         # Map channel_id to peer_id for sharing
         self._channel_peer_map: Dict[str, str] = {}
 
@@ -662,6 +828,10 @@ class AdaptiveFeeController:
         # Network fee volatility tracking
         self._fee_observations: List[Tuple[float, int]] = []  # (timestamp, fee)
 
+        # Forward events, gossip handlers and cycle steps reach this state
+        # from their own threads, and reads pop expired heap entries
+        self._lock = threading.RLock()
+
     def set_our_pubkey(self, pubkey: str) -> None:
         self.our_pubkey = pubkey
 
@@ -714,18 +884,20 @@ class AdaptiveFeeController:
 
     def update_velocity(self, channel_id: str, velocity_pct_per_hour: float) -> None:
         """Update cached velocity for a channel."""
-        self._velocity_cache[channel_id] = velocity_pct_per_hour
-        self._velocity_cache_time[channel_id] = time.time()
+        with self._lock:
+            self._velocity_cache[channel_id] = velocity_pct_per_hour
+            self._velocity_cache_time[channel_id] = time.time()
 
     def record_fee_observation(self, fee_ppm: int) -> None:
         """Record a network fee observation for volatility calculation."""
-        self._fee_observations.append((time.time(), fee_ppm))
+        with self._lock:
+            self._fee_observations.append((time.time(), fee_ppm))
 
-        # Keep only recent observations
-        cutoff = time.time() - 3600
-        self._fee_observations = [
-            (t, f) for t, f in self._fee_observations if t > cutoff
-        ]
+            # Keep only recent observations
+            cutoff = time.time() - 3600
+            self._fee_observations = [
+                (t, f) for t, f in self._fee_observations if t > cutoff
+            ]
 
     def update_pheromone(
         self,
@@ -742,43 +914,38 @@ class AdaptiveFeeController:
         High revenue → stronger deposit
 
         Time-based decay: Pheromone decays exponentially based on time since
-        last update, not just per-call. This ensures idle channels properly
-        lose their pheromone over time.
+        last update, not just per-call. The stored level is rebased to now
+        with the current evaporation rate, which then applies until the
+        next update; readers compute the decay from there.
         """
-        now = time.time()
-        evap_rate = self.calculate_evaporation_rate(channel_id)
-
-        # Apply time-based exponential decay (half-life model)
-        # If no timestamp exists, apply at least one cycle of decay
-        if channel_id in self._pheromone_last_update:
-            last_update = self._pheromone_last_update[channel_id]
-            hours_elapsed = (now - last_update) / 3600.0
-            if hours_elapsed > 0 and self._pheromone[channel_id] > 0:
-                # Convert per-cycle evaporation to continuous decay
-                # If evap_rate = 0.2 means 20% loss per hour, apply proportionally
-                decay_factor = math.pow(1 - evap_rate, hours_elapsed)
-                self._pheromone[channel_id] *= decay_factor
-        elif self._pheromone[channel_id] > 0:
-            # No timestamp but has pheromone - apply one cycle of decay
-            # This handles legacy data and ensures evaporation on failure
-            self._pheromone[channel_id] *= (1 - evap_rate)
-
-        # Update timestamp
-        self._pheromone_last_update[channel_id] = now
-
-        if routing_success:
-            # Deposit proportional to revenue
-            deposit = revenue_sats * PHEROMONE_DEPOSIT_SCALE
-            self._pheromone[channel_id] += deposit
-
-            # Track the fee that earned this pheromone
-            self._pheromone_fee[channel_id] = current_fee
+        with self._lock:
+            now = time.time()
+            evap_rate = self.calculate_evaporation_rate(channel_id)
 
-            self._log(
-                f"Channel {channel_id[:8]}: pheromone deposit {deposit:.2f}, "
-                f"total now {self._pheromone[channel_id]:.2f}",
-                level="debug"
-            )
+            entry = self._pheromone.entry(channel_id)
+            level = self._pheromone.level(channel_id, now)
+            if entry is not None and entry[1] is None and level > 0:
+                # No timestamp but has pheromone - apply one cycle of decay
+                # This handles legacy data and ensures evaporation on failure
+                level *= (1 - evap_rate)
+
+            if routing_success:
+                # Deposit proportional to revenue
+                deposit = revenue_sats * PHEROMONE_DEPOSIT_SCALE
+                level += deposit
+
+                # Track the fee that earned this pheromone
+                self._pheromone_fee[channel_id] = current_fee
+
+                self._log(
+                    f"Channel {channel_id[:8]}: pheromone deposit {deposit:.2f}, "
+                    f"total now {level:.2f}",
+                    level="debug"
+                )
+
+            self._pheromone.set(channel_id, level, now, evap_rate)
+            if channel_id not in self._pheromone:
+                self._pheromone_fee.pop(channel_id, None)
 
     def suggest_fee(
         self,
@@ -791,7 +958,8 @@ class AdaptiveFeeController:
 
         Returns (suggested_fee, reason)
         """
-        pheromone = self._pheromone.get(channel_id, 0)
+        with self._lock:
+            pheromone = self._pheromone.level(channel_id)
 
         if pheromone > PHEROMONE_EXPLOIT_THRESHOLD:
             # Strong signal - exploit current fee
@@ -812,11 +980,14 @@ class AdaptiveFeeController:
 
     def get_pheromone_level(self, channel_id: str) -> float:
         """Get current pheromone level for a channel."""
-        return self._pheromone.get(channel_id, 0.0)
+        with self._lock:
+            return self._pheromone.level(channel_id)
 
     def get_all_pheromone_levels(self) -> Dict[str, float]:
-        """Get all pheromone levels."""
-        return dict(self._pheromone)
+        """Get all current pheromone levels."""
+        with self._lock:
+            self._expire_pheromones()
+            return self._pheromone.levels()
 
     def set_channel_peer_mapping(self, channel_id: str, peer_id: str) -> None:
         """
@@ -825,7 +996,8 @@ class AdaptiveFeeController:
         This is needed for sharing pheromones - we share by peer_id
         so other members with channels to the same peer can learn.
         """
-        self._channel_peer_map[channel_id] = peer_id
+        with self._lock:
+            self._channel_peer_map[channel_id] = peer_id
 
     def update_channel_peer_mappings(self, channels: List[Dict[str, Any]]) -> None:
         """
@@ -834,11 +1006,12 @@ class AdaptiveFeeController:
         Args:
             channels: List of channel dicts with 'short_channel_id' and 'peer_id'
         """
-        for ch in channels:
-            channel_id = ch.get("short_channel_id")
-            peer_id = ch.get("peer_id")
-            if channel_id and peer_id:
-                self._channel_peer_map[channel_id] = peer_id
+        with self._lock:
+            for ch in channels:
+                channel_id = ch.get("short_channel_id")
+                peer_id = ch.get("peer_id")
+                if channel_id and peer_id:
+                    self._channel_peer_map[channel_id] = peer_id
 
     def get_shareable_pheromones(
         self,
@@ -863,39 +1036,41 @@ class AdaptiveFeeController:
         Returns:
             List of pheromone dicts ready for serialization
         """
-        exclude_peer_ids = exclude_peer_ids or set()
-        shareable = []
+        with self._lock:
+            exclude_peer_ids = exclude_peer_ids or set()
+            shareable = []
 
-        for channel_id, level in self._pheromone.items():
-            # Check level threshold
-            if level < min_level:
-                continue
+            self._expire_pheromones()
+            for channel_id, level in self._pheromone.levels().items():
+                # Check level threshold
+                if level < min_level:
+                    continue
 
-            # Get the fee that earned this pheromone
-            fee_ppm = self._pheromone_fee.get(channel_id)
-            if fee_ppm is None:
-                continue
+                # Get the fee that earned this pheromone
+                fee_ppm = self._pheromone_fee.get(channel_id)
+                if fee_ppm is None:
+                    continue
 
-            # Get peer_id for this channel
-            peer_id = self._channel_peer_map.get(channel_id)
-            if not peer_id:
-                continue
+                # Get peer_id for this channel
+                peer_id = self._channel_peer_map.get(channel_id)
+                if not peer_id:
+                    continue
 
-            # Skip hive members
-            if peer_id in exclude_peer_ids:
-                continue
+                # Skip hive members
+                if peer_id in exclude_peer_ids:
+                    continue
 
-            shareable.append({
-                "peer_id": peer_id,
-                "level": round(level, 3),
-                "fee_ppm": fee_ppm,
-                "channel_id": channel_id
-            })
+                shareable.append({
+                    "peer_id": peer_id,
+                    "level": round(level, 3),
+                    "fee_ppm": fee_ppm,
+                    "channel_id": channel_id
+                })
 
-        # Sort by level descending (strongest signals first)
-        shareable.sort(key=lambda x: -x["level"])
+            # Sort by level descending (strongest signals first)
+            shareable.sort(key=lambda x: -x["level"])
 
-        return shareable[:max_pheromones]
+            return shareable[:max_pheromones]
 
     def receive_pheromone_from_gossip(
         self,
@@ -918,31 +1093,32 @@ class AdaptiveFeeController:
         Returns:
             True if stored successfully
         """
-        peer_id = pheromone_data.get("peer_id")
-        if not peer_id:
-            return False
+        with self._lock:
+            peer_id = pheromone_data.get("peer_id")
+            if not peer_id:
+                return False
 
-        level = pheromone_data.get("level", 0)
-        fee_ppm = pheromone_data.get("fee_ppm", 0)
+            level = pheromone_data.get("level", 0)
+            fee_ppm = pheromone_data.get("fee_ppm", 0)
 
-        if level <= 0 or fee_ppm <= 0:
-            return False
+            if level <= 0 or fee_ppm <= 0:
+                return False
 
-        # Store remote pheromone, keyed by the external peer
-        entry = {
-            "reporter_id": reporter_id,
-            "level": level,
-            "fee_ppm": fee_ppm,
-            "timestamp": time.time(),
-            "weight": weighting_factor
-        }
+            # Store remote pheromone, keyed by the external peer
+            entry = {
+                "reporter_id": reporter_id,
+                "level": level,
+                "fee_ppm": fee_ppm,
+                "timestamp": time.time(),
+                "weight": weighting_factor
+            }
 
-        # Keep only recent reports per peer (last 10)
-        self._remote_pheromones[peer_id].append(entry)
-        if len(self._remote_pheromones[peer_id]) > 10:
-            self._remote_pheromones[peer_id] = self._remote_pheromones[peer_id][-10:]
+            # Keep only recent reports per peer (last 10)
+            self._remote_pheromones[peer_id].append(entry)
+            if len(self._remote_pheromones[peer_id]) > 10:
+                self._remote_pheromones[peer_id] = self._remote_pheromones[peer_id][-10:]
 
-        return True
+            return True
 
     def get_fleet_fee_hint(self, peer_id: str) -> Optional[Tuple[int, float]]:
         """
@@ -956,109 +1132,232 @@ class AdaptiveFeeController:
         Returns:
             Tuple of (suggested_fee_ppm, confidence) or None if no data
         """
-        reports = self._remote_pheromones.get(peer_id, [])
-        if not reports:
-            return None
+        with self._lock:
+            reports = self._remote_pheromones.get(peer_id, [])
+            if not reports:
+                return None
 
-        # Filter to recent reports (last 24 hours)
-        now = time.time()
-        recent = [r for r in reports if now - r.get("timestamp", 0) < 86400]
+            # Filter to recent reports (last 24 hours)
+            now = time.time()
+            recent = [r for r in reports if now - r.get("timestamp", 0) < 86400]
 
-        if not recent:
-            return None
+            if not recent:
+                return None
 
-        # Weight by level and recency
-        total_weight = 0
-        weighted_fee = 0
+            # Weight by level and recency
+            total_weight = 0
+            weighted_fee = 0
 
-        for r in recent:
-            age_hours = (now - r.get("timestamp", now)) / 3600
-            recency_weight = max(0.1, 1.0 - (age_hours / 24))
-            level_weight = r.get("level", 0) / 10  # Normalize level
-            weight = recency_weight * level_weight * r.get("weight", 0.3)
+            for r in recent:
+                age_hours = (now - r.get("timestamp", now)) / 3600
+                recency_weight = max(0.1, 1.0 - (age_hours / 24))
+                level_weight = r.get("level", 0) / 10  # Normalize level
+                weight = recency_weight * level_weight * r.get("weight", 0.3)
 
-            weighted_fee += r.get("fee_ppm", 0) * weight
-            total_weight += weight
+                weighted_fee += r.get("fee_ppm", 0) * weight
+                total_weight += weight
 
-        if total_weight < 0.1:
-            return None
+            if total_weight < 0.1:
+                return None
 
-        suggested_fee = int(weighted_fee / total_weight)
-        confidence = min(1.0, total_weight)
+            suggested_fee = int(weighted_fee / total_weight)
+            confidence = min(1.0, total_weight)
 
-        return (suggested_fee, confidence)
+            return (suggested_fee, confidence)
 
     def get_all_fleet_hints(self) -> Dict[str, Tuple[int, float]]:
         """Get fee hints for all peers with remote pheromone data."""
-        hints = {}
-        for peer_id in self._remote_pheromones:
-            hint = self.get_fleet_fee_hint(peer_id)
-            if hint:
-                hints[peer_id] = hint
-        return hints
+        with self._lock:
+            hints = {}
+            for peer_id in self._remote_pheromones:
+                hint = self.get_fleet_fee_hint(peer_id)
+                if hint:
+                    hints[peer_id] = hint
+            return hints
 
     def cleanup_old_remote_pheromones(self, max_age_hours: float = 48) -> int:
         """Remove old remote pheromone data."""
-        cutoff = time.time() - (max_age_hours * 3600)
-        cleaned = 0
-
-        for peer_id in list(self._remote_pheromones.keys()):
-            before = len(self._remote_pheromones[peer_id])
-            self._remote_pheromones[peer_id] = [
-                r for r in self._remote_pheromones[peer_id]
-                if r.get("timestamp", 0) > cutoff
-            ]
-            cleaned += before - len(self._remote_pheromones[peer_id])
-
-            # Remove empty entries
-            if not self._remote_pheromones[peer_id]:
-                del self._remote_pheromones[peer_id]
-
-        return cleaned
+        with self._lock:
+            cutoff = time.time() - (max_age_hours * 3600)
+            cleaned = 0
+
+            for peer_id in list(self._remote_pheromones.keys()):
+                before = len(self._remote_pheromones[peer_id])
+                self._remote_pheromones[peer_id] = [
+                    r for r in self._remote_pheromones[peer_id]
+                    if r.get("timestamp", 0) > cutoff
+                ]
+                cleaned += before - len(self._remote_pheromones[peer_id])
+
+                # Remove empty entries
+                if not self._remote_pheromones[peer_id]:
+                    del self._remote_pheromones[peer_id]
+
+            return cleaned
+
+    def _expire_pheromones(self, now: Optional[float] = None) -> List[str]:
+        """Drop channels whose pheromone has decayed to the threshold."""
+        expired = self._pheromone.expire(now)
+        for channel_id in expired:
+            self._pheromone_fee.pop(channel_id, None)
+        return expired
 
     def evaporate_all_pheromones(self) -> int:
         """
-        Apply time-based decay to ALL local pheromones.
+        Remove local pheromones that have decayed below PHEROMONE_MIN_LEVEL.
 
-        Called periodically from maintenance loop to ensure idle channels
-        properly lose their pheromone over time, even if they haven't routed.
+        Decay is computed on read, so this no longer rewrites any levels;
+        it only pops due entries from the expiry heap. Readers run it
+        themselves, so no periodic call is needed.
 
         Returns:
-            Number of channels that had pheromone evaporated
+            Number of channels removed
         """
-        now = time.time()
-        evaporated = 0
-        min_pheromone = 0.01  # Below this, remove entirely
-
-        for channel_id in list(self._pheromone.keys()):
-            if self._pheromone[channel_id] <= 0:
-                continue
-
-            last_update = self._pheromone_last_update.get(channel_id, now)
-            hours_elapsed = (now - last_update) / 3600.0
+        with self._lock:
+            return len(self._expire_pheromones())
 
-            if hours_elapsed > 0:
-                evap_rate = self.calculate_evaporation_rate(channel_id)
-                decay_factor = math.pow(1 - evap_rate, hours_elapsed)
-                old_level = self._pheromone[channel_id]
-                self._pheromone[channel_id] *= decay_factor
-                self._pheromone_last_update[channel_id] = now
+    def export_snapshot_state(self) -> Dict[str, List[Any]]:
+        """Export local pheromones in columnar form for the intel snapshot."""
+        with self._lock:
+            columns: Dict[str, List[Any]] = {
+                "channel_id": [], "level": [], "fee_ppm": [], "last_update": [], "rate": [],
+            }
+            self._expire_pheromones()
+            for channel_id in list(self._pheromone.levels()):
+                level, reference_time, rate = self._pheromone.entry(channel_id)
+                if level <= 0:
+                    continue
+                columns["channel_id"].append(channel_id)
+                columns["level"].append(level)
+                columns["fee_ppm"].append(self._pheromone_fee.get(channel_id))
+                columns["last_update"].append(reference_time)
+                columns["rate"].append(rate)
+            return columns
 
-                if old_level > min_pheromone and self._pheromone[channel_id] <= min_pheromone:
-                    # Pheromone dropped below threshold, clean up
-                    del self._pheromone[channel_id]
-                    self._pheromone_fee.pop(channel_id, None)
-                    self._pheromone_last_update.pop(channel_id, None)
+    def restore_snapshot_state(self, columns: Dict[str, List[Any]]) -> int:
+        """
+        Restore local pheromones from a snapshot.
 
-                evaporated += 1
+        Levels are restored as of their recorded last update, so decay
+        since then is applied on read. Snapshots without a rate column use
+        the current evaporation rate.
 
-        return evaporated
+        Returns:
+            Number of channels restored
+        """
+        with self._lock:
+            restored = 0
+            rates = columns.get("rate")
+            for i, channel_id in enumerate(columns.get("channel_id", [])):
+                rate = rates[i] if rates else None
+                if rate is None:
+                    rate = self.calculate_evaporation_rate(channel_id)
+                self._pheromone.set(channel_id, columns["level"][i],
+                                    columns["last_update"][i], rate)
+                if columns["fee_ppm"][i] is not None and channel_id in self._pheromone:
+                    self._pheromone_fee[channel_id] = columns["fee_ppm"][i]
+                restored += 1
+            return restored
 
 
 # =============================================================================
 # STIGMERGIC FEE COORDINATION
 # =============================================================================
 
+def _marker_expiry(marker: RouteMarker) -> float:
+    """Time at which a marker's strength decays to MARKER_MIN_STRENGTH."""
+    if marker.strength <= MARKER_MIN_STRENGTH:
+        return marker.timestamp
+    return marker.timestamp + (
+        MARKER_HALF_LIFE_HOURS * 3600 * math.log2(marker.strength / MARKER_MIN_STRENGTH)
+    )
+
+
+class RouteMarkerSet:
+    """
+    Markers for one (source, destination) route with a running aggregate.
+
+    Stored markers keep their deposit strength. All markers decay with the
+    same half-life, so each is weighted by strength * 2 ** (age offset)
+    relative to a per-route reference time: the common decay factor
+    cancels out of ratios, the strongest marker never changes rank as time
+    passes, and current totals need a single factor at read time.
+    """
+
+    def __init__(self, reference_time: float):
+        self.reference_time = reference_time
+        # seq -> (marker, weight), in insertion order
+        self.markers: Dict[int, Tuple[RouteMarker, float]] = {}
+        self._recompute()
+
+    def _weight(self, marker: RouteMarker) -> float:
+        offset = (marker.timestamp - self.reference_time) / (MARKER_HALF_LIFE_HOURS * 3600)
+        return marker.strength * math.pow(2, offset)
+
+    def _recompute(self) -> None:
+        self.total_weight = 0.0
+        self.fee_weight = 0.0
+        self.success_weight = 0.0
+        self.success_count = 0
+        self.failed_fee_sum = 0
+        self.best_success_seq: Optional[int] = None
+        for seq, (marker, weight) in self.markers.items():
+            self._accumulate(seq, marker, weight)
+
+    def _accumulate(self, seq: int, marker: RouteMarker, weight: float) -> None:
+        self.total_weight += weight
+        self.fee_weight += weight * marker.fee_ppm
+        if marker.success:
+            self.success_weight += weight
+            self.success_count += 1
+            if self.best_success_seq is None or weight > self.markers[self.best_success_seq][1]:
+                self.best_success_seq = seq
+        else:
+            self.failed_fee_sum += marker.fee_ppm
+
+    def add(self, seq: int, marker: RouteMarker) -> None:
+        """Add a marker, rebasing weights if its time offset grows too large."""
+        horizon = MARKER_REBASE_HALF_LIVES * MARKER_HALF_LIFE_HOURS * 3600
+        if marker.timestamp - self.reference_time > horizon:
+            self.reference_time = marker.timestamp
+            self.markers = {
+                s: (m, self._weight(m)) for s, (m, _) in self.markers.items()
+            }
+            self._recompute()
+        weight = self._weight(marker)
+        self.markers[seq] = (marker, weight)
+        self._accumulate(seq, marker, weight)
+
+    def remove(self, seq: int) -> None:
+        """Remove a marker; the aggregate is rebuilt exactly (bounded by the cap)."""
+        del self.markers[seq]
+        self._recompute()
+
+    def weakest(self) -> int:
+        """Sequence number of the marker that will expire first."""
+        return min(self.markers, key=lambda s: self.markers[s][1])
+
+    def decay_factor(self, now: float) -> float:
+        age_half_lives = (now - self.reference_time) / (MARKER_HALF_LIFE_HOURS * 3600)
+        return math.pow(2, -age_half_lives)
+
+    def aggregate(self, now: float) -> RouteAggregate:
+        """Summarize the route as of now without touching individual markers."""
+        factor = self.decay_factor(now)
+        best = self.markers[self.best_success_seq] if self.best_success_seq is not None else None
+        failed_count = len(self.markers) - self.success_count
+        return RouteAggregate(
+            marker_count=len(self.markers),
+            success_count=self.success_count,
+            total_strength=self.total_weight * factor,
+            success_strength=self.success_weight * factor,
+            weighted_fee_ppm=self.fee_weight / self.total_weight if self.total_weight > 0 else 0.0,
+            best_success_fee_ppm=best[0].fee_ppm if best else None,
+            best_success_strength=best[1] * factor if best else 0.0,
+            avg_failed_fee_ppm=self.failed_fee_sum / failed_count if failed_count else None,
+        )
+
+
 class StigmergicCoordinator:
     """
     Fleet members coordinate fees by observing each other's
@@ -1073,8 +1372,19 @@ class StigmergicCoordinator:
         self.state_manager = state_manager
         self.our_pubkey: Optional[str] = None
 
-        # Route markers (in-memory, also persisted via gossip)
-        self._markers: Dict[Tuple[str, str], List[RouteMarker]] = defaultdict(list)
+        # Route markers (in-memory, also persisted via gossip), least
+        # recently marked route first
+        self._markers: "OrderedDict[Tuple[str, str], RouteMarkerSet]" = OrderedDict()
+        self._marker_count = 0
+        self._marker_seq = 0
+
+        # (expiry_time, seq, route) for every stored marker; entries for
+        # evicted markers are skipped when popped
+        self._expiry_queue: List[Tuple[float, int, Tuple[str, str]]] = []
+
+        # Deposits, gossip and sharing run on different threads, and every
+        # read expires markers, so all access goes through this lock
+        self._lock = threading.RLock()
 
     def set_our_pubkey(self, pubkey: str) -> None:
         self.our_pubkey = pubkey
@@ -1108,11 +1418,7 @@ class StigmergicCoordinator:
             strength=volume_sats / 100_000  # Larger payments = stronger signal
         )
 
-        key = (source, destination)
-        self._markers[key].append(marker)
-
-        # Prune old markers
-        self._prune_markers(key)
+        self._store_marker(marker)
 
         self._log(
             f"Deposited marker: {source[:8]}->{destination[:8]} "
@@ -1122,13 +1428,70 @@ class StigmergicCoordinator:
 
         return marker
 
-    def _prune_markers(self, key: Tuple[str, str]) -> None:
-        """Remove expired markers."""
-        now = time.time()
-        self._markers[key] = [
-            m for m in self._markers[key]
-            if self._calculate_marker_strength(m, now) > MARKER_MIN_STRENGTH
-        ]
+    def _store_marker(self, marker: RouteMarker, now: Optional[float] = None) -> bool:
+        """
+        Add a marker to its route, enforcing the expiry and size caps.
+
+        Returns:
+            True if stored, False if already below MARKER_MIN_STRENGTH or
+            it was the route's weakest marker and evicted by the size cap
+        """
+        with self._lock:
+            now = time.time() if now is None else now
+            self._expire_markers(now)
+            expiry = _marker_expiry(marker)
+            if expiry <= now:
+                return False
+
+            key = (marker.source_peer_id, marker.destination_peer_id)
+            route = self._markers.get(key)
+            if route is None:
+                if len(self._markers) >= MARKER_MAX_ROUTES:
+                    _, evicted = self._markers.popitem(last=False)
+                    self._marker_count -= len(evicted.markers)
+                route = self._markers[key] = RouteMarkerSet(now)
+            else:
+                self._markers.move_to_end(key)
+
+            self._marker_seq += 1
+            route.add(self._marker_seq, marker)
+            self._marker_count += 1
+            heapq.heappush(self._expiry_queue, (expiry, self._marker_seq, key))
+
+            stored = True
+            if len(route.markers) > MARKER_MAX_PER_ROUTE:
+                weakest = route.weakest()
+                route.remove(weakest)
+                self._marker_count -= 1
+                stored = weakest != self._marker_seq
+            if len(self._expiry_queue) > 2 * self._marker_count + 64:
+                self._expiry_queue = [
+                    item for item in self._expiry_queue
+                    if item[2] in self._markers and item[1] in self._markers[item[2]].markers
+                ]
+                heapq.heapify(self._expiry_queue)
+            return stored
+
+    def _expire_markers(self, now: Optional[float] = None) -> int:
+        """
+        Remove markers that have decayed to MARKER_MIN_STRENGTH.
+
+        Returns:
+            Number of markers removed
+        """
+        now = time.time() if now is None else now
+        removed = 0
+        while self._expiry_queue and self._expiry_queue[0][0] <= now:
+            _, seq, key = heapq.heappop(self._expiry_queue)
+            route = self._markers.get(key)
+            if route is None or seq not in route.markers:
+                continue
+            route.remove(seq)
+            self._marker_count -= 1
+            removed += 1
+            if not route.markers:
+                del self._markers[key]
+        return removed
 
     def _calculate_marker_strength(self, marker: RouteMarker, now: float) -> float:
         """Calculate current strength of a marker (decays over time)."""
@@ -1136,24 +1499,38 @@ class StigmergicCoordinator:
         decay = math.exp(-age_hours * math.log(2) / MARKER_HALF_LIFE_HOURS)
         return marker.strength * decay
 
+    def _current_markers(self, route: RouteMarkerSet, now: float) -> List[RouteMarker]:
+        """Copies of a route's markers carrying their current strength."""
+        return [
+            replace(m, strength=self._calculate_marker_strength(m, now))
+            for m, _ in route.markers.values()
+        ]
+
     def read_markers(self, source: str, destination: str) -> List[RouteMarker]:
         """
         Read markers left by other fleet members for this route.
-        """
-        key = (source, destination)
-        markers = self._markers.get(key, [])
 
-        now = time.time()
-        result = []
+        Returns copies with their current (decayed) strength; stored markers
+        keep their deposit strength, so reads never compound the decay.
+        """
+        with self._lock:
+            now = time.time()
+            self._expire_markers(now)
+            route = self._markers.get((source, destination))
+            return self._current_markers(route, now) if route else []
 
-        for m in markers:
-            # Update strength based on decay
-            current_strength = self._calculate_marker_strength(m, now)
-            if current_strength > MARKER_MIN_STRENGTH:
-                m.strength = current_strength
-                result.append(m)
+    def get_route_aggregate(self, source: str, destination: str) -> Optional[RouteAggregate]:
+        """
+        Get the current marker summary for a route.
 
-        return result
+        Returns:
+            RouteAggregate, or None if the route has no active markers
+        """
+        with self._lock:
+            now = time.time()
+            self._expire_markers(now)
+            route = self._markers.get((source, destination))
+            return route.aggregate(now) if route else None
 
     def calculate_coordinated_fee(
         self,
@@ -1164,31 +1541,26 @@ class StigmergicCoordinator:
         """
         Set fee based on stigmergic signals from fleet.
 
+        Uses the route aggregate, so the cost does not depend on the
+        number of markers.
+
         Returns (recommended_fee, confidence)
         """
-        markers = self.read_markers(source, destination)
+        aggregate = self.get_route_aggregate(source, destination)
 
-        if not markers:
+        if aggregate is None:
             return default_fee, 0.3  # No signals, low confidence
 
-        # Separate successful and failed markers
-        successful = [m for m in markers if m.success]
-        failed = [m for m in markers if not m.success]
-
-        if successful:
-            # Find strongest successful marker
-            best = max(successful, key=lambda m: m.strength)
-
-            # Don't undercut successful fleet member
-            recommended = max(FLEET_FEE_FLOOR_PPM, best.fee_ppm)
-            confidence = min(0.9, 0.5 + best.strength * 0.1)
+        if aggregate.success_count:
+            # Don't undercut the strongest successful fleet member
+            recommended = max(FLEET_FEE_FLOOR_PPM, aggregate.best_success_fee_ppm)
+            confidence = min(0.9, 0.5 + aggregate.best_success_strength * 0.1)
 
             return recommended, confidence
 
-        if failed:
+        if aggregate.avg_failed_fee_ppm is not None:
             # All failures - try lower or avoid
-            avg_failed_fee = sum(m.fee_ppm for m in failed) / len(failed)
-            recommended = max(FLEET_FEE_FLOOR_PPM, int(avg_failed_fee * 0.8))
+            recommended = max(FLEET_FEE_FLOOR_PPM, int(aggregate.avg_failed_fee_ppm * 0.8))
             confidence = 0.4
 
             return recommended, confidence
@@ -1209,9 +1581,7 @@ class StigmergicCoordinator:
                 strength=marker_data.get("strength", 1.0)
             )
 
-            key = (marker.source_peer_id, marker.destination_peer_id)
-            self._markers[key].append(marker)
-            self._prune_markers(key)
+            self._store_marker(marker)
 
             return marker
         except (KeyError, TypeError) as e:
@@ -1219,18 +1589,14 @@ class StigmergicCoordinator:
             return None
 
     def get_all_markers(self) -> List[RouteMarker]:
-        """Get all active markers."""
-        result = []
-        now = time.time()
-
-        for markers in self._markers.values():
-            for m in markers:
-                current_strength = self._calculate_marker_strength(m, now)
-                if current_strength > MARKER_MIN_STRENGTH:
-                    m.strength = current_strength
-                    result.append(m)
-
-        return result
+        """Get all active markers, with their current strength."""
+        with self._lock:
+            now = time.time()
+            self._expire_markers(now)
+            result = []
+            for route in self._markers.values():
+                result.extend(self._current_markers(route, now))
+            return result
 
     def get_shareable_markers(
         self,
@@ -1257,43 +1623,89 @@ class StigmergicCoordinator:
         Returns:
             List of marker dicts ready for serialization
         """
-        now = time.time()
-        max_age_secs = max_age_hours * 3600
-        shareable = []
-
-        for markers in self._markers.values():
-            for m in markers:
-                # Only share our own markers
-                if m.depositor != our_pubkey:
-                    continue
+        with self._lock:
+            now = time.time()
+            max_age_secs = max_age_hours * 3600
+            shareable = []
+
+            self._expire_markers(now)
+            for route in self._markers.values():
+                for m, _ in route.markers.values():
+                    # Only share our own markers
+                    if m.depositor != our_pubkey:
+                        continue
+
+                    # Check age
+                    age = now - m.timestamp
+                    if age > max_age_secs:
+                        continue
+
+                    # Check strength
+                    current_strength = self._calculate_marker_strength(m, now)
+                    if current_strength < min_strength:
+                        continue
+
+                    shareable.append({
+                        "source_peer_id": m.source_peer_id,
+                        "destination_peer_id": m.destination_peer_id,
+                        "fee_ppm": m.fee_ppm,
+                        "success": m.success,
+                        "volume_sats": m.volume_sats,
+                        "timestamp": m.timestamp,
+                        "strength": round(current_strength, 3)
+                    })
+
+            # Sort by: success first, then by strength (descending), then by timestamp (newest)
+            shareable.sort(
+                key=lambda x: (not x["success"], -x["strength"], -x["timestamp"])
+            )
 
-                # Check age
-                age = now - m.timestamp
-                if age > max_age_secs:
-                    continue
+            # Limit to max_markers
+            return shareable[:max_markers]
 
-                # Check strength
-                current_strength = self._calculate_marker_strength(m, now)
-                if current_strength < min_strength:
-                    continue
+    def export_snapshot_state(self) -> Dict[str, List[Any]]:
+        """
+        Export route markers in columnar form for the intel snapshot.
 
-                shareable.append({
-                    "source_peer_id": m.source_peer_id,
-                    "destination_peer_id": m.destination_peer_id,
-                    "fee_ppm": m.fee_ppm,
-                    "success": m.success,
-                    "volume_sats": m.volume_sats,
-                    "timestamp": m.timestamp,
-                    "strength": round(current_strength, 3)
-                })
+        Markers are written with their deposit strength and timestamp, so
+        decay resumes from the same point on restore.
+        """
+        with self._lock:
+            fields = [
+                "depositor", "source_peer_id", "destination_peer_id", "fee_ppm",
+                "success", "volume_sats", "timestamp", "strength",
+            ]
+            columns: Dict[str, List[Any]] = {f: [] for f in fields}
+            self._expire_markers()
+            for route in list(self._markers.values()):
+                for m, _ in list(route.markers.values()):
+                    for f in fields:
+                        columns[f].append(getattr(m, f))
+            return columns
 
-        # Sort by: success first, then by strength (descending), then by timestamp (newest)
-        shareable.sort(
-            key=lambda x: (not x["success"], -x["strength"], -x["timestamp"])
-        )
+    def restore_snapshot_state(self, columns: Dict[str, List[Any]]) -> int:
+        """
+        Restore route markers from a snapshot, dropping expired ones.
 
-        # Limit to max_markers
-        return shareable[:max_markers]
+        Returns:
+            Number of markers restored
+        """
+        now = time.time()
+        restored = 0
+        for i, depositor in enumerate(columns.get("depositor", [])):
+            marker = RouteMarker(
+                depositor=depositor,
+                source_peer_id=columns["source_peer_id"][i],
+                destination_peer_id=columns["destination_peer_id"][i],
+                fee_ppm=columns["fee_ppm"][i],
+                success=columns["success"][i],
+                volume_sats=columns["volume_sats"][i],
+                timestamp=columns["timestamp"][i],
+                strength=columns["strength"][i],
+            )
+            if self._store_marker(marker, now):
+                restored += 1
+        return restored
 
 
 # =============================================================================
@@ -9,9 +9,12 @@ Implements cooperative fee coordination through:
 Author: Lightning Goats Team
 """
 
+import heapq
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 from modules.protocol import (
     HiveMessageType,
@@ -51,6 +54,10 @@ HEALTH_STRUGGLING = 25
 ELASTICITY_VERY_ELASTIC = -0.5
 ELASTICITY_SOMEWHAT_ELASTIC = 0.0
 
+# Fee profile aggregation
+FEE_PROFILE_WINDOW_HOURS = 24  # Reports older than this drop out of profiles
+CONFIDENCE_REFRESH_DELTA = 0.05  # Rewrite unchanged profiles once freshness moves this much
+
 
 # =============================================================================
 # DATA CLASSES
@@ -87,6 +94,286 @@ class MemberHealth:
     can_help_others: bool
 
 
+# =============================================================================
+# INCREMENTAL FEE PROFILE AGGREGATION
+# =============================================================================
+
+class _ReportContribution(NamedTuple):
+    """What one fee intelligence report adds to its target peer's profile."""
+    reporter_id: str
+    timestamp: int
+    fee_ppm: int
+    volume_sats: int
+    revenue_sats: int
+    utilization_pct: float
+    elasticity_point: Optional[float]
+    forward_count: int
+
+
+@dataclass
+class PeerFeeAccumulator:
+    """Running sums over the in-window reports for one target peer."""
+    report_count: int = 0
+    fee_counts: Counter = field(default_factory=Counter)  # fee_ppm -> reports (fees > 0)
+    fee_sum: int = 0
+    volume_sum: int = 0
+    revenue_sum: int = 0
+    utilization_sum: float = 0.0
+    elasticity_sum: float = 0.0
+    elasticity_count: int = 0
+    timestamp_sum: int = 0
+    forward_sum: int = 0
+    reporters: Counter = field(default_factory=Counter)  # reporter_id -> reports
+
+    def apply(self, c: _ReportContribution, sign: int) -> None:
+        """Add (sign=1) or retire (sign=-1) one report's contribution."""
+        self.report_count += sign
+        if c.fee_ppm > 0:
+            self.fee_counts[c.fee_ppm] += sign
+            if self.fee_counts[c.fee_ppm] <= 0:
+                del self.fee_counts[c.fee_ppm]
+            self.fee_sum += sign * c.fee_ppm
+        self.volume_sum += sign * c.volume_sats
+        self.revenue_sum += sign * c.revenue_sats
+        self.utilization_sum += sign * c.utilization_pct
+        if c.elasticity_point is not None:
+            self.elasticity_sum += sign * c.elasticity_point
+            self.elasticity_count += sign
+        self.timestamp_sum += sign * c.timestamp
+        self.forward_sum += sign * c.forward_count
+        self.reporters[c.reporter_id] += sign
+        if self.reporters[c.reporter_id] <= 0:
+            del self.reporters[c.reporter_id]
+        if self.elasticity_count == 0:
+            self.elasticity_sum = 0.0  # Drop accumulated float error
+        if self.report_count == 0:
+            self.utilization_sum = 0.0
+
+
+class FeeProfileAggregator:
+    """
+    Incremental per-peer aggregation of fee intelligence reports.
+
+    Keeps running sums, fee min/max counters and reporter sets for every
+    target peer over a sliding window. Reports are added as they arrive and
+    retired through a time-ordered eviction queue, so the cost of each
+    aggregation pass tracks new and expiring reports instead of the whole
+    window. Peers whose profile changed are tracked as dirty until taken.
+
+    The window is primed once from the database (see ensure_loaded());
+    reports seen before that are picked up by the initial load.
+
+    Thread Safety:
+    - add() runs on the message thread, aggregation on the fee intelligence
+      loop; all state is guarded by a single lock
+    """
+
+    def __init__(self, window_hours: int = FEE_PROFILE_WINDOW_HOURS):
+        """
+        Args:
+            window_hours: Age after which a report no longer counts
+        """
+        self.window_seconds = window_hours * 3600
+        self.loaded = False
+        self._lock = threading.Lock()
+        self._peers: Dict[str, PeerFeeAccumulator] = {}
+        self._queue: List[Tuple[int, int, str, _ReportContribution]] = []  # min-heap on timestamp
+        self._seq = 0
+        self._dirty: set = set()
+        self._loaded_through_id = 0  # Highest report id covered by the initial load
+
+    @staticmethod
+    def _contribution(report: Dict[str, Any]) -> _ReportContribution:
+        """Extract a report's contribution, mirroring the full-window formulas."""
+        our_fee = report.get("our_fee_ppm") or 0
+        fee_change = report.get("last_fee_change_ppm") or 0
+        elasticity_point = None
+        # Same rule as FeeIntelligenceManager._estimate_elasticity()
+        if fee_change != 0 and our_fee > 0:
+            elasticity_point = -(report.get("volume_delta_pct") or 0.0) / (fee_change / our_fee)
+        return _ReportContribution(
+            reporter_id=report.get("reporter_id"),
+            timestamp=int(report.get("timestamp") or 0),
+            fee_ppm=our_fee,
+            volume_sats=report.get("forward_volume_sats") or 0,
+            revenue_sats=report.get("revenue_sats") or 0,
+            utilization_pct=report.get("utilization_pct") or 0.0,
+            elasticity_point=elasticity_point,
+            forward_count=report.get("forward_count") or 0,
+        )
+
+    def _add_locked(self, report: Dict[str, Any], cutoff: int) -> bool:
+        peer_id = report.get("target_peer_id")
+        if not peer_id:
+            return False
+        c = self._contribution(report)
+        if c.timestamp < cutoff:
+            return False
+        self._peers.setdefault(peer_id, PeerFeeAccumulator()).apply(c, 1)
+        self._seq += 1
+        heapq.heappush(self._queue, (c.timestamp, self._seq, peer_id, c))
+        self._dirty.add(peer_id)
+        return True
+
+    def ensure_loaded(self, fetch_window: Callable[[], List[Dict[str, Any]]]) -> bool:
+        """
+        Prime the window from stored reports if not done yet.
+
+        Args:
+            fetch_window: Returns all stored reports inside the window
+
+        Returns:
+            True if this call performed the load
+        """
+        with self._lock:
+            if self.loaded:
+                return False
+            # Fetch under the lock so concurrent add() calls either land in
+            # the fetched rows or are applied after the load
+            reports = fetch_window()
+            cutoff = int(time.time()) - self.window_seconds
+            self._peers.clear()
+            self._queue.clear()
+            self._dirty.clear()
+            for report in reports:
+                self._add_locked(report, cutoff)
+            self._loaded_through_id = max(
+                (r.get("id") or 0 for r in reports), default=0
+            )
+            self.loaded = True
+            return True
+
+    def add(self, report: Dict[str, Any], report_id: Optional[int] = None) -> bool:
+        """
+        Add one newly stored report.
+
+        Ignored until the window has been loaded, since the load will read
+        the report from the database.
+
+        Args:
+            report: Report fields as passed to store_fee_intelligence()
+            report_id: Row id returned by store_fee_intelligence()
+
+        Returns:
+            True if the report was counted
+        """
+        with self._lock:
+            if not self.loaded:
+                return False
+            if isinstance(report_id, int) and 0 < report_id <= self._loaded_through_id:
+                return False  # Already counted by the initial load
+            return self._add_locked(report, int(time.time()) - self.window_seconds)
+
+    def expire(self, now: Optional[int] = None) -> int:
+        """
+        Retire reports that have aged out of the window.
+
+        Args:
+            now: Current time (defaults to time.time())
+
+        Returns:
+            Number of reports retired
+        """
+        cutoff = int(now if now is not None else time.time()) - self.window_seconds
+        retired = 0
+        with self._lock:
+            while self._queue and self._queue[0][0] < cutoff:
+                _, _, peer_id, c = heapq.heappop(self._queue)
+                acc = self._peers[peer_id]
+                acc.apply(c, -1)
+                if acc.report_count == 0:
+                    del self._peers[peer_id]
+                    self._dirty.discard(peer_id)  # Nothing left to write
+                else:
+                    self._dirty.add(peer_id)
+                retired += 1
+        return retired
+
+    @staticmethod
+    def _stats(acc: PeerFeeAccumulator, now: int) -> Dict[str, Any]:
+        fee_count = sum(acc.fee_counts.values())
+        if fee_count:
+            avg_fee = acc.fee_sum / fee_count
+            min_fee = min(acc.fee_counts)
+            max_fee = max(acc.fee_counts)
+        else:
+            avg_fee = DEFAULT_BASE_FEE
+            min_fee = 0
+            max_fee = 0
+        elasticity = 0.0
+        if acc.elasticity_count:
+            elasticity = max(-1.0, min(1.0, acc.elasticity_sum / acc.elasticity_count))
+        return {
+            "reporter_count": len(acc.reporters),
+            "report_count": acc.report_count,
+            "avg_fee_charged": avg_fee,
+            "min_fee_charged": min_fee,
+            "max_fee_charged": max_fee,
+            "total_hive_volume": acc.volume_sum,
+            "total_hive_revenue": acc.revenue_sum,
+            "avg_utilization": acc.utilization_sum / acc.report_count,
+            "estimated_elasticity": elasticity,
+            "avg_age_hours": (now - acc.timestamp_sum / acc.report_count) / 3600,
+            "total_forwards": acc.forward_sum,
+        }
+
+    def take_dirty(self, now: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Return statistics for every changed peer and clear the dirty set.
+
+        Args:
+            now: Current time used for report ages (defaults to time.time())
+
+        Returns:
+            Dict of peer_id -> aggregate statistics
+        """
+        now = int(now if now is not None else time.time())
+        with self._lock:
+            dirty = {
+                peer_id: self._stats(self._peers[peer_id], now)
+                for peer_id in self._dirty if peer_id in self._peers
+            }
+            self._dirty.clear()
+        return dirty
+
+    def all_stats(self, now: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Statistics for every peer in the window, without touching dirty state.
+
+        Args:
+            now: Current time used for report ages (defaults to time.time())
+
+        Returns:
+            Dict of peer_id -> aggregate statistics
+        """
+        now = int(now if now is not None else time.time())
+        with self._lock:
+            return {peer_id: self._stats(acc, now) for peer_id, acc in self._peers.items()}
+
+    def mark_dirty(self, peer_ids) -> None:
+        """Queue peers for another write (e.g. after a failed flush)."""
+        with self._lock:
+            self._dirty.update(p for p in peer_ids if p in self._peers)
+
+    def peer_stats(self, peer_id: str, now: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Current statistics for one peer, or None if it has no reports."""
+        with self._lock:
+            acc = self._peers.get(peer_id)
+            if acc is None:
+                return None
+            return self._stats(acc, int(now if now is not None else time.time()))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Aggregator size for diagnostics."""
+        with self._lock:
+            return {
+                "loaded": self.loaded,
+                "peers": len(self._peers),
+                "reports": len(self._queue),
+                "dirty": len(self._dirty),
+            }
+
+
 # =============================================================================
 # FEE INTELLIGENCE MANAGER
 # =============================================================================
@@ -129,6 +416,10 @@ class FeeIntelligenceManager:
         self._fee_intel_snapshot_rate: Dict[str, List[int]] = {}
         self._health_report_rate: Dict[str, List[int]] = {}
 
+        # Incremental per-peer fee profile state (see aggregate_fee_profiles)
+        self._profile_aggregator = FeeProfileAggregator()
+        self._written_confidence: Dict[str, float] = {}  # peer_id -> last written confidence
+
     def _log(self, msg: str, level: str = "info") -> None:
         """Log a message if plugin is available."""
         if self.plugin:
@@ -330,7 +621,7 @@ class FeeIntelligenceManager:
             if not peer_id:
                 continue
 
-            self.db.store_fee_intelligence(
+            report = dict(
                 reporter_id=reporter_id,
                 target_peer_id=peer_id,
                 timestamp=timestamp,
@@ -346,6 +637,8 @@ class FeeIntelligenceManager:
                 volume_delta_pct=peer.get("volume_delta_pct", 0.0),
                 days_observed=peer.get("days_observed", 1)
             )
+            report_id = self.db.store_fee_intelligence(**report)
+            self._profile_aggregator.add(report, report_id)
             stored_count += 1
 
         self._log(
@@ -361,83 +654,83 @@ class FeeIntelligenceManager:
 
     def aggregate_fee_profiles(self) -> int:
         """
-        Aggregate all fee intelligence into peer fee profiles.
+        Write peer fee profiles that changed since the last aggregation.
 
-        Calculates averages, estimates elasticity, and determines
-        optimal fee recommendations.
+        Per-peer sums are maintained incrementally as fee intelligence is
+        stored (see FeeProfileAggregator); this pass retires reports older
+        than FEE_PROFILE_WINDOW_HOURS, derives elasticity, optimal fee and
+        confidence for each changed peer, and writes all of them in one
+        batched transaction. Peers without new or expired reports are only
+        rewritten once their confidence has aged by CONFIDENCE_REFRESH_DELTA.
+        The first call loads the window from the database.
 
         Returns:
             Number of profiles updated
         """
-        # Get all recent fee intelligence
-        intel_reports = self.db.get_all_fee_intelligence(max_age_hours=24)
-
-        # Group by target peer
-        by_peer: Dict[str, List[Dict[str, Any]]] = {}
-        for report in intel_reports:
-            peer_id = report.get("target_peer_id")
-            if peer_id not in by_peer:
-                by_peer[peer_id] = []
-            by_peer[peer_id].append(report)
-
-        updated = 0
-        for peer_id, reports in by_peer.items():
-            if not reports:
+        aggregator = self._profile_aggregator
+        aggregator.ensure_loaded(
+            lambda: self.db.get_all_fee_intelligence(max_age_hours=FEE_PROFILE_WINDOW_HOURS)
+        )
+        retired = aggregator.expire()
+        dirty = aggregator.take_dirty()
+
+        # Unchanged peers only need a rewrite once report ageing has moved
+        # their confidence noticeably
+        pending = {}
+        window_stats = aggregator.all_stats()
+        for peer_id, stats in window_stats.items():
+            if peer_id in dirty:
                 continue
-
-            # Get unique reporters
-            reporters = list(set(r.get("reporter_id") for r in reports))
-
-            # Calculate fee statistics
-            fees = [r.get("our_fee_ppm", 0) for r in reports if r.get("our_fee_ppm", 0) > 0]
-            if fees:
-                avg_fee = sum(fees) / len(fees)
-                min_fee = min(fees)
-                max_fee = max(fees)
-            else:
-                avg_fee = DEFAULT_BASE_FEE
-                min_fee = 0
-                max_fee = 0
-
-            # Calculate volume and revenue totals
-            total_volume = sum(r.get("forward_volume_sats", 0) for r in reports)
-            total_revenue = sum(r.get("revenue_sats", 0) for r in reports)
-
-            # Calculate average utilization
-            utils = [r.get("utilization_pct", 0) for r in reports]
-            avg_util = sum(utils) / len(utils) if utils else 0
-
-            # Estimate elasticity from volume delta observations
-            elasticity = self._estimate_elasticity(reports)
-
-            # Calculate optimal fee estimate
-            optimal_fee = self._calculate_optimal_fee(
-                avg_fee=avg_fee,
-                elasticity=elasticity,
-                reporter_count=len(reporters)
+            confidence = self._confidence_score(
+                stats["reporter_count"], stats["avg_age_hours"], stats["total_forwards"]
             )
+            written = self._written_confidence.get(peer_id)
+            if written is None or abs(confidence - written) >= CONFIDENCE_REFRESH_DELTA:
+                pending[peer_id] = stats
+        for peer_id in set(self._written_confidence) - set(window_stats):
+            del self._written_confidence[peer_id]  # Left the window
+        pending.update(dirty)
+        if not pending:
+            return 0
+
+        profiles = []
+        for peer_id, stats in pending.items():
+            reporter_count = stats["reporter_count"]
+            profiles.append({
+                "peer_id": peer_id,
+                "reporter_count": reporter_count,
+                "avg_fee_charged": stats["avg_fee_charged"],
+                "min_fee_charged": stats["min_fee_charged"],
+                "max_fee_charged": stats["max_fee_charged"],
+                "total_hive_volume": stats["total_hive_volume"],
+                "total_hive_revenue": stats["total_hive_revenue"],
+                "avg_utilization": stats["avg_utilization"],
+                "estimated_elasticity": stats["estimated_elasticity"],
+                "optimal_fee_estimate": self._calculate_optimal_fee(
+                    avg_fee=stats["avg_fee_charged"],
+                    elasticity=stats["estimated_elasticity"],
+                    reporter_count=reporter_count
+                ),
+                "confidence": self._confidence_score(
+                    reporter_count, stats["avg_age_hours"], stats["total_forwards"]
+                ),
+            })
 
-            # Calculate confidence based on reporter count and data freshness
-            confidence = self._calculate_confidence(reports, len(reporters))
-
-            # Update the profile in database
-            self.db.update_peer_fee_profile(
-                peer_id=peer_id,
-                reporter_count=len(reporters),
-                avg_fee_charged=avg_fee,
-                min_fee_charged=min_fee,
-                max_fee_charged=max_fee,
-                total_hive_volume=total_volume,
-                total_hive_revenue=total_revenue,
-                avg_utilization=avg_util,
-                estimated_elasticity=elasticity,
-                optimal_fee_estimate=optimal_fee,
-                confidence=confidence
-            )
-            updated += 1
+        try:
+            self.db.update_peer_fee_profiles(profiles)
+        except Exception:
+            # Keep the peers queued so the next pass retries them
+            aggregator.mark_dirty(dirty)
+            raise
+        for profile in profiles:
+            self._written_confidence[profile["peer_id"]] = profile["confidence"]
 
-        self._log(f"Aggregated {updated} peer fee profiles from {len(intel_reports)} reports")
-        return updated
+        window = aggregator.get_stats()
+        self._log(
+            f"Aggregated {len(profiles)} changed peer fee profiles "
+            f"({window['reports']} reports in window, {retired} expired)"
+        )
+        return len(profiles)
 
     def _estimate_elasticity(self, reports: List[Dict[str, Any]]) -> float:
         """
@@ -537,17 +830,37 @@ class FeeIntelligenceManager:
         if not reports:
             return 0.0
 
+        now = int(time.time())
+        ages = [(now - r.get("timestamp", now)) / 3600 for r in reports]  # hours
+        avg_age_hours = sum(ages) / len(ages) if ages else 24
+        total_forwards = sum(r.get("forward_count", 0) for r in reports)
+
+        return self._confidence_score(reporter_count, avg_age_hours, total_forwards)
+
+    @staticmethod
+    def _confidence_score(
+        reporter_count: int,
+        avg_age_hours: float,
+        total_forwards: int
+    ) -> float:
+        """
+        Combine reporter count, freshness and volume into a confidence score.
+
+        Args:
+            reporter_count: Number of unique reporters
+            avg_age_hours: Average report age in hours
+            total_forwards: Forwards across all reports
+
+        Returns:
+            Confidence score (0-1)
+        """
         # Reporter count factor (3+ reporters = full confidence from this factor)
         reporter_factor = min(1.0, reporter_count / 3.0)
 
         # Freshness factor (average age, newer is better)
-        now = int(time.time())
-        ages = [(now - r.get("timestamp", now)) / 3600 for r in reports]  # hours
-        avg_age_hours = sum(ages) / len(ages) if ages else 24
         freshness_factor = max(0.0, 1.0 - (avg_age_hours / 24))  # Decay over 24h
 
         # Volume factor (more observations = higher confidence)
-        total_forwards = sum(r.get("forward_count", 0) for r in reports)
         volume_factor = min(1.0, total_forwards / 100)  # 100+ forwards = full
 
         # Weighted average
@@ -1147,7 +1460,7 @@ class FeeIntelligenceManager:
 
         # Store using our own pubkey as reporter
         # Use "local" signature to distinguish from remote reports
-        observation_id = self.db.store_fee_intelligence(
+        report = dict(
             reporter_id=self.our_pubkey or "local",
             target_peer_id=target_peer_id,
             timestamp=timestamp,
@@ -1163,6 +1476,8 @@ class FeeIntelligenceManager:
             volume_delta_pct=0.0,
             days_observed=1
         )
+        observation_id = self.db.store_fee_intelligence(**report)
+        self._profile_aggregator.add(report, observation_id)
 
         self._log(
             f"Stored local observation for {target_peer_id[:16]}... "
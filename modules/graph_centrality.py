@@ -0,0 +1,696 @@
+"""
+Graph Centrality Module
+
+Computes real centrality metrics over the public Lightning graph
+(listchannels) for hive members:
+- Approximate betweenness (Brandes with sampled sources)
+- Harmonic closeness for each member
+- Marginal closeness gain of adding a channel member -> candidate
+
+The graph is stored as CSR arrays (offsets + targets) so traversals are
+plain integer indexing. Heavy computation runs in a separate worker
+process (this file executed as a script) so the plugin's threads and the
+GIL are never held for the tens of seconds a mainnet-size graph needs.
+
+Results are cached per graph epoch (hash of the undirected edge set).
+When only a small fraction of edges changed since the last run, the
+previous betweenness is reused and only closeness / gains are recomputed.
+
+Consumers (planner, network metrics, positioning) must treat every getter
+as optional: None means "not computed yet", fall back to heuristics.
+
+Offline benchmark on a listchannels dump:
+    python3 modules/graph_centrality.py --fixture listchannels.json[.gz]
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+BETWEENNESS_SAMPLES = 256             # Brandes source samples per full run
+MAX_GAIN_CANDIDATES = 200             # Candidate endpoints evaluated per run
+MAX_REQUESTED_CANDIDATES = 500        # Cap on externally requested candidates
+WORKER_TIMEOUT_SECONDS = 300          # Kill the worker process after this
+
+# Incremental update: reuse betweenness if few edges changed since last run
+INCREMENTAL_MAX_CHANGE_PCT = 0.02     # <= 2% of edges added/removed
+MAX_BETWEENNESS_AGE_SECONDS = 6 * 3600  # Full recompute at least this often
+
+
+# =============================================================================
+# GRAPH
+# =============================================================================
+
+@dataclass
+class ChannelGraph:
+    """
+    Undirected public channel graph in CSR form.
+
+    Parallel channels between the same pair of nodes collapse to one edge;
+    centrality only depends on topology.
+    """
+    node_ids: List[str]
+    index: Dict[str, int]
+    offsets: array
+    targets: array
+    edge_keys: Set[Tuple[str, str]]
+    epoch: str
+    built_at: int = 0
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.edge_keys)
+
+    def degree(self, node_id: str) -> Optional[int]:
+        """Number of distinct channel peers, None if node is not in the graph."""
+        i = self.index.get(node_id)
+        if i is None:
+            return None
+        return self.offsets[i + 1] - self.offsets[i]
+
+    @classmethod
+    def from_edges(cls, edge_keys: Set[Tuple[str, str]]) -> "ChannelGraph":
+        """Build CSR arrays from a set of (a, b) node pairs with a < b."""
+        node_ids = sorted({n for edge in edge_keys for n in edge})
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        n = len(node_ids)
+
+        degree = [0] * n
+        pairs = []
+        for a, b in edge_keys:
+            u, v = index[a], index[b]
+            degree[u] += 1
+            degree[v] += 1
+            pairs.append((u, v))
+
+        offsets = array('i', [0]) * (n + 1)
+        for i in range(n):
+            offsets[i + 1] = offsets[i] + degree[i]
+
+        cursor = list(offsets[:n])
+        targets = array('i', [0]) * offsets[n]
+        for u, v in pairs:
+            targets[cursor[u]] = v
+            cursor[u] += 1
+            targets[cursor[v]] = u
+            cursor[v] += 1
+
+        digest = hashlib.sha256()
+        for a, b in sorted(edge_keys):
+            digest.update(f"{a}:{b};".encode())
+
+        return cls(
+            node_ids=node_ids,
+            index=index,
+            offsets=offsets,
+            targets=targets,
+            edge_keys=edge_keys,
+            epoch=digest.hexdigest()[:16],
+            built_at=int(time.time()),
+        )
+
+    @classmethod
+    def from_listchannels(cls, channels: Iterable[Dict[str, Any]]) -> "ChannelGraph":
+        """
+        Build the graph from listchannels entries.
+
+        Each channel appears once per direction; a channel is kept if any
+        direction is active.
+        """
+        edge_keys: Set[Tuple[str, str]] = set()
+        for ch in channels:
+            source = ch.get('source')
+            dest = ch.get('destination')
+            if not source or not dest or source == dest:
+                continue
+            if not ch.get('active', True):
+                continue
+            edge_keys.add((source, dest) if source < dest else (dest, source))
+        return cls.from_edges(edge_keys)
+
+
+def load_graph_fixture(path: str) -> ChannelGraph:
+    """
+    Load a graph from a saved `listchannels` JSON dump (optionally gzipped).
+
+    Args:
+        path: File containing {"channels": [...]} or a bare list
+
+    Returns:
+        ChannelGraph
+    """
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt') as f:
+        data = json.load(f)
+    channels = data.get('channels', []) if isinstance(data, dict) else data
+    return ChannelGraph.from_listchannels(channels)
+
+
+# =============================================================================
+# ALGORITHMS (run inside the worker process)
+# =============================================================================
+
+def _bfs_distances(offsets, targets, n: int, source: int) -> List[int]:
+    """Hop distances from source; unreachable nodes get n + 1."""
+    unreachable = n + 1
+    dist = [unreachable] * n
+    dist[source] = 0
+    frontier = [source]
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for v in frontier:
+            for w in targets[offsets[v]:offsets[v + 1]]:
+                if dist[w] == unreachable:
+                    dist[w] = depth
+                    next_frontier.append(w)
+        frontier = next_frontier
+    return dist
+
+
+def sampled_betweenness(offsets, targets, n: int, sources: List[int]) -> List[float]:
+    """
+    Brandes betweenness accumulated from a sample of sources.
+
+    Predecessor lists are not materialized: during accumulation the
+    predecessors of w are the neighbours one hop closer to the source.
+
+    Returns:
+        Betweenness per node index, extrapolated to all sources and
+        normalized to [0, 1] by (n - 1)(n - 2).
+    """
+    bc = [0.0] * n
+    if n < 3 or not sources:
+        return bc
+
+    for s in sources:
+        dist = [-1] * n
+        sigma = [0] * n
+        dist[s] = 0
+        sigma[s] = 1
+        order = [s]
+        i = 0
+        while i < len(order):
+            v = order[i]
+            i += 1
+            dv = dist[v] + 1
+            sv = sigma[v]
+            for w in targets[offsets[v]:offsets[v + 1]]:
+                dw = dist[w]
+                if dw < 0:
+                    dist[w] = dv
+                    sigma[w] = sv
+                    order.append(w)
+                elif dw == dv:
+                    sigma[w] += sv
+
+        delta = [0.0] * n
+        for w in reversed(order):
+            prev = dist[w] - 1
+            coeff = (1.0 + delta[w]) / sigma[w]
+            for v in targets[offsets[w]:offsets[w + 1]]:
+                if dist[v] == prev:
+                    delta[v] += sigma[v] * coeff
+            if w != s:
+                bc[w] += delta[w]
+
+    scale = (n / len(sources)) / ((n - 1) * (n - 2))
+    return [b * scale for b in bc]
+
+
+def _inverse_table(n: int) -> List[float]:
+    """inv[d] = 1/d for 1 <= d <= n, 0 for d == 0 and unreachable (n + 1)."""
+    return [0.0] + [1.0 / d for d in range(1, n + 1)] + [0.0]
+
+
+def harmonic_closeness(dist: List[int], inv: List[float]) -> float:
+    """Harmonic closeness (mean of 1/d over all other nodes)."""
+    n = len(dist)
+    if n < 2:
+        return 0.0
+    return sum(inv[d] for d in dist) / (n - 1)
+
+
+def edge_closeness_gain(dist_member: List[int], dist_candidate: List[int],
+                        inv: List[float]) -> float:
+    """
+    Harmonic closeness gained by the member if it opened a channel to the
+    candidate: every node's distance becomes min(d_m, 1 + d_c).
+    """
+    n = len(dist_member)
+    if n < 2:
+        return 0.0
+    gain = sum(
+        inv[dc + 1] - inv[dm]
+        for dm, dc in zip(dist_member, dist_candidate)
+        if dc + 1 < dm
+    )
+    return gain / (n - 1)
+
+
+def run_centrality_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Execute one centrality job on index-based CSR data.
+
+    Args:
+        job: {"n", "offsets", "targets", "members", "candidates",
+              "samples", "seed", "skip_betweenness"}
+
+    Returns:
+        {"betweenness": [..] or None, "closeness": {idx: value},
+         "gains": [[member_idx, candidate_idx, gain], ...], "duration_ms"}
+    """
+    start = time.time()
+    n = job["n"]
+    offsets = list(job["offsets"])
+    targets = list(job["targets"])
+
+    betweenness = None
+    if not job.get("skip_betweenness"):
+        rnd = random.Random(job.get("seed", 0))
+        k = min(n, job.get("samples", BETWEENNESS_SAMPLES))
+        sources = list(range(n)) if k >= n else rnd.sample(range(n), k)
+        betweenness = sampled_betweenness(offsets, targets, n, sources)
+
+    inv = _inverse_table(n)
+    member_dist = {
+        m: _bfs_distances(offsets, targets, n, m) for m in job.get("members", [])
+    }
+    closeness = {m: harmonic_closeness(d, inv) for m, d in member_dist.items()}
+
+    gains = []
+    for c in job.get("candidates", []):
+        dist_c = _bfs_distances(offsets, targets, n, c)
+        for m, dist_m in member_dist.items():
+            if m != c:
+                gains.append([m, c, edge_closeness_gain(dist_m, dist_c, inv)])
+
+    return {
+        "betweenness": betweenness,
+        "closeness": closeness,
+        "gains": gains,
+        "duration_ms": int((time.time() - start) * 1000),
+    }
+
+
+# =============================================================================
+# RESULTS
+# =============================================================================
+
+@dataclass
+class CentralityResult:
+    """Centrality values for one graph epoch."""
+    epoch: str
+    computed_at: int
+    duration_ms: int
+    num_nodes: int
+    num_edges: int
+    betweenness: Dict[str, float] = field(default_factory=dict)
+    betweenness_computed_at: int = 0
+    closeness: Dict[str, float] = field(default_factory=dict)
+    edge_gains: Dict[Tuple[str, str], float] = field(default_factory=dict)
+    incremental: bool = False
+
+
+# =============================================================================
+# ENGINE
+# =============================================================================
+
+class GraphCentralityEngine:
+    """
+    Owns the current graph epoch and its centrality results.
+
+    update_graph() is cheap on the caller's thread (CSR build + hash); the
+    computation runs in a background thread that drives the worker process.
+    """
+
+    def __init__(
+        self,
+        plugin=None,
+        database=None,
+        samples: int = BETWEENNESS_SAMPLES,
+        use_worker_process: bool = True
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            plugin: Plugin reference for logging
+            database: HiveDatabase for the member list
+            samples: Brandes source samples per full run
+            use_worker_process: Run jobs in a separate process (False for tests)
+        """
+        self.plugin = plugin
+        self.db = database
+        self.samples = samples
+        self.use_worker_process = use_worker_process
+
+        self._lock = threading.Lock()
+        self._graph: Optional[ChannelGraph] = None
+        self._result: Optional[CentralityResult] = None
+        self._result_graph: Optional[ChannelGraph] = None
+        self._requested_candidates: Set[str] = set()
+        self._thread: Optional[threading.Thread] = None
+        self._last_error: Optional[str] = None
+
+    def _log(self, msg: str, level: str = "debug") -> None:
+        """Log a message if plugin is available."""
+        if self.plugin:
+            self.plugin.log(f"[GraphCentrality] {msg}", level=level)
+
+    # =========================================================================
+    # INPUT
+    # =========================================================================
+
+    def _get_members(self) -> List[str]:
+        if not self.db:
+            return []
+        try:
+            return [m['peer_id'] for m in self.db.get_all_members()]
+        except Exception:
+            return []
+
+    def request_candidates(self, candidate_ids: Iterable[str]) -> None:
+        """Ask for edge gains to these nodes in the next computation."""
+        with self._lock:
+            for candidate_id in candidate_ids:
+                if len(self._requested_candidates) >= MAX_REQUESTED_CANDIDATES:
+                    break
+                self._requested_candidates.add(candidate_id)
+
+    def update_graph(self, channels: Iterable[Dict[str, Any]]) -> bool:
+        """
+        Install a fresh listchannels snapshot and start a background
+        computation if the graph epoch changed.
+
+        Args:
+            channels: listchannels entries
+
+        Returns:
+            True if a computation was started
+        """
+        graph = ChannelGraph.from_listchannels(channels)
+        with self._lock:
+            self._graph = graph
+            if self._thread and self._thread.is_alive():
+                return False  # Picked up when the running job finishes
+            if not self._needs_compute(graph):
+                return False
+            self._thread = threading.Thread(
+                target=self._compute_loop,
+                name="cl-hive-graph-centrality",
+                daemon=True
+            )
+            self._thread.start()
+        return True
+
+    def _needs_compute(self, graph: ChannelGraph) -> bool:
+        if not self._result or self._result.epoch != graph.epoch:
+            return True
+        missing = self._requested_candidates - {c for _, c in self._result.edge_gains}
+        return bool(missing & graph.index.keys())
+
+    def _compute_loop(self) -> None:
+        """Compute until the result matches the latest installed graph."""
+        while True:
+            with self._lock:
+                graph = self._graph
+                if graph is None or not self._needs_compute(graph):
+                    return
+            try:
+                self.compute(graph)
+            except Exception as e:
+                self._last_error = str(e)
+                self._log(f"Centrality computation failed: {e}", level='warn')
+                return
+
+    # =========================================================================
+    # COMPUTATION
+    # =========================================================================
+
+    def _can_reuse_betweenness(self, graph: ChannelGraph) -> bool:
+        prev_graph = self._result_graph
+        prev = self._result
+        if not prev or not prev_graph or not prev.betweenness:
+            return False
+        if time.time() - prev.betweenness_computed_at > MAX_BETWEENNESS_AGE_SECONDS:
+            return False
+        changed = len(graph.edge_keys ^ prev_graph.edge_keys)
+        return changed <= INCREMENTAL_MAX_CHANGE_PCT * max(1, prev_graph.num_edges)
+
+    def _select_candidates(self, graph: ChannelGraph, members: Set[str]) -> List[str]:
+        """Requested candidates first, then the best-connected nodes."""
+        with self._lock:
+            requested = [c for c in self._requested_candidates if c in graph.index]
+        selected = [c for c in requested if c not in members][:MAX_GAIN_CANDIDATES]
+        if len(selected) < MAX_GAIN_CANDIDATES:
+            chosen = set(selected)
+            by_degree = sorted(
+                range(graph.num_nodes),
+                key=lambda i: graph.offsets[i] - graph.offsets[i + 1]
+            )
+            for i in by_degree:
+                node_id = graph.node_ids[i]
+                if node_id in members or node_id in chosen:
+                    continue
+                selected.append(node_id)
+                if len(selected) >= MAX_GAIN_CANDIDATES:
+                    break
+        return selected
+
+    def _run_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        if not self.use_worker_process:
+            return run_centrality_job(job)
+
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--worker"],
+            input=json.dumps(job, separators=(',', ':')).encode(),
+            capture_output=True,
+            timeout=WORKER_TIMEOUT_SECONDS,
+        )
+        if proc.returncode != 0:
+            stderr = proc.stderr.decode(errors='replace').strip()[-500:]
+            raise RuntimeError(f"worker exited {proc.returncode}: {stderr}")
+        return json.loads(proc.stdout)
+
+    def compute(self, graph: Optional[ChannelGraph] = None) -> Optional[CentralityResult]:
+        """
+        Compute centrality for a graph synchronously.
+
+        Args:
+            graph: Graph to use (defaults to the last installed graph)
+
+        Returns:
+            CentralityResult, or None if there is no graph
+        """
+        graph = graph or self._graph
+        if graph is None:
+            return None
+
+        members = set(self._get_members())
+        member_idx = [graph.index[m] for m in sorted(members) if m in graph.index]
+        candidates = self._select_candidates(graph, members)
+        reuse = self._can_reuse_betweenness(graph)
+        with self._lock:
+            self._requested_candidates = {
+                c for c in self._requested_candidates
+                if c in graph.index and c not in members
+            } - set(candidates)
+
+        job = {
+            "n": graph.num_nodes,
+            "offsets": graph.offsets.tolist(),
+            "targets": graph.targets.tolist(),
+            "members": member_idx,
+            "candidates": [graph.index[c] for c in candidates],
+            "samples": self.samples,
+            "seed": int(graph.epoch, 16) & 0xFFFFFFFF,
+            "skip_betweenness": reuse,
+        }
+        start = time.time()
+        output = self._run_job(job)
+        now = int(time.time())
+
+        ids = graph.node_ids
+        if reuse:
+            betweenness = {
+                node_id: value
+                for node_id, value in self._result.betweenness.items()
+                if node_id in graph.index
+            }
+            betweenness_at = self._result.betweenness_computed_at
+        else:
+            betweenness = {
+                ids[i]: value for i, value in enumerate(output["betweenness"]) if value > 0
+            }
+            betweenness_at = now
+
+        edge_gains = {}
+        prev = self._result
+        if prev and prev.epoch == graph.epoch:
+            # Same graph, new candidates: keep gains already evaluated
+            edge_gains.update(prev.edge_gains)
+        edge_gains.update({(ids[m], ids[c]): g for m, c, g in output["gains"]})
+
+        result = CentralityResult(
+            epoch=graph.epoch,
+            computed_at=now,
+            duration_ms=int((time.time() - start) * 1000),
+            num_nodes=graph.num_nodes,
+            num_edges=graph.num_edges,
+            betweenness=betweenness,
+            betweenness_computed_at=betweenness_at,
+            closeness={ids[int(i)]: v for i, v in output["closeness"].items()},
+            edge_gains=edge_gains,
+            incremental=reuse,
+        )
+
+        with self._lock:
+            self._result = result
+            self._result_graph = graph
+            self._last_error = None
+
+        self._log(
+            f"Centrality for epoch {graph.epoch}: {graph.num_nodes} nodes, "
+            f"{graph.num_edges} edges, {len(member_idx)} members, "
+            f"{len(candidates)} candidates in {result.duration_ms}ms"
+            f"{' (betweenness reused)' if reuse else ''}",
+            level='info'
+        )
+        return result
+
+    # =========================================================================
+    # QUERIES
+    # =========================================================================
+
+    def get_result(self) -> Optional[CentralityResult]:
+        """Latest computed result (may lag the installed graph)."""
+        return self._result
+
+    def get_betweenness(self, node_id: str) -> Optional[float]:
+        """Normalized betweenness (0-1), None if not computed or not in graph."""
+        result = self._result
+        graph = self._result_graph
+        if not result or not graph or node_id not in graph.index:
+            return None
+        return result.betweenness.get(node_id, 0.0)
+
+    def get_closeness(self, member_id: str) -> Optional[float]:
+        """Harmonic closeness (0-1) of a member, None if not computed."""
+        result = self._result
+        if not result:
+            return None
+        return result.closeness.get(member_id)
+
+    def get_edge_gain(self, member_id: str, candidate_id: str) -> Optional[float]:
+        """
+        Harmonic closeness the member gains by opening to the candidate.
+
+        A miss is remembered so the pair is evaluated on the next run.
+        """
+        result = self._result
+        if not result:
+            self.request_candidates([candidate_id])
+            return None
+        gain = result.edge_gains.get((member_id, candidate_id))
+        if gain is None and member_id in result.closeness:
+            self.request_candidates([candidate_id])
+        return gain
+
+    def get_relative_edge_gain(self, member_id: str, candidate_id: str) -> Optional[float]:
+        """Edge gain as a fraction of the member's current closeness."""
+        gain = self.get_edge_gain(member_id, candidate_id)
+        closeness = self.get_closeness(member_id)
+        if gain is None or not closeness:
+            return None
+        return gain / closeness
+
+    def get_degree(self, node_id: str) -> Optional[int]:
+        """Public channel peer count in the latest installed graph."""
+        graph = self._graph
+        return graph.degree(node_id) if graph else None
+
+    def get_status(self) -> Dict[str, Any]:
+        """Engine status for diagnostics."""
+        graph = self._graph
+        result = self._result
+        return {
+            "graph_epoch": graph.epoch if graph else None,
+            "graph_nodes": graph.num_nodes if graph else 0,
+            "graph_edges": graph.num_edges if graph else 0,
+            "result_epoch": result.epoch if result else None,
+            "computed_at": result.computed_at if result else 0,
+            "duration_ms": result.duration_ms if result else 0,
+            "incremental": result.incremental if result else False,
+            "members": len(result.closeness) if result else 0,
+            "edge_gains": len(result.edge_gains) if result else 0,
+            "computing": bool(self._thread and self._thread.is_alive()),
+            "last_error": self._last_error,
+        }
+
+
+# =============================================================================
+# WORKER ENTRY POINT
+# =============================================================================
+
+def _worker_main() -> None:
+    """Read one job as JSON on stdin, write the result as JSON on stdout."""
+    try:
+        os.nice(10)
+    except (AttributeError, OSError):
+        pass
+    job = json.load(sys.stdin)
+    json.dump(run_centrality_job(job), sys.stdout, separators=(',', ':'))
+
+
+def _benchmark_main(path: str, samples: int) -> None:
+    """Time a full run on a listchannels dump."""
+    start = time.time()
+    graph = load_graph_fixture(path)
+    loaded = time.time()
+    engine = GraphCentralityEngine(samples=samples)
+    # Treat the highest-degree nodes as members for the gain computation
+    top = sorted(graph.node_ids, key=lambda n: -graph.degree(n))[:10]
+    engine._get_members = lambda: top
+    result = engine.compute(graph)
+    print(json.dumps({
+        "nodes": graph.num_nodes,
+        "edges": graph.num_edges,
+        "load_ms": int((loaded - start) * 1000),
+        "compute_ms": result.duration_ms,
+        "edge_gains": len(result.edge_gains),
+        "total_ms": int((time.time() - start) * 1000),
+    }))
+
+
+if __name__ == "__main__":
+    if "--worker" in sys.argv:
+        _worker_main()
+    elif "--fixture" in sys.argv:
+        args = sys.argv[1:]
+        fixture = args[args.index("--fixture") + 1]
+        n_samples = BETWEENNESS_SAMPLES
+        if "--samples" in args:
+            n_samples = int(args[args.index("--samples") + 1])
+        _benchmark_main(fixture, n_samples)
+    else:
+        print(__doc__)
@@ -316,6 +316,19 @@ class HealthScoreAggregator:
 
         return health
 
+    def get_all_member_health(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get every member's health record in one query.
+
+        Returns:
+            Dict mapping peer_id to its health record
+        """
+        return {
+            health["peer_id"]: health
+            for health in self.database.get_all_member_health()
+            if health.get("peer_id")
+        }
+
     def get_fleet_health_summary(self) -> Dict[str, Any]:
         """
         Get aggregated fleet health summary.
@@ -0,0 +1,409 @@
+"""
+Routing Intelligence Snapshot Module
+
+Persists the aggregated in-memory intelligence structures so a restart does
+not have to replay every raw route_probes / peer_reputation row:
+- HiveRoutingMap path statistics
+- PeerReputationManager aggregates
+- AdaptiveFeeController pheromone levels
+- StigmergicCoordinator route markers
+
+File format (version 1):
+    MAGIC (8 bytes) | version (u16) | created_at (u64) | crc32 (u32) | body
+where body is zlib-compressed JSON with one columnar section per structure
+plus the database id watermarks captured when the snapshot was taken.
+
+Startup flow:
+1. restore() loads the snapshot synchronously (fast, node is ready)
+2. catch_up() replays only rows with watermark < id <= ceiling in the
+   background, where ceiling is the max id seen at startup. Rows written
+   after startup were already applied live and must not be counted twice.
+"""
+
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from .peer_reputation import REPUTATION_STALENESS_HOURS
+from .routing_intelligence import PROBE_STALENESS_HOURS
+
+
+SNAPSHOT_MAGIC = b"HIVEINTL"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct(">8sHQI")
+
+# Snapshot cadence and validity
+SNAPSHOT_INTERVAL_SECONDS = 3600      # Persist at most once per hour
+REPLAY_BATCH_SIZE = 5000              # Probe rows per catch-up query
+
+# A snapshot older than the longest staleness window holds nothing useful
+MAX_SNAPSHOT_AGE_SECONDS = max(PROBE_STALENESS_HOURS, REPUTATION_STALENESS_HOURS) * 3600
+
+
+class SnapshotFormatError(Exception):
+    """Raised when a snapshot file is corrupt or has an unknown version."""
+    pass
+
+
+@dataclass
+class IntelSnapshot:
+    """Decoded contents of a snapshot file."""
+    version: int
+    created_at: int
+    watermarks: Dict[str, int] = field(default_factory=dict)
+    sections: Dict[str, Dict[str, list]] = field(default_factory=dict)
+
+
+def encode_snapshot(snapshot: IntelSnapshot) -> bytes:
+    """Serialize a snapshot to the versioned binary format."""
+    body = zlib.compress(
+        json.dumps(
+            {"watermarks": snapshot.watermarks, "sections": snapshot.sections},
+            separators=(',', ':')
+        ).encode('utf-8'),
+        6
+    )
+    header = SNAPSHOT_HEADER.pack(
+        SNAPSHOT_MAGIC, snapshot.version, snapshot.created_at, zlib.crc32(body)
+    )
+    return header + body
+
+
+def decode_snapshot(data: bytes) -> IntelSnapshot:
+    """
+    Parse a snapshot produced by encode_snapshot().
+
+    Raises:
+        SnapshotFormatError: on bad magic, unsupported version or corruption
+    """
+    if len(data) < SNAPSHOT_HEADER.size:
+        raise SnapshotFormatError("truncated header")
+
+    magic, version, created_at, crc = SNAPSHOT_HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotFormatError("bad magic")
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotFormatError(f"unsupported version {version}")
+
+    body = data[SNAPSHOT_HEADER.size:]
+    if zlib.crc32(body) != crc:
+        raise SnapshotFormatError("checksum mismatch")
+
+    try:
+        payload = json.loads(zlib.decompress(body).decode('utf-8'))
+    except (zlib.error, ValueError) as e:
+        raise SnapshotFormatError(f"undecodable body: {e}")
+
+    return IntelSnapshot(
+        version=version,
+        created_at=created_at,
+        watermarks=payload.get("watermarks", {}),
+        sections=payload.get("sections", {}),
+    )
+
+
+class IntelSnapshotManager:
+    """
+    Save and restore routing intelligence snapshots.
+
+    Components are optional; sections for missing components are skipped
+    on save and ignored on restore.
+    """
+
+    def __init__(
+        self,
+        database: Any,
+        plugin: Any,
+        snapshot_path: str,
+        routing_map: Any = None,
+        reputation_mgr: Any = None,
+        fee_coordination_mgr: Any = None
+    ):
+        """
+        Initialize the snapshot manager.
+
+        Args:
+            database: HiveDatabase instance
+            plugin: Plugin instance for logging
+            snapshot_path: File to read/write the snapshot
+            routing_map: HiveRoutingMap instance
+            reputation_mgr: PeerReputationManager instance
+            fee_coordination_mgr: FeeCoordinationManager instance
+        """
+        self.database = database
+        self.plugin = plugin
+        self.snapshot_path = os.path.expanduser(snapshot_path)
+        self.routing_map = routing_map
+        self.reputation_mgr = reputation_mgr
+        self.fee_coordination_mgr = fee_coordination_mgr
+
+        self._save_lock = threading.Lock()
+        self._last_save_time = 0.0
+        self._status: Dict[str, Any] = {
+            "restored_from_snapshot": False,
+            "ready": False,
+            "catch_up_complete": False,
+        }
+
+    def _log(self, msg: str, level: str = "info") -> None:
+        if self.plugin:
+            self.plugin.log(f"cl-hive: [IntelSnapshot] {msg}", level=level)
+
+    def _components(self) -> Dict[str, Any]:
+        """Map section name -> component exposing export/restore_snapshot_state."""
+        components = {}
+        if self.routing_map:
+            components["path_stats"] = self.routing_map
+        if self.reputation_mgr:
+            components["reputation"] = self.reputation_mgr
+        if self.fee_coordination_mgr:
+            components["pheromones"] = self.fee_coordination_mgr.adaptive_controller
+            components["markers"] = self.fee_coordination_mgr.stigmergic_coord
+        return components
+
+    def _current_watermarks(self) -> Dict[str, int]:
+        return {
+            "route_probes": self.database.get_max_route_probe_id(),
+            "peer_reputation": self.database.get_max_peer_reputation_id(),
+        }
+
+    def save_snapshot(self) -> Dict[str, Any]:
+        """
+        Write a snapshot of all in-memory aggregates.
+
+        Watermarks are read before exporting so that no row can be missed;
+        at worst a row stored concurrently is applied again on restore.
+        The file is written to a temp path and atomically renamed.
+
+        Returns:
+            Dict with bytes written, section sizes and duration
+        """
+        with self._save_lock:
+            start = time.time()
+            watermarks = self._current_watermarks()
+            sections = {
+                name: component.export_snapshot_state()
+                for name, component in self._components().items()
+            }
+            data = encode_snapshot(IntelSnapshot(
+                version=SNAPSHOT_VERSION,
+                created_at=int(start),
+                watermarks=watermarks,
+                sections=sections,
+            ))
+
+            directory = os.path.dirname(self.snapshot_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.snapshot_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+
+            self._last_save_time = start
+            return {
+                "bytes": len(data),
+                "watermarks": watermarks,
+                "sections": {
+                    name: len(next(iter(cols.values()), []))
+                    for name, cols in sections.items()
+                },
+                "duration_ms": int((time.time() - start) * 1000),
+            }
+
+    def maybe_save_snapshot(self, force: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Save a snapshot if SNAPSHOT_INTERVAL_SECONDS have elapsed.
+
+        Never saves before catch-up finished: the watermark would claim rows
+        that are not yet reflected in memory.
+
+        Args:
+            force: Ignore the interval (still requires catch-up)
+        """
+        if not self._status.get("catch_up_complete"):
+            return None
+        if not force and time.time() - self._last_save_time < SNAPSHOT_INTERVAL_SECONDS:
+            return None
+        return self.save_snapshot()
+
+    def load_snapshot(self) -> Optional[IntelSnapshot]:
+        """
+        Read and validate the snapshot file.
+
+        Returns:
+            IntelSnapshot, or None if missing, corrupt or too old to be useful
+        """
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self._log(f"Cannot read snapshot: {e}", level="warn")
+            return None
+
+        try:
+            snapshot = decode_snapshot(data)
+        except SnapshotFormatError as e:
+            self._log(f"Ignoring snapshot: {e}", level="warn")
+            return None
+
+        if time.time() - snapshot.created_at > MAX_SNAPSHOT_AGE_SECONDS:
+            self._log("Ignoring snapshot older than staleness window", level="info")
+            return None
+
+        return snapshot
+
+    def restore(self) -> Dict[str, Any]:
+        """
+        Restore in-memory state from the snapshot and plan the catch-up.
+
+        Must run before live messages are processed (i.e. during init), so
+        the catch-up ceiling separates replayed rows from live ones.
+
+        Returns:
+            Dict with restored counts, watermarks and catch-up ceilings.
+            Without a usable snapshot watermarks are 0, so catch-up
+            becomes a full (paged) rebuild.
+        """
+        start = time.time()
+        ceilings = self._current_watermarks()
+        snapshot = self.load_snapshot()
+
+        restored: Dict[str, int] = {}
+        watermarks = {"route_probes": 0, "peer_reputation": 0}
+        if snapshot:
+            components = self._components()
+            for name, columns in snapshot.sections.items():
+                component = components.get(name)
+                if not component:
+                    continue
+                try:
+                    restored[name] = component.restore_snapshot_state(columns)
+                except (KeyError, IndexError, TypeError, ValueError) as e:
+                    self._log(f"Skipping section {name}: {e}", level="warn")
+            watermarks.update(snapshot.watermarks)
+
+        # A watermark above the current max means the DB was reset/replaced
+        for table in watermarks:
+            if watermarks[table] > ceilings.get(table, 0):
+                watermarks[table] = 0
+
+        self._status.update({
+            "restored_from_snapshot": snapshot is not None,
+            "snapshot_created_at": snapshot.created_at if snapshot else None,
+            "restored": restored,
+            "watermarks": watermarks,
+            "ceilings": ceilings,
+            "ready": True,
+            "restore_ms": int((time.time() - start) * 1000),
+        })
+        return dict(self._status)
+
+    def catch_up(self) -> Dict[str, Any]:
+        """
+        Replay database rows between the snapshot watermark and the
+        startup ceiling. Safe to run in a background thread.
+
+        If the windowed replay fails part-way, the restored aggregates are
+        discarded and rebuilt from the database so catch-up still finishes.
+
+        Returns:
+            Dict with replayed counts and duration
+
+        Raises:
+            Exception: If the full reload fails too (saves stay disabled)
+        """
+        start = time.time()
+        watermarks = self._status.get("watermarks", {})
+        ceilings = self._status.get("ceilings", {})
+
+        full_reload = False
+        try:
+            probes_applied, peers_refreshed = self._replay_range(watermarks, ceilings)
+        except Exception as e:
+            # A partially applied window cannot be resumed safely; rebuild
+            # everything from the database instead of never finishing
+            self._log(f"Catch-up replay failed ({e}), falling back to full reload",
+                      level="warn")
+            try:
+                probes_applied, peers_refreshed = self._full_reload()
+            except Exception as reload_error:
+                self._status["catch_up_error"] = str(reload_error)
+                self._log(f"Full reload failed: {reload_error}; "
+                          f"snapshot saves stay disabled", level="error")
+                raise
+            full_reload = True
+
+        self._status.update({
+            "catch_up_complete": True,
+            "catch_up_full_reload": full_reload,
+            "catch_up_error": None,
+            "probes_replayed": probes_applied,
+            "peers_refreshed": peers_refreshed,
+            "catch_up_ms": int((time.time() - start) * 1000),
+        })
+        return dict(self._status)
+
+    def _replay_range(self, watermarks: Dict[str, int],
+                      ceilings: Dict[str, int]) -> Tuple[int, int]:
+        """Replay rows between the watermarks and the ceilings."""
+        probes_applied = 0
+        peers_refreshed = 0
+        if self.routing_map:
+            probes_applied = self.routing_map.replay_probes_in_range(
+                watermarks.get("route_probes", 0),
+                ceilings.get("route_probes", 0),
+                batch_size=REPLAY_BATCH_SIZE
+            )
+        if self.reputation_mgr:
+            peers_refreshed = self.reputation_mgr.refresh_peers_in_range(
+                watermarks.get("peer_reputation", 0),
+                ceilings.get("peer_reputation", 0)
+            )
+        return probes_applied, peers_refreshed
+
+    def _full_reload(self) -> Tuple[int, int]:
+        """Discard restored aggregates and rebuild them from the database."""
+        probes_applied = 0
+        peers_refreshed = 0
+        if self.routing_map:
+            probes_applied = self.routing_map.aggregate_from_database(reset=True)
+        if self.reputation_mgr:
+            peers_refreshed = self.reputation_mgr.aggregate_from_database()
+        return probes_applied, peers_refreshed
+
+    def start_background_catch_up(self) -> threading.Thread:
+        """Run catch_up() in a daemon thread and log the outcome."""
+        def _run():
+            try:
+                result = self.catch_up()
+                self._log(
+                    f"Catch-up complete: {result['probes_replayed']} probes, "
+                    f"{result['peers_refreshed']} peers in {result['catch_up_ms']}ms"
+                )
+            except Exception as e:
+                self._log(f"Catch-up failed: {e}", level="warn")
+
+        thread = threading.Thread(
+            target=_run,
+            name="cl-hive-intel-catch-up",
+            daemon=True
+        )
+        thread.start()
+        return thread
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get restore/catch-up status for diagnostics."""
+        status = dict(self._status)
+        status["snapshot_path"] = self.snapshot_path
+        status["last_save_time"] = int(self._last_save_time)
+        return status
@@ -20,9 +20,10 @@ Key Metrics:
 Author: Lightning Goats Team
 """
 
+import sys
 import time
 import threading
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 
@@ -137,6 +138,81 @@ class FleetTopologySnapshot:
     # Timestamp
     captured_at: int = 0
 
+    # External peer -> number of members connected to it
+    # (count == 1 means the peer is unique to one member)
+    peer_member_counts: Dict[str, int] = field(default_factory=dict)
+
+    # Members we have gossip state for (drives hive connectivity)
+    members_with_state: Set[str] = field(default_factory=set)
+
+    # Member ID -> single-bit mask, and member ID -> bitmask of its hive
+    # connections, so 2-hop reachability is a few integer ORs
+    member_bits: Dict[str, int] = field(default_factory=dict)
+    hive_connection_masks: Dict[str, int] = field(default_factory=dict)
+
+    def copy(self) -> "FleetTopologySnapshot":
+        """
+        Copy the mutable containers (not the per-member sets, which are only
+        ever replaced) so the copy can be patched while the original is read.
+        """
+        return replace(
+            self,
+            member_topologies=dict(self.member_topologies),
+            member_hive_connections=dict(self.member_hive_connections),
+            all_external_peers=set(self.all_external_peers),
+            all_members=set(self.all_members),
+            peer_member_counts=dict(self.peer_member_counts),
+            members_with_state=set(self.members_with_state),
+            member_bits=dict(self.member_bits),
+            hive_connection_masks=dict(self.hive_connection_masks),
+        )
+
+    def add_topology(self, member_id: str, topology: Set[str]) -> None:
+        """Set a member's external topology, keeping peer counters in sync."""
+        old = self.member_topologies.get(member_id, set())
+        counts = self.peer_member_counts
+        for peer in old - topology:
+            remaining = counts.get(peer, 0) - 1
+            if remaining > 0:
+                counts[peer] = remaining
+            else:
+                counts.pop(peer, None)
+                self.all_external_peers.discard(peer)
+        for peer in topology - old:
+            counts[peer] = counts.get(peer, 0) + 1
+            self.all_external_peers.add(peer)
+        self.member_topologies[member_id] = topology
+
+    def rebuild_hive_connections(self) -> None:
+        """
+        Recompute hive connections from members_with_state.
+
+        Connectivity is approximated as "both sides have gossip state", so a
+        member with state is connected to every other member with state.
+        """
+        with_state_mask = 0
+        for member_id in self.members_with_state:
+            with_state_mask |= self.member_bits[member_id]
+
+        for member_id in self.all_members:
+            if member_id in self.members_with_state:
+                self.member_hive_connections[member_id] = self.members_with_state - {member_id}
+                self.hive_connection_masks[member_id] = (
+                    with_state_mask & ~self.member_bits[member_id]
+                )
+            else:
+                self.member_hive_connections[member_id] = set()
+                self.hive_connection_masks[member_id] = 0
+
+    def refresh_statistics(self) -> None:
+        """Recompute fleet-wide averages from the current topology."""
+        sizes = [
+            len(self.member_topologies.get(m, ()))
+            for m in self.members_with_state
+        ]
+        self.avg_topology_size = sum(sizes) / len(sizes) if sizes else 0.0
+        self.total_unique_coverage = len(self.peer_member_counts)
+
 
 # =============================================================================
 # NETWORK METRICS CALCULATOR
@@ -166,7 +242,8 @@ class NetworkMetricsCalculator:
         state_manager=None,
         database=None,
         plugin=None,
-        cache_ttl: int = METRICS_CACHE_TTL
+        cache_ttl: int = METRICS_CACHE_TTL,
+        centrality_engine=None
     ):
         """
         Initialize the calculator.
@@ -176,16 +253,19 @@ class NetworkMetricsCalculator:
             database: HiveDatabase for member list
             plugin: Plugin for logging
             cache_ttl: Cache lifetime in seconds
+            centrality_engine: GraphCentralityEngine for real betweenness
         """
         self.state_manager = state_manager
         self.db = database
         self.plugin = plugin
         self.cache_ttl = cache_ttl
+        self.centrality_engine = centrality_engine
 
         # Cache
         self._cache: Dict[str, MemberPositionMetrics] = {}
         self._cache_time: int = 0
         self._topology_snapshot: Optional[FleetTopologySnapshot] = None
+        self._metrics_dirty = False  # Snapshot patched, metrics not yet recomputed
         self._lock = threading.RLock()
 
     def _log(self, msg: str, level: str = "debug") -> None:
@@ -213,14 +293,7 @@ class NetworkMetricsCalculator:
             MemberPositionMetrics or None if member not found
         """
         with self._lock:
-            # Check cache
-            if not force_refresh and self._is_cache_valid():
-                if member_id in self._cache:
-                    return self._cache[member_id]
-
-            # Refresh all metrics (more efficient than single calculation)
-            self._refresh_all_metrics()
-
+            self._ensure_fresh(force_refresh)
             return self._cache.get(member_id)
 
     def get_all_metrics(
@@ -237,10 +310,7 @@ class NetworkMetricsCalculator:
             Dict mapping member_id to MemberPositionMetrics
         """
         with self._lock:
-            if not force_refresh and self._is_cache_valid():
-                return dict(self._cache)
-
-            self._refresh_all_metrics()
+            self._ensure_fresh(force_refresh)
             return dict(self._cache)
 
     def get_rebalance_hubs(
@@ -302,19 +372,69 @@ class NetworkMetricsCalculator:
             FleetTopologySnapshot or None if no data available
         """
         with self._lock:
-            if not self._is_cache_valid():
-                self._refresh_all_metrics()
+            self._ensure_fresh()
             return self._topology_snapshot
 
     def invalidate_cache(self) -> None:
-        """Force cache invalidation (call after topology changes)."""
+        """Force cache invalidation (call after membership changes)."""
         with self._lock:
             self._cache_time = 0
 
+    def update_member_topology(self, member_id: str) -> bool:
+        """
+        Patch the snapshot after one member's gossip changed.
+
+        Re-reads only that member's state and adjusts peer counters and hive
+        connections on a copy of the snapshot, then swaps the copy in, so
+        snapshots already handed out by get_topology_snapshot() never change
+        under their readers. Metrics are recomputed from the patched snapshot
+        on next read, without re-querying every member's state.
+
+        Args:
+            member_id: Member whose state was updated
+
+        Returns:
+            True if the snapshot was patched, False if there is no current
+            snapshot or the member is unknown (next read rebuilds it)
+        """
+        if not self.state_manager:
+            return False
+
+        with self._lock:
+            snapshot = self._topology_snapshot
+            if not snapshot or not self._is_cache_valid():
+                return False
+            if member_id not in snapshot.all_members:
+                return False
+
+            state = self.state_manager.get_peer_state(member_id)
+            patched = snapshot.copy()
+            patched.add_topology(member_id, self._interned_topology(state))
+
+            had_state = member_id in patched.members_with_state
+            if bool(state) != had_state:
+                if state:
+                    patched.members_with_state.add(member_id)
+                else:
+                    patched.members_with_state.discard(member_id)
+                patched.rebuild_hive_connections()
+
+            patched.refresh_statistics()
+            self._topology_snapshot = patched
+            self._metrics_dirty = True
+            return True
+
     # =========================================================================
     # INTERNAL CALCULATION
     # =========================================================================
 
+    def _ensure_fresh(self, force_refresh: bool = False) -> None:
+        """Rebuild on TTL expiry; recompute metrics if the snapshot was patched."""
+        if force_refresh or not self._is_cache_valid():
+            self._refresh_all_metrics()
+        elif self._metrics_dirty:
+            self._recalculate_metrics(self._topology_snapshot)
+
     def _is_cache_valid(self) -> bool:
         """Check if cache is still valid."""
         return (
@@ -323,18 +443,18 @@ class NetworkMetricsCalculator:
         )
 
     def _refresh_all_metrics(self) -> None:
-        """Recalculate metrics for all members."""
-        now = int(time.time())
-
-        # Build topology snapshot
+        """Rebuild the topology snapshot and recalculate all metrics."""
         snapshot = self._build_topology_snapshot()
         if not snapshot or not snapshot.all_members:
             self._log("No members found for metrics calculation")
             return
 
         self._topology_snapshot = snapshot
+        self._recalculate_metrics(snapshot)
+        self._cache_time = int(time.time())
 
-        # Calculate metrics for each member
+    def _recalculate_metrics(self, snapshot: FleetTopologySnapshot) -> None:
+        """Calculate metrics for every member from an existing snapshot."""
         new_cache = {}
         for member_id in snapshot.all_members:
             metrics = self._calculate_member_metrics(member_id, snapshot)
@@ -342,12 +462,24 @@ class NetworkMetricsCalculator:
                 new_cache[member_id] = metrics
 
         self._cache = new_cache
-        self._cache_time = now
+        self._metrics_dirty = False
 
         self._log(f"Refreshed metrics for {len(new_cache)} members")
 
+    @staticmethod
+    def _interned_topology(state: Any) -> Set[str]:
+        """Topology set with interned pubkeys (shared across members)."""
+        if not state:
+            return set()
+        return {sys.intern(p) for p in (getattr(state, 'topology', []) or []) if p}
+
     def _build_topology_snapshot(self) -> Optional[FleetTopologySnapshot]:
-        """Build a snapshot of current fleet topology."""
+        """
+        Build a snapshot of current fleet topology.
+
+        Reads each member's state once (O(M) lookups) and derives peer
+        counters and hive connection bitmasks from it.
+        """
         if not self.db or not self.state_manager:
             return None
 
@@ -360,42 +492,18 @@ class NetworkMetricsCalculator:
 
         member_ids = {m['peer_id'] for m in members if m.get('peer_id')}
         snapshot.all_members = member_ids
-
-        topology_sizes = []
+        snapshot.member_bits = {
+            member_id: 1 << i for i, member_id in enumerate(sorted(member_ids))
+        }
 
         for member_id in member_ids:
             state = self.state_manager.get_peer_state(member_id)
-            if not state:
-                snapshot.member_topologies[member_id] = set()
-                snapshot.member_hive_connections[member_id] = set()
-                continue
-
-            # External topology (non-hive peers)
-            external_topology = set(getattr(state, 'topology', []) or [])
-            snapshot.member_topologies[member_id] = external_topology
-            snapshot.all_external_peers.update(external_topology)
-            topology_sizes.append(len(external_topology))
-
-            # Hive connections (other fleet members this node is connected to)
-            # This would come from channel data - for now approximate from who we see
-            hive_connections = set()
-            for other_id in member_ids:
-                if other_id != member_id:
-                    other_state = self.state_manager.get_peer_state(other_id)
-                    if other_state:
-                        # If we can see their state, assume connectivity
-                        hive_connections.add(other_id)
-            snapshot.member_hive_connections[member_id] = hive_connections
-
-        # Calculate statistics
-        if topology_sizes:
-            snapshot.avg_topology_size = sum(topology_sizes) / len(topology_sizes)
-
-        # Count unique coverage
-        all_peers = set()
-        for topo in snapshot.member_topologies.values():
-            all_peers.update(topo)
-        snapshot.total_unique_coverage = len(all_peers)
+            if state:
+                snapshot.members_with_state.add(member_id)
+            snapshot.add_topology(member_id, self._interned_topology(state))
+
+        snapshot.rebuild_hive_connections()
+        snapshot.refresh_statistics()
 
         return snapshot
 
@@ -423,12 +531,8 @@ class NetworkMetricsCalculator:
         metrics.external_peer_count = len(member_topology)
 
         # Find unique peers (only this member connects to)
-        other_members_peers = set()
-        for other_id, other_topo in snapshot.member_topologies.items():
-            if other_id != member_id:
-                other_members_peers.update(other_topo)
-
-        unique_peer_set = member_topology - other_members_peers
+        counts = snapshot.peer_member_counts
+        unique_peer_set = {p for p in member_topology if counts.get(p, 0) == 1}
         metrics.unique_peers = len(unique_peer_set)
         metrics.unique_peer_list = list(unique_peer_set)
 
@@ -436,8 +540,14 @@ class NetworkMetricsCalculator:
         if len(member_topology) > 0:
             metrics.bridge_score = min(1.0, metrics.unique_peers / len(member_topology))
 
-        # External centrality approximation
-        if snapshot.avg_topology_size > 0:
+        # External centrality: sampled betweenness over the public graph
+        # when available, otherwise a connectivity-based approximation
+        betweenness = None
+        if self.centrality_engine:
+            betweenness = self.centrality_engine.get_betweenness(member_id)
+        if betweenness is not None:
+            metrics.external_centrality = min(MAX_EXTERNAL_CENTRALITY, betweenness)
+        elif snapshot.avg_topology_size > 0:
             relative_connectivity = len(member_topology) / snapshot.avg_topology_size
             bridge_boost = 1.0 + (metrics.bridge_score * 0.5)
             metrics.external_centrality = min(
@@ -457,15 +567,15 @@ class NetworkMetricsCalculator:
             metrics.hive_centrality = len(hive_connections) / (fleet_size - 1)
 
         # Hive reachability: what fraction of fleet can be reached in 1-2 hops
-        reachable = set(hive_connections)  # 1-hop
+        masks = snapshot.hive_connection_masks
+        reachable = masks.get(member_id, 0)  # 1-hop
         for connected_id in hive_connections:
             # 2-hop: peers of our peers
-            connected_peers = snapshot.member_hive_connections.get(connected_id, set())
-            reachable.update(connected_peers)
-        reachable.discard(member_id)  # Don't count self
+            reachable |= masks.get(connected_id, 0)
+        reachable &= ~snapshot.member_bits.get(member_id, 0)  # Don't count self
 
         if fleet_size > 1:
-            metrics.hive_reachability = len(reachable) / (fleet_size - 1)
+            metrics.hive_reachability = bin(reachable).count("1") / (fleet_size - 1)
 
         # -----------------------------------------------------------------
         # Computed Scores
@@ -874,7 +984,8 @@ def init_calculator(
     state_manager=None,
     database=None,
     plugin=None,
-    cache_ttl: int = METRICS_CACHE_TTL
+    cache_ttl: int = METRICS_CACHE_TTL,
+    centrality_engine=None
 ) -> NetworkMetricsCalculator:
     """
     Initialize the global NetworkMetricsCalculator.
@@ -886,6 +997,7 @@ def init_calculator(
         state_manager=state_manager,
         database=database,
         plugin=plugin,
-        cache_ttl=cache_ttl
+        cache_ttl=cache_ttl,
+        centrality_engine=centrality_engine
     )
     return _calculator
@@ -2,7 +2,8 @@
 Peer Reputation Module (Phase 5 - Advanced Cooperation)
 
 Implements collective reputation tracking for external peers:
-- Aggregation of reputation reports from multiple hive members
+- Aggregation of reputation reports from multiple hive members, kept
+  incrementally in memory (latest report per reporter)
 - Outlier detection to prevent manipulation
 - Reputation scoring with confidence levels
 - Warning propagation and tracking
@@ -11,10 +12,12 @@ Security: All reputation reports require cryptographic signatures.
 Skepticism: No single reporter can significantly impact aggregated scores.
 """
 
+import bisect
+import threading
 import time
 import statistics
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set
 from collections import defaultdict
 
 from .protocol import (
@@ -82,6 +85,72 @@ class ReputationReport:
     observation_days: int
 
 
+class PeerReportState:
+    """
+    Latest reputation report per reporter for one external peer.
+
+    Keeps the reporters' uptime and HTLC success values in sorted lists so
+    the medians used for outlier filtering are read in O(1) and each new
+    report updates them in O(reporters) without touching the database.
+    """
+
+    def __init__(self):
+        self.reports: Dict[str, Dict[str, Any]] = {}  # reporter_id -> latest report
+        self._uptimes: List[float] = []
+        self._htlc_rates: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self.reports)
+
+    def _insert(self, report: Dict[str, Any]) -> None:
+        bisect.insort(self._uptimes, report.get("uptime_pct", 1.0))
+        bisect.insort(self._htlc_rates, report.get("htlc_success_rate", 1.0))
+
+    def _discard(self, report: Dict[str, Any]) -> None:
+        for values, value in ((self._uptimes, report.get("uptime_pct", 1.0)),
+                              (self._htlc_rates, report.get("htlc_success_rate", 1.0))):
+            del values[bisect.bisect_left(values, value)]
+
+    def put(self, report: Dict[str, Any]) -> bool:
+        """
+        Record a report, replacing the reporter's previous one if older.
+
+        Args:
+            report: Reputation report dict
+
+        Returns:
+            True if the report became the reporter's latest
+        """
+        reporter_id = report.get("reporter_id")
+        previous = self.reports.get(reporter_id)
+        if previous is not None:
+            if previous.get("timestamp", 0) > report.get("timestamp", 0):
+                return False
+            self._discard(previous)
+        self.reports[reporter_id] = report
+        self._insert(report)
+        return True
+
+    def prune(self, cutoff: float) -> int:
+        """Drop reporters whose latest report is not newer than cutoff."""
+        stale = [r for r, report in self.reports.items() if report.get("timestamp", 0) <= cutoff]
+        for reporter_id in stale:
+            self._discard(self.reports.pop(reporter_id))
+        return len(stale)
+
+    @staticmethod
+    def _median(values: List[float]) -> float:
+        n = len(values)
+        mid = n // 2
+        return values[mid] if n % 2 else (values[mid - 1] + values[mid]) / 2
+
+    def median_uptime(self) -> float:
+        return self._median(self._uptimes)
+
+    def median_htlc_success(self) -> float:
+        return self._median(self._htlc_rates)
+
+
 class PeerReputationManager:
     """
     Manage collective reputation data for external peers.
@@ -112,6 +181,12 @@ class PeerReputationManager:
         # Key: peer_id
         self._aggregated: Dict[str, AggregatedReputation] = {}
 
+        # Latest report per reporter, per peer. Peers missing here are
+        # loaded from the database on first use unless _state_complete.
+        self._report_state: Dict[str, PeerReportState] = {}
+        self._state_complete = False
+        self._state_lock = threading.RLock()
+
         # Rate limiting for snapshots
         self._snapshot_rate: Dict[str, List[float]] = defaultdict(list)
 
@@ -296,7 +371,7 @@ class PeerReputationManager:
             if not target_peer_id:
                 continue
 
-            self.database.store_peer_reputation(
+            report = dict(
                 reporter_id=reporter_id,
                 peer_id=target_peer_id,
                 timestamp=timestamp,
@@ -310,9 +385,10 @@ class PeerReputationManager:
                 warnings=peer_data.get("warnings", []),
                 observation_days=peer_data.get("observation_days", 7)
             )
+            self.database.store_peer_reputation(**report)
 
-            # Update aggregation for this peer
-            self._update_aggregation(target_peer_id)
+            # Update aggregation for this peer from in-memory state
+            self._ingest_report(report)
             stored_count += 1
 
         if self.plugin:
@@ -324,48 +400,91 @@ class PeerReputationManager:
 
         return {"success": True, "peers_stored": stored_count}
 
-    def _update_aggregation(self, peer_id: str):
-        """Update aggregated reputation for a peer."""
-        reports = self.database.get_peer_reputation_reports(
-            peer_id,
-            max_age_hours=REPUTATION_STALENESS_HOURS
-        )
+    def _ingest_report(self, report: Dict[str, Any]) -> None:
+        """
+        Apply one stored report to the in-memory state and re-aggregate
+        its peer, without reading the database.
+
+        A peer with no in-memory state (e.g. one kept from an intel
+        snapshot) is loaded from the database once instead; that load
+        already includes the stored report.
+        """
+        peer_id = report["peer_id"]
+        with self._state_lock:
+            state = self._report_state.get(peer_id)
+            if state is None and not self._state_complete:
+                self._update_aggregation(peer_id)
+                return
+            if state is None:
+                state = self._report_state[peer_id] = PeerReportState()
+            state.put(report)
+            self._recompute(peer_id)
+
+    def _load_reports(self, reports: Iterable[Dict[str, Any]],
+                      peer_ids: Iterable[str]) -> None:
+        """Replace the state of peer_ids with the given reports and re-aggregate them."""
+        with self._state_lock:
+            states: Dict[str, PeerReportState] = {p: PeerReportState() for p in peer_ids}
+            for report in reports:
+                peer_id = report.get("peer_id")
+                if not peer_id:
+                    continue
+                states.setdefault(peer_id, PeerReportState()).put(report)
+            for peer_id, state in states.items():
+                self._report_state[peer_id] = state
+                self._recompute(peer_id)
 
-        if not reports:
+    def _update_aggregation(self, peer_id: str):
+        """Reload a peer's reports from the database and re-aggregate it."""
+        # Query under the lock so a concurrently stored report is either in
+        # the result or ingested after the load (re-putting it is a no-op)
+        with self._state_lock:
+            reports = self.database.get_peer_reputation_reports(
+                peer_id,
+                max_age_hours=REPUTATION_STALENESS_HOURS
+            )
+            self._load_reports(reports, [peer_id])
+
+    def _recompute(self, peer_id: str) -> None:
+        """Recompute one peer's aggregate from its in-memory reports, O(reporters)."""
+        state = self._report_state.get(peer_id)
+        if state is not None:
+            state.prune(time.time() - REPUTATION_STALENESS_HOURS * 3600)
+        if not state:
+            self._report_state.pop(peer_id, None)
             if peer_id in self._aggregated:
                 del self._aggregated[peer_id]
             return
 
         # Apply skepticism: filter outliers
-        filtered = self._filter_outliers(reports)
+        filtered = self._filter_outliers(list(state.reports.values()), state)
 
         if not filtered:
             return
 
-        # Weight our own data higher
-        weighted_reports = []
-        for r in filtered:
-            weighted_reports.append(r)
-            if r.get("reporter_id") == self.our_pubkey:
-                # Add our data twice for 2x weight
-                weighted_reports.append(r)
-
-        # Calculate aggregates
-        uptimes = [r.get("uptime_pct", 1.0) for r in weighted_reports]
-        htlc_rates = [r.get("htlc_success_rate", 1.0) for r in weighted_reports]
-        fee_stabilities = [r.get("fee_stability", 1.0) for r in weighted_reports]
-        response_times = [r.get("response_time_ms", 0) for r in weighted_reports]
-        force_closes = sum(r.get("force_close_count", 0) for r in filtered)
-
-        # Aggregate warnings
+        # Weight our own data higher: our reports count twice in averages
+        uptime_sum = htlc_sum = fee_stability_sum = 0.0
+        response_sum = 0
+        weight = 0
+        force_closes = 0
         warnings_count: Dict[str, int] = defaultdict(int)
+        unique_reporters = set()
         for r in filtered:
+            w = OUR_DATA_WEIGHT if r.get("reporter_id") == self.our_pubkey else 1
+            weight += w
+            uptime_sum += w * r.get("uptime_pct", 1.0)
+            htlc_sum += w * r.get("htlc_success_rate", 1.0)
+            fee_stability_sum += w * r.get("fee_stability", 1.0)
+            response_sum += w * r.get("response_time_ms", 0)
+            force_closes += r.get("force_close_count", 0)
+            unique_reporters.add(r.get("reporter_id"))
+
+            # Aggregate warnings
             for warning in r.get("warnings", []):
                 if warning in VALID_WARNINGS:
                     warnings_count[warning] += 1
 
         # Determine confidence
-        unique_reporters = set(r.get("reporter_id") for r in filtered)
         if len(unique_reporters) >= MIN_REPORTERS_FOR_CONFIDENCE:
             confidence = "high"
         elif len(unique_reporters) >= 2:
@@ -374,9 +493,9 @@ class PeerReputationManager:
             confidence = "low"
 
         # Calculate overall score (0-100)
-        avg_uptime = statistics.mean(uptimes) if uptimes else 1.0
-        avg_htlc = statistics.mean(htlc_rates) if htlc_rates else 1.0
-        avg_fee_stability = statistics.mean(fee_stabilities) if fee_stabilities else 1.0
+        avg_uptime = uptime_sum / weight
+        avg_htlc = htlc_sum / weight
+        avg_fee_stability = fee_stability_sum / weight
 
         # Score components
         uptime_score = avg_uptime * 30
@@ -402,36 +521,46 @@ class PeerReputationManager:
             avg_uptime=avg_uptime,
             avg_htlc_success=avg_htlc,
             avg_fee_stability=avg_fee_stability,
-            avg_response_time_ms=int(statistics.mean(response_times)) if response_times else 0,
+            avg_response_time_ms=int(response_sum / weight),
             total_force_closes=force_closes,
             reporters=unique_reporters,
             report_count=len(filtered),
             warnings=dict(warnings_count),
             confidence=confidence,
-            last_update=max(timestamps) if timestamps else 0,
-            oldest_report=min(timestamps) if timestamps else 0,
+            last_update=max(timestamps),
+            oldest_report=min(timestamps),
             reputation_score=reputation_score
         )
 
     def _filter_outliers(
         self,
-        reports: List[Dict[str, Any]]
+        reports: List[Dict[str, Any]],
+        state: Optional[PeerReportState] = None
     ) -> List[Dict[str, Any]]:
         """
         Filter outlier reports to prevent manipulation.
 
         Uses median-based outlier detection.
+
+        Args:
+            reports: Reports to filter
+            state: PeerReportState holding exactly these reports, whose
+                maintained medians are used instead of sorting
         """
         if len(reports) < 3:
             return reports  # Not enough data for outlier detection
 
-        # Calculate median uptime
-        uptimes = [r.get("uptime_pct", 1.0) for r in reports]
-        median_uptime = statistics.median(uptimes)
+        if state is not None:
+            median_uptime = state.median_uptime()
+            median_htlc = state.median_htlc_success()
+        else:
+            # Calculate median uptime
+            uptimes = [r.get("uptime_pct", 1.0) for r in reports]
+            median_uptime = statistics.median(uptimes)
 
-        # Calculate median HTLC success
-        htlcs = [r.get("htlc_success_rate", 1.0) for r in reports]
-        median_htlc = statistics.median(htlcs)
+            # Calculate median HTLC success
+            htlcs = [r.get("htlc_success_rate", 1.0) for r in reports]
+            median_htlc = statistics.median(htlcs)
 
         # Filter reports that deviate significantly from median
         filtered = []
@@ -529,22 +658,124 @@ class PeerReputationManager:
             "avg_reputation_score": round(avg_score, 1),
         }
 
-    def aggregate_from_database(self):
+    def aggregate_from_database(self) -> int:
         """
         Rebuild aggregations from database reports.
 
-        Used on startup or after clearing in-memory data.
+        Used on startup or after clearing in-memory data. Loads the latest
+        report of every reporter for every peer in one query; afterwards
+        new reports are aggregated from memory alone.
+
+        Returns:
+            Number of peers aggregated
+        """
+        with self._state_lock:
+            reports = self.database.get_latest_peer_reputation_reports(
+                max_age_hours=REPUTATION_STALENESS_HOURS
+            )
+            self._report_state = {}
+            self._aggregated = {}
+            self._load_reports(reports, [])
+            self._state_complete = True
+            return len(self._aggregated)
+
+    def refresh_peers_in_range(self, after_id: int, up_to_id: int) -> int:
         """
-        # Get all unique peers with reports
-        all_reports = self.database.get_all_peer_reputation_reports(
-            max_age_hours=REPUTATION_STALENESS_HOURS
+        Recompute aggregations for peers with reports after_id < id <= up_to_id.
+
+        Only peers touched since the snapshot watermark are re-aggregated;
+        everything else keeps the restored aggregate.
+
+        Args:
+            after_id: Snapshot watermark (exclusive)
+            up_to_id: Highest id present when the refresh was scheduled
+
+        Returns:
+            Number of peers re-aggregated
+        """
+        if up_to_id <= after_id:
+            return 0
+
+        if after_id <= 0:
+            # No snapshot: every peer is touched, so bulk-load them all
+            self.aggregate_from_database()
+            return len(self._aggregated)
+
+        peers = self.database.get_peer_reputation_peers_in_id_range(
+            after_id, up_to_id, max_age_hours=REPUTATION_STALENESS_HOURS
         )
+        if peers:
+            # One bulk load for every touched peer
+            with self._state_lock:
+                self._load_reports(
+                    self.database.get_latest_peer_reputation_reports(
+                        max_age_hours=REPUTATION_STALENESS_HOURS, peer_ids=peers
+                    ),
+                    peers
+                )
+
+        return len(peers)
+
+    def export_snapshot_state(self) -> Dict[str, List[Any]]:
+        """
+        Export aggregated reputations in columnar form for the intel snapshot.
 
-        # Group by peer_id
-        peers = set(r.get("peer_id") for r in all_reports if r.get("peer_id"))
+        Returns:
+            Dict mapping field name -> list of values (one entry per peer)
+        """
+        fields = [
+            "peer_id", "avg_uptime", "avg_htlc_success", "avg_fee_stability",
+            "avg_response_time_ms", "total_force_closes", "reporters",
+            "report_count", "warnings", "confidence", "last_update",
+            "oldest_report", "reputation_score",
+        ]
+        columns: Dict[str, List[Any]] = {f: [] for f in fields}
+        for rep in list(self._aggregated.values()):
+            for f in fields:
+                value = getattr(rep, f)
+                if f == "reporters":
+                    value = sorted(value)
+                columns[f].append(value)
+        return columns
+
+    def restore_snapshot_state(self, columns: Dict[str, List[Any]]) -> int:
+        """
+        Replace aggregated reputations with the columnar state from a snapshot.
 
-        for peer_id in peers:
-            self._update_aggregation(peer_id)
+        Args:
+            columns: Output of export_snapshot_state()
+
+        Returns:
+            Number of peers restored
+        """
+        stale_cutoff = time.time() - (REPUTATION_STALENESS_HOURS * 3600)
+        restored: Dict[str, AggregatedReputation] = {}
+
+        for i, peer_id in enumerate(columns.get("peer_id", [])):
+            if columns["last_update"][i] < stale_cutoff:
+                continue
+            restored[peer_id] = AggregatedReputation(
+                peer_id=peer_id,
+                avg_uptime=columns["avg_uptime"][i],
+                avg_htlc_success=columns["avg_htlc_success"][i],
+                avg_fee_stability=columns["avg_fee_stability"][i],
+                avg_response_time_ms=columns["avg_response_time_ms"][i],
+                total_force_closes=columns["total_force_closes"][i],
+                reporters=set(columns["reporters"][i]),
+                report_count=columns["report_count"][i],
+                warnings=dict(columns["warnings"][i]),
+                confidence=columns["confidence"][i],
+                last_update=columns["last_update"][i],
+                oldest_report=columns["oldest_report"][i],
+                reputation_score=columns["reputation_score"][i],
+            )
+
+        with self._state_lock:
+            # Report state is reloaded per peer on demand after a restore
+            self._aggregated = restored
+            self._report_state = {}
+            self._state_complete = False
+        return len(restored)
 
     def cleanup_stale_data(self) -> int:
         """
@@ -556,12 +787,19 @@ class PeerReputationManager:
         now = time.time()
         stale_cutoff = now - (REPUTATION_STALENESS_HOURS * 3600)
 
-        stale_peers = [
-            peer_id for peer_id, rep in self._aggregated.items()
-            if rep.last_update < stale_cutoff
-        ]
+        with self._state_lock:
+            stale_peers = [
+                peer_id for peer_id, rep in self._aggregated.items()
+                if rep.last_update < stale_cutoff
+            ]
+
+            for peer_id in stale_peers:
+                del self._aggregated[peer_id]
+                self._report_state.pop(peer_id, None)
 
-        for peer_id in stale_peers:
-            del self._aggregated[peer_id]
+            # Re-aggregate peers where some reporters' latest reports aged out
+            for peer_id, state in list(self._report_state.items()):
+                if any(r.get("timestamp", 0) <= stale_cutoff for r in state.reports.values()):
+                    self._recompute(peer_id)
 
         return len(stale_peers)
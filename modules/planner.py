@@ -117,6 +117,10 @@ CORRIDOR_VALUE_BONUS_MEDIUM = 1.15    # 15% bonus for medium-value corridors
 # Redundancy penalty from rationalization (stigmergic marker-based)
 REDUNDANCY_PENALTY_OVERSERVED = 0.3   # 70% penalty if already well-owned by another member
 
+# Graph centrality bonus (closeness gain of the new channel for our node)
+CENTRALITY_GAIN_BONUS_MAX = 1.3       # Up to 30% bonus for closeness-improving targets
+CENTRALITY_GAIN_FULL_BONUS = 0.10     # Relative closeness gain that earns the full bonus
+
 
 # =============================================================================
 # DATA CLASSES
@@ -629,7 +633,7 @@ class Planner:
                  intent_manager=None, decision_engine=None,
                  liquidity_coordinator=None, splice_coordinator=None,
                  health_aggregator=None, rationalization_mgr=None,
-                 strategic_positioning_mgr=None):
+                 strategic_positioning_mgr=None, centrality_engine=None):
         """
         Initialize the Planner.
 
@@ -646,6 +650,7 @@ class Planner:
             health_aggregator: HealthScoreAggregator for fleet health (Phase 7)
             rationalization_mgr: RationalizationManager for redundancy detection
             strategic_positioning_mgr: StrategicPositioningManager for corridor value
+            centrality_engine: GraphCentralityEngine fed from the network cache
         """
         self.state_manager = state_manager
         self.db = database
@@ -663,6 +668,7 @@ class Planner:
         # Yield optimization modules - slime mold coordination
         self.rationalization_mgr = rationalization_mgr
         self.strategic_positioning_mgr = strategic_positioning_mgr
+        self.centrality_engine = centrality_engine
 
         # Quality scorer for peer evaluation (Phase 6.2)
         if PeerQualityScorer and database:
@@ -905,6 +911,35 @@ class Planner:
             self._log(f"Error getting corridor value: {e}", level='debug')
             return 1.0, "unknown"
 
+    def _get_centrality_bonus(self, target: str) -> tuple:
+        """
+        Get bonus for targets that move our node closer to the network.
+
+        Uses the graph centrality engine's closeness gain for a channel
+        from our node to the target, relative to our current closeness.
+
+        Args:
+            target: Target node pubkey
+
+        Returns:
+            Tuple of (bonus_multiplier: float, relative_gain: float or None)
+        """
+        if not self.centrality_engine or not self.intent_manager:
+            return 1.0, None
+
+        try:
+            gain = self.centrality_engine.get_relative_edge_gain(
+                self.intent_manager.our_pubkey, target
+            )
+            if gain is None:
+                return 1.0, None
+            fraction = min(1.0, gain / CENTRALITY_GAIN_FULL_BONUS)
+            return 1.0 + (CENTRALITY_GAIN_BONUS_MAX - 1.0) * fraction, gain
+
+        except Exception as e:
+            self._log(f"Error getting centrality gain: {e}", level='debug')
+            return 1.0, None
+
     def _is_exchange_target(self, target: str) -> tuple:
         """
         Check if target is a priority exchange node.
@@ -1146,6 +1181,11 @@ class Planner:
             self._network_cache = capacity_map
             self._network_cache_time = now
 
+            # Same snapshot drives the centrality engine (recomputes off-thread
+            # only when the graph epoch changed)
+            if self.centrality_engine:
+                self.centrality_engine.update_graph(channels_raw)
+
             self._log(f"Network cache refreshed: {len(seen_pairs)} channels, "
                      f"{len(capacity_map)} targets", level='debug')
             return True
@@ -1713,6 +1753,16 @@ class Planner:
                     level='debug'
                 )
 
+            # Graph centrality: boost targets that shorten our paths to the network
+            centrality_bonus, centrality_gain = self._get_centrality_bonus(target)
+            if centrality_bonus > 1.0:
+                adjusted_score *= centrality_bonus
+                self._log(
+                    f"Boosting {target[:16]}... - closeness gain {centrality_gain:.1%} "
+                    f"(+{int((centrality_bonus-1)*100)}%)",
+                    level='debug'
+                )
+
             # Phase 6.2: Factor in quality score
             # Combined score = adjusted_score * quality_multiplier
             # Quality multiplier ranges from 0.5 (avoid) to 1.5 (excellent)
@@ -0,0 +1,224 @@
+"""
+Policy Reconciler for cl-hive.
+
+Keeps cl-revenue-ops fee policies in line with hive membership in bulk,
+instead of one Bridge.set_hive_policy() / verify_hive_channel_zero_fees()
+round trip per member per cycle.
+
+Each reconcile() pass:
+1. Fetches the complete revenue-ops policy set once (revenue-policy list)
+2. Computes the desired policy for every member and policy-holding peer
+   from HiveDatabase membership
+3. Applies only the drifted policies (skipped in dry-run mode)
+4. Verifies zero fees on all full-member channels with three RPCs
+
+Desired policy:
+- MEMBER: HIVE strategy (0 PPM fees) with rebalancing enabled
+- NEOPHYTE: left alone. The handshake gives newly admitted neophytes the
+  HIVE strategy, so both HIVE and a regular policy are accepted
+- Non-member: must not hold the HIVE strategy; any other policy (e.g. a
+  static policy set by the advisor) is left alone
+
+A clean cycle costs O(1) RPCs; only drift adds one set per peer.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from modules.membership import MembershipTier
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+HIVE_STRATEGY = "hive"        # Zero-fee strategy for full members
+DEFAULT_STRATEGY = "dynamic"  # Strategy restored for peers leaving the hive
+
+# Reasons that mean "nothing to verify", not a fee violation
+ZERO_FEE_IGNORED_REASONS = ("no_channel", "our_direction_not_found")
+
+
+# =============================================================================
+# DATA CLASSES
+# =============================================================================
+
+@dataclass
+class PolicyDrift:
+    """One peer whose revenue-ops policy differs from the desired policy."""
+    peer_id: str
+    current_strategy: Optional[str]
+    desired_strategy: str
+    reason: str
+    applied: Optional[bool] = None  # None in dry-run mode
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "peer_id": self.peer_id,
+            "current_strategy": self.current_strategy,
+            "desired_strategy": self.desired_strategy,
+            "reason": self.reason,
+            "applied": self.applied,
+        }
+
+
+@dataclass
+class ReconcileReport:
+    """Outcome of one reconciliation pass."""
+    timestamp: int
+    dry_run: bool
+    policies_fetched: int = 0
+    members_checked: int = 0
+    drift: List[PolicyDrift] = field(default_factory=list)
+    applied: int = 0
+    failed: int = 0
+    fee_violations: Dict[str, str] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def in_sync(self) -> bool:
+        return self.error is None and not self.drift and not self.fee_violations
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "timestamp": self.timestamp,
+            "dry_run": self.dry_run,
+            "in_sync": self.in_sync,
+            "policies_fetched": self.policies_fetched,
+            "members_checked": self.members_checked,
+            "drift_count": len(self.drift),
+            "drift": [d.to_dict() for d in self.drift],
+            "applied": self.applied,
+            "failed": self.failed,
+            "fee_violations": self.fee_violations,
+            "error": self.error,
+        }
+
+
+# =============================================================================
+# RECONCILER
+# =============================================================================
+
+class PolicyReconciler:
+    """Reconciles revenue-ops policies against hive membership in bulk."""
+
+    def __init__(self, bridge, database, our_pubkey: str,
+                 log_fn: Optional[Callable[[str, str], None]] = None):
+        """
+        Args:
+            bridge: Bridge instance
+            database: HiveDatabase instance
+            our_pubkey: Our node's pubkey (never given a policy)
+            log_fn: Optional Callable(msg, level) for logging
+        """
+        self.bridge = bridge
+        self.db = database
+        self.our_pubkey = our_pubkey
+        self._log_fn = log_fn
+        self.last_report: Optional[ReconcileReport] = None
+
+    def _log(self, msg: str, level: str = "info") -> None:
+        if self._log_fn:
+            self._log_fn(f"[PolicyReconciler] {msg}", level)
+
+    def desired_strategies(self) -> Dict[str, bool]:
+        """
+        Map each hive member to whether it should hold the HIVE strategy.
+
+        Returns:
+            Dict of peer_id -> True for full members, False otherwise
+        """
+        desired = {}
+        for member in self.db.get_all_members():
+            peer_id = member.get("peer_id")
+            if not peer_id or peer_id == self.our_pubkey:
+                continue
+            desired[peer_id] = member.get("tier") == MembershipTier.MEMBER.value
+        return desired
+
+    @staticmethod
+    def _diff(policies: Dict[str, Dict[str, Any]],
+              desired: Dict[str, bool]) -> List[PolicyDrift]:
+        """Compare current policies with the desired hive membership."""
+        drift = []
+        for peer_id, is_member in desired.items():
+            policy = policies.get(peer_id) or {}
+            strategy = policy.get("strategy")
+            if is_member:
+                rebalance = policy.get("rebalance_mode", policy.get("rebalance"))
+                if strategy != HIVE_STRATEGY:
+                    reason = "missing_policy" if not policy else "member_without_hive_strategy"
+                    drift.append(PolicyDrift(peer_id, strategy, HIVE_STRATEGY, reason))
+                elif rebalance is not None and rebalance != "enabled":
+                    drift.append(PolicyDrift(peer_id, strategy, HIVE_STRATEGY,
+                                             f"rebalance_{rebalance}"))
+
+        # Former members and other neighbors still holding zero fees
+        for peer_id, policy in policies.items():
+            if peer_id not in desired and policy.get("strategy") == HIVE_STRATEGY:
+                drift.append(PolicyDrift(peer_id, HIVE_STRATEGY, DEFAULT_STRATEGY,
+                                         "non_member_with_hive_strategy"))
+        return drift
+
+    def reconcile(self, dry_run: bool = False, verify_fees: bool = True,
+                  bypass_rate_limit: bool = False) -> ReconcileReport:
+        """
+        Run one reconciliation pass.
+
+        Args:
+            dry_run: Report drift without changing any policy
+            verify_fees: Also check full-member channels for non-zero fees
+            bypass_rate_limit: Skip the Bridge's per-peer policy rate limit
+                (startup sync only)
+
+        Returns:
+            ReconcileReport describing drift and what was applied
+        """
+        report = ReconcileReport(timestamp=int(time.time()), dry_run=dry_run)
+
+        policies = self.bridge.list_policies()
+        if policies is None:
+            report.error = "revenue-ops policies unavailable"
+            self.last_report = report
+            return report
+
+        desired = self.desired_strategies()
+        report.policies_fetched = len(policies)
+        report.members_checked = len(desired)
+        report.drift = self._diff(policies, desired)
+
+        if not dry_run:
+            for drift in report.drift:
+                drift.applied = bool(self.bridge.set_hive_policy(
+                    drift.peer_id,
+                    is_member=drift.desired_strategy == HIVE_STRATEGY,
+                    bypass_rate_limit=bypass_rate_limit
+                ))
+                if drift.applied:
+                    report.applied += 1
+                else:
+                    report.failed += 1
+
+        if verify_fees:
+            members = [peer_id for peer_id, is_member in desired.items() if is_member]
+            if members:
+                for peer_id, (ok, reason) in self.bridge.verify_hive_channels_zero_fees(members).items():
+                    if not ok and reason not in ZERO_FEE_IGNORED_REASONS:
+                        report.fee_violations[peer_id] = reason
+
+        if report.drift:
+            self._log(
+                f"{'Detected' if dry_run else 'Reconciled'} {len(report.drift)} policy drift(s): "
+                f"{report.applied} applied, {report.failed} failed",
+                "info" if dry_run or not report.failed else "warn"
+            )
+        if report.fee_violations:
+            self._log(
+                f"SECURITY WARNING - Hive channels with non-zero fees: "
+                f"{[(p[:16], r) for p, r in report.fee_violations.items()]}",
+                "warn"
+            )
+
+        self.last_report = report
+        return report
@@ -16,7 +16,7 @@ The overall quality score is a weighted combination of these components.
 
 import math
 from dataclasses import dataclass
-from typing import Dict, Any, Optional, List, TYPE_CHECKING
+from typing import Dict, Any, Optional, List, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .database import HiveDatabase
@@ -130,7 +130,23 @@ class PeerQualityScorer:
         """
         # Get aggregated event summary
         summary = self.database.get_peer_event_summary(peer_id, days=days)
+        return self._score_summary(peer_id, summary, days)
 
+    def _score_summary(
+        self, peer_id: str, summary: Dict[str, Any], days: int, log: bool = True
+    ) -> PeerQualityResult:
+        """
+        Score a peer from its aggregated event summary.
+
+        Args:
+            peer_id: The external peer's pubkey
+            summary: Summary as returned by get_peer_event_summary()
+            days: Number of days the summary covers
+            log: Log the per-peer result
+
+        Returns:
+            PeerQualityResult with scores and recommendation
+        """
         factors = {
             "days_analyzed": days,
             "event_count": summary["event_count"],
@@ -181,11 +197,12 @@ class PeerQualityScorer:
             "consistency": f"{self.WEIGHT_CONSISTENCY:.0%}",
         }
 
-        self._log(
-            f"Quality score for {peer_id[:16]}...: "
-            f"overall={overall:.3f} confidence={confidence:.3f} "
-            f"rec={recommendation}"
-        )
+        if log:
+            self._log(
+                f"Quality score for {peer_id[:16]}...: "
+                f"overall={overall:.3f} confidence={confidence:.3f} "
+                f"rec={recommendation}"
+            )
 
         return PeerQualityResult(
             peer_id=peer_id,
@@ -512,6 +529,9 @@ class PeerQualityScorer:
         """
         Calculate quality scores for multiple peers.
 
+        All event summaries are fetched with one grouped query, then each
+        peer is scored from its summary without further database access.
+
         Args:
             peer_ids: List of peer pubkeys to score
             days: Number of days of history to consider
@@ -519,13 +539,25 @@ class PeerQualityScorer:
         Returns:
             List of PeerQualityResult, sorted by overall_score descending
         """
-        results = []
-        for peer_id in peer_ids:
-            result = self.calculate_score(peer_id, days=days)
-            results.append(result)
+        if not peer_ids:
+            return []
+        summaries = self.database.get_peer_event_summaries(peer_ids, days=days)
+        return self._score_summaries(
+            [(peer_id, summaries[peer_id]) for peer_id in dict.fromkeys(peer_ids)], days
+        )
+
+    def _score_summaries(
+        self, summaries: List[Tuple[str, Dict[str, Any]]], days: int
+    ) -> List[PeerQualityResult]:
+        """Score prefetched summaries, sorted by overall_score descending."""
+        results = [
+            self._score_summary(peer_id, summary, days, log=False)
+            for peer_id, summary in summaries
+        ]
 
         # Sort by overall score descending
         results.sort(key=lambda r: r.overall_score, reverse=True)
+        self._log(f"Scored {len(results)} peers over {days} days")
         return results
 
     def get_scored_peers(
@@ -541,8 +573,8 @@ class PeerQualityScorer:
         Returns:
             List of PeerQualityResult for all peers with data
         """
-        peer_ids = self.database.get_peers_with_events(days=days)
-        results = self.calculate_scores_batch(peer_ids, days=days)
+        summaries = self.database.get_peer_event_summaries(days=days)
+        results = self._score_summaries(list(summaries.items()), days)
 
         # Filter by confidence if requested
         if min_confidence > 0:
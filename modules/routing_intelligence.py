@@ -10,9 +10,10 @@ Implements collective routing intelligence for the hive:
 Security: All route probes require cryptographic signatures.
 """
 
+import threading
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from collections import defaultdict
 
 from .protocol import (
@@ -106,6 +107,13 @@ class HiveRoutingMap:
         # Key: (destination, path_tuple)
         self._path_stats: Dict[Tuple[str, Tuple[str, ...]], PathStats] = {}
 
+        # Guards every change to _path_stats. Live probes are stored and
+        # applied under it so a background rebuild can tell which probes
+        # its database read already covers.
+        self._stats_lock = threading.RLock()
+        # Live probes applied while a full reload is running (None otherwise)
+        self._rebuild_log: Optional[List[Tuple[Any, ...]]] = None
+
         # Rate limiting
         self._probe_rate: Dict[str, List[float]] = defaultdict(list)
         self._batch_rate: Dict[str, List[float]] = defaultdict(list)
@@ -262,33 +270,34 @@ class HiveRoutingMap:
         estimated_capacity = payload.get("estimated_capacity_sats", 0)
         timestamp = payload.get("timestamp", int(time.time()))
 
-        # Update path statistics
-        self._update_path_stats(
-            destination=destination,
-            path=path,
-            success=success,
-            latency_ms=latency_ms,
-            fee_ppm=total_fee_ppm,
-            capacity_sats=estimated_capacity,
-            reporter_id=reporter_id,
-            failure_reason=failure_reason,
-            timestamp=timestamp
-        )
+        with self._stats_lock:
+            # Update path statistics
+            self._update_path_stats(
+                destination=destination,
+                path=path,
+                success=success,
+                latency_ms=latency_ms,
+                fee_ppm=total_fee_ppm,
+                capacity_sats=estimated_capacity,
+                reporter_id=reporter_id,
+                failure_reason=failure_reason,
+                timestamp=timestamp
+            )
 
-        # Store in database
-        self.database.store_route_probe(
-            reporter_id=reporter_id,
-            destination=destination,
-            path=list(path),
-            success=success,
-            latency_ms=latency_ms,
-            failure_reason=failure_reason,
-            failure_hop=payload.get("failure_hop", -1),
-            estimated_capacity_sats=estimated_capacity,
-            total_fee_ppm=total_fee_ppm,
-            amount_probed_sats=payload.get("amount_probed_sats", 0),
-            timestamp=timestamp
-        )
+            # Store in database
+            self.database.store_route_probe(
+                reporter_id=reporter_id,
+                destination=destination,
+                path=list(path),
+                success=success,
+                latency_ms=latency_ms,
+                failure_reason=failure_reason,
+                failure_hop=payload.get("failure_hop", -1),
+                estimated_capacity_sats=estimated_capacity,
+                total_fee_ppm=total_fee_ppm,
+                amount_probed_sats=payload.get("amount_probed_sats", 0),
+                timestamp=timestamp
+            )
 
         if self.plugin:
             result_str = "success" if success else f"failed ({failure_reason})"
@@ -376,33 +385,34 @@ class HiveRoutingMap:
             total_fee_ppm = probe_data.get("total_fee_ppm", 0)
             estimated_capacity = probe_data.get("estimated_capacity_sats", 0)
 
-            # Update path statistics
-            self._update_path_stats(
-                destination=destination,
-                path=path,
-                success=success,
-                latency_ms=latency_ms,
-                fee_ppm=total_fee_ppm,
-                capacity_sats=estimated_capacity,
-                reporter_id=reporter_id,
-                failure_reason=failure_reason,
-                timestamp=batch_timestamp
-            )
+            with self._stats_lock:
+                # Update path statistics
+                self._update_path_stats(
+                    destination=destination,
+                    path=path,
+                    success=success,
+                    latency_ms=latency_ms,
+                    fee_ppm=total_fee_ppm,
+                    capacity_sats=estimated_capacity,
+                    reporter_id=reporter_id,
+                    failure_reason=failure_reason,
+                    timestamp=batch_timestamp
+                )
 
-            # Store in database
-            self.database.store_route_probe(
-                reporter_id=reporter_id,
-                destination=destination,
-                path=list(path),
-                success=success,
-                latency_ms=latency_ms,
-                failure_reason=failure_reason,
-                failure_hop=probe_data.get("failure_hop", -1),
-                estimated_capacity_sats=estimated_capacity,
-                total_fee_ppm=total_fee_ppm,
-                amount_probed_sats=probe_data.get("amount_probed_sats", 0),
-                timestamp=batch_timestamp
-            )
+                # Store in database
+                self.database.store_route_probe(
+                    reporter_id=reporter_id,
+                    destination=destination,
+                    path=list(path),
+                    success=success,
+                    latency_ms=latency_ms,
+                    failure_reason=failure_reason,
+                    failure_hop=probe_data.get("failure_hop", -1),
+                    estimated_capacity_sats=estimated_capacity,
+                    total_fee_ppm=total_fee_ppm,
+                    amount_probed_sats=probe_data.get("amount_probed_sats", 0),
+                    timestamp=batch_timestamp
+                )
 
             stored_count += 1
 
@@ -496,15 +506,41 @@ class HiveRoutingMap:
         timestamp: int
     ):
         """Update aggregated statistics for a path."""
+        probe = (destination, path, success, latency_ms, fee_ppm,
+                 capacity_sats, reporter_id, failure_reason, timestamp)
+        with self._stats_lock:
+            self._apply_probe(self._path_stats, *probe)
+            if self._rebuild_log is not None:
+                self._rebuild_log.append(probe)
+
+    def _path_stats_snapshot(self) -> Dict[Tuple[str, Tuple[str, ...]], PathStats]:
+        """Copy of the path map for readers (safe to iterate while probes arrive)."""
+        with self._stats_lock:
+            return dict(self._path_stats)
+
+    @staticmethod
+    def _apply_probe(
+        path_stats: Dict[Tuple[str, Tuple[str, ...]], PathStats],
+        destination: str,
+        path: Tuple[str, ...],
+        success: bool,
+        latency_ms: int,
+        fee_ppm: int,
+        capacity_sats: int,
+        reporter_id: str,
+        failure_reason: str,
+        timestamp: int
+    ):
+        """Fold one probe into a path statistics map."""
         key = (destination, path)
 
-        if key not in self._path_stats:
-            self._path_stats[key] = PathStats(
+        if key not in path_stats:
+            path_stats[key] = PathStats(
                 path=path,
                 destination=destination
             )
 
-        stats = self._path_stats[key]
+        stats = path_stats[key]
         stats.probe_count += 1
         stats.reporters.add(reporter_id)
 
@@ -512,7 +548,8 @@ class HiveRoutingMap:
             stats.success_count += 1
             stats.total_latency_ms += latency_ms
             stats.total_fee_ppm += fee_ppm
-            stats.last_success_time = timestamp
+            # Replayed probes can be older than ones already applied
+            stats.last_success_time = max(stats.last_success_time, timestamp)
 
             # Update capacity (weighted average)
             if capacity_sats > 0:
@@ -522,7 +559,7 @@ class HiveRoutingMap:
                     stats.avg_capacity_sats = (
                         stats.avg_capacity_sats * 0.7 + capacity_sats * 0.3
                     )
-        else:
+        elif timestamp >= stats.last_failure_time:
             stats.last_failure_time = timestamp
             stats.last_failure_reason = failure_reason
 
@@ -539,7 +576,7 @@ class HiveRoutingMap:
         path_tuple = tuple(path)
 
         # Look for this path to any destination
-        for (dest, p), stats in self._path_stats.items():
+        for (dest, p), stats in self._path_stats_snapshot().items():
             if p == path_tuple and stats.probe_count > 0:
                 return stats.success_count / stats.probe_count
 
@@ -559,7 +596,7 @@ class HiveRoutingMap:
         now = time.time()
         stale_cutoff = now - (PROBE_STALENESS_HOURS * 3600)
 
-        for (dest, p), stats in self._path_stats.items():
+        for (dest, p), stats in self._path_stats_snapshot().items():
             if p == path_tuple:
                 # Base confidence on reporter diversity
                 reporter_factor = min(1.0, len(stats.reporters) / 3.0)
@@ -636,7 +673,7 @@ class HiveRoutingMap:
         # Collect all paths to this destination
         candidates = []
 
-        for (dest, path), stats in self._path_stats.items():
+        for (dest, path), stats in self._path_stats_snapshot().items():
             if dest != destination:
                 continue
 
@@ -757,7 +794,7 @@ class HiveRoutingMap:
         failed_set = set(failed_path)
         candidates = []
 
-        for (dest, path), stats in self._path_stats.items():
+        for (dest, path), stats in self._path_stats_snapshot().items():
             if dest != destination:
                 continue
 
@@ -845,7 +882,7 @@ class HiveRoutingMap:
         """
         candidates = []
 
-        for (dest, path), stats in self._path_stats.items():
+        for (dest, path), stats in self._path_stats_snapshot().items():
             if dest != destination:
                 continue
 
@@ -889,16 +926,17 @@ class HiveRoutingMap:
         Returns:
             Dict with routing statistics
         """
-        total_paths = len(self._path_stats)
-        total_probes = sum(s.probe_count for s in self._path_stats.values())
-        total_successes = sum(s.success_count for s in self._path_stats.values())
+        path_stats = self._path_stats_snapshot()
+        total_paths = len(path_stats)
+        total_probes = sum(s.probe_count for s in path_stats.values())
+        total_successes = sum(s.success_count for s in path_stats.values())
 
         # Unique destinations
-        destinations = set(dest for dest, _ in self._path_stats.keys())
+        destinations = set(dest for dest, _ in path_stats.keys())
 
         # High quality paths (>90% success)
         high_quality = sum(
-            1 for s in self._path_stats.values()
+            1 for s in path_stats.values()
             if s.probe_count > 0 and s.success_count / s.probe_count >= HIGH_SUCCESS_RATE
         )
 
@@ -906,7 +944,7 @@ class HiveRoutingMap:
         now = time.time()
         recent_cutoff = now - (24 * 3600)
         recent_probes = sum(
-            1 for s in self._path_stats.values()
+            1 for s in path_stats.values()
             if max(s.last_success_time, s.last_failure_time) > recent_cutoff
         )
 
@@ -920,42 +958,187 @@ class HiveRoutingMap:
             "recent_activity_count": recent_probes,
         }
 
-    def aggregate_from_database(self):
+    def aggregate_from_database(self, reset: bool = False) -> int:
         """
         Rebuild path statistics from database probes.
 
         Used on startup or after clearing in-memory data.
+
+        With reset, the statistics are rebuilt in a separate map while live
+        probes keep arriving: probes stored up to a ceiling read under the
+        stats lock come from the database, probes applied live after it are
+        replayed from the rebuild log, and the new map is swapped in.
+
+        Args:
+            reset: Replace the current path statistics (full reload)
+
+        Returns:
+            Number of probes applied
         """
-        probes = self.database.get_all_route_probes(max_age_hours=PROBE_STALENESS_HOURS)
+        if not reset:
+            probes = self.database.get_all_route_probes(max_age_hours=PROBE_STALENESS_HOURS)
+            return sum(self._apply_probe_rows(probes, self._update_path_stats))
 
+        with self._stats_lock:
+            ceiling = self.database.get_max_route_probe_id()
+            self._rebuild_log = []
+        try:
+            rebuilt: Dict[Tuple[str, Tuple[str, ...]], PathStats] = {}
+            applied = self._replay_range(
+                0, ceiling, 5000,
+                lambda *probe: self._apply_probe(rebuilt, *probe)
+            )
+            with self._stats_lock:
+                for probe in self._rebuild_log:
+                    self._apply_probe(rebuilt, *probe)
+                self._path_stats = rebuilt
+            return applied
+        finally:
+            with self._stats_lock:
+                self._rebuild_log = None
+
+    def _apply_probe_rows(self, probes: List[Dict[str, Any]],
+                          apply_fn: Callable[..., None]):
+        """Feed database probe rows to apply_fn; yields 1 per probe applied."""
         for probe in probes:
             path = tuple(probe.get("path", []))
             if not path:
                 continue
+            apply_fn(
+                probe.get("destination", ""),
+                path,
+                probe.get("success", False),
+                probe.get("latency_ms", 0),
+                probe.get("total_fee_ppm", 0),
+                probe.get("estimated_capacity_sats", 0),
+                probe.get("reporter_id", ""),
+                probe.get("failure_reason", ""),
+                probe.get("timestamp", 0)
+            )
+            yield 1
+
+    def _replay_range(self, after_id: int, up_to_id: int, batch_size: int,
+                      apply_fn: Callable[..., None]) -> int:
+        """Page through probes with after_id < id <= up_to_id into apply_fn."""
+        applied = 0
+        cursor = after_id
+
+        while cursor < up_to_id:
+            probes = self.database.get_route_probes_in_id_range(
+                cursor, up_to_id,
+                max_age_hours=PROBE_STALENESS_HOURS,
+                limit=batch_size
+            )
+            if not probes:
+                break
+            applied += sum(self._apply_probe_rows(probes, apply_fn))
+            cursor = probes[-1]["id"]
 
-            self._update_path_stats(
-                destination=probe.get("destination", ""),
+        return applied
+
+    def replay_probes_in_range(
+        self,
+        after_id: int,
+        up_to_id: int,
+        batch_size: int = 5000
+    ) -> int:
+        """
+        Apply database probes with after_id < id <= up_to_id to path stats.
+
+        Pages through the table by id so memory stays bounded regardless of
+        how many probes are pending. The upper bound keeps probes that were
+        already applied live (after startup) from being counted twice.
+
+        Args:
+            after_id: Snapshot watermark (exclusive)
+            up_to_id: Highest id present when the replay was scheduled
+            batch_size: Rows fetched per query
+
+        Returns:
+            Number of probes applied
+        """
+        return self._replay_range(after_id, up_to_id, batch_size, self._update_path_stats)
+
+    def export_snapshot_state(self) -> Dict[str, List[Any]]:
+        """
+        Export path statistics in columnar form for the intel snapshot.
+
+        Returns:
+            Dict mapping field name -> list of values (one entry per path)
+        """
+        columns: Dict[str, List[Any]] = {
+            "destination": [], "path": [], "probe_count": [],
+            "success_count": [], "total_latency_ms": [], "total_fee_ppm": [],
+            "last_success_time": [], "last_failure_time": [],
+            "last_failure_reason": [], "avg_capacity_sats": [], "reporters": [],
+        }
+        for stats in self._path_stats_snapshot().values():
+            columns["destination"].append(stats.destination)
+            columns["path"].append(list(stats.path))
+            columns["probe_count"].append(stats.probe_count)
+            columns["success_count"].append(stats.success_count)
+            columns["total_latency_ms"].append(stats.total_latency_ms)
+            columns["total_fee_ppm"].append(stats.total_fee_ppm)
+            columns["last_success_time"].append(stats.last_success_time)
+            columns["last_failure_time"].append(stats.last_failure_time)
+            columns["last_failure_reason"].append(stats.last_failure_reason)
+            columns["avg_capacity_sats"].append(stats.avg_capacity_sats)
+            columns["reporters"].append(sorted(stats.reporters))
+        return columns
+
+    def restore_snapshot_state(self, columns: Dict[str, List[Any]]) -> int:
+        """
+        Replace path statistics with the columnar state from a snapshot.
+
+        Paths whose last observation is outside the staleness window are
+        dropped, matching what cleanup_stale_data() would do.
+
+        Args:
+            columns: Output of export_snapshot_state()
+
+        Returns:
+            Number of paths restored
+        """
+        stale_cutoff = time.time() - (PROBE_STALENESS_HOURS * 3600)
+        restored: Dict[Tuple[str, Tuple[str, ...]], PathStats] = {}
+
+        for i, destination in enumerate(columns.get("destination", [])):
+            last_success = columns["last_success_time"][i]
+            last_failure = columns["last_failure_time"][i]
+            if max(last_success, last_failure) < stale_cutoff:
+                continue
+
+            path = tuple(columns["path"][i])
+            restored[(destination, path)] = PathStats(
                 path=path,
-                success=probe.get("success", False),
-                latency_ms=probe.get("latency_ms", 0),
-                fee_ppm=probe.get("total_fee_ppm", 0),
-                capacity_sats=probe.get("estimated_capacity_sats", 0),
-                reporter_id=probe.get("reporter_id", ""),
-                failure_reason=probe.get("failure_reason", ""),
-                timestamp=probe.get("timestamp", 0)
+                destination=destination,
+                probe_count=columns["probe_count"][i],
+                success_count=columns["success_count"][i],
+                total_latency_ms=columns["total_latency_ms"][i],
+                total_fee_ppm=columns["total_fee_ppm"][i],
+                last_success_time=last_success,
+                last_failure_time=last_failure,
+                last_failure_reason=columns["last_failure_reason"][i],
+                avg_capacity_sats=columns["avg_capacity_sats"][i],
+                reporters=set(columns["reporters"][i]),
             )
 
+        with self._stats_lock:
+            self._path_stats = restored
+        return len(restored)
+
     def cleanup_stale_data(self):
         """Remove stale path statistics."""
         now = time.time()
         stale_cutoff = now - (PROBE_STALENESS_HOURS * 3600)
 
-        stale_keys = [
-            key for key, stats in self._path_stats.items()
-            if max(stats.last_success_time, stats.last_failure_time) < stale_cutoff
-        ]
+        with self._stats_lock:
+            stale_keys = [
+                key for key, stats in self._path_stats.items()
+                if max(stats.last_success_time, stats.last_failure_time) < stale_cutoff
+            ]
 
-        for key in stale_keys:
-            del self._path_stats[key]
+            for key in stale_keys:
+                del self._path_stats[key]
 
         return len(stale_keys)
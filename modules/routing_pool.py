@@ -18,7 +18,7 @@ import time
 import datetime
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 from . import network_metrics
 
@@ -100,6 +100,165 @@ class PoolStatus:
     projected_distribution: Dict[str, int]
 
 
+@dataclass
+class SnapshotInputs:
+    """Every input to a contribution snapshot, gathered once for all members."""
+    members: List[Dict[str, Any]]
+    peer_states: Dict[str, Any]                       # member_id -> gossiped state
+    position_metrics: Dict[str, Any]                  # member_id -> MemberPositionMetrics
+    contribution_stats: Dict[str, Dict[str, int]]     # member_id -> forwarded/received
+    health: Dict[str, Dict[str, Any]]                 # member_id -> health record
+
+
+# =============================================================================
+# SCORING
+# =============================================================================
+
+def _score_columns(
+    capacities: List[int],
+    uptimes: List[float],
+    centralities: List[float],
+    unique_peers: List[int],
+    bridge_scores: List[float],
+    success_rates: List[float],
+    response_times: List[float],
+) -> Tuple[List[int], List[float], List[float]]:
+    """
+    Element-wise contribution scores over per-member input columns.
+
+    Returns:
+        (weighted_capacity_sats, position_scores, operations_scores)
+    """
+    # Capital: offline capacity doesn't help
+    weighted = [int(c * u) for c, u in zip(capacities, uptimes)]
+
+    # Position: centrality, unique peers (coverage), bridge score (clusters)
+    position = [
+        min(1.0, c / MAX_CENTRALITY) * 0.4 +
+        min(1.0, p / MAX_UNIQUE_PEERS) * 0.3 +
+        min(1.0, b / MAX_BRIDGE_SCORE) * 0.3
+        for c, p, b in zip(centralities, unique_peers, bridge_scores)
+    ]
+
+    # Operations: success rate (reliability), response time (speed)
+    operations = [
+        min(1.0, s / TARGET_SUCCESS_RATE) * 0.7 +
+        max(0.0, 1.0 - (r / (TARGET_RESPONSE_MS * 10))) * 0.3
+        for s, r in zip(success_rates, response_times)
+    ]
+    return weighted, position, operations
+
+
+def _pool_share_column(
+    weighted: List[int],
+    position: List[float],
+    operations: List[float],
+) -> Optional[List[float]]:
+    """
+    Normalized pool shares from score columns.
+
+    Returns:
+        Shares summing to 1.0, or None if every raw score is zero
+    """
+    total_raw_score = sum(
+        w * CAPITAL_WEIGHT + p * POSITION_WEIGHT + o * OPERATIONS_WEIGHT
+        for w, p, o in zip(weighted, position, operations)
+    )
+    if total_raw_score == 0:
+        return None
+
+    capacity_norm = max(1, sum(weighted))
+    weight_sum = CAPITAL_WEIGHT + POSITION_WEIGHT + OPERATIONS_WEIGHT
+    shares = [
+        ((w / capacity_norm) * CAPITAL_WEIGHT + p * POSITION_WEIGHT + o * OPERATIONS_WEIGHT) / weight_sum
+        for w, p, o in zip(weighted, position, operations)
+    ]
+    total_shares = sum(shares)
+    if total_shares > 0:
+        shares = [s / total_shares for s in shares]
+    return shares
+
+
+def _estimate_operations(
+    member: Optional[Dict[str, Any]],
+    stats: Optional[Dict[str, int]],
+    health: Optional[Dict[str, Any]],
+) -> Tuple[float, float]:
+    """
+    Estimate operations metrics from proxy signals.
+
+    - success_rate: Estimated from contribution ratio and uptime
+                   (nodes that forward more with high uptime are reliable)
+    - response_time_ms: Estimated from uptime (high uptime = likely responsive)
+
+    Note: Without explicit HTLC success/failure tracking, we approximate
+    using available proxy metrics. Future enhancement could add actual
+    timing data from forward events.
+
+    Args:
+        member: hive_members row (uptime_pct)
+        stats: 30-day contribution ledger totals (forwarded/received)
+        health: Member health record, which may carry measured values
+
+    Returns:
+        (success_rate, response_time_ms)
+    """
+    uptime_pct = 1.0
+    if member:
+        uptime_pct = member.get('uptime_pct', 1.0)
+        # Handle percentage stored as 0-100 vs 0-1
+        if uptime_pct > 1.0:
+            uptime_pct = uptime_pct / 100.0
+
+    # Contribution stats as proxy for routing reliability
+    contribution_ratio = 1.0
+    total_forwarded = 0
+    if stats:
+        forwarded = stats.get('forwarded', 0)
+        received = stats.get('received', 0)
+        total_forwarded = forwarded
+        if received > 0:
+            contribution_ratio = forwarded / received
+
+    # Estimate success rate:
+    # - Base rate from uptime (offline nodes can't succeed)
+    # - Boost for good contribution ratio (active routing = working node)
+    # - Cap at TARGET_SUCCESS_RATE (0.95)
+    base_success = uptime_pct * 0.9  # Uptime contributes 90% of base
+
+    # Contribution bonus: nodes that forward a lot are likely reliable
+    # Scale: ratio of 1.0+ is good, higher is better, cap bonus at 10%
+    contrib_bonus = min(0.10, (min(contribution_ratio, 2.0) - 0.5) * 0.1)
+
+    success_rate = min(TARGET_SUCCESS_RATE, base_success + contrib_bonus)
+    success_rate = max(0.5, success_rate)  # Floor at 50%
+
+    # Estimate response time from uptime, 20ms (best) to 200ms (worst)
+    if uptime_pct >= 0.99:
+        response_time_ms = 30.0
+    elif uptime_pct >= 0.95:
+        response_time_ms = 50.0
+    elif uptime_pct >= 0.90:
+        response_time_ms = 80.0
+    else:
+        response_time_ms = 120.0
+
+    # Adjust for routing activity (active nodes are tuned)
+    if total_forwarded > 1000000:  # >1M sats forwarded
+        response_time_ms = max(20.0, response_time_ms - 20.0)
+    elif total_forwarded > 100000:  # >100k sats
+        response_time_ms = max(20.0, response_time_ms - 10.0)
+
+    # Measured values from health data take precedence
+    if health:
+        if 'success_rate' in health:
+            success_rate = health['success_rate']
+        if 'avg_response_ms' in health:
+            response_time_ms = health['avg_response_ms']
+
+    return (success_rate, response_time_ms)
+
+
 # =============================================================================
 # ROUTING POOL CLASS
 # =============================================================================
@@ -243,36 +402,14 @@ class RoutingPool:
         Returns:
             MemberContribution with computed scores
         """
-        # Capital score (70% weight)
-        # - Higher capacity = higher score
-        # - Weighted by uptime (offline capacity doesn't help)
-        weighted_capacity = int(capacity_sats * uptime_pct)
-        capital_score = uptime_pct  # Normalized by uptime, capacity used for weighting
-
-        # Position score (20% weight)
-        # - Higher centrality = more important position
-        # - More unique peers = more network coverage
-        # - Higher bridge score = connects clusters
-        centrality_norm = min(1.0, centrality / MAX_CENTRALITY)
-        unique_peers_norm = min(1.0, unique_peers / MAX_UNIQUE_PEERS)
-        bridge_norm = min(1.0, bridge_score / MAX_BRIDGE_SCORE)
-
-        position_score = (
-            centrality_norm * 0.4 +
-            unique_peers_norm * 0.3 +
-            bridge_norm * 0.3
-        )
-
-        # Operations score (10% weight)
-        # - Higher success rate = more reliable
-        # - Lower response time = faster routing
-        success_score = min(1.0, success_rate / TARGET_SUCCESS_RATE)
-        response_score = max(0.0, 1.0 - (response_time_ms / (TARGET_RESPONSE_MS * 10)))
-
-        operations_score = (
-            success_score * 0.7 +
-            response_score * 0.3
+        # Capital score (70% weight): capacity weighted by uptime
+        # Position score (20% weight): centrality, unique peers, bridge score
+        # Operations score (10% weight): success rate, response time
+        (weighted_capacity,), (position_score,), (operations_score,) = _score_columns(
+            [capacity_sats], [uptime_pct], [centrality], [unique_peers],
+            [bridge_score], [success_rate], [response_time_ms]
         )
+        capital_score = uptime_pct  # Normalized by uptime, capacity used for weighting
 
         # Combined score (will be normalized to pool_share later)
         # This is raw score, pool_share is relative to other members
@@ -298,8 +435,9 @@ class RoutingPool:
         """
         Snapshot all member contributions for a period.
 
-        Queries state from state_manager and health_aggregator,
-        calculates scores, and stores in database.
+        Gathers every member's inputs in one pass (gossiped state, position
+        metrics, contribution ledger, health), computes the scores over the
+        per-member columns and stores the snapshot in one transaction.
 
         Args:
             period: Period string (default: current week)
@@ -310,89 +448,78 @@ class RoutingPool:
         if period is None:
             period = self._current_period()
 
-        contributions = []
-        total_weighted_capacity = 0
-
         # Get all members
         members = self.db.get_all_members()
         if not members:
             self._log("No members found for contribution snapshot")
             return []
 
-        # First pass: calculate raw contributions
-        for member in members:
-            member_id = member['peer_id']
-
-            # Get capacity and uptime
-            capacity = self._get_member_capacity(member_id)
-            uptime = member.get('uptime_pct', 1.0)
-
-            # Get position metrics (from state_manager if available)
-            centrality, unique_peers, bridge_score = self._get_position_metrics(member_id)
-
-            # Get operations metrics
-            success_rate, response_time = self._get_operations_metrics(member_id)
-
-            contrib = self.calculate_contribution(
-                member_id=member_id,
+        inputs = self._gather_snapshot_inputs(members)
+        member_ids = [m['peer_id'] for m in members]
+
+        # Input columns, one entry per member
+        capacities = [
+            getattr(inputs.peer_states.get(mid), 'capacity_sats', 0) or 0
+            for mid in member_ids
+        ]
+        uptimes = [m.get('uptime_pct', 1.0) for m in members]
+        positions = self._position_metrics_all(member_ids, inputs)
+        operations = [
+            _estimate_operations(m, inputs.contribution_stats.get(mid), inputs.health.get(mid))
+            for m, mid in zip(members, member_ids)
+        ]
+
+        weighted, position_scores, operations_scores = _score_columns(
+            capacities, uptimes,
+            [p[0] for p in positions], [p[1] for p in positions], [p[2] for p in positions],
+            [o[0] for o in operations], [o[1] for o in operations],
+        )
+        contributions = [
+            MemberContribution(
+                member_id=member_ids[i],
                 period=period,
-                capacity_sats=capacity,
-                uptime_pct=uptime,
-                centrality=centrality,
-                unique_peers=unique_peers,
-                bridge_score=bridge_score,
-                success_rate=success_rate,
-                response_time_ms=response_time
+                total_capacity_sats=capacities[i],
+                weighted_capacity_sats=weighted[i],
+                uptime_pct=uptimes[i],
+                betweenness_centrality=positions[i][0],
+                unique_peers=positions[i][1],
+                bridge_score=positions[i][2],
+                routing_success_rate=operations[i][0],
+                avg_response_time_ms=operations[i][1],
+                capital_score=uptimes[i],
+                position_score=position_scores[i],
+                operations_score=operations_scores[i],
             )
+            for i in range(len(members))
+        ]
 
-            contributions.append(contrib)
-            total_weighted_capacity += contrib.weighted_capacity_sats
-
-        # Second pass: calculate pool shares
-        total_raw_score = sum(
-            c.weighted_capacity_sats * CAPITAL_WEIGHT +
-            c.position_score * POSITION_WEIGHT +
-            c.operations_score * OPERATIONS_WEIGHT
-            for c in contributions
-        )
-
-        if total_raw_score == 0:
+        shares = _pool_share_column(weighted, position_scores, operations_scores)
+        if shares is None:
             self._log("Total raw score is 0, cannot calculate shares")
             return contributions
-
-        for contrib in contributions:
-            raw_score = (
-                (contrib.weighted_capacity_sats / max(1, total_weighted_capacity)) * CAPITAL_WEIGHT +
-                contrib.position_score * POSITION_WEIGHT +
-                contrib.operations_score * OPERATIONS_WEIGHT
-            )
-            contrib.pool_share = raw_score / (CAPITAL_WEIGHT + POSITION_WEIGHT + OPERATIONS_WEIGHT)
-
-        # Normalize shares to sum to 1.0
-        total_shares = sum(c.pool_share for c in contributions)
-        if total_shares > 0:
-            for contrib in contributions:
-                contrib.pool_share /= total_shares
+        for contrib, share in zip(contributions, shares):
+            contrib.pool_share = share
 
         # Store in database
-        for contrib in contributions:
-            self.db.record_pool_contribution(
-                member_id=contrib.member_id,
-                period=period,
-                total_capacity_sats=contrib.total_capacity_sats,
-                weighted_capacity_sats=contrib.weighted_capacity_sats,
-                uptime_pct=contrib.uptime_pct,
-                betweenness_centrality=contrib.betweenness_centrality,
-                unique_peers=contrib.unique_peers,
-                bridge_score=contrib.bridge_score,
-                routing_success_rate=contrib.routing_success_rate,
-                avg_response_time_ms=contrib.avg_response_time_ms,
-                pool_share=contrib.pool_share
-            )
+        self.db.record_pool_contributions(period, [
+            {
+                "member_id": c.member_id,
+                "total_capacity_sats": c.total_capacity_sats,
+                "weighted_capacity_sats": c.weighted_capacity_sats,
+                "uptime_pct": c.uptime_pct,
+                "betweenness_centrality": c.betweenness_centrality,
+                "unique_peers": c.unique_peers,
+                "bridge_score": c.bridge_score,
+                "routing_success_rate": c.routing_success_rate,
+                "avg_response_time_ms": c.avg_response_time_ms,
+                "pool_share": c.pool_share,
+            }
+            for c in contributions
+        ])
 
         self._log(
             f"Snapshot complete for {period}: {len(contributions)} members, "
-            f"total capacity {total_weighted_capacity:,} sats"
+            f"total capacity {sum(weighted):,} sats"
         )
 
         return contributions
@@ -422,15 +549,47 @@ class RoutingPool:
             self._log(f"No revenue for period {period}")
             return {}
 
-        # Get contributions for period
+        contributions = self._period_contributions(period)
+        if not contributions:
+            self._log(f"Still no contributions for {period}")
+            return {}
+
+        distributions = self._split_revenue(total_revenue, contributions)
+        if not distributions:
+            return {}
+
+        self._log(
+            f"Distribution for {period}: {total_revenue:,} sats to "
+            f"{len(distributions)} members"
+        )
+
+        return distributions
+
+    def _period_contributions(self, period: str) -> List[Dict[str, Any]]:
+        """Stored contribution snapshot for a period, snapshotting once if missing."""
         contributions = self.db.get_pool_contributions(period)
         if not contributions:
             self._log(f"No contributions recorded for {period}, snapshotting now")
             self.snapshot_contributions(period)
             contributions = self.db.get_pool_contributions(period)
+        return contributions
 
-        if not contributions:
-            self._log(f"Still no contributions for {period}")
+    def _split_revenue(
+        self,
+        total_revenue: int,
+        contributions: List[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """
+        Split revenue across a stored contribution snapshot.
+
+        Args:
+            total_revenue: Pool revenue in sats
+            contributions: Stored contribution rows (member_id, pool_share)
+
+        Returns:
+            Dict mapping member_id to distribution amount in sats
+        """
+        if total_revenue <= 0 or not contributions:
             return {}
 
         # Calculate total shares
@@ -460,11 +619,6 @@ class RoutingPool:
             largest = max(distributions.keys(), key=lambda k: distributions[k])
             distributions[largest] += remainder
 
-        self._log(
-            f"Distribution for {period}: {total_revenue:,} sats to "
-            f"{len(distributions)} members"
-        )
-
         return distributions
 
     def settle_period(self, period: str = None) -> List[PoolDistribution]:
@@ -551,15 +705,11 @@ class RoutingPool:
         # Get revenue
         revenue = self.db.get_pool_revenue(period=period)
 
-        # Get or create contributions
-        contributions = self.db.get_pool_contributions(period)
-        if not contributions:
-            # No snapshot yet, calculate now
-            self.snapshot_contributions(period)
-            contributions = self.db.get_pool_contributions(period)
+        # Served from the stored snapshot (taken once if the period has none)
+        contributions = self._period_contributions(period)
 
-        # Calculate projected distribution
-        projected = self.calculate_distribution(period)
+        # Projected distribution over the same snapshot and revenue
+        projected = self._split_revenue(revenue.get('total_sats', 0), contributions)
 
         # Total capacity
         total_capacity = sum(c.get('total_capacity_sats', 0) for c in contributions)
@@ -602,8 +752,8 @@ class RoutingPool:
         """
         period = self._current_period()
 
-        # Get current contribution
-        contributions = self.db.get_pool_contributions(period)
+        # Current contribution from the stored period snapshot
+        contributions = self._period_contributions(period)
         current = next(
             (c for c in contributions if c['member_id'] == member_id),
             None
@@ -613,8 +763,9 @@ class RoutingPool:
         contribution_history = self.db.get_member_contribution_history(member_id)
         distribution_history = self.db.get_member_distribution_history(member_id)
 
-        # Calculate projected distribution
-        projected = self.calculate_distribution(period)
+        # Projected distribution over the same snapshot
+        revenue = self.db.get_pool_revenue(period=period)
+        projected = self._split_revenue(revenue.get('total_sats', 0), contributions)
 
         return {
             "member_id": member_id,
@@ -642,192 +793,123 @@ class RoutingPool:
         year, week, _ = last_week.isocalendar()
         return f"{year}-W{week:02d}"
 
-    def _get_member_capacity(self, member_id: str) -> int:
-        """Get total channel capacity for a member."""
+    def _gather_snapshot_inputs(self, members: List[Dict[str, Any]]) -> SnapshotInputs:
+        """
+        Read every member's snapshot inputs with one bulk lookup per source.
+
+        Sources that are unavailable or fail contribute nothing, and the
+        affected metrics fall back to their defaults.
+        """
+        peer_states: Dict[str, Any] = {}
         if self.state_manager:
-            state = self.state_manager.get_peer_state(member_id)
-            if state:
-                return getattr(state, 'capacity_sats', 0) or 0
-        return 0
+            peer_states = {s.peer_id: s for s in self.state_manager.get_all_peer_states()}
 
-    def _get_position_metrics(self, member_id: str) -> Tuple[float, int, float]:
+        # Shared calculator (preferred - cached and fleet-wide consistent)
+        position_metrics: Dict[str, Any] = {}
+        calculator = self.metrics_calculator or network_metrics.get_calculator()
+        if calculator:
+            position_metrics = calculator.get_all_metrics()
+
+        contribution_stats: Dict[str, Dict[str, int]] = {}
+        try:
+            contribution_stats = self.db.get_all_contribution_stats(window_days=30)
+        except Exception:
+            pass
+
+        health: Dict[str, Dict[str, Any]] = {}
+        if self.health_aggregator:
+            try:
+                health = self.health_aggregator.get_all_member_health()
+            except Exception:
+                pass
+
+        return SnapshotInputs(
+            members=members,
+            peer_states=peer_states,
+            position_metrics=position_metrics,
+            contribution_stats=contribution_stats,
+            health=health,
+        )
+
+    def _position_metrics_all(
+        self,
+        member_ids: List[str],
+        inputs: SnapshotInputs
+    ) -> List[Tuple[float, int, float]]:
         """
-        Get position metrics for a member.
+        Position metrics for every member, in member order.
 
-        Uses the shared NetworkMetricsCalculator if available for cached,
-        fleet-wide consistent calculations. Falls back to local calculation
-        if calculator not initialized.
+        Uses the shared NetworkMetricsCalculator results where available and
+        the local topology estimate for members it has no metrics for.
 
         Returns:
-            (centrality, unique_peers, bridge_score)
+            List of (centrality, unique_peers, bridge_score)
         """
-        # Try shared calculator first (preferred - cached and consistent)
-        calculator = self.metrics_calculator or network_metrics.get_calculator()
-        if calculator:
-            metrics = calculator.get_member_metrics(member_id)
+        local = None
+        positions = []
+        for member_id in member_ids:
+            metrics = inputs.position_metrics.get(member_id)
             if metrics:
-                return (
+                positions.append((
                     metrics.external_centrality,
                     metrics.unique_peers,
                     metrics.bridge_score
-                )
-
-        # Fallback: local calculation if calculator unavailable
-        return self._calculate_position_metrics_local(member_id)
+                ))
+                continue
+            if local is None:
+                local = self._calculate_position_metrics_local(member_ids, inputs.peer_states)
+            positions.append(local[member_id])
+        return positions
 
-    def _calculate_position_metrics_local(self, member_id: str) -> Tuple[float, int, float]:
+    def _calculate_position_metrics_local(
+        self,
+        member_ids: List[str],
+        peer_states: Dict[str, Any]
+    ) -> Dict[str, Tuple[float, int, float]]:
         """
-        Local fallback calculation for position metrics.
+        Local fallback calculation for position metrics, for all members at once.
 
-        Used when NetworkMetricsCalculator is not available.
-        """
-        centrality = 0.01  # Default low centrality
-        unique_peers = 0
-        bridge_score = 0.0
-
-        if not self.state_manager:
-            return (centrality, unique_peers, bridge_score)
-
-        # Get this member's topology
-        state = self.state_manager.get_peer_state(member_id)
-        if not state:
-            return (centrality, unique_peers, bridge_score)
-
-        member_topology = set(getattr(state, 'topology', []) or [])
-        if not member_topology:
-            return (centrality, unique_peers, bridge_score)
-
-        # Collect all other members' topologies to find unique peers
-        all_members = self.db.get_all_members() if self.db else []
-        other_members_peers = set()
-        topology_sizes = []
-
-        for member in all_members:
-            other_id = member.get('peer_id')
-            if not other_id:
-                continue
+        Used when NetworkMetricsCalculator is not available. A peer is unique
+        to a member when no other member's gossiped topology includes it.
 
-            other_state = self.state_manager.get_peer_state(other_id)
-            if not other_state:
-                continue
+        Returns:
+            Dict mapping member_id to (centrality, unique_peers, bridge_score)
+        """
+        default = (0.01, 0, 0.0)  # Default low centrality
+        topologies = {
+            member_id: set(getattr(peer_states[member_id], 'topology', []) or [])
+            for member_id in member_ids
+            if member_id in peer_states
+        }
 
-            other_topology = set(getattr(other_state, 'topology', []) or [])
-            topology_sizes.append(len(other_topology))
+        # How many members connect to each peer
+        peer_counts = Counter(peer for topology in topologies.values() for peer in topology)
+        topology_sizes = [len(t) for t in topologies.values()]
+        avg_topology_size = sum(topology_sizes) / len(topology_sizes) if topology_sizes else 0
 
-            if other_id != member_id:
-                other_members_peers.update(other_topology)
+        results: Dict[str, Tuple[float, int, float]] = {}
+        for member_id in member_ids:
+            member_topology = topologies.get(member_id)
+            if not member_topology:
+                results[member_id] = default
+                continue
 
-        # Calculate unique peers (peers only this member connects to)
-        unique_peer_set = member_topology - other_members_peers
-        unique_peers = len(unique_peer_set)
+            # Unique peers (peers only this member connects to)
+            unique_peers = sum(1 for peer in member_topology if peer_counts[peer] == 1)
 
-        # Calculate bridge score (ratio of unique to total connections)
-        if len(member_topology) > 0:
+            # Bridge score (ratio of unique to total connections)
             bridge_score = min(1.0, unique_peers / len(member_topology))
 
-        # Approximate betweenness centrality
-        if topology_sizes:
-            avg_topology_size = sum(topology_sizes) / len(topology_sizes)
+            # Approximate betweenness centrality
+            centrality = default[0]
             if avg_topology_size > 0:
                 relative_connectivity = len(member_topology) / avg_topology_size
                 bridge_boost = 1.0 + (bridge_score * 0.5)
                 centrality = min(MAX_CENTRALITY, 0.01 * relative_connectivity * bridge_boost)
 
-        return (centrality, unique_peers, bridge_score)
-
-    def _get_operations_metrics(self, member_id: str) -> Tuple[float, float]:
-        """
-        Get operations metrics for a member.
-
-        Calculates:
-        - success_rate: Estimated from contribution ratio and uptime
-                       (nodes that forward more with high uptime are reliable)
-        - response_time_ms: Estimated from uptime (high uptime = likely responsive)
-
-        Note: Without explicit HTLC success/failure tracking, we approximate
-        using available proxy metrics. Future enhancement could add actual
-        timing data from forward events.
+            results[member_id] = (centrality, unique_peers, bridge_score)
 
-        Returns:
-            (success_rate, response_time_ms)
-        """
-        # Default values (good baseline)
-        success_rate = 0.95
-        response_time_ms = 50.0
-
-        # Get member data for uptime
-        member = self.db.get_member(member_id) if self.db else None
-        uptime_pct = 1.0
-        if member:
-            uptime_pct = member.get('uptime_pct', 1.0)
-            # Handle percentage stored as 0-100 vs 0-1
-            if uptime_pct > 1.0:
-                uptime_pct = uptime_pct / 100.0
-
-        # Get contribution stats as proxy for routing reliability
-        contribution_ratio = 1.0
-        total_forwarded = 0
-        if self.db:
-            try:
-                stats = self.db.get_contribution_stats(member_id, window_days=30)
-                forwarded = stats.get('forwarded', 0)
-                received = stats.get('received', 0)
-                total_forwarded = forwarded
-                if received > 0:
-                    contribution_ratio = forwarded / received
-            except Exception:
-                pass
-
-        # Estimate success rate:
-        # - Base rate from uptime (offline nodes can't succeed)
-        # - Boost for good contribution ratio (active routing = working node)
-        # - Cap at TARGET_SUCCESS_RATE (0.95)
-        base_success = uptime_pct * 0.9  # Uptime contributes 90% of base
-
-        # Contribution bonus: nodes that forward a lot are likely reliable
-        # Scale: ratio of 1.0+ is good, higher is better, cap bonus at 10%
-        contrib_bonus = min(0.10, (min(contribution_ratio, 2.0) - 0.5) * 0.1)
-
-        success_rate = min(TARGET_SUCCESS_RATE, base_success + contrib_bonus)
-        success_rate = max(0.5, success_rate)  # Floor at 50%
-
-        # Estimate response time:
-        # - High uptime suggests well-maintained, fast node
-        # - Active routing (high forwarded volume) suggests responsive
-        # - Scale from 20ms (best) to 200ms (worst) based on metrics
-        if uptime_pct >= 0.99:
-            # Excellent uptime = likely fast
-            response_time_ms = 30.0
-        elif uptime_pct >= 0.95:
-            # Good uptime
-            response_time_ms = 50.0
-        elif uptime_pct >= 0.90:
-            # Acceptable uptime
-            response_time_ms = 80.0
-        else:
-            # Lower uptime = assume slower
-            response_time_ms = 120.0
-
-        # Adjust for routing activity (active nodes are tuned)
-        if total_forwarded > 1000000:  # >1M sats forwarded
-            response_time_ms = max(20.0, response_time_ms - 20.0)
-        elif total_forwarded > 100000:  # >100k sats
-            response_time_ms = max(20.0, response_time_ms - 10.0)
-
-        # Check health aggregator for additional signals
-        if self.health_aggregator:
-            try:
-                health = self.health_aggregator.get_member_health(member_id)
-                if health:
-                    # If health data includes success metrics, use them
-                    if 'success_rate' in health:
-                        success_rate = health['success_rate']
-                    if 'avg_response_ms' in health:
-                        response_time_ms = health['avg_response_ms']
-            except Exception:
-                pass
-
-        return (success_rate, response_time_ms)
+        return results
 
     def set_our_pubkey(self, pubkey: str):
         """Set our node's pubkey."""
@@ -44,6 +44,7 @@ class HiveContext:
     rationalization_mgr: Any = None  # RationalizationManager (Channel Rationalization)
     strategic_positioning_mgr: Any = None  # StrategicPositioningManager (Phase 5 - Strategic Positioning)
     anticipatory_manager: Any = None  # AnticipatoryLiquidityManager (Phase 7.1 - Anticipatory Liquidity)
+    policy_reconciler: Any = None  # PolicyReconciler (bulk revenue-ops policy sync)
     our_id: str = ""  # Our node pubkey (alias for our_pubkey for consistency)
     log: Callable[[str, str], None] = None  # Logger function: (msg, level) -> None
 
@@ -1353,6 +1354,27 @@ def reinit_bridge(ctx: HiveContext) -> Dict[str, Any]:
     }
 
 
+def reconcile_policies(ctx: HiveContext, dry_run: bool = True) -> Dict[str, Any]:
+    """
+    Reconcile cl-revenue-ops fee policies with hive membership.
+
+    Fetches every policy once, reports drift from the desired policy and,
+    unless dry_run, applies only the drifted policies.
+
+    Permission: Member only (to apply changes)
+    """
+    if not dry_run:
+        perm_error = check_permission(ctx, 'member')
+        if perm_error:
+            return perm_error
+
+    if not ctx.policy_reconciler:
+        return {"error": "Policy reconciler not initialized"}
+
+    report = ctx.policy_reconciler.reconcile(dry_run=dry_run)
+    return report.to_dict()
+
+
 def topology(ctx: HiveContext) -> Dict[str, Any]:
     """
     Get current topology analysis from the Planner.
@@ -2224,10 +2246,14 @@ def stigmergic_markers(ctx: HiveContext, source: str = None, destination: str =
         return {"error": "Fee coordination not initialized"}
 
     try:
+        aggregate = None
         if source and destination:
             markers = ctx.fee_coordination_mgr.stigmergic_coord.read_markers(
                 source, destination
             )
+            aggregate = ctx.fee_coordination_mgr.stigmergic_coord.get_route_aggregate(
+                source, destination
+            )
         else:
             markers = ctx.fee_coordination_mgr.stigmergic_coord.get_all_markers()
 
@@ -2251,6 +2277,7 @@ def stigmergic_markers(ctx: HiveContext, source: str = None, destination: str =
             "avg_successful_fee_ppm": int(avg_success_fee),
             "avg_failed_fee_ppm": int(avg_failed_fee),
             "markers": [m.to_dict() for m in markers[:50]],  # Limit output
+            "route_aggregate": aggregate.to_dict() if aggregate else None,
             "filtered": {
                 "source": source,
                 "destination": destination
@@ -21,8 +21,10 @@ Thread Safety:
 
 import time
 import json
+import hashlib
 import sqlite3
 import threading
+from collections import OrderedDict
 from dataclasses import dataclass, asdict, field
 from typing import Dict, List, Optional, Any, Tuple
 from decimal import Decimal, ROUND_DOWN
@@ -40,6 +42,9 @@ MIN_PAYMENT_FLOOR_SATS = 100
 # algorithm changes in a way that affects plan hashes.
 DISTRIBUTED_SETTLEMENT_PLAN_VERSION = 2
 
+# Settlement computation contexts kept per manager (LRU by input hash)
+SETTLEMENT_CONTEXT_CACHE_SIZE = 16
+
 
 def calculate_min_payment(total_fees: int, member_count: int) -> int:
     """
@@ -128,6 +133,41 @@ class SettlementPayment:
     error: Optional[str] = None
 
 
+@dataclass
+class SettlementContext:
+    """
+    Everything derived from one period's contribution snapshot.
+
+    Built once per distinct input (see SettlementManager.get_settlement_context)
+    and shared by proposal creation, voting, balance checks and execution.
+    Treat as read-only.
+    """
+    period: str
+    input_key: str
+    contributions: List[Dict[str, Any]]
+    data_hash: str
+    results: List[SettlementResult]
+    total_fees: int
+    min_payment: int
+    payments: List[Dict[str, Any]]
+    plan_hash: str
+    expected_sent: Dict[str, int]
+    results_by_peer: Dict[str, SettlementResult] = field(default_factory=dict)
+
+    def plan(self) -> Dict[str, Any]:
+        """The deterministic settlement plan, as returned by compute_settlement_plan()."""
+        return {
+            "plan_version": DISTRIBUTED_SETTLEMENT_PLAN_VERSION,
+            "period": self.period,
+            "data_hash": self.data_hash,
+            "plan_hash": self.plan_hash,
+            "min_payment_sats": self.min_payment,
+            "payments": [dict(p) for p in self.payments],
+            "expected_sent_sats": dict(self.expected_sent),
+            "total_fees_sats": self.total_fees,
+        }
+
+
 class SettlementManager:
     """
     Manages BOLT12-based revenue settlement for the hive fleet.
@@ -153,6 +193,14 @@ class SettlementManager:
         self.rpc = rpc
         self._local = threading.local()
 
+        # input_key -> SettlementContext, least recently used first
+        self._contexts: "OrderedDict[str, SettlementContext]" = OrderedDict()
+        self._contexts_lock = threading.Lock()
+
+        # Optional SettlementPaymentExecutor; when set, our distributed
+        # settlement payments are made through its durable job queue
+        self.payment_executor = None
+
     def _get_connection(self) -> sqlite3.Connection:
         """Get thread-local database connection."""
         return self.db._get_connection()
@@ -557,8 +605,6 @@ class SettlementManager:
         min_payment_sats: int,
         payments: List[Dict[str, Any]],
     ) -> str:
-        import hashlib
-
         # Canonicalize payments ordering.
         canon_payments = sorted(
             payments,
@@ -626,15 +672,67 @@ class SettlementManager:
 
         return payments, min_payment
 
-    def compute_settlement_plan(
+    @staticmethod
+    def _context_input_key(period: str, contributions: List[Dict[str, Any]]) -> str:
+        """
+        Hash every contribution field the plan depends on.
+
+        Unlike calculate_settlement_hash() this includes forward_count, which
+        feeds the fair shares but not the canonical data hash.
+        """
+        fields = ("peer_id", "fees_earned", "rebalance_costs", "capacity", "uptime", "forward_count")
+        rows = sorted(
+            ([c.get(f) for f in fields] for c in contributions),
+            key=lambda row: str(row[0] or "")
+        )
+        payload = json.dumps([period, rows], separators=(",", ":"), default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get_settlement_context(
         self,
         period: str,
         contributions: List[Dict[str, Any]],
-    ) -> Dict[str, Any]:
+        cache: bool = True,
+    ) -> SettlementContext:
         """
-        Compute a deterministic settlement plan (payments + hashes) from a canonical
-        contributions snapshot.
+        Get the settlement computation for a contributions snapshot.
+
+        The canonical hash, fair shares and payment plan are computed once
+        per distinct input and memoized, so proposing, voting, balance
+        checks and execution on the same period share one computation.
+
+        Args:
+            period: Settlement period (YYYY-WW)
+            contributions: Canonical contribution dicts
+            cache: Memoize a newly built context. Replays of old periods
+                   pass False so they cannot evict live periods' contexts.
+
+        Returns:
+            SettlementContext for these inputs
         """
+        input_key = self._context_input_key(period, contributions)
+        with self._contexts_lock:
+            context = self._contexts.get(input_key)
+            if context is not None:
+                if cache:
+                    self._contexts.move_to_end(input_key)
+                return context
+
+        context = self._build_settlement_context(period, contributions, input_key)
+        if not cache:
+            return context
+        with self._contexts_lock:
+            self._contexts[input_key] = context
+            while len(self._contexts) > SETTLEMENT_CONTEXT_CACHE_SIZE:
+                self._contexts.popitem(last=False)
+        return context
+
+    def _build_settlement_context(
+        self,
+        period: str,
+        contributions: List[Dict[str, Any]],
+        input_key: str,
+    ) -> SettlementContext:
         member_contributions: List[MemberContribution] = []
         for c in contributions:
             uptime = c.get("uptime", 100)
@@ -670,16 +768,30 @@ class SettlementManager:
         for p in payments:
             expected_sent[p["from_peer"]] = expected_sent.get(p["from_peer"], 0) + int(p["amount_sats"])
 
-        return {
-            "plan_version": DISTRIBUTED_SETTLEMENT_PLAN_VERSION,
-            "period": period,
-            "data_hash": data_hash,
-            "plan_hash": plan_hash,
-            "min_payment_sats": min_payment,
-            "payments": payments,
-            "expected_sent_sats": expected_sent,
-            "total_fees_sats": total_fees,
-        }
+        return SettlementContext(
+            period=period,
+            input_key=input_key,
+            contributions=[dict(c) for c in contributions],
+            data_hash=data_hash,
+            results=results,
+            total_fees=total_fees,
+            min_payment=min_payment,
+            payments=payments,
+            plan_hash=plan_hash,
+            expected_sent=expected_sent,
+            results_by_peer={r.peer_id: r for r in results},
+        )
+
+    def compute_settlement_plan(
+        self,
+        period: str,
+        contributions: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Compute a deterministic settlement plan (payments + hashes) from a canonical
+        contributions snapshot.
+        """
+        return self.get_settlement_context(period, contributions).plan()
 
     def _enrich_with_network_metrics(
         self,
@@ -688,7 +800,8 @@ class SettlementManager:
         """
         Enrich member contributions with network position metrics.
 
-        Fetches hive centrality and rebalance hub score for each member.
+        Fetches hive centrality and rebalance hub score for all members
+        with one calculator lookup.
 
         Args:
             contributions: List of member contributions
@@ -700,8 +813,9 @@ class SettlementManager:
         if not calculator:
             return contributions
 
+        all_metrics = calculator.get_all_metrics()
         for contrib in contributions:
-            metrics = calculator.get_member_metrics(contrib.peer_id)
+            metrics = all_metrics.get(contrib.peer_id)
             if metrics:
                 contrib.hive_centrality = metrics.hive_centrality
                 contrib.rebalance_hub_score = metrics.rebalance_hub_score
@@ -1044,8 +1158,6 @@ class SettlementManager:
         Returns:
             SHA256 hash (64 hex chars)
         """
-        import hashlib
-
         # Sort contributions by peer_id for determinism
         sorted_contribs = sorted(contributions, key=lambda x: x.get('peer_id', ''))
 
@@ -1071,7 +1183,9 @@ class SettlementManager:
         Gather contribution data from gossiped FEE_REPORT messages.
 
         This uses PERSISTED fee reports from the database (survives restarts),
-        falling back to in-memory state_manager data if needed.
+        falling back to in-memory state_manager data if needed. All inputs
+        are read with bulk queries: one pass over members, fee reports,
+        gossiped fees and peer states.
 
         Args:
             state_manager: HiveStateManager with gossiped fee data
@@ -1089,6 +1203,10 @@ class SettlementManager:
         db_fee_reports = self.db.get_fee_reports_for_period(period)
         db_fees_by_peer = {r['peer_id']: r for r in db_fee_reports}
 
+        # In-memory gossip state, fetched once for the whole fleet
+        gossip_fees = state_manager.get_all_peer_fees()
+        peer_states = {s.peer_id: s for s in state_manager.get_all_peer_states()}
+
         for member in all_members:
             peer_id = member['peer_id']
 
@@ -1100,13 +1218,13 @@ class SettlementManager:
                 rebalance_costs = db_report.get('rebalance_costs_sats', 0)
             else:
                 # Fall back to in-memory state (may be from current session)
-                fee_data = state_manager.get_peer_fees(peer_id)
+                fee_data = gossip_fees.get(peer_id, {})
                 fees_earned = fee_data.get('fees_earned_sats', 0)
                 forward_count = fee_data.get('forward_count', 0)
                 rebalance_costs = fee_data.get('rebalance_costs_sats', 0)
 
             # Get capacity from state
-            peer_state = state_manager.get_peer_state(peer_id)
+            peer_state = peer_states.get(peer_id)
 
             # Canonicalize uptime for hashing/settlement math.
             # hive_members.uptime_pct is stored as a fraction (0-1) by
@@ -1385,33 +1503,12 @@ class SettlementManager:
         Returns:
             Tuple of (balance_sats, creditor_peer_id or None, min_payment_threshold)
         """
-        # Convert to MemberContribution objects
-        member_contributions = [
-            MemberContribution(
-                peer_id=c['peer_id'],
-                capacity_sats=c.get('capacity', 0),
-                forwards_sats=c.get('forward_count', 0) * 100000,  # Estimate
-                fees_earned_sats=c.get('fees_earned', 0),
-                uptime_pct=c.get('uptime', 100),
-            )
-            for c in contributions
-        ]
-
-        # Calculate fair shares
-        results = self.calculate_fair_shares(member_contributions)
-
-        # Calculate dynamic minimum payment
-        total_fees = sum(c.get('fees_earned', 0) for c in contributions)
-        member_count = len(contributions)
-        min_payment = calculate_min_payment(total_fees, member_count)
-
-        # Find our result
-        our_result = None
-        for result in results:
-            if result.peer_id == our_peer_id:
-                our_result = result
-                break
+        # Shares come from the same memoized computation as the plan
+        context = self.get_settlement_context(proposal.get('period', ''), contributions)
+        results = context.results
+        min_payment = context.min_payment
 
+        our_result = context.results_by_peer.get(our_peer_id)
         if not our_result:
             return (0, None, min_payment)
 
@@ -1476,35 +1573,50 @@ class SettlementManager:
         total_sent = 0
         payment_hashes: List[str] = []
 
-        for p in our_payments:
-            to_peer = p["to_peer"]
-            amount = int(p["amount_sats"])
-            offer = self.get_offer(to_peer)
-            if not offer:
-                self.plugin.log(
-                    f"SETTLEMENT: Missing BOLT12 offer for receiver {to_peer[:16]}... "
-                    f"(proposal {proposal_id[:16]}...)",
-                    level="warn"
-                )
+        if self.payment_executor is not None and our_payments:
+            self.payment_executor.plan_payments(proposal_id, period, our_payments)
+            self.payment_executor.run_pending()
+            status = self.payment_executor.proposal_status(proposal_id)
+            if not status["complete"]:
+                for failed in status["failed_final"]:
+                    self.plugin.log(
+                        f"SETTLEMENT: Payment to {failed['to_peer_id'][:16]}... for "
+                        f"{failed['amount_sats']} sats failed permanently: {failed['error']}",
+                        level="warn"
+                    )
                 return None
-
-            pay = SettlementPayment(
-                from_peer=our_peer_id,
-                to_peer=to_peer,
-                amount_sats=amount,
-                bolt12_offer=offer,
-            )
-            pay = await self.execute_payment(pay)
-            if pay.status != "completed":
-                self.plugin.log(
-                    f"SETTLEMENT: Payment failed to {to_peer[:16]}... for {amount} sats: {pay.error}",
-                    level="warn"
+            total_sent = status["settled_sats"]
+            payment_hashes = status["payment_hashes"]
+        else:
+            for p in our_payments:
+                to_peer = p["to_peer"]
+                amount = int(p["amount_sats"])
+                offer = self.get_offer(to_peer)
+                if not offer:
+                    self.plugin.log(
+                        f"SETTLEMENT: Missing BOLT12 offer for receiver {to_peer[:16]}... "
+                        f"(proposal {proposal_id[:16]}...)",
+                        level="warn"
+                    )
+                    return None
+
+                pay = SettlementPayment(
+                    from_peer=our_peer_id,
+                    to_peer=to_peer,
+                    amount_sats=amount,
+                    bolt12_offer=offer,
                 )
-                return None
-
-            total_sent += amount
-            if pay.payment_hash:
-                payment_hashes.append(pay.payment_hash)
+                pay = await self.execute_payment(pay)
+                if pay.status != "completed":
+                    self.plugin.log(
+                        f"SETTLEMENT: Payment failed to {to_peer[:16]}... for {amount} sats: {pay.error}",
+                        level="warn"
+                    )
+                    return None
+
+                total_sent += amount
+                if pay.payment_hash:
+                    payment_hashes.append(pay.payment_hash)
 
         if total_sent != expected_sent:
             self.plugin.log(
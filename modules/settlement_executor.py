@@ -0,0 +1,431 @@
+"""
+Durable settlement payment executor for cl-hive.
+
+Drives each settlement payment we owe through explicit, persisted states so
+a failed payment or a restart never causes a receiver to be paid twice.
+
+States:
+- planned: job created from the settlement plan, nothing fetched yet
+- invoice_fetched: BOLT12 invoice fetched and decoded (payment_hash known)
+- paying: pay issued (persisted *before* the RPC is made)
+- settled: lightningd reports the payment complete
+- failed_retryable: last attempt failed, retried after exponential backoff
+- failed_final: retries exhausted or the invoice is unusable
+
+Design:
+- Job ids are derived from (proposal, payer, receiver, amount), so planning
+  the same proposal twice is a no-op.
+- Fetch is idempotent: a fetched invoice is reused until it goes stale, and
+  is only replaced once listpays shows it was never paid.
+- Pay is idempotent: retries pay the same invoice, and any job found in
+  'paying' (e.g. after a crash) is reconciled with listpays before anything
+  else happens to it.
+- At most MAX_IN_FLIGHT jobs are in 'paying' at once: a job takes a slot
+  before fetching and paying, and keeps it while the pay is pending.
+"""
+
+import hashlib
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+
+# Payment job states
+PAYMENT_PLANNED = "planned"
+PAYMENT_INVOICE_FETCHED = "invoice_fetched"
+PAYMENT_PAYING = "paying"
+PAYMENT_SETTLED = "settled"
+PAYMENT_FAILED_RETRYABLE = "failed_retryable"
+PAYMENT_FAILED_FINAL = "failed_final"
+
+# States a job can be picked up from for its next step
+RUNNABLE_PAYMENT_STATES = [PAYMENT_PLANNED, PAYMENT_INVOICE_FETCHED, PAYMENT_FAILED_RETRYABLE]
+
+# Outcomes of looking a payment up in listpays
+PAY_COMPLETE = "complete"
+PAY_PENDING = "pending"
+PAY_FAILED = "failed"
+
+
+def payment_job_id(proposal_id: str, from_peer: str, to_peer: str, amount_sats: int) -> str:
+    """Deterministic job id for one payment of a settlement plan."""
+    key = f"{proposal_id}:{from_peer}:{to_peer}:{int(amount_sats)}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _msat(value: Any) -> Optional[int]:
+    """Parse an msat amount as returned by decode (int or '123msat')."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value[:-4] if value.endswith("msat") else value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class PaymentFinalError(Exception):
+    """A payment step failed in a way retrying cannot fix."""
+
+
+class SettlementPaymentExecutor:
+    """Persists and advances settlement payments through the payment state machine."""
+
+    # Retry policy constants
+    BASE_RETRY_SECONDS = 60
+    MAX_RETRY_SECONDS = 3600          # 1 hour cap
+    MAX_ATTEMPTS = 8
+    MAX_IN_FLIGHT = 3                 # Payments in 'paying' at once
+    INVOICE_REUSE_SECONDS = 3600      # BOLT12 invoices default to a 2h expiry
+    PAY_MAX_FEE = "1sat"              # Members are directly connected
+    PAY_RETRY_FOR_SECONDS = 30
+
+    def __init__(self, database, rpc, get_offer_fn: Callable[[str], Optional[str]],
+                 log_fn: Callable[..., None]):
+        """
+        Args:
+            database: HiveDatabase instance
+            rpc: RPC proxy with fetchinvoice, decode, pay and listpays
+            get_offer_fn: Callable(peer_id) -> BOLT12 offer or None
+            log_fn: Callable(msg, level) for logging
+        """
+        self._db = database
+        self._rpc = rpc
+        self._get_offer_fn = get_offer_fn
+        self._log = log_fn
+        self._run_lock = threading.Lock()
+        self._slot_lock = threading.Lock()
+        self._free_slots = 0
+        # Long-lived so each run does not open fresh per-thread DB connections
+        self._pool = ThreadPoolExecutor(max_workers=self.MAX_IN_FLIGHT,
+                                        thread_name_prefix="cl-hive-settle-pay")
+
+    # =========================================================================
+    # PLANNING AND STATUS
+    # =========================================================================
+
+    def plan_payments(self, proposal_id: str, period: str,
+                      payments: List[Dict[str, Any]]) -> int:
+        """
+        Create a job for each payment we owe under a settlement plan.
+
+        Args:
+            proposal_id: Settlement proposal the payments belong to
+            period: Settlement period
+            payments: Plan payment dicts with from_peer, to_peer, amount_sats
+
+        Returns:
+            Number of new jobs (0 if the proposal was already planned)
+        """
+        jobs = []
+        for p in payments:
+            amount = int(p["amount_sats"])
+            if amount <= 0:
+                continue
+            jobs.append({
+                "job_id": payment_job_id(proposal_id, p["from_peer"], p["to_peer"], amount),
+                "proposal_id": proposal_id,
+                "period": period,
+                "from_peer_id": p["from_peer"],
+                "to_peer_id": p["to_peer"],
+                "amount_sats": amount,
+                "state": PAYMENT_PLANNED,
+            })
+        if not jobs:
+            return 0
+        created = self._db.add_settlement_payment_jobs(jobs)
+        if created:
+            self._log(f"SETTLEMENT_EXEC: Planned {created} payment(s) for "
+                      f"{proposal_id[:16]}...", "info")
+        return created
+
+    def proposal_status(self, proposal_id: str) -> Dict[str, Any]:
+        """
+        Summarize the payment jobs of one proposal.
+
+        Returns:
+            Dict with per-state counts, settled totals and 'complete' set
+            once every job has settled
+        """
+        jobs = self._db.get_settlement_payment_jobs(proposal_id=proposal_id)
+        states: Dict[str, int] = {}
+        for job in jobs:
+            states[job["state"]] = states.get(job["state"], 0) + 1
+        settled = [j for j in jobs if j["state"] == PAYMENT_SETTLED]
+        return {
+            "proposal_id": proposal_id,
+            "jobs": len(jobs),
+            "states": states,
+            "complete": bool(jobs) and len(settled) == len(jobs),
+            "settled_sats": sum(j["amount_sats"] for j in settled),
+            "payment_hashes": [j["payment_hash"] for j in settled if j["payment_hash"]],
+            "failed_final": [
+                {"to_peer_id": j["to_peer_id"], "amount_sats": j["amount_sats"],
+                 "error": j["last_error"]}
+                for j in jobs if j["state"] == PAYMENT_FAILED_FINAL
+            ],
+        }
+
+    def retry_failed(self, proposal_id: Optional[str] = None) -> int:
+        """
+        Give failed_final jobs a fresh set of attempts (operator action).
+
+        Args:
+            proposal_id: Only reset this proposal's jobs
+
+        Returns:
+            Number of jobs reset
+        """
+        reset = 0
+        for job in self._db.get_settlement_payment_jobs(
+                proposal_id=proposal_id, states=[PAYMENT_FAILED_FINAL]):
+            if self._db.transition_settlement_payment_job(
+                    job["job_id"], [PAYMENT_FAILED_FINAL], PAYMENT_FAILED_RETRYABLE,
+                    attempts=0, next_attempt_at=0):
+                reset += 1
+        return reset
+
+    # =========================================================================
+    # EXECUTION
+    # =========================================================================
+
+    def run_pending(self) -> Dict[str, int]:
+        """
+        Reconcile in-flight payments, then advance every due job.
+
+        Safe to call from several threads; overlapping calls return at once.
+
+        Returns:
+            Counts of jobs reconciled, advanced, settled and failed_final
+        """
+        stats = {"reconciled": 0, "advanced": 0, "settled": 0, "failed_final": 0, "in_flight": 0}
+        if not self._run_lock.acquire(blocking=False):
+            return stats
+        try:
+            # Jobs left in 'paying' (crash, or pay still pending in lightningd)
+            for job in self._db.get_settlement_payment_jobs(states=[PAYMENT_PAYING]):
+                stats["reconciled"] += 1
+                self._tally(stats, self._reconcile(job))
+
+            in_flight = len(self._db.get_settlement_payment_jobs(states=[PAYMENT_PAYING]))
+            stats["in_flight"] = in_flight
+            slots = self.MAX_IN_FLIGHT - in_flight
+            if slots <= 0:
+                return stats
+
+            # Jobs take a free slot before paying; those left without one
+            # stay due for the next run
+            with self._slot_lock:
+                self._free_slots = slots
+            due = self._db.get_settlement_payment_jobs(
+                states=RUNNABLE_PAYMENT_STATES, due_before=int(time.time()))
+            due.sort(key=lambda job: job["next_attempt_at"] or 0)
+            if len(due) == 1:
+                outcomes = [self._advance(due[0])]
+            elif due:
+                outcomes = list(self._pool.map(self._advance, due))
+            else:
+                outcomes = []
+            stats["advanced"] = len(due)
+            for outcome in outcomes:
+                self._tally(stats, outcome)
+            return stats
+        finally:
+            self._run_lock.release()
+
+    def shutdown(self) -> None:
+        """Stop the payment worker pool (plugin shutdown)."""
+        self._pool.shutdown(wait=False)
+
+    def _take_slot(self) -> bool:
+        """Reserve one of this run's in-flight slots."""
+        with self._slot_lock:
+            if self._free_slots <= 0:
+                return False
+            self._free_slots -= 1
+            return True
+
+    def _release_slot(self) -> None:
+        with self._slot_lock:
+            self._free_slots += 1
+
+    @staticmethod
+    def _tally(stats: Dict[str, int], state: Optional[str]) -> None:
+        """Count a job's resulting state into run stats."""
+        if state == PAYMENT_SETTLED:
+            stats["settled"] += 1
+        elif state == PAYMENT_FAILED_FINAL:
+            stats["failed_final"] += 1
+
+    def _reconcile(self, job: Dict[str, Any]) -> Optional[str]:
+        """Resolve a job found in 'paying' from lightningd's payment record."""
+        try:
+            outcome = self._lookup_payment(job["payment_hash"])
+        except Exception as e:
+            self._log(f"SETTLEMENT_EXEC: listpays failed for job {job['job_id'][:16]}...: {e}",
+                      "warn")
+            return None
+        if outcome == PAY_COMPLETE:
+            return self._settle(job, PAYMENT_PAYING)
+        if outcome == PAY_PENDING:
+            return None
+        # Failed, or pay never reached lightningd before we stopped
+        return self._fail(job, PAYMENT_PAYING, "payment not completed")
+
+    def _advance(self, job: Dict[str, Any]) -> Optional[str]:
+        """
+        Take one job as far as it can go this cycle.
+
+        Returns:
+            The job's resulting state, or None if it was left unchanged
+        """
+        state = job["state"]
+        try:
+            if job["bolt12_invoice"] and job["payment_hash"]:
+                # A previous invoice may have been paid; never drop it unseen
+                outcome = self._lookup_payment(job["payment_hash"])
+                if outcome == PAY_COMPLETE:
+                    return self._settle(job, state)
+                if outcome == PAY_PENDING:
+                    # Already in flight in lightningd; it occupies a slot
+                    # if one is left (the count never goes below zero)
+                    self._take_slot()
+                    self._db.transition_settlement_payment_job(
+                        job["job_id"], [state], PAYMENT_PAYING)
+                    return PAYMENT_PAYING
+                fetched_at = job["invoice_fetched_at"] or 0
+                if time.time() - fetched_at > self.INVOICE_REUSE_SECONDS:
+                    job = dict(job, bolt12_invoice=None, payment_hash=None)
+
+            if not self._take_slot():
+                return None
+            result = None
+            try:
+                if not (job["bolt12_invoice"] and job["payment_hash"]):
+                    job = self._fetch_invoice(job)
+                    if job is None:
+                        return None
+                result = self._pay(job)
+                return result
+            finally:
+                # A pending pay keeps its slot until the next run reconciles it
+                if result != PAYMENT_PAYING:
+                    self._release_slot()
+        except PaymentFinalError as e:
+            return self._fail(job, job["state"], str(e), final=True)
+        except Exception as e:
+            return self._fail(job, job["state"], str(e))
+
+    def _fetch_invoice(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Fetch and verify a BOLT12 invoice; returns the updated job."""
+        offer = job["bolt12_offer"] or self._get_offer_fn(job["to_peer_id"])
+        if not offer:
+            raise RuntimeError("no BOLT12 offer registered for receiver")
+
+        amount_msat = job["amount_sats"] * 1000
+        result = self._rpc.fetchinvoice(offer=offer, amount_msat=f"{amount_msat}msat")
+        invoice = result.get("invoice") if isinstance(result, dict) else None
+        if not invoice:
+            raise RuntimeError("failed to fetch invoice from offer")
+
+        decoded = self._rpc.decode(invoice)
+        payment_hash = decoded.get("invoice_payment_hash") or decoded.get("payment_hash")
+        if not payment_hash:
+            raise RuntimeError("fetched invoice has no payment hash")
+        invoice_msat = _msat(decoded.get("invoice_amount_msat", decoded.get("amount_msat")))
+        if invoice_msat != amount_msat:
+            # The receiver is asking for a different amount; retrying won't help
+            raise PaymentFinalError(f"invoice amount {invoice_msat}msat != {amount_msat}msat")
+
+        fields = {
+            "bolt12_offer": offer,
+            "bolt12_invoice": invoice,
+            "payment_hash": payment_hash,
+            "invoice_fetched_at": int(time.time()),
+        }
+        if not self._db.transition_settlement_payment_job(
+                job["job_id"], [job["state"]], PAYMENT_INVOICE_FETCHED, **fields):
+            return None
+        return dict(job, state=PAYMENT_INVOICE_FETCHED, **fields)
+
+    def _pay(self, job: Dict[str, Any]) -> Optional[str]:
+        """Pay the job's invoice, persisting 'paying' before the RPC."""
+        if not self._db.transition_settlement_payment_job(
+                job["job_id"], [job["state"]], PAYMENT_PAYING):
+            return None
+        job = dict(job, state=PAYMENT_PAYING)
+
+        try:
+            result = self._rpc.pay(job["bolt12_invoice"], maxfee=self.PAY_MAX_FEE,
+                                   retry_for=self.PAY_RETRY_FOR_SECONDS)
+        except Exception as e:
+            # pay errors are ambiguous (e.g. "already pending"); ask lightningd
+            outcome = self._lookup_payment(job["payment_hash"])
+            if outcome == PAY_COMPLETE:
+                return self._settle(job, PAYMENT_PAYING)
+            if outcome == PAY_PENDING:
+                return PAYMENT_PAYING
+            return self._fail(job, PAYMENT_PAYING, str(e))
+
+        status = result.get("status") if isinstance(result, dict) else None
+        if status == PAY_COMPLETE:
+            return self._settle(job, PAYMENT_PAYING)
+        if status == PAY_PENDING:
+            return PAYMENT_PAYING
+        return self._fail(job, PAYMENT_PAYING, (result or {}).get("message", "payment failed"))
+
+    def _lookup_payment(self, payment_hash: Optional[str]) -> Optional[str]:
+        """Aggregate listpays entries for a hash: complete, pending, failed or None."""
+        if not payment_hash:
+            return None
+        pays = self._rpc.listpays(payment_hash=payment_hash).get("pays", [])
+        statuses = {p.get("status") for p in pays}
+        for outcome in (PAY_COMPLETE, PAY_PENDING, PAY_FAILED):
+            if outcome in statuses:
+                return outcome
+        return None
+
+    # =========================================================================
+    # TRANSITIONS
+    # =========================================================================
+
+    def _settle(self, job: Dict[str, Any], from_state: str) -> Optional[str]:
+        """Mark a job settled; returns the new state or None if it moved on."""
+        if not self._db.transition_settlement_payment_job(
+                job["job_id"], [from_state], PAYMENT_SETTLED,
+                payment_hash=job["payment_hash"], last_error=None,
+                settled_at=int(time.time())):
+            return None
+        self._log(f"SETTLEMENT_EXEC: Paid {job['amount_sats']} sats to "
+                  f"{job['to_peer_id'][:16]}... ({job['proposal_id'][:16]}...)", "info")
+        return PAYMENT_SETTLED
+
+    def _fail(self, job: Dict[str, Any], from_state: str, error: str,
+              final: bool = False) -> Optional[str]:
+        """Record a failed attempt and schedule a retry or give up."""
+        # The invoice columns are left alone: a failed invoice is checked with
+        # listpays before it is ever paid again or replaced
+        attempts = (job["attempts"] or 0) + 1
+        final = final or attempts >= self.MAX_ATTEMPTS
+        to_state = PAYMENT_FAILED_FINAL if final else PAYMENT_FAILED_RETRYABLE
+        if not self._db.transition_settlement_payment_job(
+                job["job_id"], [from_state], to_state, attempts=attempts,
+                last_error=error[:500],
+                next_attempt_at=0 if final else self._calculate_next_attempt(attempts)):
+            return None
+        self._log(f"SETTLEMENT_EXEC: Payment to {job['to_peer_id'][:16]}... failed "
+                  f"(attempt {attempts}/{self.MAX_ATTEMPTS}{', giving up' if final else ''}): "
+                  f"{error}", "warn")
+        return to_state
+
+    def _calculate_next_attempt(self, attempts: int) -> int:
+        """
+        Calculate the next attempt timestamp using exponential backoff with jitter.
+
+        Formula: min(BASE * 2^(attempts-1), MAX) plus 0-25% jitter.
+        """
+        delay = min(self.BASE_RETRY_SECONDS * (2 ** (attempts - 1)), self.MAX_RETRY_SECONDS)
+        return int(time.time() + delay + random.uniform(0, delay * 0.25))
@@ -309,7 +309,8 @@ class RouteValueAnalyzer:
     Value = f(volume, margin, accessibility)
     """
 
-    def __init__(self, plugin, state_manager=None, fee_coordination_mgr=None):
+    def __init__(self, plugin, state_manager=None, fee_coordination_mgr=None,
+                 centrality_engine=None):
         """
         Initialize the route value analyzer.
 
@@ -317,10 +318,12 @@ class RouteValueAnalyzer:
             plugin: Plugin reference for RPC calls
             state_manager: StateManager for fleet topology
             fee_coordination_mgr: FeeCoordinationManager for corridor data
+            centrality_engine: GraphCentralityEngine for public graph data
         """
         self.plugin = plugin
         self.state_manager = state_manager
         self.fee_coordination_mgr = fee_coordination_mgr
+        self.centrality_engine = centrality_engine
         self._our_pubkey: Optional[str] = None
 
         # Cache for corridor values
@@ -372,10 +375,14 @@ class RouteValueAnalyzer:
         """
         Estimate number of competitors for routing to a target.
 
-        This is a rough estimate based on known network data.
+        Every public channel peer of the target can route to it, so the
+        target's degree in the public graph is used when known.
         """
-        # In a real implementation, this would query network gossip
-        # For now, return a conservative estimate
+        if self.centrality_engine:
+            degree = self.centrality_engine.get_degree(target_peer_id)
+            if degree is not None:
+                return degree
+        # Graph not loaded yet - conservative estimate
         return 10
 
     def _is_exchange(self, alias: str) -> Tuple[bool, float]:
@@ -572,7 +579,8 @@ class FleetPositioningStrategy:
         plugin,
         state_manager=None,
         route_analyzer: RouteValueAnalyzer = None,
-        planner=None
+        planner=None,
+        centrality_engine=None
     ):
         """
         Initialize the fleet positioning strategy.
@@ -582,11 +590,13 @@ class FleetPositioningStrategy:
             state_manager: StateManager for fleet state
             route_analyzer: RouteValueAnalyzer for value assessment
             planner: Planner for underserved targets
+            centrality_engine: GraphCentralityEngine for edge gain estimates
         """
         self.plugin = plugin
         self.state_manager = state_manager
         self.route_analyzer = route_analyzer
         self.planner = planner
+        self.centrality_engine = centrality_engine
         self._our_pubkey: Optional[str] = None
 
         # Track recent recommendations
@@ -679,8 +689,9 @@ class FleetPositioningStrategy:
             - Additional connections: diminishing returns (0.1 / current_count)
 
         For external targets:
-            - Minimal improvement (+0.02) since they don't affect hive_centrality
-            - External channels improve bridge_score instead (separate metric)
+            - Relative harmonic closeness gain over the public graph, from the
+              centrality engine (capped at 0.3)
+            - Minimal improvement (+0.02) if the engine has no estimate yet
 
         Args:
             member_id: Node public key of the member opening channel
@@ -702,7 +713,7 @@ class FleetPositioningStrategy:
         hive_peer_count = member_metrics.hive_peer_count
 
         # Check if target is a hive member (internal channel)
-        topology = calculator._get_topology_snapshot()
+        topology = calculator.get_topology_snapshot()
         if not topology:
             return 0.0
 
@@ -721,9 +732,13 @@ class FleetPositioningStrategy:
                 # Diminishing returns
                 return max(0.02, 0.1 / hive_peer_count)
         else:
-            # Opening to external target - check if it improves bridge position
-            # (bridge bonus if target is well-connected externally)
-            # This is a heuristic - real bridge detection would need network graph
+            # Opening to external target - measure closeness gain on the graph
+            if self.centrality_engine:
+                gain = self.centrality_engine.get_relative_edge_gain(
+                    member_id, target_peer_id
+                )
+                if gain is not None:
+                    return min(0.3, gain)
             return 0.02  # Minimal centrality boost for external targets
 
     def _select_best_member_for_target(self, target_peer_id: str) -> Optional[str]:
@@ -1781,7 +1796,8 @@ class StrategicPositioningManager:
         state_manager=None,
         fee_coordination_mgr=None,
         yield_metrics_mgr=None,
-        planner=None
+        planner=None,
+        centrality_engine=None
     ):
         """
         Initialize the strategic positioning manager.
@@ -1793,6 +1809,7 @@ class StrategicPositioningManager:
             fee_coordination_mgr: FeeCoordinationManager for corridor data
             yield_metrics_mgr: YieldMetricsManager for flow data
             planner: Planner for underserved targets
+            centrality_engine: GraphCentralityEngine for public graph centrality
         """
         self.plugin = plugin
         self.database = database
@@ -1801,14 +1818,16 @@ class StrategicPositioningManager:
         self.route_analyzer = RouteValueAnalyzer(
             plugin=plugin,
             state_manager=state_manager,
-            fee_coordination_mgr=fee_coordination_mgr
+            fee_coordination_mgr=fee_coordination_mgr,
+            centrality_engine=centrality_engine
         )
 
         self.positioning_strategy = FleetPositioningStrategy(
             plugin=plugin,
             state_manager=state_manager,
             route_analyzer=self.route_analyzer,
-            planner=planner
+            planner=planner,
+            centrality_engine=centrality_engine
         )
 
         self.physarum_mgr = PhysarumChannelManager(
@@ -33,6 +33,11 @@ SATURATION_RISK_THRESHOLD = 0.85    # >85% local = saturation risk
 # Competition detection
 MIN_CHANNELS_FOR_COMPETITION = 2    # Need at least 2 members with channels
 
+# RPC result caching (avoid per-channel listnodes/getinfo calls)
+NODE_ALIAS_CACHE_TTL = 3600         # Aliases rarely change; refresh hourly
+BLOCKHEIGHT_CACHE_TTL = 300         # Channel age only needs ~day precision
+ALIAS_BULK_FETCH_THRESHOLD = 20     # Misses above this use one bulk listnodes
+
 
 # =============================================================================
 # DATA CLASSES
@@ -354,6 +359,18 @@ class YieldMetricsManager:
         self._velocity_cache: Dict[str, Dict] = {}
         self._velocity_cache_ttl = 300  # 5 minutes
 
+        # Node alias cache: peer_id -> (alias or None, fetched_at)
+        # None is cached too so unknown nodes aren't re-queried every call
+        self._alias_cache: Dict[str, Tuple[Optional[str], float]] = {}
+
+        # Block height cache for SCID-derived channel age
+        self._blockheight: int = 0
+        self._blockheight_time: float = 0
+
+        # SCID -> peer_id, learned from listpeerchannels, so single-channel
+        # requests can ask for just that peer's channels
+        self._scid_peer_map: Dict[str, str] = {}
+
     def set_our_pubkey(self, pubkey: str) -> None:
         """Set our node's pubkey after initialization."""
         self.our_pubkey = pubkey
@@ -385,16 +402,13 @@ class YieldMetricsManager:
         metrics = []
 
         try:
-            # Get channel list
-            if channel_id:
-                channels_resp = self.plugin.rpc.listpeerchannels()
-                channels = [
-                    ch for ch in channels_resp.get("channels", [])
-                    if ch.get("short_channel_id") == channel_id
-                ]
-            else:
-                channels_resp = self.plugin.rpc.listpeerchannels()
-                channels = channels_resp.get("channels", [])
+            channels = self._list_channels(channel_id)
+            normal_channels = [
+                ch for ch in channels if ch.get("state") == "CHANNELD_NORMAL"
+            ]
+            aliases = self._get_peer_aliases(
+                {ch.get("peer_id", "") for ch in normal_channels}
+            )
 
             # Get profitability data from cl-revenue-ops if available
             profitability_data = {}
@@ -407,10 +421,7 @@ class YieldMetricsManager:
                 except Exception:
                     pass
 
-            for ch in channels:
-                if ch.get("state") != "CHANNELD_NORMAL":
-                    continue
-
+            for ch in normal_channels:
                 scid = ch.get("short_channel_id", "")
                 peer_id = ch.get("peer_id", "")
 
@@ -423,18 +434,8 @@ class YieldMetricsManager:
                 # Get profitability data if available
                 prof = profitability_data.get(scid, {})
 
-                # Get peer alias
-                peer_alias = None
-                try:
-                    nodes = self.plugin.rpc.listnodes(id=peer_id)
-                    if nodes.get("nodes"):
-                        peer_alias = nodes["nodes"][0].get("alias")
-                except Exception:
-                    pass
-
-                # Calculate channel age
-                funding_txid = ch.get("funding_txid")
-                channel_age_days = self._get_channel_age_days(funding_txid)
+                peer_alias = aliases.get(peer_id)
+                channel_age_days = self._get_channel_age_days(scid)
 
                 # Determine flow direction
                 flow_direction = "balanced"
@@ -469,22 +470,125 @@ class YieldMetricsManager:
 
         return metrics
 
-    def _get_channel_age_days(self, funding_txid: str) -> int:
-        """Get channel age in days from funding transaction."""
-        if not funding_txid:
-            return 0
+    def _list_channels(self, channel_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List our channels, narrowing to one peer when a single SCID is requested.
+
+        Falls back to the full listing when the SCID's peer is not known yet
+        (or the channel is no longer with that peer).
+        """
+        if channel_id:
+            peer_id = self._scid_peer_map.get(channel_id)
+            if peer_id:
+                resp = self.plugin.rpc.listpeerchannels(id=peer_id)
+                matches = [
+                    ch for ch in resp.get("channels", [])
+                    if ch.get("short_channel_id") == channel_id
+                ]
+                if matches:
+                    return matches
+
+        channels = self.plugin.rpc.listpeerchannels().get("channels", [])
+        for ch in channels:
+            scid = ch.get("short_channel_id")
+            if scid and ch.get("peer_id"):
+                self._scid_peer_map[scid] = ch["peer_id"]
 
+        if channel_id:
+            return [ch for ch in channels if ch.get("short_channel_id") == channel_id]
+        return channels
+
+    def _get_peer_aliases(self, peer_ids) -> Dict[str, Optional[str]]:
+        """
+        Resolve node aliases through a TTL cache.
+
+        Many misses are filled from one bulk listnodes call; a few misses are
+        looked up individually. Nodes without an alias (or unknown to gossip)
+        are cached as None so they don't cost an RPC on every call.
+        """
+        now = time.time()
+        result: Dict[str, Optional[str]] = {}
+        misses = []
+
+        for peer_id in peer_ids:
+            if not peer_id:
+                continue
+            cached = self._alias_cache.get(peer_id)
+            if cached and now - cached[1] < NODE_ALIAS_CACHE_TTL:
+                result[peer_id] = cached[0]
+            else:
+                misses.append(peer_id)
+
+        if not misses:
+            return result
+
+        if len(misses) >= ALIAS_BULK_FETCH_THRESHOLD:
+            try:
+                nodes = self.plugin.rpc.listnodes().get("nodes", [])
+            except Exception:
+                nodes = []
+            # Only keep the ids we asked for, not the whole public graph;
+            # ids missing from gossip (or a failed fetch) are cached as None
+            wanted = set(misses)
+            aliases = {
+                node["nodeid"]: node.get("alias")
+                for node in nodes if node.get("nodeid") in wanted
+            }
+            for peer_id in misses:
+                alias = aliases.get(peer_id)
+                self._alias_cache[peer_id] = (alias, now)
+                result[peer_id] = alias
+            return result
+
+        for peer_id in misses:
+            alias = None
+            try:
+                nodes = self.plugin.rpc.listnodes(id=peer_id)
+                if nodes.get("nodes"):
+                    alias = nodes["nodes"][0].get("alias")
+            except Exception:
+                pass
+            self._alias_cache[peer_id] = (alias, now)
+            result[peer_id] = alias
+
+        return result
+
+    def _get_blockheight(self) -> int:
+        """Get current block height, cached for BLOCKHEIGHT_CACHE_TTL."""
+        now = time.time()
+        if self._blockheight and now - self._blockheight_time < BLOCKHEIGHT_CACHE_TTL:
+            return self._blockheight
         try:
-            # Try to get block height from transaction
-            tx = self.plugin.rpc.gettxout(txid=funding_txid, vout=0)
-            if tx and tx.get("height"):
-                current_height = self.plugin.rpc.getinfo().get("blockheight", 0)
-                blocks_old = current_height - tx.get("height")
-                return blocks_old // 144  # ~144 blocks per day
+            height = self.plugin.rpc.getinfo().get("blockheight", 0)
+            if height:
+                self._blockheight = height
+                self._blockheight_time = now
         except Exception:
             pass
+        return self._blockheight
+
+    def _get_channel_age_days(self, short_channel_id: str) -> int:
+        """
+        Get channel age in days from the funding block encoded in the SCID.
+
+        SCID format is block_height x tx_index x output_index, so no per-channel
+        RPC is needed; only the (cached) current block height.
+        """
+        if not short_channel_id:
+            return 0
 
-        return 0
+        parts = short_channel_id.replace(":", "x").split("x")
+        if len(parts) != 3:
+            return 0
+        try:
+            funding_block = int(parts[0])
+        except ValueError:
+            return 0
+
+        current_height = self._get_blockheight()
+        if current_height <= funding_block:
+            return 0
+        return (current_height - funding_block) // 144  # ~144 blocks per day
 
     # =========================================================================
     # VELOCITY PREDICTION
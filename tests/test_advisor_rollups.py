@@ -0,0 +1,209 @@
+"""
+Tests for AdvisorDB hourly/daily rollups and retention tiers.
+
+Covers:
+- Rollups maintained incrementally by the record_* methods
+- Backfill from raw history matches incremental maintenance
+- Long-window channel history, fleet trends and goat feeder trends read
+  rollups and survive raw retention
+- Per-tier retention in cleanup_old_data()
+"""
+
+import os
+import random
+import sys
+import time
+
+import pytest
+
+# Add tools directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
+
+from advisor_db import AdvisorDB, ROLLUP_BUCKET_SECONDS
+
+
+@pytest.fixture
+def db(tmp_path):
+    return AdvisorDB(str(tmp_path / "advisor.db"))
+
+
+def _insert_channel_rows(db, rows):
+    """rows: (timestamp, channel, local, fee_ppm); rolled up like record_channel_states()."""
+    with db._get_conn() as conn:
+        last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM channel_history").fetchone()[0]
+        conn.executemany("""
+            INSERT INTO channel_history (
+                timestamp, node_name, channel_id, peer_id, capacity_sats,
+                local_sats, remote_sats, balance_ratio, flow_state, forward_count, fee_ppm
+            ) VALUES (?, 'alice', ?, '02aa', 1000000, ?, 1000000 - ?, ? / 1000000.0, 'balanced', 1, ?)
+        """, [(ts, ch, local, local, local, fee) for ts, ch, local, fee in rows])
+        db._rollup_new_rows(conn, {"channel_history": last_id})
+
+
+def _insert_fleet_rows(db, rows):
+    """rows: (timestamp, total_revenue_sats, total_capacity_sats, total_channels)."""
+    with db._get_conn() as conn:
+        last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM fleet_snapshots").fetchone()[0]
+        conn.executemany("""
+            INSERT INTO fleet_snapshots (
+                timestamp, snapshot_type, total_nodes, nodes_healthy, total_channels,
+                total_capacity_sats, total_revenue_sats, net_profit_sats
+            ) VALUES (?, 'hourly', 2, 2, ?, ?, ?, ?)
+        """, [(ts, ch, cap, rev, rev) for ts, rev, cap, ch in rows])
+        db._rollup_new_rows(conn, {"fleet_snapshots": last_id})
+
+
+def _insert_goat_rows(db, rows):
+    """rows: (timestamp, node, revenue, expense)."""
+    with db._get_conn() as conn:
+        last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM goat_feeder_snapshots").fetchone()[0]
+        conn.executemany("""
+            INSERT INTO goat_feeder_snapshots (
+                timestamp, node_name, window_days, revenue_sats, revenue_count,
+                expense_sats, expense_count, net_profit_sats, profitable
+            ) VALUES (?, ?, 1, ?, 1, ?, 1, ?, 1)
+        """, [(ts, node, rev, exp, rev - exp) for ts, node, rev, exp in rows])
+        db._rollup_new_rows(conn, {"goat_feeder_snapshots": last_id})
+
+
+def _rollup_rows(db, table):
+    with db._get_conn() as conn:
+        return [dict(r) for r in conn.execute(f"SELECT * FROM {table} ORDER BY 1, 2, 3, 4")]
+
+
+class TestRollupMaintenance:
+
+    def test_record_methods_maintain_rollups(self, db):
+        report = {"nodes": {"alice": {"healthy": True, "channels_detail": [
+            {"channel_id": "1x1x0", "local_sats": 400_000, "capacity_sats": 1_000_000,
+             "balance_ratio": 0.4, "fee_ppm": 100, "flow_state": "source"}
+        ]}}}
+        db.record_channel_states(report)
+        report["nodes"]["alice"]["channels_detail"][0].update(local_sats=600_000, balance_ratio=0.6)
+        db.record_channel_states(report)
+        db.record_fleet_snapshot({"fleet_summary": {"total_channels": 3}})
+        db.record_goat_feeder_snapshot("alice", 1, 500, 2, 200, 1)
+
+        hourly = [r for r in _rollup_rows(db, "channel_history_rollup") if r["resolution"] == "hour"]
+        assert len(hourly) == 1
+        assert hourly[0]["samples"] == 2
+        assert hourly[0]["open_local_sats"] == 400_000
+        assert hourly[0]["close_local_sats"] == 600_000
+        assert hourly[0]["min_local_sats"] == 400_000
+        assert hourly[0]["sum_local_sats"] == 1_000_000
+        assert hourly[0]["close_flow_state"] == "source"
+
+        assert {r["resolution"] for r in _rollup_rows(db, "fleet_snapshot_rollup")} == {"day", "hour"}
+        goat = _rollup_rows(db, "goat_feeder_rollup")
+        assert [r["net_profit_sats"] for r in goat] == [300, 300]
+
+    def test_incremental_matches_backfill(self, db, tmp_path):
+        rnd = random.Random(3)
+        start = 1_700_000_000
+        rows = [(start + i * 600 + rnd.randint(0, 500), f"{i % 3}x1x0",
+                 rnd.randint(0, 1_000_000), rnd.randint(1, 500)) for i in range(300)]
+        rnd.shuffle(rows)
+        for i in range(0, len(rows), 7):
+            _insert_channel_rows(db, rows[i:i + 7])
+
+        # Re-open on a copy whose rollups are rebuilt by the schema upgrade
+        with db._get_conn() as conn:
+            conn.execute("DELETE FROM channel_history_rollup")
+            conn.execute("UPDATE schema_version SET version = 6")
+        fresh = AdvisorDB(db.db_path)
+        rebuilt = _rollup_rows(fresh, "channel_history_rollup")
+
+        other = AdvisorDB(str(tmp_path / "other.db"))
+        for i in range(0, len(rows), 7):
+            _insert_channel_rows(other, rows[i:i + 7])
+        incremental = _rollup_rows(other, "channel_history_rollup")
+
+        assert len(rebuilt) == len(incremental) > 0
+        for a, b in zip(rebuilt, incremental):
+            assert a == pytest.approx(b)
+
+
+class TestRollupQueries:
+
+    def test_channel_history_resolution(self, db):
+        now = int(time.time())
+        _insert_channel_rows(db, [(now - h * 3600, "1x1x0", 500_000 + h, 100) for h in range(0, 24 * 10)])
+
+        raw = db.get_channel_history("alice", "1x1x0", hours=24)
+        assert len(raw) == 24
+        assert "samples" not in raw[0]
+
+        week = db.get_channel_history("alice", "1x1x0", hours=168)
+        assert 168 <= len(week) <= 169
+        assert week[-1]["local_sats"] == 500_000
+        assert week[-1]["remote_sats"] == 500_000
+        assert week[-1]["samples"] == 1
+        assert [r["timestamp"] for r in week] == sorted(r["timestamp"] for r in week)
+
+        daily = db.get_channel_history("alice", "1x1x0", hours=168, resolution="day")
+        # The first day bucket reaches back before the window, unless its
+        # last sample falls on the cutoff (the final hour of a day)
+        assert 168 <= sum(r["samples"] for r in daily) < 169 + 24
+        assert all(r["min_local_sats"] <= r["avg_local_sats"] <= r["max_local_sats"] for r in daily)
+
+    def test_history_survives_raw_retention(self, tmp_path):
+        db = AdvisorDB(str(tmp_path / "advisor.db"), retention_days={"raw": 2, "hour": 5})
+        now = int(time.time())
+        _insert_channel_rows(db, [(now - h * 3600, "1x1x0", 1000 * h, 100) for h in range(24 * 20)])
+        _insert_fleet_rows(db, [(now - h * 3600, 1000 + (480 - h), 1_000_000, 10) for h in range(24 * 20)])
+        db.cleanup_old_data()
+
+        assert len(db.get_channel_history("alice", "1x1x0", hours=24 * 30, resolution="raw")) in (48, 49)
+        hourly = db.get_channel_history("alice", "1x1x0", hours=24 * 5)
+        assert hourly[0]["resolution"] == "hour"
+        assert len(hourly) >= 24 * 4
+        daily = db.get_channel_history("alice", "1x1x0", hours=24 * 30)
+        assert daily[0]["resolution"] == "day"
+        assert sum(r["samples"] for r in daily) == 24 * 20
+
+        with db._get_conn() as conn:
+            oldest_hour = conn.execute(
+                "SELECT MIN(bucket_start) FROM channel_history_rollup WHERE resolution = 'hour'"
+            ).fetchone()[0]
+        assert oldest_hour >= now - 5 * 86400 - ROLLUP_BUCKET_SECONDS["hour"]
+
+        trend = db.get_fleet_trends(days=14)
+        # Revenue grew from 1144 (14 days ago) to 1480; daily buckets are
+        # accurate to within one day (1168)
+        assert 26.5 <= trend.revenue_change_pct <= 29.5
+
+    def test_fleet_trends_match_raw(self, db):
+        now = int(time.time())
+        _insert_fleet_rows(db, [(now - h * 3600 - 120, 2000 - h, 1_000_000 + h, 20) for h in range(24 * 10)])
+        long = db.get_fleet_trends(days=7)
+        # Rollup answer is within one bucket of the raw oldest point
+        assert long.revenue_change_pct == pytest.approx((2000 - 1833) / 1833 * 100, abs=0.1)
+        assert long.period_hours == 168
+
+    def test_goat_feeder_trends_match_raw(self, db):
+        rnd = random.Random(9)
+        now = int(time.time())
+        rows = [(now - rnd.randint(0, 30 * 86400), rnd.choice(["alice", "bob"]),
+                 rnd.randint(0, 1000), rnd.randint(0, 800)) for _ in range(2000)]
+        _insert_goat_rows(db, rows)
+
+        for days in (7, 14):
+            cutoff = now - days * 86400
+            prev_cutoff = now - days * 2 * 86400
+            for node in ("alice", None):
+                trend = db.get_goat_feeder_trends(node_name=node, days=days)
+                mine = [r for r in rows if node is None or r[1] == node]
+                current = [r for r in mine if r[0] > cutoff]
+                previous = [r for r in mine if prev_cutoff < r[0] <= cutoff]
+                assert trend["current_period"]["revenue_sats"] == sum(r[2] for r in current)
+                assert trend["current_period"]["revenue_count"] == len(current)
+                assert trend["previous_period"]["expense_sats"] == sum(r[3] for r in previous)
+
+    def test_rollup_tier_retention(self, tmp_path):
+        db = AdvisorDB(str(tmp_path / "advisor.db"), retention_days={"hour": 3, "day": 10})
+        now = int(time.time())
+        _insert_goat_rows(db, [(now - d * 86400, "alice", 10, 0) for d in range(20)])
+        db.cleanup_old_data()
+        rows = _rollup_rows(db, "goat_feeder_rollup")
+        assert 3 <= sum(r["resolution"] == "hour" for r in rows) <= 4
+        assert 10 <= sum(r["resolution"] == "day" for r in rows) <= 11
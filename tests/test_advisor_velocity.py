@@ -0,0 +1,235 @@
+"""
+Tests for set-based channel velocity computation in AdvisorDB.
+
+Covers:
+- Single grouped pass over the velocity window matches the per-channel
+  reference implementation
+- Window table is fed by record_channel_states and pruned on update
+- Trends, depletion/full predictions and confidence
+- get_critical_channels reads the materialized table via its index
+
+Benchmark (5,000 channels, 30 days of 6-hourly and recent 30-minute samples):
+    CL_HIVE_BENCHMARK=1 pytest tests/test_advisor_velocity.py -k benchmark -s
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+# Add tools directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
+
+from advisor_db import AdvisorDB
+
+
+@pytest.fixture
+def db(tmp_path):
+    return AdvisorDB(str(tmp_path / "advisor.db"))
+
+
+def _insert_history(db, rows):
+    """
+    Bulk-load channel_history like record_channel_states() does.
+
+    rows: (timestamp, node, channel, capacity, local)
+    """
+    with db._get_conn() as conn:
+        last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM channel_history").fetchone()[0]
+        conn.executemany("""
+            INSERT INTO channel_history (
+                timestamp, node_name, channel_id, peer_id,
+                capacity_sats, local_sats, remote_sats, balance_ratio
+            ) VALUES (?, ?, ?, '', ?, ?, ?, ?)
+        """, [(ts, node, ch, cap, local, cap - local, local / cap) for ts, node, ch, cap, local in rows])
+        db._append_velocity_window(conn, after_id=last_id)
+
+
+def _legacy_update_velocities(db):
+    """Previous per-channel (N+1) implementation, kept as the reference."""
+    cutoff = int((datetime.now() - timedelta(hours=6)).timestamp())
+    with db._get_conn() as conn:
+        channels = conn.execute("""
+            SELECT DISTINCT node_name, channel_id FROM channel_history WHERE timestamp > ?
+        """, (cutoff,)).fetchall()
+        for row in channels:
+            readings = conn.execute("""
+                SELECT timestamp, local_sats, balance_ratio, capacity_sats
+                FROM channel_history
+                WHERE node_name = ? AND channel_id = ? AND timestamp > ?
+                ORDER BY timestamp
+            """, (row['node_name'], row['channel_id'], cutoff)).fetchall()
+            if len(readings) < 2:
+                continue
+            oldest, newest = readings[0], readings[-1]
+            hours = (newest['timestamp'] - oldest['timestamp']) / 3600.0
+            if hours < 0.1:
+                continue
+            velocity_sats = (newest['local_sats'] - oldest['local_sats']) / hours
+            velocity_pct = ((newest['balance_ratio'] - oldest['balance_ratio']) * 100) / hours
+            if abs(velocity_pct) < 0.5:
+                trend = "stable"
+            elif velocity_sats < 0:
+                trend = "depleting"
+            else:
+                trend = "filling"
+            hours_depleted = hours_full = None
+            if trend == "depleting":
+                hours_depleted = newest['local_sats'] / abs(velocity_sats)
+            elif trend == "filling":
+                hours_full = (newest['capacity_sats'] - newest['local_sats']) / velocity_sats
+            conn.execute("""
+                INSERT OR REPLACE INTO channel_velocity (
+                    node_name, channel_id, updated_at,
+                    current_local_sats, current_balance_ratio,
+                    balance_velocity_sats_per_hour, balance_velocity_pct_per_hour,
+                    hours_until_depleted, hours_until_full,
+                    trend, trend_confidence
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                row['node_name'], row['channel_id'], int(time.time()),
+                newest['local_sats'], newest['balance_ratio'],
+                velocity_sats, velocity_pct, hours_depleted, hours_full,
+                trend, min(1.0, len(readings) / 10.0)
+            ))
+
+
+def _materialized(db):
+    with db._get_conn() as conn:
+        rows = conn.execute("SELECT * FROM channel_velocity").fetchall()
+    return {
+        (r['node_name'], r['channel_id']): (
+            r['current_local_sats'],
+            r['balance_velocity_sats_per_hour'],
+            r['balance_velocity_pct_per_hour'],
+            r['hours_until_depleted'] or 0,
+            r['hours_until_full'] or 0,
+            r['trend_confidence'],
+        )
+        for r in rows
+    }
+
+
+class TestSetBasedVelocity:
+
+    def test_matches_reference(self, db):
+        rnd = random.Random(5)
+        now = int(time.time())
+        rows = []
+        for c in range(40):
+            cap = 1_000_000
+            local = rnd.randint(100_000, 900_000)
+            # 30 days of history, only the last 6h count; some channels sparse
+            for step in range(0, 30 * 24, 6 if c % 5 else 200):
+                ts = now - 30 * 86400 + step * 3600
+                local = max(0, min(cap, local + rnd.randint(-20_000, 20_000)))
+                rows.append((ts, "alice" if c % 2 else "bob", f"{c}x1x0", cap, local))
+            for minutes in (300, 180, 60):
+                local = max(0, min(cap, local + rnd.randint(-50_000, 50_000)))
+                rows.append((now - minutes * 60, "alice" if c % 2 else "bob", f"{c}x1x0", cap, local))
+        _insert_history(db, rows)
+
+        _legacy_update_velocities(db)
+        expected = _materialized(db)
+        with db._get_conn() as conn:
+            conn.execute("DELETE FROM channel_velocity")
+
+        db._update_channel_velocities()
+        actual = _materialized(db)
+        assert len(actual) == 40
+        assert set(actual) == set(expected)
+        for key, values in expected.items():
+            assert actual[key] == pytest.approx(values)
+
+    def test_trend_and_critical_channels(self, db):
+        now = int(time.time())
+        _insert_history(db, [
+            # Draining 100k/h from 300k: depleted in ~2h
+            (now - 7200, "alice", "1x1x0", 1_000_000, 500_000),
+            (now, "alice", "1x1x0", 1_000_000, 300_000),
+            # Filling 50k/h with 100k remote: full in ~2h
+            (now - 7200, "alice", "2x1x0", 1_000_000, 800_000),
+            (now, "alice", "2x1x0", 1_000_000, 900_000),
+            # Flat
+            (now - 7200, "alice", "3x1x0", 1_000_000, 500_000),
+            (now, "alice", "3x1x0", 1_000_000, 500_000),
+            # Single reading: no velocity
+            (now, "alice", "4x1x0", 1_000_000, 500_000),
+        ])
+        db._update_channel_velocities()
+
+        draining = db.get_channel_velocity("alice", "1x1x0")
+        assert draining.trend == "depleting"
+        assert draining.hours_until_depleted == pytest.approx(3.0)
+        assert db.get_channel_velocity("alice", "2x1x0").trend == "filling"
+        assert db.get_channel_velocity("alice", "3x1x0").trend == "stable"
+        assert db.get_channel_velocity("alice", "4x1x0") is None
+
+        critical = db.get_critical_channels(hours_threshold=24)
+        assert [v.channel_id for v in critical] == ["2x1x0", "1x1x0"]
+        assert db.get_critical_channels(hours_threshold=1) == []
+
+    def test_window_maintained_by_record_channel_states(self, db):
+        report = {"nodes": {"alice": {"healthy": True, "channels_detail": [
+            {"channel_id": "1x1x0", "local_sats": 400_000, "capacity_sats": 1_000_000}
+        ]}}}
+        old = int(time.time()) - 7 * 3600
+        _insert_history(db, [(old, "alice", "1x1x0", 1_000_000, 500_000)])
+        with db._get_conn() as conn:
+            # Out-of-window rows are never copied
+            assert conn.execute("SELECT COUNT(*) FROM channel_velocity_window").fetchone()[0] == 0
+
+        db.record_channel_states(report)
+        db.record_channel_states(report)
+        with db._get_conn() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM channel_velocity_window").fetchone()[0] == 2
+            conn.execute("UPDATE channel_velocity_window SET timestamp = ?", (old,))
+        db._update_channel_velocities()
+        with db._get_conn() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM channel_velocity_window").fetchone()[0] == 0
+
+    def test_critical_query_uses_index(self, db):
+        with db._get_conn() as conn:
+            plan = conn.execute("""
+                EXPLAIN QUERY PLAN
+                SELECT * FROM channel_velocity
+                WHERE COALESCE(hours_until_depleted, hours_until_full) < 24
+                ORDER BY COALESCE(hours_until_depleted, hours_until_full)
+            """).fetchall()
+        assert any("idx_channel_velocity_critical" in row[3] for row in plan)
+
+
+@pytest.mark.skipif(not os.environ.get("CL_HIVE_BENCHMARK"), reason="set CL_HIVE_BENCHMARK=1")
+def test_benchmark_5000_channels(db):
+    rnd = random.Random(1)
+    now = int(time.time())
+    rows = []
+    for c in range(5000):
+        node = f"node{c % 10}"
+        local = rnd.randint(100_000, 900_000)
+        for step in range(0, 30 * 24, 6):
+            rows.append((now - 30 * 86400 + step * 3600, node, f"{c}x1x0", 1_000_000, local))
+        for minutes in range(330, -1, -30):
+            local = max(0, min(1_000_000, local + rnd.randint(-20_000, 20_000)))
+            rows.append((now - minutes * 60, node, f"{c}x1x0", 1_000_000, local))
+    _insert_history(db, rows)
+
+    def best_of(fn, runs=3):
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    legacy = best_of(lambda: _legacy_update_velocities(db))
+    set_based = best_of(db._update_channel_velocities)
+    critical_ms = best_of(lambda: db.get_critical_channels(hours_threshold=24)) * 1000
+
+    print(f"\n{len(rows)} history rows, 5000 channels: "
+          f"per-channel {legacy * 1000:.0f}ms, set-based {set_based * 1000:.0f}ms "
+          f"({legacy / set_based:.1f}x), critical query {critical_ms:.1f}ms")
+    assert set_based < legacy
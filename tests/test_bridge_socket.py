@@ -0,0 +1,259 @@
+"""
+Tests for the Bridge's persistent lightning-rpc socket client.
+
+Covers:
+- One connection reused across Bridge calls, params passed as JSON-RPC
+- RPC errors surface as RpcError and keep the connection
+- Timeouts and dropped connections trip the CircuitBreaker, then reconnect
+- Concurrent callers are serialized and matched to their replies
+
+Benchmark (socket client vs forking lightning-cli per call):
+    CL_HIVE_BENCHMARK=1 pytest tests/test_bridge_socket.py -k benchmark -s
+"""
+
+import json
+import os
+import socket
+import stat
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Mock pyln.client before importing modules (no-op if another test did)
+if "pyln.client" not in sys.modules:
+    class MockRpcError(Exception):
+        """Mock RpcError to match pyln.client.RpcError behavior."""
+        pass
+
+    mock_pyln = MagicMock()
+    mock_pyln.Plugin = MagicMock
+    mock_pyln.RpcError = MockRpcError
+    sys.modules["pyln"] = mock_pyln
+    sys.modules["pyln.client"] = mock_pyln
+
+from modules.bridge import (
+    Bridge,
+    BridgeStatus,
+    CircuitOpenError,
+    CircuitState,
+    MAX_FAILURES,
+    RpcError,
+    SocketRpcClient,
+)
+
+
+class FakeLightningRpc:
+    """
+    Threaded unix-socket server speaking lightningd's JSON-RPC framing.
+
+    Methods: "echo" returns its params, "fail" returns an error, "hang"
+    never replies, anything else returns {"method": name}. Replies are
+    terminated by a blank line like lightningd's.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.connections = 0
+        self.requests = []
+        self.drop_after_reply = False
+        self.notify = False
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(path)
+        self._server.listen(8)
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _reply(self, request):
+        method = request["method"]
+        if method == "fail":
+            return {"jsonrpc": "2.0", "id": request["id"],
+                    "error": {"code": -32601, "message": "Unknown command 'fail'"}}
+        if method == "echo":
+            return {"jsonrpc": "2.0", "id": request["id"], "result": request["params"]}
+        return {"jsonrpc": "2.0", "id": request["id"], "result": {"method": method}}
+
+    def _handle(self, conn):
+        decoder = json.JSONDecoder()
+        buffer = ""
+        with conn:
+            while True:
+                try:
+                    data = conn.recv(65536)
+                except OSError:
+                    return
+                if not data:
+                    return
+                buffer += data.decode()
+                while buffer.strip():
+                    try:
+                        request, end = decoder.raw_decode(buffer.lstrip())
+                    except json.JSONDecodeError:
+                        break
+                    buffer = buffer.lstrip()[end:]
+                    self.requests.append(request["method"])
+                    if request["method"] == "hang":
+                        continue
+                    if self.notify:
+                        note = {"jsonrpc": "2.0", "method": "message", "params": {"level": "info"}}
+                        conn.sendall(json.dumps(note).encode() + b"\n\n")
+                    conn.sendall(json.dumps(self._reply(request)).encode() + b"\n\n")
+                    if self.drop_after_reply:
+                        self.drop_after_reply = False
+                        return
+
+    def close(self):
+        self._server.close()
+
+
+@pytest.fixture
+def server(tmp_path):
+    srv = FakeLightningRpc(str(tmp_path / "lightning-rpc"))
+    yield srv
+    srv.close()
+
+
+def _bridge(socket_path):
+    rpc = MagicMock()
+    rpc.get_socket_path.return_value = socket_path
+    bridge = Bridge(rpc, MagicMock())
+    bridge._status = BridgeStatus.ENABLED
+    return bridge
+
+
+class TestSocketRpcClient:
+
+    def test_connection_reused(self, server):
+        bridge = _bridge(server.path)
+        assert bridge.get_stats()["rpc_transport"] == "socket"
+        for method in ("revenue-status", "revenue-policy", "listpeerchannels"):
+            assert bridge.safe_call(method) == {"method": method}
+        assert bridge.safe_call("echo", {"peer_id": "02aa", "strategy": "hive", "skip": None}) == \
+            {"peer_id": "02aa", "strategy": "hive"}
+        assert server.connections == 1
+        assert bridge.rpc.call.call_count == 0
+        bridge.close()
+
+    def test_rpc_error_keeps_connection(self, server):
+        bridge = _bridge(server.path)
+        with pytest.raises(RpcError):
+            bridge.safe_call("fail")
+        assert bridge._revenue_ops_cb._failure_count == 1
+        assert bridge.safe_call("revenue-status") == {"method": "revenue-status"}
+        assert server.connections == 1
+
+    def test_notifications_skipped(self, server):
+        server.notify = True
+        client = SocketRpcClient(server.path)
+        assert client.call("getinfo") == {"method": "getinfo"}
+        assert client.call("echo", {"a": 1}) == {"a": 1}
+
+    def test_timeout_trips_breaker_then_reconnects(self, server):
+        bridge = _bridge(server.path)
+        bridge._socket_client.timeout = 0.2
+        for _ in range(MAX_FAILURES):
+            with pytest.raises(TimeoutError):
+                bridge.safe_call("hang")
+        assert bridge._revenue_ops_cb.state == CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            bridge.safe_call("revenue-status")
+
+        # After the breaker resets, a fresh connection serves the call
+        bridge._revenue_ops_cb.reset()
+        assert bridge.safe_call("revenue-status") == {"method": "revenue-status"}
+        assert server.connections == MAX_FAILURES + 1
+
+    def test_reconnects_after_server_drop(self, server):
+        client = SocketRpcClient(server.path, timeout=2)
+        server.drop_after_reply = True
+        assert client.call("getinfo") == {"method": "getinfo"}
+        time.sleep(0.05)
+        # The stale connection is replaced; the request is sent once
+        assert client.call("listfunds") == {"method": "listfunds"}
+        assert server.requests == ["getinfo", "listfunds"]
+        assert client.connects == 2
+
+    def test_unreachable_socket_trips_breaker(self, tmp_path):
+        bridge = _bridge(str(tmp_path / "missing"))
+        for _ in range(MAX_FAILURES):
+            with pytest.raises(OSError):
+                bridge.safe_call("revenue-status")
+        with pytest.raises(CircuitOpenError):
+            bridge.safe_call("revenue-status")
+
+    def test_concurrent_callers(self, server):
+        client = SocketRpcClient(server.path)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda i: client.call("echo", {"i": i}), range(200)))
+        assert results == [{"i": i} for i in range(200)]
+        assert server.connections == 1
+
+    def test_falls_back_to_proxy_without_socket(self):
+        rpc = MagicMock(spec=["call", "plugin"])
+        rpc.call.return_value = {"ok": True}
+        bridge = Bridge(rpc, MagicMock())
+        bridge._status = BridgeStatus.ENABLED
+        assert bridge.get_stats()["rpc_transport"] == "proxy"
+        assert bridge.safe_call("revenue-status") == {"ok": True}
+
+
+LIGHTNING_CLI_SHIM = """#!{python}
+# Minimal lightning-cli stand-in: --rpc-file PATH -k METHOD key=value...
+import json, socket, sys
+args = sys.argv[1:]
+path = args[args.index("--rpc-file") + 1]
+method = args[args.index("-k") + 1]
+params = dict(a.split("=", 1) for a in args[args.index("-k") + 2:])
+sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+sock.connect(path)
+sock.sendall(json.dumps({{"jsonrpc": "2.0", "id": 1, "method": method, "params": params}}).encode())
+buf = b""
+while not buf.rstrip().endswith(b"}}"):
+    buf += sock.recv(65536)
+print(json.dumps(json.loads(buf)["result"]))
+"""
+
+
+@pytest.mark.skipif(not os.environ.get("CL_HIVE_BENCHMARK"), reason="set CL_HIVE_BENCHMARK=1")
+def test_benchmark_socket_vs_subprocess(server, tmp_path, monkeypatch):
+    # Use the real lightning-cli when installed, otherwise a Python shim
+    # (which makes the subprocess path look somewhat slower than it is)
+    import shutil
+    if not shutil.which("lightning-cli"):
+        shim = tmp_path / "bin" / "lightning-cli"
+        shim.parent.mkdir()
+        shim.write_text(LIGHTNING_CLI_SHIM.format(python=sys.executable))
+        shim.chmod(shim.stat().st_mode | stat.S_IEXEC)
+        monkeypatch.setenv("PATH", f"{shim.parent}{os.pathsep}{os.environ['PATH']}")
+
+    bridge = _bridge(server.path)
+    payload = {"peer_id": "02" + "ab" * 32, "strategy": "hive"}
+    calls = 200
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        bridge._call_via_lightning_cli("echo", payload)
+    subprocess_ms = (time.perf_counter() - start) * 1000 / calls
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        bridge._call_via_socket("echo", payload)
+    socket_ms = (time.perf_counter() - start) * 1000 / calls
+
+    print(f"\nlightning-cli: {subprocess_ms:.2f} ms/call, socket: {socket_ms:.3f} ms/call "
+          f"({subprocess_ms / socket_ms:.0f}x)")
+    assert socket_ms < subprocess_ms
@@ -31,6 +31,7 @@ from modules.cost_reduction import (
     URGENT_MAX_FEE_PPM,
     FLEET_PATH_SAVINGS_THRESHOLD,
     FLEET_FEE_DISCOUNT_PCT,
+    MAX_CANDIDATE_PATHS,
     MIN_CIRCULAR_AMOUNT_SATS,
 )
 
@@ -644,6 +645,102 @@ class TestFleetRebalanceRouter:
         assert result["estimated_external_cost_sats"] > 0
 
 
+def _member(i):
+    return "03" + f"{i:064x}"
+
+
+def _peer(name):
+    return "02" + name * 64
+
+
+class TestFleetPathSearch:
+    """Test precomputed member graph, k-shortest paths and memoization."""
+
+    def _router(self, topologies, hub_scores=None):
+        state_manager = MockStateManager()
+        for member, peers in topologies.items():
+            state_manager.set_peer_state(member, topology=peers)
+        router = FleetRebalanceRouter(plugin=MockPlugin(), state_manager=state_manager)
+        router.get_member_hub_scores = MagicMock(return_value=hub_scores or {})
+        return router, state_manager
+
+    def _chain(self):
+        # from_peer - M0 -(p1)- M1 -(p2)- M2 - to_peer, plus M0 -(p3)- M3 -(p4)- M2
+        m = [_member(i) for i in range(4)]
+        return m, {
+            m[0]: [_peer("x"), _peer("1"), _peer("3")],
+            m[1]: [_peer("1"), _peer("2")],
+            m[2]: [_peer("2"), _peer("4"), _peer("y")],
+            m[3]: [_peer("3"), _peer("4")],
+        }
+
+    def test_member_adjacency_from_shared_peers(self):
+        m, topo = self._chain()
+        router, _ = self._router(topo)
+        router._get_fleet_topology()
+
+        assert router._member_adjacency[m[0]] == {m[1], m[3]}
+        assert router._member_adjacency[m[2]] == {m[1], m[3]}
+        assert router._peer_members[_peer("x")] == {m[0]}
+
+    def test_find_fleet_path_multi_hop(self):
+        m, topo = self._chain()
+        router, _ = self._router(topo)
+
+        path = router.find_fleet_path(_peer("x"), _peer("y"), 100_000)
+
+        assert path.hops == 3
+        assert path.path[0] == m[0] and path.path[-1] == m[2]
+
+    def test_k_shortest_paths_distinct_and_bounded(self):
+        m, topo = self._chain()
+        router, _ = self._router(topo)
+
+        paths = router._find_all_fleet_paths(_peer("x"), _peer("y"))
+        assert sorted(map(tuple, paths)) == [(m[0], m[1], m[2]), (m[0], m[3], m[2])]
+
+        assert router._find_all_fleet_paths(_peer("x"), _peer("y"), max_depth=2) == []
+
+    def test_hub_aware_path_prefers_high_hub(self):
+        m, topo = self._chain()
+        router, _ = self._router(topo, hub_scores={m[3]: 0.9, m[1]: 0.1})
+
+        path = router.find_hub_aware_fleet_path(_peer("x"), _peer("y"), 100_000)
+
+        assert path.path == [m[0], m[3], m[2]]
+
+    def test_memo_reused_until_topology_changes(self):
+        m, topo = self._chain()
+        router, state_manager = self._router(topo)
+
+        router._find_all_fleet_paths(_peer("x"), _peer("y"))
+        router._k_shortest_member_paths = MagicMock(side_effect=AssertionError("not memoized"))
+        router._find_all_fleet_paths(_peer("x"), _peer("y"))
+        assert (_peer("x"), _peer("y")) in router._candidate_path_cache
+
+        # New member connecting both peers directly: rebuilt on next refresh
+        state_manager.set_peer_state(_member(9), topology=[_peer("x"), _peer("y")])
+        router._topology_cache_time = 0
+        path = router.find_fleet_path(_peer("x"), _peer("y"), 100_000)
+        assert path.path == [_member(9)]
+        assert not router._candidate_path_cache
+
+    def test_large_fleet_path_count_bounded(self):
+        # 40 members all sharing one hub peer: exhaustive DFS would explode
+        hub = _peer("h")
+        topo = {_member(i): [hub, _peer("a") if i < 20 else _peer("b")] for i in range(40)}
+        topo[_member(0)].append(_peer("x"))
+        topo[_member(39)].append(_peer("y"))
+        router, _ = self._router(topo)
+
+        paths = router._find_all_fleet_paths(_peer("x"), _peer("y"))
+
+        assert paths[0] == [_member(0), _member(39)]
+        assert len(paths) <= MAX_CANDIDATE_PATHS
+        assert len({tuple(p) for p in paths}) == len(paths)
+        assert all(len(p) <= 4 and len(set(p)) == len(p) for p in paths)
+
+
 # =============================================================================
 # CIRCULAR FLOW DETECTOR TESTS
 # =============================================================================
@@ -0,0 +1,270 @@
+"""
+Tests for the single-pass cycle pipeline.
+
+Covers:
+- Replaying a recorded cycle snapshot produces the same broadcast,
+  whatever order the steps finish in
+- Independent steps run concurrently; depends_on and after are honoured
+- Period-gated steps run once per period
+- Steps needing funds are skipped when listfunds failed
+- The broadcast phase sends each peer every message once, skipping us and
+  peers that turn out to be unreachable
+- Per-step timings are recorded
+"""
+
+import json
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.cycle_pipeline import (
+    STEP_ERROR,
+    STEP_NOT_DUE,
+    STEP_OK,
+    STEP_SKIPPED,
+    CyclePipeline,
+    CycleSnapshot,
+    CycleStep,
+    utc_day,
+)
+
+
+US = "02" + "00" * 32
+
+
+def _peer(i):
+    return "03" + f"{i:064x}"
+
+
+# A recorded cycle: what _gather_cycle_snapshot would have captured
+RECORDED_CYCLE = {
+    "now": 1_790_000_000,
+    "our_pubkey": US,
+    "funds": {"channels": [
+        {"peer_id": _peer(10 + i), "short_channel_id": f"800x{i}x0",
+         "state": "CHANNELD_NORMAL" if i % 4 else "ONCHAIN",
+         "amount_msat": 2_000_000_000, "our_amount_msat": 250_000_000 * i}
+        for i in range(8)
+    ]},
+    "forwards": [
+        {"out_channel": f"800x{i % 8}x0", "fee_msat": 1_000 * i, "out_msat": 50_000 * i,
+         "received_time": 1_790_000_000 - 3_600 * i}
+        for i in range(40)
+    ],
+    "members": [{"peer_id": US, "tier": "member"}] +
+               [{"peer_id": _peer(i), "tier": "member"} for i in range(4)],
+    "member_health": [{"peer_id": _peer(i), "capacity_score": 40 + i} for i in range(4)],
+}
+
+
+def _jitter():
+    time.sleep(random.uniform(0, 0.01))
+
+
+def _channel_report(snapshot):
+    _jitter()
+    return [json.dumps({ch["short_channel_id"]: ch["our_amount_msat"]
+                        for ch in snapshot.normal_channels}).encode()]
+
+
+def _daily_revenue(snapshot):
+    _jitter()
+    since = snapshot.now - 86_400
+    total = sum(f["fee_msat"] for f in snapshot.forwards if f["received_time"] > since)
+    return [f"revenue:{total}".encode()]
+
+
+def _health(snapshot):
+    _jitter()
+    return [f"health:{len(snapshot.member_health)}".encode(), b"needs:none"]
+
+
+def _cycle_steps():
+    return [
+        CycleStep("channels", _channel_report),
+        CycleStep("revenue", _daily_revenue),
+        CycleStep("health", _health, after=("channels",)),
+        CycleStep("quiet", lambda snapshot: None),
+    ]
+
+
+def replay(recorded, steps, send_ok=lambda peer_id: True, **kwargs):
+    """Run a recorded cycle through a pipeline, capturing every send."""
+    sends = []
+
+    def send_fn(peer_id, msg):
+        sends.append((peer_id, msg))
+        return send_ok(peer_id)
+
+    pipeline = CyclePipeline(steps, send_fn=send_fn, **kwargs)
+    report = pipeline.run(CycleSnapshot.from_dict(json.loads(json.dumps(recorded))))
+    return report, sends
+
+
+class TestReplay:
+
+    def test_replay_is_deterministic(self):
+        first, sends = replay(RECORDED_CYCLE, _cycle_steps())
+        for _ in range(5):
+            _, again = replay(RECORDED_CYCLE, _cycle_steps())
+            assert again == sends
+
+        peers = [_peer(i) for i in range(4)]
+        assert [p for p, _ in sends] == [p for p in peers for _ in range(4)]
+        assert [m for _, m in sends[:4]] == [m for _, m in first.outgoing]
+        assert [name for name, _ in first.outgoing] == ["channels", "revenue", "health", "health"]
+        assert first.messages_sent == 16 and first.peers == 4
+
+    def test_snapshot_round_trip_and_views(self):
+        snapshot = CycleSnapshot.from_dict(RECORDED_CYCLE)
+        assert CycleSnapshot.from_dict(json.loads(json.dumps(snapshot.to_dict()))) == snapshot
+        assert len(snapshot.normal_channels) == 6
+        assert US in snapshot.member_ids and US not in snapshot.broadcast_targets
+
+
+class TestScheduling:
+
+    def test_independent_steps_run_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def meet(snapshot):
+            barrier.wait()  # Would time out if the steps ran one by one
+            return [b"x"]
+
+        steps = [CycleStep(f"s{i}", meet) for i in range(3)]
+        report, _ = replay(RECORDED_CYCLE, steps, max_workers=3)
+        assert all(r.status == STEP_OK for r in report.steps.values())
+
+    def test_dependencies(self):
+        order = []
+        lock = threading.Lock()
+
+        def step(name, fail=False):
+            def run(snapshot):
+                time.sleep(0.01)
+                with lock:
+                    order.append(name)
+                if fail:
+                    raise RuntimeError(f"{name} broke")
+                return [name.encode()]
+            return run
+
+        steps = [
+            CycleStep("share", step("share", fail=True)),
+            CycleStep("aggregate", step("aggregate")),
+            CycleStep("uses_share", step("uses_share"), depends_on=("share",)),
+            CycleStep("after_uses_share", step("after_uses_share"), depends_on=("uses_share",)),
+            CycleStep("cleanup", step("cleanup"), after=("share", "aggregate")),
+            CycleStep("save", step("save"), after=("cleanup", "after_uses_share")),
+        ]
+        report, sends = replay(RECORDED_CYCLE, steps)
+        status = {name: r.status for name, r in report.steps.items()}
+        assert status == {"share": STEP_ERROR, "aggregate": STEP_OK, "uses_share": STEP_SKIPPED,
+                          "after_uses_share": STEP_SKIPPED, "cleanup": STEP_OK, "save": STEP_OK}
+        assert report.steps["share"].error == "share broke"
+        assert order.index("cleanup") > max(order.index("share"), order.index("aggregate"))
+        assert order[-1] == "save"
+        assert [name for name, _ in report.outgoing] == ["aggregate", "cleanup", "save"]
+
+    def test_funds_unavailable_skips_only_channel_steps(self):
+        recorded = dict(RECORDED_CYCLE, funds={}, funds_error="listfunds timed out")
+        steps = [
+            CycleStep("channels", _channel_report, needs_funds=True),
+            CycleStep("uses_channels", lambda s: [b"x"], depends_on=("channels",)),
+            CycleStep("revenue", _daily_revenue),
+            CycleStep("cleanup", lambda s: None, after=("channels",)),
+        ]
+        report, sends = replay(recorded, steps)
+        status = {name: r.status for name, r in report.steps.items()}
+        assert status == {"channels": STEP_SKIPPED, "uses_channels": STEP_SKIPPED,
+                          "revenue": STEP_OK, "cleanup": STEP_OK}
+        assert "listfunds timed out" in report.steps["channels"].error
+        assert [name for name, _ in report.outgoing] == ["revenue"]
+
+        # needs_funds steps run normally when listfunds succeeded
+        report, _ = replay(RECORDED_CYCLE, steps)
+        assert report.steps["channels"].status == STEP_OK
+
+    def test_invalid_graphs_rejected(self):
+        noop = lambda snapshot: None  # noqa: E731
+        with pytest.raises(ValueError):
+            CyclePipeline([CycleStep("a", noop, depends_on=("missing",))], send_fn=None)
+        with pytest.raises(ValueError):
+            CyclePipeline([CycleStep("a", noop, after=("b",)),
+                           CycleStep("b", noop, depends_on=("a",))], send_fn=None)
+        with pytest.raises(ValueError):
+            CyclePipeline([CycleStep("a", noop), CycleStep("a", noop)], send_fn=None)
+
+    def test_worker_threads_reused_across_cycles(self):
+        threads = set()
+
+        def record(snapshot):
+            threads.add(threading.get_ident())
+            time.sleep(0.01)
+
+        pipeline = CyclePipeline([CycleStep(f"s{i}", record) for i in range(4)],
+                                 send_fn=lambda peer_id, msg: True, max_workers=2)
+        snapshot = CycleSnapshot.from_dict(RECORDED_CYCLE)
+        for _ in range(3):
+            pipeline.run(snapshot)
+        pipeline.shutdown()
+        assert len(threads) <= 2
+
+    def test_period_gated_steps(self):
+        calls = []
+        fail = [True]
+
+        def daily(snapshot):
+            calls.append(snapshot.now)
+            if fail[0]:
+                raise RuntimeError("not yet")
+            return [b"yield"]
+
+        pipeline = CyclePipeline([CycleStep("yield", daily, period=utc_day),
+                                  CycleStep("after", lambda s: None, depends_on=("yield",))],
+                                 send_fn=lambda peer_id, msg: True)
+        snapshot = CycleSnapshot.from_dict(RECORDED_CYCLE)
+
+        assert pipeline.run(snapshot).steps["yield"].status == STEP_ERROR  # Not marked
+        fail[0] = False
+        assert pipeline.run(snapshot).steps["yield"].status == STEP_OK
+        report = pipeline.run(snapshot)
+        assert report.steps["yield"].status == STEP_NOT_DUE
+        assert report.steps["after"].status == STEP_OK
+        snapshot.now += 86_400
+        assert pipeline.run(snapshot).steps["yield"].status == STEP_OK
+        assert len(calls) == 3
+
+
+class TestBroadcast:
+
+    def test_unreachable_peers_and_pauses(self):
+        pauses = []
+        offline = {_peer(1), _peer(3)}
+        report, sends = replay(RECORDED_CYCLE, _cycle_steps(),
+                               send_ok=lambda peer_id: peer_id not in offline,
+                               pause_fn=lambda: pauses.append(1))
+        # One failed attempt per offline peer, then the peer is skipped
+        assert [p for p, _ in sends] == [_peer(0)] * 4 + [_peer(1)] + [_peer(2)] * 4 + [_peer(3)]
+        assert report.peers_unreachable == 2 and report.messages_sent == 8
+        assert len(pauses) == 3
+
+    def test_nothing_to_send(self):
+        report, sends = replay(RECORDED_CYCLE, [CycleStep("quiet", lambda s: [])])
+        assert sends == [] and report.peers == 0
+
+    def test_timings_recorded(self):
+        steps = _cycle_steps() + [CycleStep("slow", lambda s: time.sleep(0.05))]
+        report, _ = replay(RECORDED_CYCLE, steps)
+        assert report.steps["slow"].duration_ms >= 50
+        assert report.steps_ms >= report.steps["slow"].duration_ms
+        assert report.duration_ms >= report.steps_ms + report.broadcast_ms - 1e-6
+        data = json.loads(json.dumps(report.to_dict()))
+        assert set(data["steps"]) == {"channels", "revenue", "health", "quiet", "slow"}
+        assert data["messages_queued"] == 4
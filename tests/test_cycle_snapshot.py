@@ -0,0 +1,228 @@
+"""
+Tests for the per-cycle advisor data snapshot.
+
+Covers:
+- fetch_sources() runs each distinct RPC once and times every call
+- CycleSnapshot is read-only and memoizes DB lookups for the cycle
+- Every scanner reads only the data it declares in SCANNER_DEPENDENCIES
+- scan_all() records per-scanner and per-fetch timings
+- ProactiveAdvisor._analyze_node_state() fetches each source once
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+# Add tools directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
+
+from advisor_db import AdvisorDB
+from cycle_snapshot import DB_CHANNEL_HISTORY, DB_METADATA, CycleSnapshot, fetch_sources
+from opportunity_scanner import SCANNER_DEPENDENCIES, OpportunityScanner
+
+
+class CountingMcp:
+    """MCP client double that counts calls per method."""
+
+    def __init__(self, responses=None, delay=0.0, hang=()):
+        self.responses = responses or {}
+        self.delay = delay
+        self.hang = set(hang)
+        self.calls = []
+
+    async def call(self, method, params):
+        self.calls.append(method)
+        if method in self.hang:
+            await asyncio.sleep(10)
+        await asyncio.sleep(self.delay)
+        return self.responses.get(method, {"method": method})
+
+
+class RecordingSnapshot(CycleSnapshot):
+    """CycleSnapshot that records which state keys and DB lookups are read."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.read = set()
+
+    def __getitem__(self, key):
+        self.read.add(key)
+        return super().__getitem__(key)
+
+    def channel_history(self, channel_id, hours=24):
+        self.read.add(DB_CHANNEL_HISTORY)
+        return super().channel_history(channel_id, hours)
+
+    def metadata(self, key):
+        self.read.add(DB_METADATA)
+        return super().metadata(key)
+
+
+@pytest.fixture
+def db(tmp_path):
+    return AdvisorDB(str(tmp_path / "advisor.db"))
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _state():
+    """Node state rich enough to drive every scanner past its early exits."""
+    channels = [
+        {"channel_id": "1x1x0", "short_channel_id": "1x1x0", "peer_id": "02peer1",
+         "balance_ratio": 0.98, "forward_count": 0, "capacity_sats": 1_000_000,
+         "local_sats": 980_000, "fee_ppm": 100},
+        {"channel_id": "2x1x0", "short_channel_id": "2x1x0", "peer_id": "02peer2",
+         "balance_ratio": 0.05, "forward_count": 5, "capacity_sats": 2_000_000,
+         "local_sats": 100_000, "fee_ppm": 300},
+    ]
+    return {
+        "summary": {"channel_count": 2, "underwater_pct": 60, "roc_pct": 0.1},
+        "channels": channels,
+        "profitability": {"channels_by_class": {"underwater": [{"channel_id": "2x1x0"}]}},
+        "dashboard": {"bleeder_warnings": [{"channel_id": "2x1x0", "peer_id": "02peer2"}]},
+        "context": {"velocity_alerts": [], "channels": []},
+        "velocities": {"channels": [{"channel_id": "2x1x0", "trend": "depleting",
+                                     "hours_until_depleted": 5, "confidence": 0.9}]},
+        "defense_status": {"warnings": [{"peer_id": "02peer2", "severity": "high"}]},
+        "internal_competition": {"conflicts": [{"peer_id": "02peer1"}]},
+        "circular_flows": {"circular_flows": [{"total_cost_sats": 5000}]},
+        "rebalance_recommendations": {"recommendations": [{"channel_id": "2x1x0"}]},
+        "positioning": {"valuable_corridors": [{"source": "02a", "destination": "02b"}]},
+        "flow_recommendations": {"recommendations": [{"channel_id": "1x1x0"}]},
+        "competitor_analysis": {"analysis": [{"channel_id": "1x1x0"}]},
+        "close_recommendations": {"recommendations": [{"channel_id": "1x1x0"}]},
+        "ban_candidates": {"candidates": [{"peer_id": "02peer2"}]},
+        "hive_members": {"members": [{"peer_id": "02newbie", "tier": "neophyte"}]},
+        "node_info": {"id": "02ours"},
+        "pheromone_levels": {"levels": [{"channel_id": "1x1x0", "level": 0.9}]},
+        "stigmergic_markers": {"markers": [{"destination": "02peer1", "success": True}]},
+        "routing_intelligence": {"status": "active"},
+        "fleet_corridor_consensus": {},
+        "fleet_close_proposals": [{"target_member": "02ours", "target_peer": "02peer1",
+                                   "reporters": ["02x", "02y"]}],
+        "our_pubkey": "02ours",
+    }
+
+
+class TestFetchSources:
+
+    def test_distinct_calls_run_once(self):
+        mcp = CountingMcp(delay=0.1)
+        sources = {
+            "channels": ("hive_channels", {"node": "alice"}),
+            "channels_again": ("hive_channels", {"node": "alice"}),
+            "bob_channels": ("hive_channels", {"node": "bob"}),
+            "info": ("hive_node_info", {"node": "alice"}),
+        }
+        start = time.perf_counter()
+        results, timings = _run(fetch_sources(mcp, sources))
+        # Concurrent, and the duplicate source shares its call
+        assert time.perf_counter() - start < 0.25
+        assert sorted(mcp.calls) == ["hive_channels", "hive_channels", "hive_node_info"]
+        assert results["channels"] is results["channels_again"]
+        assert timings["hive_channels"]["calls"] == 2
+        assert timings["hive_node_info"]["seconds"] >= 0.1
+
+    def test_timeout_yields_empty(self):
+        mcp = CountingMcp(hang={"slow_tool"})
+        results, timings = _run(fetch_sources(
+            mcp, {"slow": ("slow_tool", {}), "fast": ("fast_tool", {})}, timeout=0.1
+        ))
+        assert results == {"slow": {}, "fast": {"method": "fast_tool"}}
+        assert timings["slow_tool"]["errors"] == 1
+        assert timings["fast_tool"]["errors"] == 0
+
+
+class TestCycleSnapshot:
+
+    def test_read_only(self):
+        snapshot = CycleSnapshot("alice", {"channels": []})
+        assert snapshot.get("channels") == []
+        assert snapshot.get("missing", {}) == {}
+        with pytest.raises(TypeError):
+            snapshot["channels"] = [1]
+        with pytest.raises(AttributeError):
+            snapshot.update({"x": 1})
+
+    def test_db_lookups_memoized(self, db, monkeypatch):
+        calls = []
+        original = db.get_channel_history
+        monkeypatch.setattr(db, "get_channel_history",
+                            lambda *a, **kw: calls.append(a) or original(*a, **kw))
+        snapshot = CycleSnapshot("alice", {}, db=db)
+        for _ in range(3):
+            snapshot.channel_history("1x1x0", hours=168)
+        snapshot.channel_history("1x1x0", hours=24)
+        assert len(calls) == 2
+        assert snapshot.fetch_timings[DB_CHANNEL_HISTORY]["calls"] == 2
+
+        db.set_metadata("onboarded_02abc", True)
+        assert snapshot.metadata("onboarded_02abc") is True
+        assert snapshot.metadata("onboarded_02abc") is True
+        assert snapshot.fetch_timings[DB_METADATA]["calls"] == 1
+
+
+class TestScannerDependencies:
+
+    def test_every_scanner_declared(self):
+        scanners = {name[len("_scan_"):] for name in dir(OpportunityScanner)
+                    if name.startswith("_scan_")}
+        assert scanners == set(SCANNER_DEPENDENCIES)
+
+    @pytest.mark.parametrize("name", list(SCANNER_DEPENDENCIES))
+    def test_scanner_reads_only_declared_data(self, name, db):
+        scanner = OpportunityScanner(CountingMcp(), db)
+        snapshot = RecordingSnapshot("alice", _state(), db=db)
+        _run(getattr(scanner, f"_scan_{name}")("alice", snapshot))
+        assert snapshot.read <= set(SCANNER_DEPENDENCIES[name])
+
+
+class TestScanAll:
+
+    def test_timings_and_isolation(self, db, monkeypatch):
+        scanner = OpportunityScanner(CountingMcp(), db)
+
+        async def broken(node_name, state):
+            raise RuntimeError("scanner bug")
+
+        monkeypatch.setattr(scanner, "_scan_ban_candidates", broken)
+        state = _state()
+        state["channels"] = state["channels"] + [dict(state["channels"][0])]  # duplicate row
+        opportunities = _run(scanner.scan_all("alice", state))
+        assert opportunities
+
+        timings = scanner.last_scan_timings
+        assert set(timings["scanners"]) == set(SCANNER_DEPENDENCIES)
+        assert timings["scanners"]["ban_candidates"]["error"] == "scanner bug"
+        assert timings["scanners"]["profitability"]["opportunities"] > 0
+        assert timings["scanners"]["time_based_fees"]["depends_on"] == ["channels", DB_CHANNEL_HISTORY]
+        # Three channel rows, two distinct channels: two history lookups
+        assert timings["fetches"][DB_CHANNEL_HISTORY]["calls"] == 2
+
+
+def test_analyze_node_state_fetches_each_source_once(tmp_path, db):
+    from proactive_advisor import ProactiveAdvisor
+
+    mcp = CountingMcp({
+        "hive_channels": {"channels": [{"channel_id": "1x1x0", "capacity_sats": 1_000_000,
+                                        "local_sats": 400_000}]},
+        "hive_node_info": {"id": "02ours"},
+    })
+    advisor = ProactiveAdvisor(mcp, db, log_file=str(tmp_path / "advisor.log"))
+    snapshot = _run(advisor._analyze_node_state("alice"))
+
+    assert isinstance(snapshot, CycleSnapshot)
+    assert len(mcp.calls) == len(set(mcp.calls))
+    assert snapshot["summary"]["total_capacity_sats"] == 1_000_000
+    assert snapshot["our_pubkey"] == "02ours"
+    assert set(snapshot.fetch_timings) == set(mcp.calls)
+
+    opportunities = _run(advisor.scanner.scan_all("alice", snapshot))
+    assert isinstance(opportunities, list)
+    # Scanning the snapshot issues no further RPCs
+    assert len(mcp.calls) == len(set(mcp.calls))
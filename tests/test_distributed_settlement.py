@@ -117,21 +117,25 @@ def mock_state_manager():
         return fee_data.get(peer_id, {'fees_earned_sats': 0, 'forward_count': 0})
 
     sm.get_peer_fees.side_effect = get_peer_fees
+    sm.get_all_peer_fees.side_effect = lambda: dict(fee_data)
 
     # Mock peer state for capacity
     class MockPeerState:
-        def __init__(self, capacity):
+        def __init__(self, peer_id, capacity):
+            self.peer_id = peer_id
             self.capacity_sats = capacity
 
+    capacities = {
+        '02' + 'a' * 64: MockPeerState('02' + 'a' * 64, 10_000_000),
+        '02' + 'b' * 64: MockPeerState('02' + 'b' * 64, 8_000_000),
+        '02' + 'c' * 64: MockPeerState('02' + 'c' * 64, 5_000_000),
+    }
+
     def get_peer_state(peer_id):
-        capacities = {
-            '02' + 'a' * 64: MockPeerState(10_000_000),
-            '02' + 'b' * 64: MockPeerState(8_000_000),
-            '02' + 'c' * 64: MockPeerState(5_000_000),
-        }
         return capacities.get(peer_id)
 
     sm.get_peer_state.side_effect = get_peer_state
+    sm.get_all_peer_states.side_effect = lambda: list(capacities.values())
 
     return sm
 
@@ -10,6 +10,8 @@ Tests cover:
 """
 
 import pytest
+import sys
+import threading
 import time
 import math
 from unittest.mock import MagicMock, patch
@@ -41,6 +43,19 @@ from modules.fee_coordination import (
 )
 
 
+def _run_threads(threads):
+    """Run threads to completion, switching between them as often as possible."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+
 class MockDatabase:
     """Mock database for testing."""
 
@@ -342,6 +357,36 @@ class TestAdaptiveFeeController:
         assert fee < 500  # Should lower fees
         assert "lower" in reason or "saturating" in reason
 
+    def test_concurrent_updates_and_sharing(self):
+        """Forward events and the sharing step can run on different threads."""
+        errors = []
+
+        def update(offset):
+            try:
+                for i in range(300):
+                    channel_id = f"{offset}x{i % 50}x0"
+                    self.controller.set_channel_peer_mapping(channel_id, f"peer{i % 50}")
+                    self.controller.update_pheromone(
+                        channel_id, 500, routing_success=True, revenue_sats=1000
+                    )
+            except Exception as e:
+                errors.append(e)
+
+        def share():
+            try:
+                for _ in range(100):
+                    self.controller.get_shareable_pheromones()
+                    self.controller.export_snapshot_state()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=update, args=(n,)) for n in range(3)]
+        threads.append(threading.Thread(target=share))
+        _run_threads(threads)
+
+        assert errors == []
+        assert len(self.controller.get_all_pheromone_levels()) == 150
+
 
 # =============================================================================
 # STIGMERGIC COORDINATOR TESTS
@@ -427,6 +472,48 @@ class TestStigmergicCoordinator:
         assert fee >= 600
         assert confidence > 0.3
 
+    def test_concurrent_deposits_and_sharing(self):
+        """Gossip, deposits and the sharing step can run on different threads."""
+        errors = []
+        our_pubkey = "02" + "0" * 64
+
+        def deposit(offset):
+            try:
+                for i in range(300):
+                    self.coordinator.deposit_marker(
+                        f"peer{offset}", f"dest{i % 20}", 500, True, 100_000
+                    )
+                    self.coordinator.receive_marker_from_gossip({
+                        "depositor": "03" + "1" * 64,
+                        "source_peer_id": f"peer{offset}",
+                        "destination_peer_id": f"dest{i % 20}",
+                        "fee_ppm": 400,
+                        "success": True,
+                        "volume_sats": 10_000,
+                        # Decays to the minimum strength a moment after arriving
+                        "timestamp": time.time() - 24 * 3600 * math.log2(10) + 0.05,
+                        "strength": 1.0,
+                    })
+            except Exception as e:
+                errors.append(e)
+
+        def share():
+            try:
+                for _ in range(100):
+                    self.coordinator.get_shareable_markers(our_pubkey)
+                    self.coordinator.export_snapshot_state()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=deposit, args=(n,)) for n in range(3)]
+        threads.append(threading.Thread(target=share))
+        _run_threads(threads)
+
+        assert errors == []
+        markers = self.coordinator.get_all_markers()
+        assert self.coordinator._marker_count == len(markers)
+        assert all(m.depositor == our_pubkey for m in markers)
+
 
 # =============================================================================
 # MYCELIUM DEFENSE SYSTEM TESTS
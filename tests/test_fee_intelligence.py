@@ -56,6 +56,11 @@ class MockDatabase:
     def update_peer_fee_profile(self, peer_id, **kwargs):
         self.fee_profiles[peer_id] = {"peer_id": peer_id, **kwargs}
 
+    def update_peer_fee_profiles(self, profiles):
+        for profile in profiles:
+            self.update_peer_fee_profile(**profile)
+        return len(profiles)
+
     def get_peer_fee_profile(self, peer_id):
         return self.fee_profiles.get(peer_id)
 
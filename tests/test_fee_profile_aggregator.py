@@ -0,0 +1,214 @@
+"""
+Tests for incremental fee profile aggregation.
+
+Covers:
+- Incremental statistics match a full recompute of the 24h window
+- Expired reports are retired through the eviction queue (min/max included)
+- Only changed peers are written, in one batched transaction
+- Unchanged peers are rewritten once their confidence has aged
+- The window is loaded from the database once, without double counting
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Mock pyln.client before importing modules (no-op if another test did)
+if "pyln.client" not in sys.modules:
+    class MockRpcError(Exception):
+        """Mock RpcError to match pyln.client.RpcError behavior."""
+        pass
+
+    mock_pyln = MagicMock()
+    mock_pyln.Plugin = MagicMock
+    mock_pyln.RpcError = MockRpcError
+    sys.modules["pyln"] = mock_pyln
+    sys.modules["pyln.client"] = mock_pyln
+
+from modules.database import HiveDatabase
+from modules.fee_intelligence import (
+    CONFIDENCE_REFRESH_DELTA,
+    FEE_PROFILE_WINDOW_HOURS,
+    FeeIntelligenceManager,
+    FeeProfileAggregator,
+)
+
+
+OUR = "02" + "a" * 64
+WINDOW = FEE_PROFILE_WINDOW_HOURS * 3600
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = HiveDatabase(str(tmp_path / "test.db"), Mock())
+    database.initialize()
+    return database
+
+
+def _report(rng, peer, ts):
+    return {
+        "reporter_id": f"02{rng.randrange(4):064x}",
+        "target_peer_id": peer,
+        "timestamp": ts,
+        "our_fee_ppm": rng.choice([0, 50, 100, 250, 400]),
+        "their_fee_ppm": 10,
+        "forward_count": rng.randrange(20),
+        "forward_volume_sats": rng.randrange(1_000_000),
+        "revenue_sats": rng.randrange(500),
+        "flow_direction": "balanced",
+        "utilization_pct": rng.random(),
+        "signature": "sig",
+        "last_fee_change_ppm": rng.choice([0, 0, 25, -40]),
+        "volume_delta_pct": rng.uniform(-0.5, 0.5),
+        "days_observed": 1,
+    }
+
+
+def _full_recompute(manager, reports):
+    """Profiles computed from scratch with the full-window formulas."""
+    by_peer = {}
+    for r in reports:
+        by_peer.setdefault(r["target_peer_id"], []).append(r)
+    profiles = {}
+    for peer, rs in by_peer.items():
+        fees = [r["our_fee_ppm"] for r in rs if r["our_fee_ppm"] > 0]
+        reporters = {r["reporter_id"] for r in rs}
+        profiles[peer] = {
+            "reporter_count": len(reporters),
+            "avg_fee_charged": sum(fees) / len(fees) if fees else 100,
+            "min_fee_charged": min(fees) if fees else 0,
+            "max_fee_charged": max(fees) if fees else 0,
+            "total_hive_volume": sum(r["forward_volume_sats"] for r in rs),
+            "total_hive_revenue": sum(r["revenue_sats"] for r in rs),
+            "avg_utilization": sum(r["utilization_pct"] for r in rs) / len(rs),
+            "estimated_elasticity": manager._estimate_elasticity(rs),
+            "confidence": manager._calculate_confidence(rs, len(reporters)),
+        }
+    return profiles
+
+
+def _assert_profiles_match(db, expected):
+    for peer, want in expected.items():
+        got = db.get_peer_fee_profile(peer)
+        assert got is not None, peer
+        for key, value in want.items():
+            # Unchanged profiles may lag on report ageing, within a bound
+            tolerance = CONFIDENCE_REFRESH_DELTA if key == "confidence" else 1e-6
+            assert got[key] == pytest.approx(value, abs=tolerance), (peer, key)
+
+
+class TestFeeProfileAggregator:
+
+    def test_eviction_updates_min_max(self):
+        now = int(time.time())
+        agg = FeeProfileAggregator()
+        agg.ensure_loaded(lambda: [])
+        base = {"target_peer_id": "03x", "reporter_id": "02a"}
+        agg.add(dict(base, timestamp=now - WINDOW + 60, our_fee_ppm=10))
+        agg.add(dict(base, timestamp=now - 100, our_fee_ppm=500, reporter_id="02b"))
+        agg.add(dict(base, timestamp=now, our_fee_ppm=200))
+        assert agg.take_dirty()["03x"]["min_fee_charged"] == 10
+
+        assert agg.expire(now + 120) == 1
+        stats = agg.take_dirty(now + 120)["03x"]
+        assert (stats["min_fee_charged"], stats["max_fee_charged"]) == (200, 500)
+        assert stats["reporter_count"] == 2 and stats["report_count"] == 2
+
+        # Once every report has expired the peer leaves the window
+        agg.expire(now + WINDOW + 1)
+        assert agg.take_dirty() == {}
+        assert agg.get_stats()["peers"] == 0
+
+    def test_reports_before_load_or_outside_window_ignored(self):
+        now = int(time.time())
+        agg = FeeProfileAggregator()
+        assert agg.add({"target_peer_id": "03x", "timestamp": now}) is False
+        agg.ensure_loaded(lambda: [{"id": 7, "target_peer_id": "03x", "timestamp": now}])
+        # Row 7 was read by the load; later rows are new
+        assert agg.add({"target_peer_id": "03x", "timestamp": now}, 7) is False
+        assert agg.add({"target_peer_id": "03x", "timestamp": now}, 8) is True
+        assert agg.add({"target_peer_id": "03x", "timestamp": now - WINDOW - 10}, 9) is False
+        assert agg.peer_stats("03x")["report_count"] == 2
+
+
+class TestIncrementalAggregation:
+
+    def test_matches_full_recompute_over_time(self, db, monkeypatch):
+        rng = random.Random(41)
+        manager = FeeIntelligenceManager(db, our_pubkey=OUR)
+        peers = [f"03{i:064x}" for i in range(8)]
+        start = int(time.time()) - 2 * WINDOW
+        for r in (_report(rng, rng.choice(peers), start + rng.randrange(WINDOW)) for _ in range(60)):
+            db.store_fee_intelligence(**r)
+
+        clock = [start + WINDOW]
+        monkeypatch.setattr(time, "time", lambda: clock[0])
+        assert manager.aggregate_fee_profiles() > 0
+        for _ in range(6):
+            clock[0] += WINDOW // 5
+            for _ in range(15):
+                manager.store_local_observation(
+                    target_peer_id=rng.choice(peers),
+                    our_fee_ppm=rng.choice([0, 75, 300]),
+                    forward_count=rng.randrange(10),
+                    forward_volume_sats=rng.randrange(500_000),
+                    utilization_pct=rng.random(),
+                    timestamp=clock[0] - rng.randrange(600),
+                )
+            manager.aggregate_fee_profiles()
+            window = db.get_all_fee_intelligence(max_age_hours=FEE_PROFILE_WINDOW_HOURS)
+            _assert_profiles_match(db, _full_recompute(manager, window))
+
+    def test_only_changed_peers_written_in_one_batch(self, db, monkeypatch):
+        manager = FeeIntelligenceManager(db, our_pubkey=OUR)
+        now = int(time.time())
+        for i in range(5):
+            manager.store_local_observation(f"03{i:064x}", our_fee_ppm=100, timestamp=now)
+
+        reads = []
+        original_read = db.get_all_fee_intelligence
+        monkeypatch.setattr(db, "get_all_fee_intelligence",
+                            lambda **kw: reads.append(kw) or original_read(**kw))
+        monkeypatch.setattr(db, "update_peer_fee_profile",
+                            Mock(side_effect=AssertionError("per-peer write")))
+        batches = []
+        original_batch = db.update_peer_fee_profiles
+        monkeypatch.setattr(db, "update_peer_fee_profiles",
+                            lambda profiles: batches.append(len(profiles)) or original_batch(profiles))
+
+        assert manager.aggregate_fee_profiles() == 5
+        assert manager.aggregate_fee_profiles() == 0
+        manager.store_local_observation(f"03{1:064x}", our_fee_ppm=300, timestamp=now)
+        assert manager.aggregate_fee_profiles() == 1
+
+        assert batches == [5, 1]
+        assert len(reads) == 1  # Window loaded once
+        assert db.get_peer_fee_profile(f"03{1:064x}")["max_fee_charged"] == 300
+
+    def test_aged_confidence_refreshed(self, db, monkeypatch):
+        manager = FeeIntelligenceManager(db, our_pubkey=OUR)
+        now = int(time.time())
+        manager.store_local_observation("03" + "b" * 64, our_fee_ppm=100, timestamp=now)
+        assert manager.aggregate_fee_profiles() == 1
+        fresh = db.get_peer_fee_profile("03" + "b" * 64)["confidence"]
+
+        monkeypatch.setattr(time, "time", lambda: now + 600)
+        assert manager.aggregate_fee_profiles() == 0  # Ageing below the refresh delta
+        monkeypatch.setattr(time, "time", lambda: now + 6 * 3600)
+        assert manager.aggregate_fee_profiles() == 1
+        assert db.get_peer_fee_profile("03" + "b" * 64)["confidence"] < fresh
+
+    def test_failed_flush_is_retried(self, db, monkeypatch):
+        manager = FeeIntelligenceManager(db, our_pubkey=OUR)
+        manager.store_local_observation("03" + "b" * 64, our_fee_ppm=100)
+        monkeypatch.setattr(db, "update_peer_fee_profiles", Mock(side_effect=RuntimeError("locked")))
+        with pytest.raises(RuntimeError):
+            manager.aggregate_fee_profiles()
+        monkeypatch.undo()
+        assert manager.aggregate_fee_profiles() == 1
@@ -0,0 +1,217 @@
+"""
+Tests for the MCP server's fleet RPC layer.
+
+Covers:
+- Concurrent fan-out under one overall deadline with partial results
+- Per-node status for ok / error / timeout nodes
+- Read-only response cache: TTL, params keying, in-flight coalescing
+- Write calls invalidate the node's cached responses, including fetches in flight
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+# Add tools directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
+
+from fleet_rpc import ResponseCache, fan_out
+
+
+class FakeNodeConnection:
+    """
+    NodeConnection double.
+
+    Args:
+        name: Node name
+        delay: Seconds each call takes
+        fail: Return an RPC error dict
+        raise_exc: Raise this exception from call()
+        cache: Optional shared ResponseCache (as HiveFleet wires it)
+    """
+
+    def __init__(self, name, delay=0.0, fail=False, raise_exc=None, cache=None):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.raise_exc = raise_exc
+        self.cache = cache
+        self.calls = []
+
+    async def call(self, method, params=None):
+        if self.cache is not None:
+            return await self.cache.call(
+                self.name, method, params, lambda: self._call_uncached(method, params)
+            )
+        return await self._call_uncached(method, params)
+
+    async def _call_uncached(self, method, params=None):
+        self.calls.append((method, params))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.raise_exc:
+            raise self.raise_exc
+        if self.fail:
+            return {"error": f"{self.name} unavailable"}
+        return {"node": self.name, "method": method, "n": len(self.calls)}
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestFanOut:
+
+    def test_concurrent_not_sequential(self):
+        nodes = {f"n{i}": FakeNodeConnection(f"n{i}", delay=0.2) for i in range(10)}
+        start = time.monotonic()
+        outcome = _run(fan_out(nodes, lambda node: node.call("getinfo"), deadline=5))
+        assert time.monotonic() - start < 1.0
+        assert outcome.complete
+        assert list(outcome.results) == list(nodes)
+
+    def test_partial_results_at_deadline(self):
+        nodes = {
+            "fast": FakeNodeConnection("fast"),
+            "slow": FakeNodeConnection("slow", delay=5),
+            "down": FakeNodeConnection("down", fail=True),
+            "boom": FakeNodeConnection("boom", raise_exc=RuntimeError("socket closed")),
+        }
+        start = time.monotonic()
+        outcome = _run(fan_out(nodes, lambda node: node.call("getinfo"), deadline=0.3))
+        assert time.monotonic() - start < 1.0
+
+        assert outcome.results["fast"]["node"] == "fast"
+        assert outcome.status["fast"]["status"] == "ok"
+        assert outcome.status["slow"]["status"] == "timeout"
+        assert "Timeout" in outcome.results["slow"]["error"]
+        assert outcome.status["down"]["status"] == "error"
+        assert outcome.results["boom"] == {"error": "socket closed"}
+        assert outcome.complete is False
+        assert outcome.summary()["nodes"]["slow"]["status"] == "timeout"
+
+    def test_semaphore_limits_per_node(self):
+        node = FakeNodeConnection("a", delay=0.05)
+        active = {"now": 0, "max": 0}
+
+        async def tracked(n):
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+            try:
+                return await n.call("getinfo")
+            finally:
+                active["now"] -= 1
+
+        async def scenario():
+            sem = {"a": asyncio.Semaphore(1)}
+            await asyncio.gather(*[fan_out({"a": node}, tracked, semaphores=sem) for _ in range(3)])
+
+        _run(scenario())
+        assert active["max"] == 1
+
+
+class TestResponseCache:
+
+    def test_read_only_served_once_within_ttl(self):
+        cache = ResponseCache(ttl_seconds=60)
+        node = FakeNodeConnection("a", cache=cache)
+
+        async def scenario():
+            first = await node.call("listpeerchannels")
+            second = await node.call("listpeerchannels")
+            other = await node.call("listpeerchannels", {"id": "02" + "a" * 64})
+            return first, second, other
+
+        first, second, other = _run(scenario())
+        assert first == second
+        assert other != first
+        assert len(node.calls) == 2
+        assert cache.stats()["hits"] == 1
+
+    def test_concurrent_identical_calls_coalesced(self):
+        cache = ResponseCache()
+        node = FakeNodeConnection("a", delay=0.1, cache=cache)
+
+        async def scenario():
+            return await asyncio.gather(*[node.call("hive-status") for _ in range(5)])
+
+        results = _run(scenario())
+        assert len(node.calls) == 1
+        assert all(r == results[0] for r in results)
+        assert len({id(r) for r in results}) == 5
+
+    def test_caller_mutations_do_not_leak(self):
+        cache = ResponseCache(ttl_seconds=60)
+        node = FakeNodeConnection("a", delay=0.05, cache=cache)
+
+        async def scenario():
+            first, coalesced = await asyncio.gather(
+                node.call("listpeerchannels"), node.call("listpeerchannels")
+            )
+            first["flow_profile"] = "annotated"
+            coalesced["market_context"] = "annotated"
+            hit = await node.call("listpeerchannels")
+            hit["pnl_summary"] = "annotated"
+            return await node.call("listpeerchannels")
+
+        fresh = _run(scenario())
+        assert len(node.calls) == 1
+        assert fresh == {"node": "a", "method": "listpeerchannels", "n": 1}
+
+    def test_errors_and_writes_not_cached(self):
+        cache = ResponseCache()
+        node = FakeNodeConnection("a", fail=True, cache=cache)
+
+        async def scenario():
+            await node.call("getinfo")
+            await node.call("getinfo")
+
+        _run(scenario())
+        assert len(node.calls) == 2
+
+        node.fail = False
+        node.calls.clear()
+
+        async def write_between():
+            await node.call("listpeerchannels")
+            await node.call("setchannel", {"id": "100x1x0", "feeppm": 10})
+            await node.call("listpeerchannels")
+
+        _run(write_between())
+        assert [m for m, _ in node.calls] == ["listpeerchannels", "setchannel", "listpeerchannels"]
+
+    def test_ttl_expiry_and_node_isolation(self):
+        cache = ResponseCache(ttl_seconds=0.05)
+        a = FakeNodeConnection("a", cache=cache)
+        b = FakeNodeConnection("b", cache=cache)
+
+        async def scenario():
+            await a.call("getinfo")
+            await b.call("getinfo")
+            await a.call("setchannel")          # Invalidates only node a
+            await b.call("getinfo")
+            await asyncio.sleep(0.1)
+            await b.call("getinfo")
+
+        _run(scenario())
+        assert [m for m, _ in b.calls] == ["getinfo", "getinfo"]
+
+    def test_write_during_fetch_not_cached(self):
+        cache = ResponseCache(ttl_seconds=60)
+        reader = FakeNodeConnection("a", delay=0.1, cache=cache)
+        writer = FakeNodeConnection("a", cache=cache)
+
+        async def scenario():
+            stale = asyncio.ensure_future(reader.call("listpeerchannels"))
+            await asyncio.sleep(0.02)
+            await writer.call("setchannel", {"id": "100x1x0", "feeppm": 10})
+            # Issued after the write: must not join the pre-write fetch
+            after_write = await reader.call("listpeerchannels")
+            await stale
+            return after_write, await reader.call("listpeerchannels")
+
+        after_write, cached = _run(scenario())
+        assert len(reader.calls) == 2
+        assert after_write["n"] == 2
+        assert cached == after_write
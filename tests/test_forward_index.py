@@ -0,0 +1,184 @@
+"""
+Tests for the MCP server's incremental forward index.
+
+Covers:
+- created_index paging and the per-node high-water mark
+- Second sync fetches only new forwards
+- Offered forwards re-checked until they settle
+- Window aggregates match the full-scan semantics
+- Fallback signal for nodes without created_index
+- Compare-and-set on the high-water mark
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+# Add tools directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
+
+from advisor_db import AdvisorDB, FORWARD_BUCKET_SECONDS
+from forward_index import ForwardIndex
+
+
+class FakeNode:
+    """NodeConnection double serving listforwards from a list."""
+
+    def __init__(self, name="alice", supports_index=True):
+        self.name = name
+        self.supports_index = supports_index
+        self.forwards = []
+        self.calls = []
+
+    def add(self, status="settled", in_msat=1_001_000, out_msat=1_000_000,
+            out_channel="100x1x0", resolved_time=None):
+        fwd = {
+            "created_index": len(self.forwards) + 1,
+            "status": status,
+            "in_msat": in_msat,
+            "out_msat": out_msat,
+            "out_channel": out_channel,
+            "received_time": time.time(),
+        }
+        if status != "offered":
+            fwd["resolved_time"] = resolved_time or time.time()
+        if not self.supports_index:
+            del fwd["created_index"]
+        self.forwards.append(fwd)
+        return fwd
+
+    async def call(self, method, params=None):
+        self.calls.append((method, dict(params or {})))
+        start = (params or {}).get("start", 0)
+        limit = (params or {}).get("limit", len(self.forwards))
+        if not self.supports_index:
+            return {"forwards": list(self.forwards)}
+        page = [f for f in self.forwards if f["created_index"] >= start][:limit]
+        return {"forwards": [dict(f) for f in page]}
+
+
+@pytest.fixture
+def db(tmp_path):
+    return AdvisorDB(str(tmp_path / "advisor.db"))
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _window(seconds=86400):
+    now = int(time.time())
+    return (now - seconds, now)
+
+
+class TestForwardIndexSync:
+
+    def test_pages_and_advances_mark(self, db):
+        node = FakeNode()
+        for _ in range(25):
+            node.add()
+        index = ForwardIndex(db, page_limit=10)
+
+        result = _run(index.sync(node))
+        assert result["fetched"] == 25
+        assert result["created_index"] == 25
+        assert len(node.calls) == 3
+        assert db.get_forward_index_state("alice")["created_index"] == 25
+
+        stats = _run(index.window_stats(node, [_window()]))[0]
+        assert stats["forward_count"] == 25
+        assert stats["total_volume_msat"] == 25_000_000
+        assert stats["total_revenue_msat"] == 25_000
+        assert stats["avg_fee_ppm"] == 1000
+        assert stats["per_channel"]["100x1x0"]["count"] == 25
+
+    def test_second_sync_fetches_only_new(self, db):
+        node = FakeNode()
+        for _ in range(5):
+            node.add()
+        index = ForwardIndex(db)
+        _run(index.sync(node))
+
+        node.add(out_channel="200x1x0")
+        node.calls.clear()
+        result = _run(index.sync(node))
+        assert result["fetched"] == 1
+        assert node.calls == [("listforwards", {"index": "created", "start": 6, "limit": 1000})]
+
+        stats = db.get_forward_window_stats("alice", *_window())
+        assert stats["forward_count"] == 6
+        assert set(stats["per_channel"]) == {"100x1x0", "200x1x0"}
+
+    def test_offered_forward_counted_when_settled(self, db):
+        node = FakeNode()
+        node.add()
+        offered = node.add(status="offered")
+        node.add(status="failed")
+        index = ForwardIndex(db)
+
+        result = _run(index.sync(node))
+        assert result["settled_indexed"] == 1
+        assert result["pending"] == 1
+
+        offered["status"] = "settled"
+        offered["resolved_time"] = time.time()
+        result = _run(index.sync(node))
+        assert result["settled_indexed"] == 1
+        assert result["pending"] == 0
+        assert db.get_forward_window_stats("alice", *_window())["forward_count"] == 2
+        assert db.get_forward_index_state("alice")["pending"] == {}
+
+    def test_windows_use_resolved_time(self, db):
+        node = FakeNode()
+        now = int(time.time())
+        node.add(resolved_time=now - 2 * 86400)
+        node.add(resolved_time=now - 3600 - FORWARD_BUCKET_SECONDS)
+        node.add(resolved_time=now)
+        index = ForwardIndex(db)
+
+        day, week = _run(index.window_stats(node, [_window(), _window(7 * 86400)]))
+        assert day["forward_count"] == 2
+        assert week["forward_count"] == 3
+
+    def test_unindexed_node_returns_none(self, db):
+        node = FakeNode(supports_index=False)
+        node.add()
+        index = ForwardIndex(db)
+        assert _run(index.window_stats(node, [_window()])) is None
+        assert db.get_forward_index_state("alice")["created_index"] == 0
+
+    def test_rpc_error_leaves_mark(self, db):
+        node = FakeNode()
+        node.add()
+
+        async def failing_call(method, params=None):
+            return {"error": "connection refused"}
+
+        node.call = failing_call
+        assert "error" in _run(ForwardIndex(db).sync(node))
+        assert db.get_forward_index_state("alice")["created_index"] == 0
+
+
+class TestForwardIndexStorage:
+
+    def test_compare_and_set(self, db):
+        bucket = {("100x1x0", 3600): (1, 1000, 1)}
+        assert db.apply_forward_index_batch("alice", 0, 5, bucket) is True
+        # Stale writer that also started from 0 must not double count
+        assert db.apply_forward_index_batch("alice", 0, 5, bucket) is False
+        stats = db.get_forward_window_stats("alice", 0, 7200)
+        assert stats["forward_count"] == 1
+        assert db.get_forward_index_state("alice")["forwards_indexed"] == 1
+
+    def test_nodes_isolated_and_reset(self, db):
+        db.apply_forward_index_batch("alice", 0, 1, {("a", 0): (1, 10, 1)})
+        db.apply_forward_index_batch("bob", 0, 1, {("b", 0): (2, 20, 2)})
+        assert db.get_forward_window_stats("bob", 0, 10)["forward_count"] == 2
+
+        db.reset_forward_index("alice")
+        assert db.get_forward_window_stats("alice", 0, 10)["forward_count"] == 0
+        assert db.get_forward_index_state("alice")["created_index"] == 0
+        assert db.get_forward_window_stats("bob", 0, 10)["forward_count"] == 2
@@ -0,0 +1,277 @@
+"""
+Tests for the graph centrality engine.
+
+Covers:
+- CSR construction from listchannels (dedup, inactive, epoch stability)
+- Exact betweenness on small graphs, closeness and edge gain values
+- Incremental reuse of betweenness across graph epochs
+- Worker process path matches the in-process computation
+- Consumers fall back to heuristics until results exist
+
+Run with: pytest tests/test_graph_centrality.py -v
+Benchmark (mainnet-size synthetic fixture):
+    CL_HIVE_BENCHMARK=1 pytest tests/test_graph_centrality.py -k mainnet -s
+"""
+
+import gzip
+import json
+import os
+import random
+import sys
+import time
+import pytest
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.graph_centrality import (
+    ChannelGraph,
+    GraphCentralityEngine,
+    load_graph_fixture,
+    run_centrality_job,
+)
+from modules.strategic_positioning import RouteValueAnalyzer
+
+
+def _node(c):
+    return "02" + c * 64
+
+
+def _nid(i):
+    return "03" + f"{i:064x}"
+
+
+A, B, C, D, E = (_node(c) for c in "abcde")
+
+
+def _channels(edges, active=True):
+    """listchannels-style entries, one per direction."""
+    channels = []
+    for i, (u, v) in enumerate(edges):
+        scid = f"100x{i}x0"
+        channels.append({"source": u, "destination": v, "short_channel_id": scid, "active": active})
+        channels.append({"source": v, "destination": u, "short_channel_id": scid, "active": active})
+    return channels
+
+
+class MockDatabase:
+    def __init__(self, members):
+        self.members = members
+
+    def get_all_members(self):
+        return [{"peer_id": m, "tier": "member"} for m in self.members]
+
+
+def _engine(members, **kwargs):
+    kwargs.setdefault("use_worker_process", False)
+    return GraphCentralityEngine(plugin=MagicMock(), database=MockDatabase(members), **kwargs)
+
+
+# =============================================================================
+# GRAPH
+# =============================================================================
+
+class TestChannelGraph:
+
+    def test_csr_dedup_and_inactive(self):
+        channels = _channels([(A, B), (B, C)])
+        channels += _channels([(A, B)])            # Parallel channel
+        channels += _channels([(C, D)], active=False)
+        graph = ChannelGraph.from_listchannels(channels)
+
+        assert graph.num_nodes == 3
+        assert graph.num_edges == 2
+        assert graph.degree(B) == 2
+        assert graph.degree(A) == 1
+        assert graph.degree(D) is None
+        b = graph.index[B]
+        neighbours = {graph.node_ids[t] for t in graph.targets[graph.offsets[b]:graph.offsets[b + 1]]}
+        assert neighbours == {A, C}
+
+    def test_epoch_independent_of_order(self):
+        channels = _channels([(A, B), (B, C), (C, D)])
+        g1 = ChannelGraph.from_listchannels(channels)
+        g2 = ChannelGraph.from_listchannels(list(reversed(channels)))
+        g3 = ChannelGraph.from_listchannels(_channels([(A, B), (B, C)]))
+        assert g1.epoch == g2.epoch
+        assert g1.epoch != g3.epoch
+
+
+# =============================================================================
+# ALGORITHMS
+# =============================================================================
+
+class TestCentralityValues:
+
+    def test_path_graph_values(self):
+        # A - B - C - D
+        engine = _engine([A])
+        graph = ChannelGraph.from_listchannels(_channels([(A, B), (B, C), (C, D)]))
+        result = engine.compute(graph)
+
+        # Exact (4 sources <= samples): B lies on A-C, A-D pairs -> 2/3
+        assert engine.get_betweenness(B) == pytest.approx(2 / 3)
+        assert engine.get_betweenness(A) == pytest.approx(0.0)
+
+        before = (1 + 1 / 2 + 1 / 3) / 3
+        assert engine.get_closeness(A) == pytest.approx(before)
+
+        # Channel A-D: D at 1 hop, C stays at 2
+        after = (1 + 1 / 2 + 1) / 3
+        assert engine.get_edge_gain(A, D) == pytest.approx(after - before)
+        assert engine.get_edge_gain(A, B) == pytest.approx(0.0)
+        assert engine.get_relative_edge_gain(A, D) == pytest.approx((after - before) / before)
+        assert result.incremental is False
+
+    def test_star_center(self):
+        graph = ChannelGraph.from_listchannels(_channels([(A, B), (A, C), (A, D), (A, E)]))
+        engine = _engine([])
+        engine.compute(graph)
+        assert engine.get_betweenness(A) == pytest.approx(1.0)
+        assert engine.get_betweenness(B) == pytest.approx(0.0)
+        assert engine.get_betweenness(_node("f")) is None
+
+    def test_sampled_betweenness_close_to_exact(self):
+        rnd = random.Random(7)
+        nodes = [_nid(i) for i in range(300)]
+        edges = set()
+        for i in range(1, 300):
+            edges.add((nodes[rnd.randrange(i)], nodes[i]))
+        for _ in range(300):
+            u, v = rnd.sample(nodes, 2)
+            edges.add((u, v))
+        graph = ChannelGraph.from_listchannels(_channels(sorted(edges)))
+
+        job = {
+            "n": graph.num_nodes,
+            "offsets": graph.offsets.tolist(),
+            "targets": graph.targets.tolist(),
+            "samples": graph.num_nodes,
+        }
+        exact = run_centrality_job(job)["betweenness"]
+        sampled = run_centrality_job(dict(job, samples=100, seed=3))["betweenness"]
+
+        top_exact = max(range(len(exact)), key=exact.__getitem__)
+        assert sampled[top_exact] == pytest.approx(exact[top_exact], rel=0.3)
+
+    def test_disconnected_nodes_contribute_nothing(self):
+        graph = ChannelGraph.from_listchannels(_channels([(A, B), (C, D)]))
+        engine = _engine([A])
+        engine.compute(graph)
+        assert engine.get_closeness(A) == pytest.approx(1 / 3)
+        # A-C connects the components: C at 1, D at 2
+        assert engine.get_edge_gain(A, C) == pytest.approx((1 + 1 / 2) / 3)
+
+
+# =============================================================================
+# ENGINE
+# =============================================================================
+
+class TestEngine:
+
+    def test_update_graph_computes_once_per_epoch(self):
+        engine = _engine([A])
+        channels = _channels([(A, B), (B, C), (C, D)])
+        assert engine.update_graph(channels) is True
+        engine._thread.join(5)
+        first = engine.get_result()
+        assert first is not None
+
+        assert engine.update_graph(channels) is False
+        assert engine.get_result() is first
+
+    def test_small_change_reuses_betweenness(self):
+        # Path of 121 nodes, member at one end
+        edges = [(_nid(i), _nid(i + 1)) for i in range(120)]
+        member = _nid(0)
+        engine = _engine([member])
+        first = engine.compute(ChannelGraph.from_listchannels(_channels(edges)))
+
+        # One extra edge (<2% change): betweenness reused, closeness recomputed
+        changed = edges + [(member, _nid(60))]
+        result = engine.compute(ChannelGraph.from_listchannels(_channels(changed)))
+        assert result.incremental is True
+        assert result.betweenness == first.betweenness
+        assert result.closeness[member] > first.closeness[member]
+
+        rewired = [(_nid(i), member) for i in range(10, 20)] + edges
+        assert engine.compute(ChannelGraph.from_listchannels(_channels(rewired))).incremental is False
+
+    def test_requested_candidate_evaluated_on_next_run(self):
+        engine = _engine([A])
+        engine.compute(ChannelGraph.from_listchannels(_channels([(A, B), (B, C), (C, D)])))
+        with_gains = dict(engine.get_result().edge_gains)
+        assert (A, D) in with_gains
+
+        # Unknown pair: remembered and evaluated next time
+        engine.get_result().edge_gains.pop((A, D))
+        assert engine.get_edge_gain(A, D) is None
+        assert D in engine._requested_candidates
+        assert engine.update_graph(_channels([(A, B), (B, C), (C, D)])) is True
+        engine._thread.join(5)
+        assert engine.get_edge_gain(A, D) == pytest.approx(with_gains[(A, D)])
+        assert not engine._requested_candidates
+
+    def test_worker_process_matches_inline(self):
+        graph = ChannelGraph.from_listchannels(_channels([(A, B), (B, C), (C, D), (B, E)]))
+        inline = _engine([A]).compute(graph)
+        worker = _engine([A], use_worker_process=True).compute(graph)
+        assert worker.betweenness == pytest.approx(inline.betweenness)
+        assert worker.closeness == pytest.approx(inline.closeness)
+        assert worker.edge_gains == pytest.approx(inline.edge_gains)
+
+
+# =============================================================================
+# CONSUMERS
+# =============================================================================
+
+class TestConsumers:
+
+    def test_competitor_count_uses_degree(self):
+        engine = _engine([])
+        analyzer = RouteValueAnalyzer(plugin=MagicMock(), centrality_engine=engine)
+        assert analyzer._estimate_competitor_count(A) == 10  # No graph yet
+
+        engine.update_graph(_channels([(A, B), (A, C), (A, D)]))
+        engine._thread.join(5)
+        assert analyzer._estimate_competitor_count(A) == 3
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def _write_synthetic_fixture(path, num_nodes=15000, num_channels=50000, seed=1):
+    """Preferential-attachment graph roughly shaped like mainnet."""
+    rnd = random.Random(seed)
+    ids = ["02%064x" % rnd.getrandbits(256) for _ in range(num_nodes)]
+    pool = [0, 1]
+    edges = {(0, 1)}
+    for v in range(2, num_nodes):
+        for _ in range(1 if rnd.random() < 0.5 else rnd.randint(1, 8)):
+            u = rnd.choice(pool)
+            edges.add((min(u, v), max(u, v)))
+            pool += [u, v]
+    while len(edges) < num_channels:
+        u, v = rnd.choice(pool), rnd.choice(pool)
+        if u != v:
+            edges.add((min(u, v), max(u, v)))
+    with gzip.open(path, "wt") as f:
+        json.dump({"channels": _channels([(ids[u], ids[v]) for u, v in edges])}, f)
+
+
+@pytest.mark.skipif(not os.environ.get("CL_HIVE_BENCHMARK"), reason="set CL_HIVE_BENCHMARK=1")
+def test_mainnet_size_under_a_minute(tmp_path):
+    path = str(tmp_path / "listchannels.json.gz")
+    _write_synthetic_fixture(path)
+
+    start = time.time()
+    graph = load_graph_fixture(path)
+    members = sorted(graph.node_ids, key=lambda n: -graph.degree(n))[:10]
+    engine = _engine(members, use_worker_process=True)
+    result = engine.compute(graph)
+    elapsed = time.time() - start
+
+    print(f"\n{graph.num_nodes} nodes, {graph.num_edges} edges: {elapsed:.1f}s")
+    assert elapsed < 60
+    assert len(result.edge_gains) > 0
@@ -0,0 +1,368 @@
+"""
+Tests for the routing intelligence snapshot (fast restart).
+
+Covers:
+- Binary format round-trip, corruption and version checks
+- Restore of path stats, reputation, pheromones and markers
+- Watermark catch-up replays only rows newer than the snapshot
+- Rows stored after startup are not double counted
+- Catch-up and full reload running alongside live probes
+
+Run with: pytest tests/test_intel_snapshot.py -v
+"""
+
+import os
+import sys
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.database import HiveDatabase
+from modules.fee_coordination import FeeCoordinationManager
+from modules.intel_snapshot import (
+    IntelSnapshot,
+    IntelSnapshotManager,
+    SnapshotFormatError,
+    SNAPSHOT_VERSION,
+    decode_snapshot,
+    encode_snapshot,
+)
+from modules.peer_reputation import PeerReputationManager
+from modules.routing_intelligence import HiveRoutingMap
+
+
+OUR_PUBKEY = "02" + "a" * 64
+REPORTER = "02" + "b" * 64
+DEST = "03" + "c" * 64
+HOP = "03" + "d" * 64
+PEER = "03" + "e" * 64
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def mock_plugin():
+    plugin = Mock()
+    plugin.log = Mock()
+    return plugin
+
+
+@pytest.fixture
+def db(tmp_path, mock_plugin):
+    database = HiveDatabase(str(tmp_path / "test.db"), mock_plugin)
+    database.initialize()
+    return database
+
+
+def _make_components(db, plugin):
+    routing_map = HiveRoutingMap(db, plugin, OUR_PUBKEY)
+    reputation_mgr = PeerReputationManager(db, plugin, OUR_PUBKEY)
+    fee_mgr = FeeCoordinationManager(db, plugin)
+    fee_mgr.set_our_pubkey(OUR_PUBKEY)
+    return routing_map, reputation_mgr, fee_mgr
+
+
+def _make_manager(db, plugin, path, components):
+    routing_map, reputation_mgr, fee_mgr = components
+    return IntelSnapshotManager(
+        database=db,
+        plugin=plugin,
+        snapshot_path=str(path),
+        routing_map=routing_map,
+        reputation_mgr=reputation_mgr,
+        fee_coordination_mgr=fee_mgr,
+    )
+
+
+def _store_probe(db, success=True, fee=100, reporter=REPORTER):
+    db.store_route_probe(
+        reporter_id=reporter, destination=DEST, path=[HOP],
+        success=success, latency_ms=50, total_fee_ppm=fee,
+        estimated_capacity_sats=1_000_000, timestamp=int(time.time())
+    )
+
+
+def _stats(routing_map):
+    return routing_map._path_stats[(DEST, (HOP,))]
+
+
+# =============================================================================
+# FORMAT
+# =============================================================================
+
+class TestSnapshotFormat:
+
+    def test_round_trip(self):
+        snap = IntelSnapshot(
+            version=SNAPSHOT_VERSION, created_at=123,
+            watermarks={"route_probes": 7},
+            sections={"path_stats": {"destination": ["x"]}},
+        )
+        decoded = decode_snapshot(encode_snapshot(snap))
+        assert decoded.created_at == 123
+        assert decoded.watermarks == {"route_probes": 7}
+        assert decoded.sections == {"path_stats": {"destination": ["x"]}}
+
+    def test_rejects_bad_magic(self):
+        data = bytearray(encode_snapshot(IntelSnapshot(SNAPSHOT_VERSION, 1)))
+        data[0:8] = b"NOTASNAP"
+        with pytest.raises(SnapshotFormatError):
+            decode_snapshot(bytes(data))
+
+    def test_rejects_unknown_version(self):
+        data = encode_snapshot(IntelSnapshot(SNAPSHOT_VERSION + 1, 1))
+        with pytest.raises(SnapshotFormatError):
+            decode_snapshot(data)
+
+    def test_rejects_corrupt_body(self):
+        data = bytearray(encode_snapshot(IntelSnapshot(SNAPSHOT_VERSION, 1)))
+        data[-1] ^= 0xFF
+        with pytest.raises(SnapshotFormatError):
+            decode_snapshot(bytes(data))
+
+
+# =============================================================================
+# SAVE / RESTORE
+# =============================================================================
+
+class TestSnapshotRestore:
+
+    def test_full_restore_and_catch_up(self, db, mock_plugin, tmp_path):
+        for _ in range(3):
+            _store_probe(db)
+        db.store_peer_reputation(
+            reporter_id=REPORTER, peer_id=PEER, timestamp=int(time.time()),
+            uptime_pct=0.9, htlc_success_rate=0.8
+        )
+
+        # First start: no snapshot, background rebuild from database
+        components = _make_components(db, mock_plugin)
+        mgr = _make_manager(db, mock_plugin, tmp_path / "intel.snap", components)
+        status = mgr.restore()
+        assert status["restored_from_snapshot"] is False
+        mgr.catch_up()
+        routing_map, reputation_mgr, fee_mgr = components
+        assert _stats(routing_map).probe_count == 3
+        assert reputation_mgr.get_reputation(PEER) is not None
+
+        fee_mgr.adaptive_controller.update_pheromone("123x1x0", 250, True, 1000)
+        fee_mgr.stigmergic_coord.deposit_marker(HOP, DEST, 300, True, 500_000)
+        saved = mgr.save_snapshot()
+        assert saved["sections"]["path_stats"] == 1
+
+        # More probes arrive while the node is down
+        _store_probe(db, success=False)
+        _store_probe(db, fee=200)
+
+        # Restart: restore snapshot, replay only the two newer rows
+        components2 = _make_components(db, mock_plugin)
+        mgr2 = _make_manager(db, mock_plugin, tmp_path / "intel.snap", components2)
+        status = mgr2.restore()
+        assert status["restored_from_snapshot"] is True
+        assert status["ready"] is True
+        routing_map2, reputation_mgr2, fee_mgr2 = components2
+        assert _stats(routing_map2).probe_count == 3
+
+        result = mgr2.catch_up()
+        assert result["probes_replayed"] == 2
+        stats = _stats(routing_map2)
+        assert stats.probe_count == 5
+        assert stats.success_count == 4
+        assert stats.reporters == {REPORTER}
+
+        rep = reputation_mgr2.get_reputation(PEER)
+        assert rep is not None
+        assert rep.reporters == {REPORTER}
+
+        assert fee_mgr2.adaptive_controller.get_pheromone_level("123x1x0") > 0
+        assert fee_mgr2.adaptive_controller._pheromone_fee["123x1x0"] == 250
+        assert len(fee_mgr2.stigmergic_coord.read_markers(HOP, DEST)) == 1
+
+    def test_live_rows_after_startup_not_double_counted(self, db, mock_plugin, tmp_path):
+        _store_probe(db)
+        components = _make_components(db, mock_plugin)
+        mgr = _make_manager(db, mock_plugin, tmp_path / "intel.snap", components)
+        mgr.restore()
+
+        # A live probe is applied in memory and stored before catch-up runs
+        routing_map = components[0]
+        routing_map._update_path_stats(
+            destination=DEST, path=(HOP,), success=True, latency_ms=10,
+            fee_ppm=100, capacity_sats=0, reporter_id=REPORTER,
+            failure_reason="", timestamp=int(time.time())
+        )
+        _store_probe(db)
+
+        mgr.catch_up()
+        assert _stats(routing_map).probe_count == 2
+
+    def test_no_save_before_catch_up(self, db, mock_plugin, tmp_path):
+        components = _make_components(db, mock_plugin)
+        mgr = _make_manager(db, mock_plugin, tmp_path / "intel.snap", components)
+        mgr.restore()
+        assert mgr.maybe_save_snapshot(force=True) is None
+        mgr.catch_up()
+        assert mgr.maybe_save_snapshot(force=True) is not None
+        # Interval not elapsed
+        assert mgr.maybe_save_snapshot() is None
+
+    def test_failed_replay_falls_back_to_full_reload(self, db, mock_plugin, tmp_path):
+        for _ in range(3):
+            _store_probe(db)
+        components = _make_components(db, mock_plugin)
+        mgr = _make_manager(db, mock_plugin, tmp_path / "intel.snap", components)
+        mgr.restore()
+
+        routing_map = components[0]
+        real_replay = routing_map.replay_probes_in_range
+
+        def broken_replay(after_id, up_to_id, batch_size=5000):
+            real_replay(after_id, after_id + 1, batch_size=batch_size)  # Partly applied
+            raise RuntimeError("database is locked")
+
+        routing_map.replay_probes_in_range = broken_replay
+        result = mgr.catch_up()
+        assert result["catch_up_complete"] is True
+        assert result["catch_up_full_reload"] is True
+        assert result["probes_replayed"] == 3
+        assert _stats(routing_map).probe_count == 3  # Not double counted
+        assert mgr.maybe_save_snapshot(force=True) is not None
+        assert any("falling back to full reload" in str(c) for c in mock_plugin.log.call_args_list)
+
+    def test_failed_full_reload_keeps_saves_disabled(self, db, mock_plugin, tmp_path):
+        components = _make_components(db, mock_plugin)
+        mgr = _make_manager(db, mock_plugin, tmp_path / "intel.snap", components)
+        mgr.restore()
+        routing_map = components[0]
+        routing_map.replay_probes_in_range = Mock(side_effect=RuntimeError("locked"))
+        routing_map.aggregate_from_database = Mock(side_effect=RuntimeError("still locked"))
+
+        with pytest.raises(RuntimeError):
+            mgr.catch_up()
+        assert mgr.get_status()["catch_up_error"] == "still locked"
+        assert mgr.maybe_save_snapshot(force=True) is None
+
+    def test_stale_snapshot_ignored(self, db, mock_plugin, tmp_path):
+        path = tmp_path / "intel.snap"
+        path.write_bytes(encode_snapshot(IntelSnapshot(
+            version=SNAPSHOT_VERSION, created_at=int(time.time()) - 30 * 86400,
+            sections={"path_stats": {"destination": []}},
+        )))
+        components = _make_components(db, mock_plugin)
+        mgr = _make_manager(db, mock_plugin, path, components)
+        assert mgr.restore()["restored_from_snapshot"] is False
+
+    def test_watermark_above_db_max_resets(self, db, mock_plugin, tmp_path):
+        _store_probe(db)
+        path = tmp_path / "intel.snap"
+        path.write_bytes(encode_snapshot(IntelSnapshot(
+            version=SNAPSHOT_VERSION, created_at=int(time.time()),
+            watermarks={"route_probes": 10_000, "peer_reputation": 0},
+        )))
+        components = _make_components(db, mock_plugin)
+        mgr = _make_manager(db, mock_plugin, path, components)
+        status = mgr.restore()
+        assert status["watermarks"]["route_probes"] == 0
+        assert mgr.catch_up()["probes_replayed"] == 1
+
+    def test_stale_paths_dropped_on_restore(self, db, mock_plugin):
+        routing_map = HiveRoutingMap(db, mock_plugin, OUR_PUBKEY)
+        old = int(time.time()) - 48 * 3600
+        routing_map._update_path_stats(
+            destination=DEST, path=(HOP,), success=True, latency_ms=10,
+            fee_ppm=100, capacity_sats=0, reporter_id=REPORTER,
+            failure_reason="", timestamp=old
+        )
+        state = routing_map.export_snapshot_state()
+        assert routing_map.restore_snapshot_state(state) == 0
+
+
+# =============================================================================
+# CATCH-UP CONCURRENT WITH LIVE PROBES
+# =============================================================================
+
+def _live_probe(routing_map, db, timestamp=None):
+    """What handle_route_probe does once a probe passed validation."""
+    timestamp = timestamp or int(time.time())
+    with routing_map._stats_lock:
+        routing_map._update_path_stats(
+            destination=DEST, path=(HOP,), success=True, latency_ms=50,
+            fee_ppm=100, capacity_sats=1_000_000, reporter_id=REPORTER,
+            failure_reason="", timestamp=timestamp
+        )
+        db.store_route_probe(
+            reporter_id=REPORTER, destination=DEST, path=[HOP],
+            success=True, latency_ms=50, total_fee_ppm=100,
+            estimated_capacity_sats=1_000_000, timestamp=timestamp
+        )
+
+
+class TestConcurrentCatchUp:
+
+    def _run_with_live_probes(self, routing_map, db, background, live=150):
+        errors = []
+
+        def run():
+            try:
+                background()
+            except Exception as e:  # pragma: no cover - surfaced below
+                errors.append(e)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        for _ in range(live):
+            _live_probe(routing_map, db)
+        thread.join()
+        assert not errors
+
+    def test_replay_range_with_live_probes(self, db, mock_plugin):
+        for _ in range(300):
+            _store_probe(db)
+        ceiling = db.get_max_route_probe_id()
+        routing_map = HiveRoutingMap(db, mock_plugin, OUR_PUBKEY)
+
+        self._run_with_live_probes(
+            routing_map, db,
+            lambda: routing_map.replay_probes_in_range(0, ceiling, batch_size=20)
+        )
+        assert _stats(routing_map).probe_count == 300 + 150
+
+    def test_full_reload_with_live_probes(self, db, mock_plugin):
+        for _ in range(300):
+            _store_probe(db)
+        routing_map = HiveRoutingMap(db, mock_plugin, OUR_PUBKEY)
+        routing_map.aggregate_from_database()
+
+        self._run_with_live_probes(
+            routing_map, db,
+            lambda: routing_map.aggregate_from_database(reset=True)
+        )
+        # Every stored probe counted exactly once, none lost in the swap
+        assert _stats(routing_map).probe_count == 300 + 150
+        assert routing_map._rebuild_log is None
+
+    def test_replayed_older_probe_keeps_last_seen(self, db, mock_plugin):
+        routing_map = HiveRoutingMap(db, mock_plugin, OUR_PUBKEY)
+        now = int(time.time())
+        _live_probe(routing_map, db, timestamp=now)
+        for success in (True, False):
+            routing_map._update_path_stats(
+                destination=DEST, path=(HOP,), success=success, latency_ms=10,
+                fee_ppm=100, capacity_sats=0, reporter_id=REPORTER,
+                failure_reason="old", timestamp=now - 3600
+            )
+        recent_failure = now - 60
+        routing_map._update_path_stats(
+            destination=DEST, path=(HOP,), success=False, latency_ms=0,
+            fee_ppm=0, capacity_sats=0, reporter_id=REPORTER,
+            failure_reason="recent", timestamp=recent_failure
+        )
+        stats = _stats(routing_map)
+        assert stats.last_success_time == now
+        assert stats.last_failure_time == recent_failure
+        assert stats.last_failure_reason == "recent"
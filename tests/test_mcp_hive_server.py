@@ -305,6 +305,112 @@ class TestAdvisorDBConcurrency:
             assert isinstance(r, dict)
 
 
+class TestAdvisorDBPooling:
+    """Test pooled connections, batched transactions and the async facade."""
+
+    @staticmethod
+    def _report(channels=0):
+        return {
+            "fleet_summary": {"total_nodes": 1, "channel_health": {}},
+            "hive_topology": {},
+            "nodes": {
+                "alice": {
+                    "healthy": True,
+                    "channels_detail": [
+                        {"channel_id": f"{i}x1x0", "local_sats": 500_000, "capacity_sats": 1_000_000}
+                        for i in range(channels)
+                    ],
+                }
+            },
+        }
+
+    def test_connection_reused_between_operations(self, temp_db):
+        with temp_db._get_conn() as conn1:
+            conn1.execute("SELECT 1")
+        with temp_db._get_conn() as conn2:
+            conn2.execute("SELECT 1")
+        assert conn1 is conn2
+
+        # Nested operations never share a connection
+        with temp_db._get_conn() as outer:
+            with temp_db._get_conn() as inner:
+                assert inner is not outer
+
+    def test_batch_commits_once(self, temp_db):
+        with temp_db.batch():
+            temp_db.record_fleet_snapshot(self._report(), "manual")
+            recorded = temp_db.record_channel_states(self._report(channels=3))
+        assert recorded == 3
+        stats = temp_db.get_stats()
+        assert stats["fleet_snapshots"] == 1
+        assert stats["channel_history_records"] == 3
+
+    def test_batch_rolls_back_on_error(self, temp_db):
+        with pytest.raises(RuntimeError):
+            with temp_db.batch():
+                temp_db.record_fleet_snapshot(self._report(), "manual")
+                raise RuntimeError("abort")
+        assert temp_db.get_stats()["fleet_snapshots"] == 0
+
+        # Pooled connection is still usable afterwards
+        temp_db.record_fleet_snapshot(self._report(), "manual")
+        assert temp_db.get_stats()["fleet_snapshots"] == 1
+
+    def test_async_facade_runs_off_event_loop(self, temp_db):
+        import threading
+        from advisor_db import AsyncAdvisorDB
+
+        adb = AsyncAdvisorDB(temp_db)
+        loop_thread = {}
+
+        async def scenario():
+            loop_thread["id"] = threading.get_ident()
+            snapshot_id, count = await adb.run_batch(
+                lambda db: (db.record_fleet_snapshot(self._report(), "manual"),
+                            db.record_channel_states(self._report(channels=2)))
+            )
+            worker = await adb.run(threading.get_ident)
+            stats = await adb.get_stats()
+            return snapshot_id, count, worker, stats
+
+        try:
+            snapshot_id, count, worker, stats = asyncio.run(scenario())
+        finally:
+            adb.shutdown()
+        assert snapshot_id and count == 2
+        assert worker != loop_thread["id"]
+        assert stats["fleet_snapshots"] == 1
+
+    def test_recent_decisions_via_facade(self, temp_db):
+        from advisor_db import AsyncAdvisorDB
+
+        for i in range(3):
+            temp_db.record_decision("fee_change", "alice", f"rec {i}")
+        adb = AsyncAdvisorDB(temp_db)
+        try:
+            rows = asyncio.run(adb.get_recent_decisions(2))
+        finally:
+            adb.shutdown()
+        assert len(rows) == 2
+        assert set(rows[0]) >= {"id", "timestamp", "node_name", "recommendation", "status"}
+
+    def test_handlers_do_not_touch_sync_db_on_loop(self):
+        """Handlers reach the advisor DB only through the async facade."""
+        server_path = os.path.join(
+            os.path.dirname(__file__), '..', 'tools', 'mcp-hive-server.py'
+        )
+        with open(server_path, 'r') as f:
+            source = f.read()
+
+        import ast
+        for node in ast.parse(source).body:
+            if isinstance(node, ast.AsyncFunctionDef) and node.name.startswith("handle_"):
+                body = ast.get_source_segment(source, node)
+                assert "ensure_advisor_db()" not in body, node.name
+                assert "_get_conn()" not in body, node.name
+        assert "await adb.run(_build_proactive_advisor" in source
+
+
 # =============================================================================
 # _normalize_response() Tests
 # =============================================================================
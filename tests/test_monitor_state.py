@@ -0,0 +1,232 @@
+"""
+Tests for hive-monitor state diffing and change-driven alerting.
+
+Covers:
+- Typed diffs between node snapshots (channels, capacity, funds,
+  governance, pending actions, revenue, reachability)
+- Deduplication, hysteresis and cooldowns in alert rules
+- Alert history and node state persisted across restarts
+- Recording a poll log from FleetMonitor and replaying it
+"""
+
+import copy
+import importlib.util
+import os
+import sys
+
+
+# Add tools directory to path
+TOOLS_DIR = os.path.join(os.path.dirname(__file__), '..', 'tools')
+sys.path.insert(0, TOOLS_DIR)
+
+from monitor_state import (
+    ACTION_ADDED, ACTION_RESOLVED, CAPACITY_CHANGED, CHANNEL_CLOSED, CHANNEL_OPENED,
+    GOVERNANCE_CHANGED, NODE_RECOVERED, NODE_UNREACHABLE, ONCHAIN_CHANGED, REVENUE_CHANGED,
+    AlertStore, NodeStateTracker, PollLog, diff_snapshots, replay_poll_log,
+    snapshot_from_responses,
+)
+from monitor_transport import FakeTransport
+
+
+def _responses(mode="advisor", channels=None, onchain_sats=500_000, actions=(), bleeders=0):
+    """Raw RPC responses for one healthy poll."""
+    channels = {"100x1x0": 1_000_000, "200x1x0": 2_000_000} if channels is None else channels
+    return {
+        "hive-status": {"governance_mode": mode},
+        "hive-pending-actions": {"actions": [{"id": i, "action_type": "channel_open"} for i in actions]},
+        "revenue-status": {},
+        "revenue-dashboard": {"period": {"gross_revenue_sats": 10}, "bleeder_count": bleeders},
+        "listfunds": {
+            "channels": [{"short_channel_id": scid, "amount_msat": sats * 1000}
+                         for scid, sats in channels.items()],
+            "outputs": [{"amount_msat": onchain_sats * 1000, "status": "confirmed"}],
+        },
+    }
+
+
+DOWN = {method: {"error": "connection refused"} for method in _responses()}
+
+
+def _types(alerts):
+    return [(a.alert_type, a.key, a.resolved) for a in alerts]
+
+
+class TestDiff:
+
+    def test_first_snapshot_is_baseline(self):
+        snapshot = snapshot_from_responses("alice", _responses(actions=[1]), 0)
+        events = diff_snapshots(None, snapshot)
+        assert [(e.kind, e.key) for e in events] == [(ACTION_ADDED, "1")]
+
+    def test_typed_changes(self):
+        old = snapshot_from_responses("alice", _responses(actions=[1, 2]), 0)
+        new = snapshot_from_responses("alice", _responses(
+            mode="autonomous",
+            channels={"100x1x0": 1_000_000, "300x1x0": 500_000},
+            onchain_sats=400_000,
+            actions=[2, 3],
+            bleeders=1,
+        ), 60)
+        events = {(e.kind, e.key): e for e in diff_snapshots(old, new)}
+
+        assert events[(GOVERNANCE_CHANGED, "")].new == "autonomous"
+        assert (CHANNEL_OPENED, "300x1x0") in events
+        assert events[(CHANNEL_CLOSED, "200x1x0")].old == 2_000_000
+        assert events[(CAPACITY_CHANGED, "")].new == 1_500_000
+        assert events[(ONCHAIN_CHANGED, "")].old == 500_000
+        assert (ACTION_ADDED, "3") in events and (ACTION_RESOLVED, "1") in events
+        assert events[(REVENUE_CHANGED, "bleeder_count")].new == 1
+        assert (REVENUE_CHANGED, "gross_revenue_sats") not in events
+
+    def test_unknown_facets_not_diffed(self):
+        tracker = NodeStateTracker()
+        tracker.observe("alice", _responses(), 0)
+        partial = dict(_responses(channels={}), listfunds={"error": "timeout"})
+        _, events, _ = tracker.observe("alice", partial, 60)
+        assert events == []
+        # The last known channels survive the failed listfunds
+        _, events, _ = tracker.observe("alice", _responses(), 120)
+        assert events == []
+
+    def test_unreachable_and_recovery(self):
+        tracker = NodeStateTracker()
+        tracker.observe("alice", _responses(), 0)
+        _, events, _ = tracker.observe("alice", DOWN, 60)
+        assert [e.kind for e in events] == [NODE_UNREACHABLE]
+        _, events, _ = tracker.observe("alice", _responses(onchain_sats=1), 120)
+        assert [e.kind for e in events] == [NODE_RECOVERED, ONCHAIN_CHANGED]
+
+
+class TestAlertRules:
+
+    def test_pending_action_deduplicated_until_resolved(self):
+        alerts = replay_poll_log([
+            {"ts": 0, "node": "alice", "responses": _responses(actions=[7])},
+            {"ts": 60, "node": "alice", "responses": _responses(actions=[7])},
+            {"ts": 120, "node": "alice", "responses": _responses(actions=[])},
+            {"ts": 180, "node": "alice", "responses": _responses(actions=[8])},
+        ])
+        assert _types(alerts) == [
+            ("pending_action", "7", False),
+            ("pending_action", "7", True),
+            ("pending_action", "8", False),
+        ]
+        assert alerts[0].message == "New pending action: channel_open (ID: 7)"
+        assert alerts[0].details["id"] == 7
+
+    def test_unreachable_hysteresis_and_cooldown(self):
+        polls = [_responses(), DOWN, _responses(), DOWN, DOWN, DOWN, _responses(), DOWN, DOWN]
+        alerts = replay_poll_log(
+            {"ts": i * 60, "node": "alice", "responses": r} for i, r in enumerate(polls)
+        )
+        # Single failed poll: nothing. Two in a row: one alert, resolved on
+        # recovery. Down again within the cooldown: not re-raised.
+        assert _types(alerts) == [
+            ("node_unreachable", "", False),
+            ("node_unreachable", "", True),
+        ]
+        assert alerts[0].severity == "critical"
+        assert alerts[0].timestamp == 4 * 60
+
+    def test_onchain_threshold_does_not_flap(self):
+        levels = [500_000, 90_000, 110_000, 90_000, 90_000, 150_000, 90_000, 250_000]
+        alerts = replay_poll_log(
+            {"ts": i * 60, "node": "alice", "responses": _responses(onchain_sats=v)}
+            for i, v in enumerate(levels)
+        )
+        assert _types(alerts) == [("onchain_low", "", False), ("onchain_low", "", True)]
+        assert alerts[0].timestamp == 4 * 60
+        assert alerts[1].timestamp == 7 * 60
+
+    def test_capacity_drop_and_channel_events(self):
+        alerts = replay_poll_log([
+            {"ts": 0, "node": "alice", "responses": _responses()},
+            {"ts": 60, "node": "alice", "responses": _responses(channels={"100x1x0": 1_000_000})},
+            {"ts": 120, "node": "alice", "responses": _responses(
+                channels={"100x1x0": 1_000_000, "400x1x0": 50_000})},
+        ])
+        assert _types(alerts) == [
+            ("channel_closed", "200x1x0", False),
+            ("capacity_drop", "", False),
+            ("channel_opened", "400x1x0", False),
+        ]
+
+
+class TestPersistence:
+
+    POLLS = [
+        (0, "alice", _responses(actions=[1])),
+        (60, "bob", DOWN),
+        (120, "bob", DOWN),
+        (180, "alice", _responses(actions=[1], onchain_sats=50_000)),
+        (240, "alice", _responses(actions=[1], onchain_sats=50_000)),
+        (300, "bob", DOWN),
+        (360, "alice", _responses(actions=[], onchain_sats=50_000)),
+        (420, "bob", _responses()),
+    ]
+
+    def _records(self, polls):
+        return [{"ts": ts, "node": node, "responses": copy.deepcopy(r)} for ts, node, r in polls]
+
+    def test_restart_matches_uninterrupted_run(self, tmp_path):
+        expected = replay_poll_log(self._records(self.POLLS))
+        assert len(expected) == 5
+
+        store_dir = str(tmp_path / "state")
+        first = replay_poll_log(self._records(self.POLLS[:4]), store=AlertStore(store_dir))
+        # Restart: a new tracker loads alert history and last snapshots
+        second = replay_poll_log(self._records(self.POLLS[4:]), store=AlertStore(store_dir))
+        assert _types(first + second) == _types(expected)
+
+        history = AlertStore(store_dir).load_alerts()
+        assert _types(history) == _types(expected)
+
+    def test_restart_does_not_reannounce(self, tmp_path):
+        store_dir = str(tmp_path / "state")
+        replay_poll_log(self._records(self.POLLS[:1]), store=AlertStore(store_dir))
+        again = replay_poll_log(self._records([(600, "alice", _responses(actions=[1]))]),
+                                store=AlertStore(store_dir))
+        assert again == []
+
+        # Alert history alone is enough to keep active alerts deduplicated
+        os.remove(os.path.join(store_dir, "state.json"))
+        again = replay_poll_log(self._records([(660, "alice", _responses(actions=[1]))]),
+                                store=AlertStore(store_dir))
+        assert again == []
+
+
+def _load_hive_monitor():
+    spec = importlib.util.spec_from_file_location("hive_monitor", os.path.join(TOOLS_DIR, "hive-monitor.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_record_and_replay_fleet_monitor(tmp_path):
+    hive_monitor = _load_hive_monitor()
+    script = {
+        "alice": [_responses(actions=[1]), _responses(actions=[1, 2], mode="autonomous"),
+                  _responses(actions=[2], mode="autonomous")],
+    }
+    transport = FakeTransport()
+    nodes = {"alice": hive_monitor.NodeConnection(name="alice", transport=transport)}
+    log_path = str(tmp_path / "polls.jsonl")
+    monitor = hive_monitor.FleetMonitor(nodes, db_path=str(tmp_path / "advisor.db"),
+                                        state_dir=str(tmp_path / "state"), poll_log=log_path)
+    for responses in script["alice"]:
+        transport.responses = responses
+        monitor.check_all_nodes()
+    monitor.close()
+
+    live = [(a.alert_type, a.message) for a in monitor.alerts]
+    assert live == [
+        ("pending_action", "New pending action: channel_open (ID: 1)"),
+        ("pending_action", "New pending action: channel_open (ID: 2)"),
+        ("governance_mode_changed", "Governance mode changed: advisor -> autonomous"),
+        ("pending_action", "Resolved: pending_action"),
+    ]
+    assert monitor.state["alice"].governance_mode == "autonomous"
+    assert monitor.state["alice"].pending_action_ids == {2}
+
+    replayed = replay_poll_log(PollLog.read(log_path))
+    assert [(a.alert_type, a.message) for a in replayed] == live
@@ -0,0 +1,230 @@
+"""
+Tests for hive-monitor transports and concurrent polling.
+
+Covers:
+- FleetPoller checks nodes concurrently under a per-node timeout
+- Exponential backoff for failing nodes, reset on recovery
+- A node whose previous check is still running is not polled twice
+- UnixSocketTransport reuses one connection and reconnects after a drop
+- FleetMonitor.check_all_nodes over FakeTransport
+"""
+
+import importlib.util
+import json
+import os
+import socket
+import sys
+import threading
+import time
+
+import pytest
+
+# Add tools directory to path
+TOOLS_DIR = os.path.join(os.path.dirname(__file__), '..', 'tools')
+sys.path.insert(0, TOOLS_DIR)
+
+from monitor_transport import FakeTransport, FleetPoller, UnixSocketTransport, make_transport
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeLightningRpc:
+    """Threaded unix-socket JSON-RPC server answering like lightning-rpc."""
+
+    def __init__(self, path):
+        self.path = path
+        self.connections = 0
+        self.requests = []
+        self.drop_after = None
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(path)
+        self._server.listen(4)
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn):
+        decoder = json.JSONDecoder()
+        buffer = ""
+        with conn:
+            while True:
+                data = conn.recv(65536)
+                if not data:
+                    return
+                buffer += data.decode()
+                while buffer.strip():
+                    try:
+                        request, end = decoder.raw_decode(buffer.lstrip())
+                    except json.JSONDecodeError:
+                        break
+                    buffer = buffer.lstrip()[end:]
+                    self.requests.append(request["method"])
+                    if request["method"] == "fail":
+                        reply = {"jsonrpc": "2.0", "id": request["id"],
+                                 "error": {"code": -32601, "message": "Unknown command"}}
+                    else:
+                        # Large enough to arrive in several chunks
+                        reply = {"jsonrpc": "2.0", "id": request["id"],
+                                 "result": {"method": request["method"], "pad": "x" * 200_000}}
+                    conn.sendall(json.dumps(reply).encode() + b"\n\n")
+                    if self.drop_after and len(self.requests) >= self.drop_after:
+                        self.drop_after = None
+                        return
+
+    def close(self):
+        self._server.close()
+
+
+class TestFleetPoller:
+
+    def test_polls_concurrently(self):
+        poller = FleetPoller(max_workers=8, node_timeout=5)
+        transports = {f"n{i}": FakeTransport({"getinfo": {"id": i}}, delay=0.2) for i in range(8)}
+
+        start = time.monotonic()
+        results = poller.poll(transports, lambda name: transports[name].call("getinfo"))
+        assert time.monotonic() - start < 1.0
+        assert list(results) == list(transports)
+        assert results["n3"] == {"id": 3}
+        poller.shutdown()
+
+    def test_timeout_and_backoff(self):
+        clock = FakeClock()
+        poller = FleetPoller(node_timeout=0.2, backoff_base=60, backoff_max=200, clock=clock)
+        transports = {
+            "ok": FakeTransport({"getinfo": {}}),
+            "slow": FakeTransport({"getinfo": {}}, delay=0.5),
+            "down": FakeTransport(fail=True),
+        }
+
+        def check(name):
+            return transports[name].call("getinfo")
+
+        results = poller.poll(transports, check)
+        assert results["ok"] == {}
+        assert "Timeout" in results["slow"]["error"]
+        assert results["down"]["error"] == "connection refused"
+
+        # Within backoff: failing nodes are skipped without a call
+        calls_before = len(transports["down"].calls)
+        results = poller.poll(transports, check)
+        assert results["down"]["skipped"] == "backoff"
+        assert results["down"]["retry_in_seconds"] == 60
+        assert len(transports["down"].calls) == calls_before
+
+        # Backoff doubles per failure up to the cap
+        clock.now += 61
+        poller.poll(["down"], check)
+        assert poller.health["down"].next_poll_at == clock.now + 120
+        clock.now += 121
+        poller.poll(["down"], check)
+        assert poller.health["down"].next_poll_at == clock.now + 200
+
+        # Recovery resets the backoff
+        transports["down"].fail = False
+        clock.now += 201
+        assert poller.poll(["down"], check)["down"] == {}
+        assert poller.health["down"].consecutive_failures == 0
+        poller.shutdown()
+
+    def test_running_check_not_duplicated(self):
+        clock = FakeClock()
+        poller = FleetPoller(node_timeout=0.05, backoff_base=0, clock=clock)
+        transport = FakeTransport({"getinfo": {}}, delay=0.3)
+        check = lambda name: transport.call("getinfo")
+
+        poller.poll(["slow"], check)
+        result = poller.poll(["slow"], check)
+        assert result["slow"]["skipped"] == "previous check still running"
+        assert len(transport.calls) == 1
+        poller.shutdown()
+
+
+class TestUnixSocketTransport:
+
+    def test_persistent_connection(self, tmp_path):
+        server = FakeLightningRpc(str(tmp_path / "lightning-rpc"))
+        transport = UnixSocketTransport(server.path, timeout=5)
+        try:
+            for method in ("getinfo", "listfunds", "hive-status"):
+                assert transport.call(method)["method"] == method
+            assert server.connections == 1
+            assert transport.call("fail") == {"error": "Unknown command"}
+            assert server.connections == 1
+        finally:
+            transport.close()
+            server.close()
+
+    def test_reconnects_after_drop(self, tmp_path):
+        server = FakeLightningRpc(str(tmp_path / "lightning-rpc"))
+        server.drop_after = 1
+        transport = UnixSocketTransport(server.path, timeout=5)
+        try:
+            assert transport.call("getinfo")["method"] == "getinfo"
+            # The dropped connection surfaces as one error, then reconnects
+            second = transport.call("listfunds")
+            if "error" in second:
+                second = transport.call("listfunds")
+            assert second["method"] == "listfunds"
+            assert server.connections == 2
+        finally:
+            transport.close()
+            server.close()
+
+    def test_unreachable_socket(self, tmp_path):
+        transport = UnixSocketTransport(str(tmp_path / "missing"), timeout=1)
+        assert "error" in transport.call("getinfo")
+
+    def test_make_transport_modes(self):
+        socket_transport = make_transport({"name": "a", "mode": "socket"}, "/ln", "bitcoin")
+        assert socket_transport.socket_path == "/ln/bitcoin/lightning-rpc"
+        with pytest.raises(ValueError):
+            make_transport({"name": "a", "mode": "carrier-pigeon"}, "/ln", "bitcoin")
+
+
+def _load_hive_monitor():
+    spec = importlib.util.spec_from_file_location("hive_monitor", os.path.join(TOOLS_DIR, "hive-monitor.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestFleetMonitorPolling:
+
+    def test_check_all_nodes_with_fake_transport(self, tmp_path):
+        hive_monitor = _load_hive_monitor()
+        healthy = FakeTransport({
+            "hive-status": {"governance_mode": "advisor"},
+            "hive-pending-actions": {"actions": [{"id": 7, "action_type": "channel_open"}]},
+            "listfunds": {"channels": [{"amount_msat": 2_000_000_000}], "outputs": []},
+        })
+        nodes = {
+            "alice": hive_monitor.NodeConnection(name="alice", transport=healthy),
+            "bob": hive_monitor.NodeConnection(name="bob", transport=FakeTransport(fail=True)),
+        }
+        monitor = hive_monitor.FleetMonitor(nodes, db_path=str(tmp_path / "advisor.db"))
+
+        results = monitor.check_all_nodes()
+        assert results["alice"]["funds"]["total_capacity_sats"] == 2_000_000
+        assert monitor.state["alice"].governance_mode == "advisor"
+        assert [a.alert_type for a in monitor.alerts] == ["pending_action"]
+        assert results["bob"]["error"] == "connection refused"
+        assert monitor.state["bob"].is_healthy is False
+
+        # bob is backed off on the next interval
+        assert monitor.check_all_nodes()["bob"]["skipped"] == "backoff"
+        monitor.close()
+        assert healthy.closed
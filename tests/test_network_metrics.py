@@ -0,0 +1,169 @@
+"""
+Tests for Network Metrics Module.
+
+Tests cover:
+- Topology snapshot built with one state lookup per member
+- Counter-based unique peers / bridge score match the pairwise definition
+- Bitmask 2-hop reachability
+- Incremental snapshot patching on single-member gossip changes
+- Patching swaps in a copy; published snapshots never change
+"""
+
+import random
+import pytest
+from unittest.mock import MagicMock
+
+from modules.network_metrics import NetworkMetricsCalculator
+
+
+class MockDatabase:
+    """Mock database for testing."""
+
+    def __init__(self, member_ids):
+        self.member_ids = list(member_ids)
+
+    def get_all_members(self):
+        return [{"peer_id": m} for m in self.member_ids]
+
+
+class MockStateManager:
+    """Mock state manager that counts lookups."""
+
+    def __init__(self):
+        self.states = {}
+        self.lookups = 0
+
+    def get_peer_state(self, peer_id):
+        self.lookups += 1
+        return self.states.get(peer_id)
+
+    def set_topology(self, peer_id, topology):
+        state = MagicMock()
+        state.topology = list(topology)
+        self.states[peer_id] = state
+
+
+def _member(i):
+    return "02" + f"{i:064x}"
+
+
+def _peer(i):
+    return "03" + f"{i:064x}"
+
+
+def _build_fleet(members=20, peers_per_member=15, peer_pool=120, stateless=()):
+    rng = random.Random(42)
+    member_ids = [_member(i) for i in range(members)]
+    sm = MockStateManager()
+    for i, member_id in enumerate(member_ids):
+        if i in stateless:
+            continue
+        sm.set_topology(member_id, rng.sample(
+            [_peer(p) for p in range(peer_pool)], peers_per_member
+        ))
+    calc = NetworkMetricsCalculator(state_manager=sm, database=MockDatabase(member_ids))
+    return calc, sm, member_ids
+
+
+def _reference_unique(member_id, sm, member_ids):
+    """Pairwise definition: peers no other member connects to."""
+    mine = set(sm.states[member_id].topology) if member_id in sm.states else set()
+    others = set()
+    for other in member_ids:
+        if other != member_id and other in sm.states:
+            others.update(sm.states[other].topology)
+    return mine - others
+
+
+class TestTopologySnapshot:
+
+    def test_one_state_lookup_per_member(self):
+        calc, sm, member_ids = _build_fleet()
+        calc.get_all_metrics()
+        assert sm.lookups == len(member_ids)
+
+    def test_unique_peers_match_pairwise_definition(self):
+        calc, sm, member_ids = _build_fleet(stateless=(3,))
+        metrics = calc.get_all_metrics()
+        for member_id in member_ids:
+            expected = _reference_unique(member_id, sm, member_ids)
+            assert set(metrics[member_id].unique_peer_list) == expected
+            assert metrics[member_id].unique_peers == len(expected)
+
+    def test_hive_connectivity(self):
+        calc, sm, member_ids = _build_fleet(members=5, stateless=(0,))
+        metrics = calc.get_all_metrics()
+
+        # Stateless member has no hive connections
+        assert metrics[member_ids[0]].hive_peer_count == 0
+        assert metrics[member_ids[0]].hive_reachability == 0.0
+
+        # Others see each other (3 of 4 possible)
+        m1 = metrics[member_ids[1]]
+        assert m1.hive_peer_count == 3
+        assert m1.hive_centrality == pytest.approx(0.75)
+        assert m1.hive_reachability == pytest.approx(0.75)
+
+
+class TestIncrementalUpdate:
+
+    def test_patch_matches_full_rebuild(self):
+        calc, sm, member_ids = _build_fleet(stateless=(5,))
+        calc.get_all_metrics()
+        lookups_before = sm.lookups
+
+        # Member 2 changes topology, member 5 appears, member 7 disappears
+        sm.set_topology(member_ids[2], [_peer(p) for p in range(200, 210)] + [_peer(0)])
+        assert calc.update_member_topology(member_ids[2])
+        sm.set_topology(member_ids[5], [_peer(1), _peer(300)])
+        assert calc.update_member_topology(member_ids[5])
+        del sm.states[member_ids[7]]
+        assert calc.update_member_topology(member_ids[7])
+
+        patched = calc.get_all_metrics()
+        assert sm.lookups == lookups_before + 3
+
+        rebuilt = calc.get_all_metrics(force_refresh=True)
+        for member_id in member_ids:
+            a, b = patched[member_id].to_dict(), rebuilt[member_id].to_dict()
+            a.pop("calculated_at")
+            b.pop("calculated_at")
+            assert a == b
+            assert set(patched[member_id].unique_peer_list) == set(
+                rebuilt[member_id].unique_peer_list
+            )
+
+        snapshot = calc.get_topology_snapshot()
+        assert _peer(300) in snapshot.all_external_peers
+        assert snapshot.peer_member_counts[_peer(300)] == 1
+
+    def test_patch_does_not_mutate_published_snapshot(self):
+        calc, sm, member_ids = _build_fleet(members=5, stateless=(4,))
+        before = calc.get_topology_snapshot()
+        peers = set(before.all_external_peers)
+        counts = dict(before.peer_member_counts)
+        topologies = dict(before.member_topologies)
+        with_state = set(before.members_with_state)
+
+        sm.set_topology(member_ids[0], [_peer(500)])
+        assert calc.update_member_topology(member_ids[0])
+        sm.set_topology(member_ids[4], [_peer(501)])
+        assert calc.update_member_topology(member_ids[4])
+
+        assert before.all_external_peers == peers
+        assert before.peer_member_counts == counts
+        assert before.member_topologies == topologies
+        assert before.members_with_state == with_state
+
+        after = calc.get_topology_snapshot()
+        assert after is not before
+        assert {_peer(500), _peer(501)} <= after.all_external_peers
+
+    def test_no_snapshot_means_no_patch(self):
+        calc, sm, member_ids = _build_fleet()
+        assert calc.update_member_topology(member_ids[0]) is False
+
+    def test_unknown_member_not_patched(self):
+        calc, sm, member_ids = _build_fleet()
+        calc.get_all_metrics()
+        assert calc.update_member_topology(_member(999)) is False
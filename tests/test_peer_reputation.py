@@ -617,3 +617,148 @@ class TestPeerReputationSnapshot:
             PEER_REPUTATION_SNAPSHOT_RATE_LIMIT
         )
         assert allowed is False
+
+
+class TestIncrementalReputationState:
+    """Test in-memory per-reporter state and incremental aggregation."""
+
+    PEERS = ["03" + c * 64 for c in "pqrs"]
+    REPORTERS = ["02" + f"{i:064x}" for i in range(7)]
+
+    def setup_method(self):
+        import tempfile
+        from unittest.mock import Mock
+        from modules.database import HiveDatabase
+
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db = HiveDatabase(f"{self._tmp.name}/test.db", Mock())
+        self.db.initialize()
+        self.our_pubkey = self.REPORTERS[0]
+        self.rep_mgr = PeerReputationManager(self.db, MagicMock(), self.our_pubkey)
+
+    def teardown_method(self):
+        self._tmp.cleanup()
+
+    def _report(self, rng, peer_id, reporter_id, timestamp):
+        return {
+            "reporter_id": reporter_id,
+            "peer_id": peer_id,
+            "timestamp": timestamp,
+            "uptime_pct": rng.choice([0.2, 0.85, 0.9, 0.95, 1.0]),
+            "response_time_ms": rng.randrange(50, 500),
+            "force_close_count": rng.choice([0, 0, 1]),
+            "fee_stability": rng.random(),
+            "htlc_success_rate": rng.choice([0.3, 0.9, 0.95, 0.99]),
+            "warnings": rng.choice([[], ["fee_spike"], ["slow_response", "bogus"]]),
+        }
+
+    def _store_and_ingest(self, report):
+        self.db.store_peer_reputation(**report)
+        self.rep_mgr._ingest_report(dict(report))
+
+    def _assert_same(self, got, want):
+        assert got.reporters == want.reporters
+        assert got.report_count == want.report_count
+        assert got.avg_uptime == pytest.approx(want.avg_uptime)
+        assert got.avg_htlc_success == pytest.approx(want.avg_htlc_success)
+        assert got.avg_fee_stability == pytest.approx(want.avg_fee_stability)
+        assert got.reputation_score == want.reputation_score
+        assert got.warnings == want.warnings
+        assert (got.confidence, got.last_update) == (want.confidence, want.last_update)
+
+    def test_incremental_matches_bulk_rebuild_without_db_reads(self, monkeypatch):
+        import random
+        rng = random.Random(43)
+        now = int(time.time())
+        self.rep_mgr.aggregate_from_database()
+
+        monkeypatch.setattr(self.db, "get_peer_reputation_reports",
+                            MagicMock(side_effect=AssertionError("per-peer query")))
+        for i in range(150):
+            self._store_and_ingest(self._report(
+                rng, rng.choice(self.PEERS), rng.choice(self.REPORTERS), now - 3600 + i
+            ))
+        monkeypatch.undo()
+
+        rebuilt = PeerReputationManager(self.db, MagicMock(), self.our_pubkey)
+        rebuilt.aggregate_from_database()
+        assert set(rebuilt.get_all_reputations()) == set(self.PEERS)
+        for peer_id in self.PEERS:
+            self._assert_same(self.rep_mgr.get_reputation(peer_id), rebuilt.get_reputation(peer_id))
+            # Only the latest report of each reporter counts
+            assert rebuilt.get_reputation(peer_id).report_count <= len(self.REPORTERS)
+
+    def test_latest_report_per_reporter_and_outliers(self):
+        import statistics
+        now = int(time.time())
+        self.rep_mgr.aggregate_from_database()
+        peer = self.PEERS[0]
+        for i, reporter in enumerate(self.REPORTERS[1:5]):
+            self._store_and_ingest({"reporter_id": reporter, "peer_id": peer, "timestamp": now,
+                                    "uptime_pct": 0.9 + i * 0.01, "htlc_success_rate": 0.95})
+        # Reporter 1 changes its mind to an outlier; a late, older report is ignored
+        self._store_and_ingest({"reporter_id": self.REPORTERS[1], "peer_id": peer,
+                                "timestamp": now + 10, "uptime_pct": 0.1, "htlc_success_rate": 0.95})
+        self._store_and_ingest({"reporter_id": self.REPORTERS[1], "peer_id": peer,
+                                "timestamp": now - 10, "uptime_pct": 0.9, "htlc_success_rate": 0.95})
+
+        state = self.rep_mgr._report_state[peer]
+        uptimes = [r["uptime_pct"] for r in state.reports.values()]
+        assert sorted(uptimes) == [0.1, 0.91, 0.92, 0.93]
+        assert state.median_uptime() == statistics.median(uptimes)
+
+        rep = self.rep_mgr.get_reputation(peer)
+        assert self.REPORTERS[1] not in rep.reporters
+        assert rep.avg_uptime == pytest.approx(0.92)
+
+    def test_restored_peer_loaded_once_on_new_report(self, monkeypatch):
+        now = int(time.time())
+        peer = self.PEERS[1]
+        for reporter in self.REPORTERS[1:4]:
+            self.db.store_peer_reputation(reporter_id=reporter, peer_id=peer, timestamp=now,
+                                          uptime_pct=0.9, htlc_success_rate=0.9)
+        self.rep_mgr.aggregate_from_database()
+        state = self.rep_mgr.export_snapshot_state()
+
+        restarted = PeerReputationManager(self.db, MagicMock(), self.our_pubkey)
+        assert restarted.restore_snapshot_state(state) == 1
+        loads = []
+        original = self.db.get_peer_reputation_reports
+        monkeypatch.setattr(self.db, "get_peer_reputation_reports",
+                            lambda *a, **kw: loads.append(a) or original(*a, **kw))
+
+        for reporter in self.REPORTERS[4:6]:
+            report = {"reporter_id": reporter, "peer_id": peer, "timestamp": now + 1,
+                      "uptime_pct": 0.8, "htlc_success_rate": 0.9}
+            self.db.store_peer_reputation(**report)
+            restarted._ingest_report(report)
+
+        assert len(loads) == 1
+        assert restarted.get_reputation(peer).reporters == set(self.REPORTERS[1:6])
+
+    def test_refresh_without_snapshot_is_one_bulk_load(self, monkeypatch):
+        now = int(time.time())
+        for peer in self.PEERS:
+            self.db.store_peer_reputation(reporter_id=self.REPORTERS[1], peer_id=peer,
+                                          timestamp=now, uptime_pct=0.9)
+        monkeypatch.setattr(self.db, "get_peer_reputation_reports",
+                            MagicMock(side_effect=AssertionError("per-peer query")))
+        refreshed = self.rep_mgr.refresh_peers_in_range(0, self.db.get_max_peer_reputation_id())
+        assert refreshed == len(self.PEERS)
+
+    def test_stale_reporters_pruned(self):
+        now = int(time.time())
+        old = now - (REPUTATION_STALENESS_HOURS * 3600) + 60
+        peer = self.PEERS[2]
+        self.rep_mgr.aggregate_from_database()
+        self._store_and_ingest({"reporter_id": self.REPORTERS[1], "peer_id": peer,
+                                "timestamp": old, "uptime_pct": 0.2})
+        self._store_and_ingest({"reporter_id": self.REPORTERS[2], "peer_id": peer,
+                                "timestamp": now, "uptime_pct": 0.9})
+        assert self.rep_mgr.get_reputation(peer).report_count == 2
+
+        with patch("modules.peer_reputation.time.time", return_value=now + 120):
+            assert self.rep_mgr.cleanup_stale_data() == 0
+        rep = self.rep_mgr.get_reputation(peer)
+        assert rep.reporters == {self.REPORTERS[2]}
+        assert rep.avg_uptime == pytest.approx(0.9)
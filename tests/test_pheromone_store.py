@@ -0,0 +1,187 @@
+"""
+Tests for the lazy-decay pheromone store.
+
+Covers:
+- Property: read-time decay matches the old evaporation sweep semantics
+  over random update/advance sequences
+- Reads are exact and do not change state
+- Threshold cleanup via the expiry heap (fee dropped with the pheromone)
+- Heap compaction under repeated updates
+- Snapshot round trip keeps the decay rate
+"""
+
+import math
+import random
+import time
+from collections import defaultdict
+
+import pytest
+
+from modules.fee_coordination import (
+    BASE_EVAPORATION_RATE,
+    PHEROMONE_DEPOSIT_SCALE,
+    PHEROMONE_MIN_LEVEL,
+    AdaptiveFeeController,
+    PheromoneStore,
+)
+
+
+class SweepReference:
+    """
+    The previous eagerly-swept pheromone model: levels decayed on update
+    and by a periodic evaporate_all_pheromones() pass.
+    """
+
+    def __init__(self, rates):
+        self.rates = rates
+        self.pheromone = defaultdict(float)
+        self.fee = {}
+        self.last_update = {}
+
+    def update(self, channel_id, fee, success, revenue, now):
+        rate = self.rates[channel_id]
+        if channel_id in self.last_update:
+            hours = (now - self.last_update[channel_id]) / 3600.0
+            if hours > 0 and self.pheromone[channel_id] > 0:
+                self.pheromone[channel_id] *= math.pow(1 - rate, hours)
+        elif self.pheromone[channel_id] > 0:
+            self.pheromone[channel_id] *= (1 - rate)
+        self.last_update[channel_id] = now
+        if success:
+            self.pheromone[channel_id] += revenue * PHEROMONE_DEPOSIT_SCALE
+            self.fee[channel_id] = fee
+
+    def sweep(self, now):
+        for channel_id in list(self.pheromone):
+            if self.pheromone[channel_id] <= 0:
+                continue
+            hours = (now - self.last_update.get(channel_id, now)) / 3600.0
+            if hours > 0:
+                old = self.pheromone[channel_id]
+                self.pheromone[channel_id] *= math.pow(1 - self.rates[channel_id], hours)
+                self.last_update[channel_id] = now
+                if old > PHEROMONE_MIN_LEVEL and self.pheromone[channel_id] <= PHEROMONE_MIN_LEVEL:
+                    del self.pheromone[channel_id]
+                    self.fee.pop(channel_id, None)
+                    self.last_update.pop(channel_id, None)
+
+    def levels(self):
+        return {c: v for c, v in self.pheromone.items() if v > PHEROMONE_MIN_LEVEL}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+def _controller(rng, channels):
+    """Controller with a fixed, per-channel evaporation rate."""
+    controller = AdaptiveFeeController()
+    for channel_id in channels:
+        controller.update_velocity(channel_id, rng.choice([0.0, 0.02, 0.05, 0.1]))
+    rates = {c: controller.calculate_evaporation_rate(c) for c in channels}
+    return controller, rates
+
+
+class TestSweepEquivalence:
+
+    @pytest.mark.parametrize("seed", range(8))
+    def test_matches_sweep_semantics(self, clock, seed):
+        rng = random.Random(seed)
+        channels = [f"{i}x1x0" for i in range(6)]
+        controller, rates = _controller(rng, channels)
+        reference = SweepReference(rates)
+
+        for _ in range(300):
+            clock[0] += rng.choice([0, 60, 900, 3600, 6 * 3600, 30 * 3600])
+            # A read at time t equals a sweep at t followed by a read
+            reference.sweep(clock[0])
+
+            if rng.random() < 0.6:
+                channel_id = rng.choice(channels)
+                success = rng.random() < 0.7
+                revenue = rng.randrange(20, 20_000)
+                fee = rng.randrange(1, 2000)
+                reference.update(channel_id, fee, success, revenue, clock[0])
+                controller.update_pheromone(channel_id, fee, success, revenue)
+
+            expected = reference.levels()
+            got = controller.get_all_pheromone_levels()
+            assert set(got) == set(expected)
+            for channel_id, level in expected.items():
+                assert got[channel_id] == pytest.approx(level, rel=1e-9)
+                assert controller.get_pheromone_level(channel_id) == pytest.approx(level, rel=1e-9)
+            assert controller._pheromone_fee == {
+                c: f for c, f in reference.fee.items() if c in expected
+            }
+
+    def test_reads_are_exact_without_sweeps(self, clock):
+        controller = AdaptiveFeeController()
+        controller.update_pheromone("1x1x0", 300, True, 20_000)
+        start = controller.get_pheromone_level("1x1x0")
+        assert start == pytest.approx(20.0)
+
+        elapsed = 0.0
+        for hours in (0.5, 1, 3, 7.25):
+            clock[0] += hours * 3600
+            elapsed += hours
+            want = start * (1 - BASE_EVAPORATION_RATE) ** elapsed
+            # Repeated reads see the same value; reading never compounds decay
+            assert controller.get_pheromone_level("1x1x0") == pytest.approx(want)
+            assert controller.get_pheromone_level("1x1x0") == pytest.approx(want)
+
+
+class TestThresholdCleanup:
+
+    def test_expiry_heap_drops_pheromone_and_fee(self, clock):
+        controller = AdaptiveFeeController()
+        controller.set_channel_peer_mapping("1x1x0", "03aa")
+        controller.update_pheromone("1x1x0", 300, True, 1000)  # level 1.0
+        hours_to_expiry = math.log(PHEROMONE_MIN_LEVEL) / math.log(1 - BASE_EVAPORATION_RATE)
+
+        clock[0] += (hours_to_expiry - 0.01) * 3600
+        assert controller.evaporate_all_pheromones() == 0
+        assert controller.get_pheromone_level("1x1x0") > PHEROMONE_MIN_LEVEL
+
+        clock[0] += 0.02 * 3600
+        assert controller.get_pheromone_level("1x1x0") == 0.0
+        assert controller.get_all_pheromone_levels() == {}
+        assert "1x1x0" not in controller._pheromone_fee
+        assert controller.evaporate_all_pheromones() == 0
+
+    def test_superseded_heap_entries_compacted(self, clock):
+        store = PheromoneStore()
+        for i in range(5000):
+            store.set("1x1x0", 5.0 + i, clock[0], 0.2)
+        assert len(store._expiry_heap) <= 2 * len(store) + 64
+        clock[0] += 365 * 86400
+        assert store.expire(clock[0]) == ["1x1x0"]
+        assert len(store) == 0
+
+    def test_unreferenced_levels_do_not_decay(self, clock):
+        store = PheromoneStore()
+        store["1x1x0"] = 0.005
+        clock[0] += 86400
+        assert store["1x1x0"] == 0.005
+        assert store.expire(clock[0]) == []
+
+
+class TestSnapshotRoundTrip:
+
+    def test_restore_keeps_rate_and_level(self, clock):
+        rng = random.Random(5)
+        controller, rates = _controller(rng, ["1x1x0", "2x1x0"])
+        controller.update_velocity("2x1x0", 0.1)
+        controller.update_pheromone("1x1x0", 200, True, 5000)
+        controller.update_pheromone("2x1x0", 400, True, 8000)
+        clock[0] += 2 * 3600
+        columns = controller.export_snapshot_state()
+
+        restored = AdaptiveFeeController()  # No velocity: a different default rate
+        assert restored.restore_snapshot_state(columns) == 2
+        clock[0] += 5 * 3600
+        assert restored.get_all_pheromone_levels() == pytest.approx(
+            controller.get_all_pheromone_levels())
+        assert restored._pheromone_fee == {"1x1x0": 200, "2x1x0": 400}
@@ -0,0 +1,212 @@
+"""
+Tests for bulk policy reconciliation between hive membership and
+cl-revenue-ops.
+
+Covers:
+- Drift detection for members and former members; neophytes left alone
+- Only drifted policies are applied; dry-run changes nothing
+- A clean cycle costs a constant number of RPCs regardless of size
+- Bulk zero-fee verification matches the per-peer check
+"""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Mock pyln.client before importing modules (no-op if another test did)
+if "pyln.client" not in sys.modules:
+    class MockRpcError(Exception):
+        """Mock RpcError to match pyln.client.RpcError behavior."""
+        pass
+
+    mock_pyln = MagicMock()
+    mock_pyln.Plugin = MagicMock
+    mock_pyln.RpcError = MockRpcError
+    sys.modules["pyln"] = mock_pyln
+    sys.modules["pyln.client"] = mock_pyln
+
+from modules.bridge import Bridge, BridgeStatus
+from modules.policy_reconciler import PolicyReconciler
+from modules.rpc_commands import HiveContext, reconcile_policies
+
+
+OUR = "02" + "00" * 32
+
+
+def _peer(i):
+    return "03" + f"{i:02x}" * 32
+
+
+class FakeNodeRpc:
+    """RPC proxy double holding revenue-ops policies and channel gossip."""
+
+    def __init__(self, policies, fees=None):
+        self.policies = policies          # peer_id -> policy dict
+        self.fees = fees or {}            # peer_id -> (base_msat, ppm) for our direction
+        self.calls = []
+
+    def call(self, method, payload=None):
+        self.calls.append(method)
+        assert method == "revenue-policy"
+        if payload["action"] == "list":
+            return {"policies": [dict(p, peer_id=k) for k, p in self.policies.items()]}
+        if payload["action"] == "set":
+            policy = {"strategy": payload["strategy"]}
+            if "rebalance" in payload:
+                policy["rebalance_mode"] = payload["rebalance"]
+            self.policies[payload["peer_id"]] = policy
+            return {"status": "success"}
+        raise AssertionError(payload)
+
+    def getinfo(self):
+        self.calls.append("getinfo")
+        return {"id": OUR}
+
+    def listpeerchannels(self, id=None):
+        self.calls.append("listpeerchannels")
+        channels = [{"peer_id": p, "short_channel_id": f"{i}x1x0", "state": "CHANNELD_NORMAL"}
+                    for i, p in enumerate(self.fees, start=1)]
+        if id is not None:
+            channels = [c for c in channels if c["peer_id"] == id]
+        return {"channels": channels}
+
+    def listchannels(self, short_channel_id=None, source=None):
+        self.calls.append("listchannels")
+        channels = []
+        for i, (peer, (base, ppm)) in enumerate(self.fees.items(), start=1):
+            scid = f"{i}x1x0"
+            channels.append({"short_channel_id": scid, "source": OUR,
+                             "base_fee_millisatoshi": base, "fee_per_millionth": ppm})
+            channels.append({"short_channel_id": scid, "source": peer,
+                             "base_fee_millisatoshi": 1000, "fee_per_millionth": 500})
+        if short_channel_id is not None:
+            channels = [c for c in channels if c["short_channel_id"] == short_channel_id]
+        if source is not None:
+            channels = [c for c in channels if c["source"] == source]
+        return {"channels": channels}
+
+
+def _setup(members, policies, fees=None):
+    rpc = FakeNodeRpc(policies, fees)
+    bridge = Bridge(rpc, MagicMock())
+    bridge._status = BridgeStatus.ENABLED
+    db = MagicMock()
+    db.get_all_members.return_value = [{"peer_id": p, "tier": t} for p, t in members.items()]
+    return rpc, bridge, PolicyReconciler(bridge, db, OUR)
+
+
+HIVE = {"strategy": "hive", "rebalance_mode": "enabled"}
+
+
+class TestPolicyReconciler:
+
+    def test_detects_and_applies_only_drift(self):
+        members = {OUR: "member", _peer(1): "member", _peer(2): "member",
+                   _peer(3): "neophyte", _peer(4): "member"}
+        policies = {
+            _peer(1): dict(HIVE),                                  # in sync
+            _peer(2): {"strategy": "dynamic"},                     # member lost hive
+            _peer(3): dict(HIVE),                                  # neophyte with hive, kept
+            _peer(5): dict(HIVE),                                  # former member
+            _peer(6): {"strategy": "static", "fee_ppm": 50},       # advisor policy, untouched
+        }
+        rpc, bridge, reconciler = _setup(members, policies)
+
+        report = reconciler.reconcile(verify_fees=False)
+        assert sorted((d.peer_id, d.desired_strategy, d.reason) for d in report.drift) == [
+            (_peer(2), "hive", "member_without_hive_strategy"),
+            (_peer(4), "hive", "missing_policy"),
+            (_peer(5), "dynamic", "non_member_with_hive_strategy"),
+        ]
+        assert report.applied == 3 and report.failed == 0
+        assert rpc.calls.count("revenue-policy") == 1 + 3
+        assert rpc.policies[_peer(3)] == HIVE
+        assert rpc.policies[_peer(6)] == {"strategy": "static", "fee_ppm": 50}
+        assert OUR not in rpc.policies
+
+        # Second pass: nothing left to do
+        rpc.calls.clear()
+        report = reconciler.reconcile(verify_fees=False)
+        assert report.in_sync
+        assert rpc.calls == ["revenue-policy"]
+
+    def test_neophyte_policy_left_alone(self):
+        members = {_peer(1): "neophyte", _peer(2): "neophyte"}
+        policies = {_peer(1): dict(HIVE), _peer(2): {"strategy": "dynamic"}}
+        rpc, bridge, reconciler = _setup(members, policies)
+        report = reconciler.reconcile(verify_fees=False)
+        assert report.in_sync
+        assert rpc.calls == ["revenue-policy"]
+
+    def test_dry_run_changes_nothing(self):
+        members = {_peer(1): "member"}
+        rpc, bridge, reconciler = _setup(members, {_peer(1): {"strategy": "dynamic"}})
+        report = reconciler.reconcile(dry_run=True, verify_fees=False)
+        assert [d.applied for d in report.drift] == [None]
+        assert rpc.policies[_peer(1)] == {"strategy": "dynamic"}
+        assert rpc.calls == ["revenue-policy"]
+
+    def test_rate_limited_apply_reported_as_failed(self):
+        members = {_peer(1): "member"}
+        rpc, bridge, reconciler = _setup(members, {_peer(1): {"strategy": "dynamic"}})
+        bridge._policy_last_change[_peer(1)] = time.time()
+        report = reconciler.reconcile(verify_fees=False)
+        assert report.failed == 1 and report.drift[0].applied is False
+        # Startup sync bypasses the rate limit
+        report = reconciler.reconcile(verify_fees=False, bypass_rate_limit=True)
+        assert report.applied == 1
+
+    def test_unavailable_policies(self):
+        rpc, bridge, reconciler = _setup({_peer(1): "member"}, {})
+        bridge._status = BridgeStatus.DISABLED
+        report = reconciler.reconcile()
+        assert report.error and not report.in_sync
+
+    @pytest.mark.parametrize("size", [5, 50])
+    def test_clean_cycle_costs_constant_rpcs(self, size):
+        members = {_peer(i): "member" for i in range(1, size + 1)}
+        policies = {p: dict(HIVE) for p in members}
+        fees = {p: (0, 0) for p in members}
+        rpc, bridge, reconciler = _setup(members, policies, fees)
+
+        report = reconciler.reconcile()
+        assert report.in_sync
+        assert len(rpc.calls) == 4  # list + getinfo + listpeerchannels + listchannels
+
+
+class TestBulkZeroFeeVerification:
+
+    def test_matches_per_peer_check(self):
+        fees = {_peer(1): (0, 0), _peer(2): (0, 10), _peer(3): (1000, 0)}
+        rpc, bridge, _ = _setup({}, {}, fees)
+        peers = [_peer(1), _peer(2), _peer(3), _peer(4)]
+
+        bulk = bridge.verify_hive_channels_zero_fees(peers)
+        assert bulk == {p: bridge.verify_hive_channel_zero_fees(p) for p in peers}
+        assert bulk[_peer(2)] == (False, "non_zero_fees: base=0msat, ppm=10")
+        assert bulk[_peer(4)] == (False, "no_channel")
+
+    def test_reconcile_reports_fee_violations(self):
+        members = {_peer(1): "member", _peer(2): "member", _peer(3): "neophyte"}
+        policies = {_peer(1): dict(HIVE), _peer(2): dict(HIVE)}
+        fees = {_peer(1): (0, 0), _peer(2): (0, 25), _peer(3): (1000, 100)}
+        rpc, bridge, reconciler = _setup(members, policies, fees)
+        report = reconciler.reconcile()
+        # Neophytes are not expected to run zero fees
+        assert report.fee_violations == {_peer(2): "non_zero_fees: base=0msat, ppm=25"}
+
+
+def test_rpc_dry_run_default():
+    members = {_peer(1): "member"}
+    rpc, bridge, reconciler = _setup(members, {})
+    ctx = HiveContext(database=MagicMock(), config=None, safe_plugin=None,
+                      our_pubkey=OUR, bridge=bridge, policy_reconciler=reconciler)
+    result = reconcile_policies(ctx)
+    assert result["dry_run"] is True
+    assert result["drift_count"] == 1
+    assert rpc.policies == {}
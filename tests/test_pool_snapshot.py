@@ -0,0 +1,214 @@
+"""
+Tests for bulk contribution snapshotting in the routing pool.
+
+Covers:
+- The single-pass snapshot matches the per-member computation it replaces,
+  with and without the shared network metrics calculator
+- Inputs are read with one bulk lookup per source and the snapshot is
+  written in one transaction
+- Pool and member status are served from the stored period snapshot
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Mock pyln.client before importing modules (no-op if another test did)
+if "pyln.client" not in sys.modules:
+    class MockRpcError(Exception):
+        """Mock RpcError to match pyln.client.RpcError behavior."""
+        pass
+
+    mock_pyln = MagicMock()
+    mock_pyln.Plugin = MagicMock
+    mock_pyln.RpcError = MockRpcError
+    sys.modules["pyln"] = mock_pyln
+    sys.modules["pyln.client"] = mock_pyln
+
+from modules import network_metrics
+from modules.database import HiveDatabase
+from modules.health_aggregator import HealthScoreAggregator
+from modules.network_metrics import MemberPositionMetrics
+from modules.routing_pool import MAX_CENTRALITY, RoutingPool
+from modules.state_manager import HivePeerState, StateManager
+
+
+PERIOD = "2026-W41"
+
+
+def _peer(i):
+    return "02" + f"{i:064x}"
+
+
+@pytest.fixture
+def fleet(tmp_path, monkeypatch):
+    """Members with gossiped topology, ledger activity and health records."""
+    monkeypatch.setattr(network_metrics, "get_calculator", lambda: None)
+    rng = random.Random(8)
+    db = HiveDatabase(str(tmp_path / "pool.db"), Mock())
+    db.initialize()
+    state_manager = StateManager(db)
+    externals = [f"03{i:064x}" for i in range(40)]
+    now = int(time.time())
+    for i in range(15):
+        peer_id = _peer(i)
+        db.add_member(peer_id, tier="member")
+        db.update_member(peer_id, uptime_pct=rng.choice([1.0, 0.97, 0.92, 0.6, 99.5]))
+        for _ in range(rng.randrange(6)):
+            db.record_contribution(peer_id, rng.choice(["forwarded", "received"]),
+                                   rng.randrange(1_000_000))
+        db.update_member_health(peer_id, rng.randrange(100), 50, 50, 50)
+        if i % 5 == 4:
+            continue  # No gossiped state yet
+        state_manager._local_state[peer_id] = HivePeerState(
+            peer_id=peer_id, capacity_sats=rng.randrange(1, 30) * 1_000_000,
+            available_sats=0, fee_policy={}, topology=rng.sample(externals, rng.randrange(0, 12)),
+            version=1, last_update=now,
+        )
+    pool = RoutingPool(db, MagicMock(), state_manager=state_manager,
+                       health_aggregator=HealthScoreAggregator(db))
+    return db, state_manager, pool
+
+
+def _per_member_snapshot(pool, period, calculator=None):
+    """The original per-member snapshot loop (scores only, nothing stored)."""
+    db, state_manager = pool.db, pool.state_manager
+    members = db.get_all_members()
+
+    def local_position(member_id):
+        state = state_manager.get_peer_state(member_id)
+        topology = set(state.topology) if state else set()
+        if not topology:
+            return (0.01, 0, 0.0)
+        others, sizes = set(), []
+        for member in db.get_all_members():
+            other = state_manager.get_peer_state(member["peer_id"])
+            if not other:
+                continue
+            sizes.append(len(set(other.topology)))
+            if member["peer_id"] != member_id:
+                others.update(other.topology)
+        unique = len(topology - others)
+        bridge = min(1.0, unique / len(topology))
+        avg = sum(sizes) / len(sizes)
+        return (min(MAX_CENTRALITY, 0.01 * (len(topology) / avg) * (1.0 + bridge * 0.5)), unique, bridge)
+
+    def operations(member_id):
+        uptime = db.get_member(member_id).get("uptime_pct", 1.0)
+        uptime = uptime / 100.0 if uptime > 1.0 else uptime
+        stats = db.get_contribution_stats(member_id, window_days=30)
+        ratio = stats["forwarded"] / stats["received"] if stats["received"] > 0 else 1.0
+        success = max(0.5, min(0.95, uptime * 0.9 + min(0.10, (min(ratio, 2.0) - 0.5) * 0.1)))
+        response = 30.0 if uptime >= 0.99 else 50.0 if uptime >= 0.95 else 80.0 if uptime >= 0.90 else 120.0
+        if stats["forwarded"] > 1000000:
+            response = max(20.0, response - 20.0)
+        elif stats["forwarded"] > 100000:
+            response = max(20.0, response - 10.0)
+        return success, response
+
+    contributions = []
+    for member in members:
+        member_id = member["peer_id"]
+        state = state_manager.get_peer_state(member_id)
+        metrics = calculator.get_member_metrics(member_id) if calculator else None
+        position = ((metrics.external_centrality, metrics.unique_peers, metrics.bridge_score)
+                    if metrics else local_position(member_id))
+        success, response = operations(member_id)
+        contributions.append(pool.calculate_contribution(
+            member_id, period, state.capacity_sats if state else 0, member.get("uptime_pct", 1.0),
+            *position, success_rate=success, response_time_ms=response))
+
+    total_weighted = sum(c.weighted_capacity_sats for c in contributions)
+    for c in contributions:
+        c.pool_share = ((c.weighted_capacity_sats / max(1, total_weighted)) * 0.70 +
+                        c.position_score * 0.20 + c.operations_score * 0.10) / 1.0
+    total = sum(c.pool_share for c in contributions)
+    for c in contributions:
+        c.pool_share /= total
+    return contributions
+
+
+class TestBulkSnapshot:
+
+    def test_matches_per_member_computation(self, fleet):
+        _, _, pool = fleet
+        expected = _per_member_snapshot(pool, PERIOD)
+        got = pool.snapshot_contributions(PERIOD)
+        assert [c.member_id for c in got] == [c.member_id for c in expected]
+        for g, e in zip(got, expected):
+            assert g.__dict__ == pytest.approx(e.__dict__, rel=1e-12)
+        assert any(c.unique_peers for c in got)
+
+    def test_calculator_metrics_with_local_fallback(self, fleet):
+        _, _, pool = fleet
+        calculator = Mock()
+        metrics = {
+            _peer(i): MemberPositionMetrics(member_id=_peer(i), external_centrality=0.05,
+                                            unique_peers=7, bridge_score=0.4)
+            for i in range(0, 15, 2)
+        }
+        calculator.get_all_metrics.return_value = metrics
+        calculator.get_member_metrics.side_effect = metrics.get
+        pool.metrics_calculator = calculator
+
+        expected = _per_member_snapshot(pool, PERIOD, calculator)
+        got = pool.snapshot_contributions(PERIOD)
+        for g, e in zip(got, expected):
+            assert g.__dict__ == pytest.approx(e.__dict__, rel=1e-12)
+        assert calculator.get_all_metrics.call_count == 1
+        assert calculator.get_member_metrics.call_count == 15  # All from the reference
+
+    def test_one_bulk_read_per_source_and_one_transaction(self, fleet, monkeypatch):
+        db, state_manager, pool = fleet
+        for name in ("get_member", "get_contribution_stats", "record_pool_contribution"):
+            monkeypatch.setattr(db, name, Mock(side_effect=AssertionError(name)))
+        monkeypatch.setattr(state_manager, "get_peer_state",
+                            Mock(side_effect=AssertionError("get_peer_state")))
+        transactions = []
+        original = db.transaction
+        monkeypatch.setattr(db, "transaction",
+                            lambda: transactions.append(1) or original())
+
+        contributions = pool.snapshot_contributions(PERIOD)
+        assert transactions == [1]
+        stored = {c["member_id"]: c["pool_share"] for c in db.get_pool_contributions(PERIOD)}
+        assert stored == pytest.approx({c.member_id: c.pool_share for c in contributions})
+        assert sum(stored.values()) == pytest.approx(1.0)
+
+        # Re-snapshotting replaces the period's rows
+        pool.snapshot_contributions(PERIOD)
+        assert len(db.get_pool_contributions(PERIOD)) == len(contributions)
+
+
+class TestStatusFromSnapshot:
+
+    def test_status_served_from_stored_snapshot(self, fleet, monkeypatch):
+        db, _, pool = fleet
+        monkeypatch.setattr(pool, "_current_period", lambda: PERIOD)
+        monkeypatch.setattr(db, "_period_to_timestamps",
+                            lambda period: (0, int(time.time()) + 60))
+        for i in range(4):
+            pool.record_revenue(_peer(i), 2_500)
+
+        snapshots = []
+        original = pool.snapshot_contributions
+        monkeypatch.setattr(pool, "snapshot_contributions",
+                            lambda period=None: snapshots.append(period) or original(period))
+
+        status = pool.get_pool_status()
+        member = pool.get_member_status(_peer(3))
+        pool.get_pool_status()
+        assert snapshots == [PERIOD]  # Taken once, then served from storage
+
+        projected = {c["member_id_full"]: c["projected_distribution_sats"]
+                     for c in status["contributions"]}
+        assert projected == pool.calculate_distribution(PERIOD)
+        assert sum(projected.values()) == 10_000
+        assert member["projected_distribution_sats"] == projected[_peer(3)]
+        assert member["current_contribution"]["member_id"] == _peer(3)
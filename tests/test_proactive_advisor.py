@@ -333,7 +333,7 @@ class TestOpportunityScanner:
             }
         }
 
-        opportunities = asyncio.get_event_loop().run_until_complete(
+        opportunities = asyncio.run(
             opportunity_scanner._scan_velocity_alerts("test-node", state)
         )
 
@@ -358,7 +358,7 @@ class TestOpportunityScanner:
             }
         }
 
-        opportunities = asyncio.get_event_loop().run_until_complete(
+        opportunities = asyncio.run(
             opportunity_scanner._scan_profitability("test-node", state)
         )
 
@@ -383,7 +383,7 @@ class TestOpportunityScanner:
             ]
         }
 
-        opportunities = asyncio.get_event_loop().run_until_complete(
+        opportunities = asyncio.run(
             opportunity_scanner._scan_imbalanced_channels("test-node", state)
         )
 
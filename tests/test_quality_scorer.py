@@ -0,0 +1,210 @@
+"""
+Tests for set-based peer event summaries and batch quality scoring.
+
+Covers:
+- Grouped summaries match the row-by-row aggregation they replace
+- The summary query is served from the covering index
+- Batch scoring issues one summary query and matches per-peer scoring
+- The optional per-day rollup stays in step with inserts and pruning
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Mock pyln.client before importing modules (no-op if another test did)
+if "pyln.client" not in sys.modules:
+    class MockRpcError(Exception):
+        """Mock RpcError to match pyln.client.RpcError behavior."""
+        pass
+
+    mock_pyln = MagicMock()
+    mock_pyln.Plugin = MagicMock
+    mock_pyln.RpcError = MockRpcError
+    sys.modules["pyln"] = mock_pyln
+    sys.modules["pyln.client"] = mock_pyln
+
+from modules.database import HiveDatabase, PEER_EVENT_SUM_COLUMNS, SQL_IN_CLAUSE_CHUNK
+from modules.quality_scorer import PeerQualityScorer
+
+
+EVENT_TYPES = ["channel_open", "remote_close", "local_close", "mutual_close", "quality_report"]
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = HiveDatabase(str(tmp_path / "test.db"), Mock())
+    database.initialize()
+    return database
+
+
+def _peer(i):
+    return "03" + f"{i:064x}"
+
+
+def _store_events(db, rng, peers, count, now):
+    for _ in range(count):
+        event_type = rng.choice(EVENT_TYPES)
+        db.store_peer_event(
+            peer_id=rng.choice(peers),
+            reporter_id=f"02{rng.randrange(5):064x}",
+            event_type=event_type,
+            timestamp=now - rng.randrange(120 * 86400),
+            duration_days=rng.choice([0, 3, 45, 200]),
+            total_revenue_sats=rng.randrange(5000),
+            total_rebalance_cost_sats=rng.randrange(1000),
+            net_pnl_sats=rng.randrange(-2000, 4000),
+            forward_count=rng.randrange(300),
+            routing_score=rng.choice([0.0, 0.2, 0.5, 0.9]),
+            profitability_score=rng.choice([0.0, 0.4, 0.5, 0.8]),
+            closer=rng.choice([None, "remote", "local", "mutual"]) if event_type.endswith("_close") else None,
+        )
+
+
+def _row_by_row_summary(db, peer_id, days):
+    """The original per-peer aggregation over loaded event rows."""
+    events = [e for e in db.get_peer_events(peer_id=peer_id, days=days, limit=100000)]
+    if not events:
+        return {"event_count": 0, "reporters": []}
+    closes = [e for e in events if e["event_type"].endswith("_close")]
+    routing = [e["routing_score"] for e in events if e["routing_score"]]
+    profit = [e["profitability_score"] for e in events if e["profitability_score"]]
+    durations = [e["duration_days"] for e in closes if e["duration_days"]]
+    reporter_scores = {}
+    for reporter in {e["reporter_id"] for e in events}:
+        mine = [e for e in events if e["reporter_id"] == reporter]
+        r_routing = [e["routing_score"] for e in mine if e["routing_score"]]
+        r_profit = [e["profitability_score"] for e in mine if e["profitability_score"]]
+        reporter_scores[reporter] = {
+            "event_count": len(mine),
+            "avg_routing_score": sum(r_routing) / len(r_routing) if r_routing else 0.5,
+            "avg_profitability_score": sum(r_profit) / len(r_profit) if r_profit else 0.5,
+        }
+    return {
+        "event_count": len(events),
+        "open_count": sum(e["event_type"] == "channel_open" for e in events),
+        "close_count": len(closes),
+        "remote_close_count": sum(e["closer"] == "remote" for e in closes),
+        "local_close_count": sum(e["closer"] == "local" for e in closes),
+        "mutual_close_count": sum(e["closer"] == "mutual" for e in closes),
+        "total_revenue_sats": sum(e["total_revenue_sats"] for e in closes),
+        "total_rebalance_cost_sats": sum(e["total_rebalance_cost_sats"] for e in closes),
+        "total_net_pnl_sats": sum(e["net_pnl_sats"] for e in closes),
+        "total_forward_count": sum(e["forward_count"] for e in closes),
+        "avg_routing_score": sum(routing) / len(routing) if routing else 0.5,
+        "avg_profitability_score": sum(profit) / len(profit) if profit else 0.5,
+        "avg_duration_days": sum(durations) / len(durations) if durations else 0,
+        "reporters": sorted(reporter_scores),
+        "reporter_scores": reporter_scores,
+    }
+
+
+def _assert_summary_matches(got, want):
+    got = dict(got, reporters=sorted(got["reporters"]))
+    for key, value in want.items():
+        if key == "reporter_scores":
+            assert set(got[key]) == set(value)
+            for reporter, scores in value.items():
+                assert got[key][reporter] == pytest.approx(scores)
+        else:
+            assert got[key] == pytest.approx(value), key
+
+
+class TestPeerEventSummaries:
+
+    def test_matches_row_by_row_aggregation(self, db):
+        rng = random.Random(42)
+        peers = [_peer(i) for i in range(12)]
+        _store_events(db, rng, peers, 600, int(time.time()))
+
+        summaries = db.get_peer_event_summaries(peers + [_peer(99)], days=90)
+        for peer_id in peers + [_peer(99)]:
+            _assert_summary_matches(summaries[peer_id], _row_by_row_summary(db, peer_id, 90))
+            assert db.get_peer_event_summary(peer_id, days=90)["event_count"] == \
+                summaries[peer_id]["event_count"]
+
+        # Without a peer list, every peer with events in the window
+        assert set(db.get_peer_event_summaries(days=90)) == set(db.get_peers_with_events(days=90))
+
+    def test_summary_query_uses_covering_index(self, db):
+        expr = PEER_EVENT_SUM_COLUMNS[-1][1].format(e="e")
+        plan = " ".join(row["detail"] for row in db._get_connection().execute(
+            f"EXPLAIN QUERY PLAN SELECT peer_id, reporter_id, SUM({expr}) FROM peer_events AS e "
+            f"WHERE e.timestamp > 0 AND peer_id IN (?, ?) GROUP BY peer_id, reporter_id",
+            (_peer(1), _peer(2))
+        ))
+        assert "COVERING INDEX idx_peer_events_summary" in plan
+
+    def test_large_peer_lists_chunked(self, db):
+        now = int(time.time())
+        peers = [_peer(i) for i in range(SQL_IN_CLAUSE_CHUNK * 2 + 7)]
+        for peer_id in peers[::50]:
+            db.store_peer_event(peer_id=peer_id, reporter_id="02aa", event_type="channel_open",
+                                timestamp=now)
+        summaries = db.get_peer_event_summaries(peers)
+        assert len(summaries) == len(peers)
+        assert sum(s["event_count"] for s in summaries.values()) == len(peers[::50])
+
+
+class TestBatchScoring:
+
+    def test_single_query_and_same_scores(self, db, monkeypatch):
+        rng = random.Random(7)
+        peers = [_peer(i) for i in range(30)]
+        _store_events(db, rng, peers, 400, int(time.time()))
+        scorer = PeerQualityScorer(db)
+        expected = {p: scorer.calculate_score(p).overall_score for p in peers}
+
+        calls = []
+        original = db.get_peer_event_summaries
+        monkeypatch.setattr(db, "get_peer_event_summaries",
+                            lambda *a, **kw: calls.append(a) or original(*a, **kw))
+        monkeypatch.setattr(db, "get_peer_event_summary",
+                            Mock(side_effect=AssertionError("per-peer query")))
+
+        results = scorer.calculate_scores_batch(peers)
+        assert len(calls) == 1
+        assert {r.peer_id: r.overall_score for r in results} == pytest.approx(expected)
+        assert [r.overall_score for r in results] == sorted(expected.values(), reverse=True)
+
+        scored = scorer.get_scored_peers()
+        assert len(calls) == 2
+        assert {r.peer_id for r in scored} == set(db.get_peers_with_events())
+
+
+class TestPeerEventRollup:
+
+    def test_rollup_tracks_inserts_and_pruning(self, db):
+        rng = random.Random(3)
+        peers = [_peer(i) for i in range(6)]
+        now = int(time.time())
+        _store_events(db, rng, peers, 200, now)
+        assert not db.is_peer_event_rollup_enabled()
+
+        assert db.enable_peer_event_rollup() > 0
+        assert db.enable_peer_event_rollup() > 0  # Idempotent rebuild
+        _store_events(db, rng, peers, 200, now)
+
+        # Whole days only: a window covering all events matches exactly
+        exact = db.get_peer_event_summaries(peers, days=200)
+        rolled = db.get_peer_event_summaries(peers, days=200, use_rollup=True)
+        for peer_id in peers:
+            _assert_summary_matches(rolled[peer_id], _row_by_row_summary(db, peer_id, 200))
+            assert rolled[peer_id]["event_count"] == exact[peer_id]["event_count"]
+
+        db.prune_peer_events(older_than_days=30)
+        oldest_day = db._get_connection().execute(
+            "SELECT MIN(day) AS d FROM peer_event_daily").fetchone()["d"]
+        assert oldest_day >= (now - 30 * 86400) // 86400
+
+        db.disable_peer_event_rollup()
+        assert not db.is_peer_event_rollup_enabled()
+        db.store_peer_event(peer_id=peers[0], reporter_id="02aa", event_type="channel_open",
+                            timestamp=now)
+        assert db.get_peer_event_summaries(peers, use_rollup=True)[peers[0]]["event_count"] == 0
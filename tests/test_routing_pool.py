@@ -71,6 +71,11 @@ class MockDatabase:
     def record_pool_contribution(self, **kwargs):
         self.pool_contributions.append(kwargs)
 
+    def record_pool_contributions(self, period, contributions):
+        for c in contributions:
+            self.record_pool_contribution(period=period, **c)
+        return len(contributions)
+
     def get_pool_contributions(self, period):
         return self.pool_contributions
 
@@ -103,8 +108,12 @@ class MockStateManager:
     def get_peer_state(self, peer_id):
         return self.peer_states.get(peer_id)
 
+    def get_all_peer_states(self):
+        return list(self.peer_states.values())
+
     def set_peer_state(self, peer_id, capacity=0, topology=None):
         state = MagicMock()
+        state.peer_id = peer_id
         state.capacity_sats = capacity
         state.topology = topology or []
         self.peer_states[peer_id] = state
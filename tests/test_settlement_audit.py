@@ -0,0 +1,271 @@
+"""
+Tests for the settlement replay and audit engine.
+
+Covers:
+- A consistent distributed period (proposal, votes, executions, settled
+  record) replays cleanly
+- Tampered history is reported as mismatches, rounding drift and missing
+  payments
+- Proposals without a contributions snapshot fall back to fee reports
+- Legacy periods replay fair shares and payments from recorded rows
+- The batch audit covers every distributed and legacy period without
+  touching the live settlement context cache
+"""
+
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Mock pyln.client before importing modules (no-op if another test did)
+if "pyln.client" not in sys.modules:
+    class MockRpcError(Exception):
+        """Mock RpcError to match pyln.client.RpcError behavior."""
+        pass
+
+    mock_pyln = MagicMock()
+    mock_pyln.Plugin = MagicMock
+    mock_pyln.RpcError = MockRpcError
+    sys.modules["pyln"] = mock_pyln
+    sys.modules["pyln.client"] = mock_pyln
+
+from modules.database import HiveDatabase
+from modules.settlement import MemberContribution, SettlementManager
+from modules.settlement_audit import (
+    CATEGORY_MISMATCH,
+    CATEGORY_MISSING_PAYMENT,
+    CATEGORY_ROUNDING_DRIFT,
+    SettlementAuditor,
+)
+from modules.state_manager import HivePeerState, StateManager
+
+
+PERIOD = "2026-40"
+
+
+def _peer(i):
+    return "02" + f"{i:064x}"
+
+
+@pytest.fixture
+def fleet(tmp_path):
+    """A fixture database with members, fee reports and gossiped capacity."""
+    rng = random.Random(11)
+    db = HiveDatabase(str(tmp_path / "audit.db"), Mock())
+    db.initialize()
+    manager = SettlementManager(db, MagicMock())
+    manager.initialize_tables()
+    state_manager = StateManager(db)
+    now = int(time.time())
+    for i in range(8):
+        peer_id = _peer(i)
+        db.add_member(peer_id, tier="member")
+        db.save_fee_report(peer_id, PERIOD, rng.randrange(100_000), rng.randrange(800),
+                           now - 86400, now, rng.randrange(3_000))
+        state_manager._local_state[peer_id] = HivePeerState(
+            peer_id=peer_id, capacity_sats=rng.randrange(1, 40) * 1_000_000,
+            available_sats=0, fee_policy={}, topology=[], version=1, last_update=now,
+        )
+    return db, manager, state_manager
+
+
+def _settle(db, manager, state_manager, period=PERIOD):
+    """Run a distributed period end to end, recording what a healthy fleet would."""
+    rpc = MagicMock()
+    rpc.signmessage.return_value = {"zbase": "sig"}
+    proposal = manager.create_proposal(period, _peer(0), state_manager, rpc)
+    plan = manager.compute_settlement_plan(period, proposal["contributions"])
+    for c in proposal["contributions"]:
+        db.add_settlement_ready_vote(proposal["proposal_id"], c["peer_id"],
+                                     proposal["data_hash"], "sig")
+        db.add_settlement_execution(proposal["proposal_id"], c["peer_id"], "sig",
+                                    amount_paid_sats=plan["expected_sent_sats"].get(c["peer_id"], 0),
+                                    plan_hash=plan["plan_hash"])
+    db.update_settlement_proposal_status(proposal["proposal_id"], "ready")
+    assert manager.check_and_complete_settlement(proposal["proposal_id"])
+    return proposal, plan
+
+
+def _kinds(report, category=None):
+    return sorted(f["kind"] for f in report["findings"]
+                  if category is None or f["category"] == category)
+
+
+def _execute(db, proposal_id, peer_id, sql, *args):
+    db._get_connection().execute(
+        f"UPDATE settlement_executions SET {sql} WHERE proposal_id = ? AND executor_peer_id = ?",
+        (*args, proposal_id, peer_id))
+
+
+class TestDistributedAudit:
+
+    def test_consistent_period_replays_cleanly(self, fleet):
+        db, manager, state_manager = fleet
+        proposal, plan = _settle(db, manager, state_manager)
+        assert plan["payments"]
+
+        report = SettlementAuditor(manager).audit_period(PERIOD)
+        assert report["ok"], report["findings"]
+        assert report["findings"] == []
+        assert report["input_source"] == "proposal_snapshot"
+        assert report["replayed"]["plan_hash"] == proposal["plan_hash"]
+        assert report["recorded"]["executed_sats"] == \
+            report["replayed"]["total_distributed_sats"] == \
+            sum(plan["expected_sent_sats"].values())
+
+    def test_tampered_history_reported(self, fleet):
+        db, manager, state_manager = fleet
+        proposal, plan = _settle(db, manager, state_manager)
+        pid = proposal["proposal_id"]
+        payers = sorted(plan["expected_sent_sats"])
+        non_payer = next(c["peer_id"] for c in proposal["contributions"]
+                         if c["peer_id"] not in plan["expected_sent_sats"])
+
+        _execute(db, pid, payers[0], "amount_paid_sats = amount_paid_sats - 1")
+        db._get_connection().execute(
+            "DELETE FROM settlement_executions WHERE proposal_id = ? AND executor_peer_id = ?",
+            (pid, payers[-1]))
+        _execute(db, pid, non_payer, "plan_hash = ?", "f" * 64)
+        db._get_connection().execute(
+            "UPDATE settlement_ready_votes SET data_hash = ? WHERE voter_peer_id = ?",
+            ("0" * 64, non_payer))
+
+        report = SettlementAuditor(manager).audit_period(PERIOD)
+        assert not report["ok"]
+        assert _kinds(report, CATEGORY_ROUNDING_DRIFT) == ["payment_amount_mismatch"]
+        assert _kinds(report, CATEGORY_MISSING_PAYMENT) == ["missing_payment"]
+        assert _kinds(report, CATEGORY_MISMATCH) == ["execution_plan_mismatch", "vote_hash_mismatch"]
+        missing = next(f for f in report["findings"] if f["kind"] == "missing_payment")
+        assert missing["peer_id"] == payers[-1]
+        assert missing["expected"] == plan["expected_sent_sats"][payers[-1]]
+
+    def test_proposal_header_and_input_drift(self, fleet):
+        db, manager, state_manager = fleet
+        proposal, _ = _settle(db, manager, state_manager)
+        contributions = proposal["contributions"]
+        contributions[1]["fees_earned"] += 5_000
+        db._get_connection().execute(
+            "UPDATE settlement_proposals SET contributions_json = ?, total_fees_sats = ? "
+            "WHERE proposal_id = ?",
+            (json.dumps(contributions), proposal["total_fees_sats"] + 5_000,
+             proposal["proposal_id"]))
+
+        report = SettlementAuditor(manager).audit_period(PERIOD)
+        assert "data_hash_mismatch" in _kinds(report, CATEGORY_MISMATCH)
+        assert "plan_hash_mismatch" in _kinds(report, CATEGORY_MISMATCH)
+        drift = [f for f in report["findings"] if f["kind"] == "input_drift"]
+        assert [(f["peer_id"], f["actual"] - f["expected"]) for f in drift] == \
+            [(contributions[1]["peer_id"], -5_000)]
+
+    def test_missing_snapshot_reconstructed_from_fee_reports(self, fleet):
+        db, manager, state_manager = fleet
+        proposal, _ = _settle(db, manager, state_manager)
+        db._get_connection().execute(
+            "UPDATE settlement_proposals SET contributions_json = NULL WHERE proposal_id = ?",
+            (proposal["proposal_id"],))
+
+        report = SettlementAuditor(manager).audit_period(PERIOD)
+        assert report["input_source"] == "fee_reports"
+        assert "snapshot_missing" in _kinds(report)
+        # Hashes are not comparable without capacity; fee totals still are
+        assert report["replayed"]["total_fees_sats"] == proposal["total_fees_sats"]
+        assert "data_hash_mismatch" not in _kinds(report)
+
+    def test_unknown_period(self, fleet):
+        _, manager, _ = fleet
+        report = SettlementAuditor(manager).audit_period("2020-01")
+        assert report["ok"] and _kinds(report) == ["no_proposal"]
+
+
+class TestLegacyAudit:
+
+    def _record(self, db, manager):
+        members = [
+            MemberContribution(peer_id=_peer(i), capacity_sats=(i + 1) * 2_000_000,
+                               forwards_sats=(7 - i) * 500_000, fees_earned_sats=fees,
+                               uptime_pct=99.0, bolt12_offer=f"lno1offer{i}")
+            for i, fees in enumerate([40_000, 1_000, 25_000, 0, 8_000, 12_000, 333, 90_000])
+        ]
+        for m in members:
+            manager.register_offer(m.peer_id, m.bolt12_offer)
+        results = manager.calculate_fair_shares(members)
+        payments = manager.generate_payments(results, total_fees=sum(r.fees_earned for r in results))
+        period_id = manager.create_settlement_period()
+        manager.record_contributions(period_id, results, members)
+        manager.record_payments(period_id, payments)
+        for p in payments:
+            manager.update_payment_status(period_id, p.from_peer, p.to_peer, "completed",
+                                          payment_hash="00" * 32)
+        manager.complete_settlement_period(period_id)
+        return period_id, results, payments
+
+    def test_legacy_replay(self, fleet):
+        db, manager, _ = fleet
+        period_id, results, payments = self._record(db, manager)
+        auditor = SettlementAuditor(manager, our_pubkey=payments[0].from_peer)
+        report = auditor.audit_legacy_period(period_id)
+        assert report["ok"] and report["findings"] == []
+        assert len(report["replayed"]["payments"]) == len(payments)
+
+        conn = db._get_connection()
+        # An older release truncated shares: one sat short for one member
+        conn.execute("UPDATE settlement_contributions SET fair_share_sats = fair_share_sats - 1, "
+                     "balance_sats = balance_sats - 1 WHERE period_id = ? AND peer_id = ?",
+                     (period_id, results[0].peer_id))
+        # Our payment failed; a remote one was never confirmed
+        ours, theirs = payments[0], next(p for p in payments if p.from_peer != payments[0].from_peer)
+        manager.update_payment_status(period_id, ours.from_peer, ours.to_peer, "error",
+                                      error="no route")
+        manager.update_payment_status(period_id, theirs.from_peer, theirs.to_peer, "pending")
+        conn.execute("DELETE FROM settlement_payments WHERE period_id = ? AND to_peer_id = ? "
+                     "AND from_peer_id = ?", (period_id, payments[-1].to_peer,
+                                              payments[-1].from_peer))
+
+        report = auditor.audit_legacy_period(period_id)
+        assert _kinds(report, CATEGORY_ROUNDING_DRIFT) == \
+            ["balance_mismatch", "fair_share_mismatch", "undistributed_remainder"]
+        assert _kinds(report, CATEGORY_MISSING_PAYMENT) == \
+            ["payment_not_completed", "payment_not_recorded"]
+        assert "remote_payment_unconfirmed" in _kinds(report)
+
+
+class TestBatchAudit:
+
+    def test_audits_every_period(self, fleet):
+        db, manager, state_manager = fleet
+        _settle(db, manager, state_manager)
+        for i in range(3):
+            db.save_fee_report(_peer(i), "2026-41", 10_000 * (i + 1), 50, 0, 1, 0)
+        _settle(db, manager, state_manager, period="2026-41")
+        db.mark_period_settled("2026-39", "gone", 1234)
+        TestLegacyAudit()._record(db, manager)
+
+        result = SettlementAuditor(manager).audit_all()
+        reports = result["reports"]
+        assert [r.get("period", r.get("period_id")) for r in reports] == \
+            ["2026-39", "2026-40", "2026-41", 1]
+        assert result["summary"]["periods"] == 4
+        assert result["summary"]["ok"] == 3
+        assert _kinds(reports[0]) == ["proposal_missing"]
+
+        failures = SettlementAuditor(manager).audit_all(include_legacy=False, only_failures=True)
+        assert [r["period"] for r in failures["reports"]] == ["2026-39"]
+
+    def test_replays_leave_live_contexts_alone(self, fleet):
+        db, manager, state_manager = fleet
+        _settle(db, manager, state_manager)
+        _settle(db, manager, state_manager, period="2026-41")
+        manager._contexts.clear()
+        live = manager.get_settlement_context("2026-42", [
+            {"peer_id": _peer(0), "fees_earned": 1_000, "capacity": 1_000_000, "uptime": 100},
+        ])
+
+        result = SettlementAuditor(manager).audit_all()
+        assert result["summary"]["ok"] == 2
+        assert list(manager._contexts.values()) == [live]
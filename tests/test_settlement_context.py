@@ -0,0 +1,209 @@
+"""
+Tests for the memoized settlement computation context.
+
+Covers:
+- Bulk contribution gathering matches the per-member lookups it replaces
+- Plans, hashes and balances match a fresh per-call computation
+- Proposal, vote and balance checks on one period share one computation
+- The context cache is keyed by every input the plan depends on
+
+Benchmark (synthetic fleets of 10-500 members, old vs memoized path):
+    CL_HIVE_BENCHMARK=1 pytest tests/test_settlement_context.py -k benchmark -s
+"""
+
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Mock pyln.client before importing modules (no-op if another test did)
+if "pyln.client" not in sys.modules:
+    class MockRpcError(Exception):
+        """Mock RpcError to match pyln.client.RpcError behavior."""
+        pass
+
+    mock_pyln = MagicMock()
+    mock_pyln.Plugin = MagicMock
+    mock_pyln.RpcError = MockRpcError
+    sys.modules["pyln"] = mock_pyln
+    sys.modules["pyln.client"] = mock_pyln
+
+from modules.database import HiveDatabase
+from modules.settlement import (
+    SETTLEMENT_CONTEXT_CACHE_SIZE,
+    DISTRIBUTED_SETTLEMENT_PLAN_VERSION,
+    MemberContribution,
+    SettlementManager,
+    calculate_min_payment,
+)
+from modules.state_manager import HivePeerState, StateManager
+
+
+PERIOD = "2026-41"
+
+
+def _peer(i):
+    return "02" + f"{i:064x}"
+
+
+def _fleet(tmp_path, size, seed=1):
+    """A database and state manager for a synthetic fleet."""
+    rng = random.Random(seed)
+    db = HiveDatabase(str(tmp_path / f"fleet{size}.db"), Mock())
+    db.initialize()
+    state_manager = StateManager(db)
+    now = int(time.time())
+    for i in range(size):
+        peer_id = _peer(i)
+        db.add_member(peer_id, tier="member")
+        db.update_member(peer_id, uptime_pct=rng.choice([0.95, 0.99, 1.0, 87.5]))
+        fees, forwards, costs = rng.randrange(50_000), rng.randrange(500), rng.randrange(2_000)
+        if i % 3:
+            db.save_fee_report(peer_id, PERIOD, fees, forwards, now - 86400, now, costs)
+        state_manager._local_state[peer_id] = HivePeerState(
+            peer_id=peer_id, capacity_sats=rng.randrange(1, 50) * 1_000_000,
+            available_sats=0, fee_policy={}, topology=[], version=1, last_update=now,
+            fees_earned_sats=fees // 2, fees_forward_count=forwards, fees_costs_sats=costs,
+        )
+    return db, state_manager
+
+
+def _per_member_contributions(manager, state_manager, period):
+    """The original gather loop: per-member state manager lookups."""
+    db_fees = {r["peer_id"]: r for r in manager.db.get_fee_reports_for_period(period)}
+    contributions = []
+    for member in manager.db.get_all_members():
+        peer_id = member["peer_id"]
+        fee_data = db_fees.get(peer_id) or state_manager.get_peer_fees(peer_id)
+        peer_state = state_manager.get_peer_state(peer_id)
+        uptime_f = float(member.get("uptime_pct", 1.0))
+        if uptime_f <= 1.0:
+            uptime_f *= 100.0
+        contributions.append({
+            "peer_id": peer_id,
+            "fees_earned": fee_data.get("fees_earned_sats", 0),
+            "rebalance_costs": fee_data.get("rebalance_costs_sats", 0),
+            "capacity": peer_state.capacity_sats if peer_state else 0,
+            "uptime": int(round(max(0.0, min(100.0, uptime_f)))),
+            "forward_count": fee_data.get("forward_count", 0),
+        })
+    return contributions
+
+
+def _fresh_plan(manager, period, contributions):
+    """A plan computed without the context cache."""
+    key = manager._context_input_key(period, contributions)
+    return manager._build_settlement_context(period, contributions, key).plan()
+
+
+def _manager(db):
+    return SettlementManager(db, MagicMock())
+
+
+class TestSettlementContext:
+
+    @pytest.mark.parametrize("size", [10, 60])
+    def test_bulk_gather_and_plan_match(self, tmp_path, size):
+        db, state_manager = _fleet(tmp_path, size)
+        manager = _manager(db)
+
+        contributions = manager.gather_contributions_from_gossip(state_manager, PERIOD)
+        assert contributions == _per_member_contributions(manager, state_manager, PERIOD)
+
+        plan = manager.compute_settlement_plan(PERIOD, contributions)
+        assert plan == _fresh_plan(manager, PERIOD, contributions)
+        assert plan["plan_version"] == DISTRIBUTED_SETTLEMENT_PLAN_VERSION
+        assert plan["data_hash"] == manager.calculate_settlement_hash(PERIOD, contributions)
+
+        # Balances agree with the plan the members will execute
+        for c in contributions:
+            balance, creditor, min_payment = manager.calculate_our_balance(
+                {"period": PERIOD}, contributions, c["peer_id"])
+            assert min_payment == plan["min_payment_sats"]
+            if plan["expected_sent_sats"].get(c["peer_id"]):
+                assert balance < -min_payment and creditor is not None
+
+    def test_balance_matches_legacy_conversion_without_costs(self, tmp_path):
+        db, state_manager = _fleet(tmp_path, 12)
+        manager = _manager(db)
+        contributions = [dict(c, rebalance_costs=0) for c in
+                         manager.gather_contributions_from_gossip(state_manager, PERIOD)]
+        legacy = manager.calculate_fair_shares([
+            MemberContribution(peer_id=c["peer_id"], capacity_sats=c["capacity"],
+                               forwards_sats=c["forward_count"] * 100000,
+                               fees_earned_sats=c["fees_earned"], uptime_pct=c["uptime"])
+            for c in contributions
+        ])
+        min_payment = calculate_min_payment(sum(c["fees_earned"] for c in contributions),
+                                            len(contributions))
+        for r in legacy:
+            balance, _, threshold = manager.calculate_our_balance(
+                {"period": PERIOD}, contributions, r.peer_id)
+            assert (balance, threshold) == (r.balance, min_payment)
+
+    def test_proposal_vote_and_balance_share_one_computation(self, tmp_path, monkeypatch):
+        db, state_manager = _fleet(tmp_path, 20)
+        manager = _manager(db)
+        calls = []
+        original = manager.calculate_fair_shares
+        monkeypatch.setattr(manager, "calculate_fair_shares",
+                            lambda *a, **kw: calls.append(1) or original(*a, **kw))
+        rpc = MagicMock()
+        rpc.signmessage.return_value = {"zbase": "sig"}
+
+        proposal = manager.create_proposal(PERIOD, _peer(0), state_manager, rpc)
+        vote = manager.verify_and_vote(proposal, _peer(1), state_manager, rpc)
+        assert vote is not None and vote["data_hash"] == proposal["data_hash"]
+        manager.calculate_our_balance(proposal, proposal["contributions"], _peer(2))
+        manager.compute_settlement_plan(PERIOD, list(reversed(proposal["contributions"])))
+        assert len(calls) == 1
+
+    def test_cache_keyed_by_all_plan_inputs(self, tmp_path):
+        db, state_manager = _fleet(tmp_path, 8)
+        manager = _manager(db)
+        contributions = manager.gather_contributions_from_gossip(state_manager, PERIOD)
+        first = manager.get_settlement_context(PERIOD, contributions)
+
+        # forward_count is not in the data hash but changes the shares
+        changed = [dict(c) for c in contributions]
+        changed[0]["forward_count"] += 1000
+        second = manager.get_settlement_context(PERIOD, changed)
+        assert second is not first
+        assert second.data_hash == first.data_hash
+        assert second.results != first.results
+        assert manager.get_settlement_context(PERIOD, contributions) is first
+
+        for i in range(SETTLEMENT_CONTEXT_CACHE_SIZE + 4):
+            manager.get_settlement_context(f"2026-{i:02d}", contributions)
+        assert len(manager._contexts) == SETTLEMENT_CONTEXT_CACHE_SIZE
+
+
+@pytest.mark.skipif(not os.environ.get("CL_HIVE_BENCHMARK"), reason="set CL_HIVE_BENCHMARK=1")
+@pytest.mark.parametrize("size", [10, 50, 200, 500])
+def test_benchmark_settlement_context(tmp_path, size):
+    db, state_manager = _fleet(tmp_path, size)
+    manager = _manager(db)
+    rounds = 5  # One proposal, one vote and a few balance/execution checks
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        old_contributions = _per_member_contributions(manager, state_manager, PERIOD)
+        old_plan = _fresh_plan(manager, PERIOD, old_contributions)
+    old_ms = (time.perf_counter() - start) * 1000 / rounds
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        contributions = manager.gather_contributions_from_gossip(state_manager, PERIOD)
+        plan = manager.compute_settlement_plan(PERIOD, contributions)
+    new_ms = (time.perf_counter() - start) * 1000 / rounds
+
+    assert contributions == old_contributions
+    assert plan == old_plan
+    print(f"\n{size} members: per-call {old_ms:.2f} ms, memoized {new_ms:.2f} ms "
+          f"({old_ms / new_ms:.1f}x)")
@@ -0,0 +1,352 @@
+"""
+Tests for the durable settlement payment executor.
+
+Covers:
+- Planning is idempotent and every payment is made exactly once
+- A crash after pay (or before pay reaches lightningd) resumes from the
+  database without paying a receiver twice
+- Failed payments back off exponentially, reuse their invoice, and end in
+  failed_final after MAX_ATTEMPTS
+- The number of payments in flight is capped
+- execute_our_settlement only confirms once every job has settled
+"""
+
+import asyncio
+import hashlib
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Mock pyln.client before importing modules (no-op if another test did)
+if "pyln.client" not in sys.modules:
+    class MockRpcError(Exception):
+        """Mock RpcError to match pyln.client.RpcError behavior."""
+        pass
+
+    mock_pyln = MagicMock()
+    mock_pyln.Plugin = MagicMock
+    mock_pyln.RpcError = MockRpcError
+    sys.modules["pyln"] = mock_pyln
+    sys.modules["pyln.client"] = mock_pyln
+
+from modules.database import HiveDatabase
+from modules.settlement import SettlementManager
+from modules.settlement_executor import (
+    PAYMENT_FAILED_FINAL,
+    PAYMENT_FAILED_RETRYABLE,
+    PAYMENT_INVOICE_FETCHED,
+    PAYMENT_PAYING,
+    PAYMENT_SETTLED,
+    SettlementPaymentExecutor,
+)
+
+
+PROPOSAL = "ab" * 32
+US = "02" + "11" * 32
+
+
+def _peer(i):
+    return "03" + f"{i:064x}"
+
+
+class Crash(BaseException):
+    """Simulated process death (not caught by the executor)."""
+
+
+class FakeRpcError(Exception):
+    pass
+
+
+class FakeNode:
+    """In-memory fetchinvoice/decode/pay/listpays with injectable failures."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.invoices = {}          # invoice -> (payment_hash, amount_msat)
+        self.pays = {}              # payment_hash -> [status, ...]
+        self.fetch_calls = 0
+        self.pay_calls = []         # invoices passed to pay
+        self.fail_pays = 0          # next N pays fail
+        self.crash = None           # "before_pay" | "after_pay"
+        self.amount_skew_msat = 0
+        self.pay_delay = 0.0
+        self.pay_pending = False    # pay returns 'pending' (still in flight)
+        self.active = 0
+        self.max_active = 0
+
+    def fetchinvoice(self, offer, amount_msat):
+        with self.lock:
+            self.fetch_calls += 1
+            n = self.fetch_calls
+        invoice = f"lni1{offer}{n}"
+        payment_hash = hashlib.sha256(invoice.encode()).hexdigest()
+        self.invoices[invoice] = (payment_hash, int(amount_msat[:-4]) + self.amount_skew_msat)
+        return {"invoice": invoice}
+
+    def decode(self, invoice):
+        payment_hash, amount_msat = self.invoices[invoice]
+        return {"type": "bolt12 invoice", "invoice_payment_hash": payment_hash,
+                "invoice_amount_msat": amount_msat}
+
+    def pay(self, invoice, maxfee=None, retry_for=None):
+        if self.crash == "before_pay":
+            self.crash = None
+            raise Crash()
+        payment_hash = self.invoices[invoice][0]
+        with self.lock:
+            self.pay_calls.append(invoice)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            failing = self.fail_pays > 0
+            self.fail_pays -= failing
+        time.sleep(self.pay_delay)
+        with self.lock:
+            self.active -= 1
+            self.pays.setdefault(payment_hash, []).append("failed" if failing else "complete")
+        if failing:
+            raise FakeRpcError("no route")
+        if self.pay_pending:
+            self.pays[payment_hash][-1] = "pending"
+            return {"status": "pending", "payment_hash": payment_hash}
+        if self.crash == "after_pay":
+            self.crash = None
+            raise Crash()
+        return {"status": "complete", "payment_hash": payment_hash}
+
+    def listpays(self, payment_hash):
+        return {"pays": [{"payment_hash": payment_hash, "status": s}
+                         for s in self.pays.get(payment_hash, [])]}
+
+    def completed(self):
+        return [h for h, statuses in self.pays.items() if "complete" in statuses]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_800_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def env(tmp_path):
+    path = str(tmp_path / "exec.db")
+    db = HiveDatabase(path, Mock())
+    db.initialize()
+    node = FakeNode()
+
+    def make_executor(database=db):
+        return SettlementPaymentExecutor(database, node, lambda peer: f"lno{peer[-4:]}",
+                                         lambda msg, level="info": None)
+    return db, node, make_executor, path
+
+
+def _payments(n, amount=1_000):
+    return [{"from_peer": US, "to_peer": _peer(i), "amount_sats": amount + i} for i in range(n)]
+
+
+def _states(db):
+    return sorted(j["state"] for j in db.get_settlement_payment_jobs())
+
+
+class TestExecution:
+
+    def test_each_payment_made_once(self, env, clock):
+        db, node, make_executor, _ = env
+        executor = make_executor()
+        assert executor.plan_payments(PROPOSAL, "2026-40", _payments(4)) == 4
+        stats = executor.run_pending()
+        assert stats["settled"] == 4 and _states(db) == [PAYMENT_SETTLED] * 4
+
+        # Replanning and rerunning are no-ops
+        assert executor.plan_payments(PROPOSAL, "2026-40", _payments(4)) == 0
+        executor.run_pending()
+        assert len(node.pay_calls) == 4 and len(node.completed()) == 4
+
+        status = executor.proposal_status(PROPOSAL)
+        assert status["complete"]
+        assert status["settled_sats"] == sum(p["amount_sats"] for p in _payments(4))
+        assert sorted(status["payment_hashes"]) == sorted(node.completed())
+
+    def test_crash_after_pay_resumes_without_repaying(self, env, clock):
+        db, node, make_executor, path = env
+        make_executor().plan_payments(PROPOSAL, "2026-40", _payments(1))
+        node.crash = "after_pay"
+        with pytest.raises(Crash):
+            make_executor().run_pending()
+        assert _states(db) == [PAYMENT_PAYING]
+
+        # Restart: fresh database handle and executor
+        restarted = HiveDatabase(path, Mock())
+        restarted.initialize()
+        stats = make_executor(restarted).run_pending()
+        assert stats["reconciled"] == 1 and stats["settled"] == 1
+        assert _states(restarted) == [PAYMENT_SETTLED]
+        assert len(node.pay_calls) == 1 and node.fetch_calls == 1
+
+    def test_crash_before_pay_retries_same_invoice(self, env, clock):
+        db, node, make_executor, _ = env
+        executor = make_executor()
+        executor.plan_payments(PROPOSAL, "2026-40", _payments(1))
+        node.crash = "before_pay"
+        with pytest.raises(Crash):
+            executor.run_pending()
+
+        executor.run_pending()  # Nothing in listpays: retryable, invoice kept
+        job = db.get_settlement_payment_jobs()[0]
+        assert job["state"] == PAYMENT_FAILED_RETRYABLE and job["bolt12_invoice"]
+
+        clock[0] = job["next_attempt_at"]
+        executor.run_pending()
+        assert _states(db) == [PAYMENT_SETTLED]
+        assert node.fetch_calls == 1 and node.pay_calls == [job["bolt12_invoice"]]
+
+
+class TestFailures:
+
+    def test_backoff_then_failed_final(self, env, clock):
+        db, node, make_executor, _ = env
+        executor = make_executor()
+        executor.plan_payments(PROPOSAL, "2026-40", _payments(1))
+        node.fail_pays = 1_000
+
+        delays = []
+        for attempt in range(1, executor.MAX_ATTEMPTS + 1):
+            start = clock[0]
+            executor.run_pending()
+            job = db.get_settlement_payment_jobs()[0]
+            assert job["attempts"] == attempt
+            if attempt == executor.MAX_ATTEMPTS:
+                break
+            assert job["state"] == PAYMENT_FAILED_RETRYABLE
+            delays.append(job["next_attempt_at"] - start)
+
+            executor.run_pending()  # Not due yet
+            assert len(node.pay_calls) == attempt
+            clock[0] = job["next_attempt_at"]
+
+        assert job["state"] == PAYMENT_FAILED_FINAL and job["last_error"] == "no route"
+        for i, delay in enumerate(delays):
+            base = min(executor.BASE_RETRY_SECONDS * 2 ** i, executor.MAX_RETRY_SECONDS)
+            assert base <= delay <= base * 1.25
+        # The first invoice is reused until it goes stale
+        assert len(set(node.pay_calls[:4])) == 1 and 1 < node.fetch_calls < len(node.pay_calls)
+
+        executor.run_pending()
+        assert len(node.pay_calls) == executor.MAX_ATTEMPTS
+        assert executor.proposal_status(PROPOSAL)["failed_final"][0]["error"] == "no route"
+
+        # Operator retry gives it a fresh set of attempts
+        node.fail_pays = 0
+        assert executor.retry_failed(PROPOSAL) == 1
+        executor.run_pending()
+        assert _states(db) == [PAYMENT_SETTLED]
+
+    def test_wrong_invoice_amount_is_final(self, env, clock):
+        db, node, make_executor, _ = env
+        node.amount_skew_msat = 1_000
+        executor = make_executor()
+        executor.plan_payments(PROPOSAL, "2026-40", _payments(1))
+        assert executor.run_pending()["failed_final"] == 1
+        assert _states(db) == [PAYMENT_FAILED_FINAL] and node.pay_calls == []
+
+
+class TestConcurrency:
+
+    def test_in_flight_payments_capped(self, env):
+        db, node, make_executor, _ = env
+        node.pay_delay = 0.05
+        executor = make_executor()
+        executor.plan_payments(PROPOSAL, "2026-40", _payments(10))
+        assert executor.run_pending()["settled"] == 10
+        assert 1 < node.max_active <= executor.MAX_IN_FLIGHT
+
+    def test_pending_payments_hold_slots(self, env):
+        db, node, make_executor, _ = env
+        executor = make_executor()
+        executor.plan_payments(PROPOSAL, "2026-40", _payments(executor.MAX_IN_FLIGHT + 1))
+        jobs = db.get_settlement_payment_jobs()
+        for i, job in enumerate(jobs[:executor.MAX_IN_FLIGHT]):
+            db.transition_settlement_payment_job(job["job_id"], ["planned"], PAYMENT_PAYING,
+                                                 payment_hash=f"{i:064x}")
+            node.pays[f"{i:064x}"] = ["pending"]
+
+        stats = executor.run_pending()
+        assert stats["in_flight"] == executor.MAX_IN_FLIGHT and stats["advanced"] == 0
+        assert node.fetch_calls == 0
+
+
+    def test_pending_pays_within_run_capped(self, env):
+        db, node, make_executor, _ = env
+        node.pay_pending = True
+        executor = make_executor()
+        executor.plan_payments(PROPOSAL, "2026-40", _payments(executor.MAX_IN_FLIGHT + 3))
+        executor.run_pending()
+        assert len(node.pay_calls) == executor.MAX_IN_FLIGHT
+        assert _states(db).count(PAYMENT_PAYING) == executor.MAX_IN_FLIGHT
+
+        # Slots free up once the pending pays complete
+        for payment_hash in list(node.pays):
+            node.pays[payment_hash] = ["complete"]
+        node.pay_pending = False
+        stats = executor.run_pending()
+        assert stats["reconciled"] == executor.MAX_IN_FLIGHT
+        assert _states(db) == [PAYMENT_SETTLED] * (executor.MAX_IN_FLIGHT + 3)
+
+    def test_found_pending_never_overdraws_slots(self, env):
+        db, node, make_executor, _ = env
+        executor = make_executor()
+        count = executor.MAX_IN_FLIGHT + 2
+        executor.plan_payments(PROPOSAL, "2026-40", _payments(count))
+        for i, job in enumerate(db.get_settlement_payment_jobs()):
+            db.transition_settlement_payment_job(
+                job["job_id"], ["planned"], PAYMENT_INVOICE_FETCHED,
+                bolt12_invoice=f"lni1pending{i}", payment_hash=f"{i:064x}",
+                invoice_fetched_at=int(time.time()))
+            node.pays[f"{i:064x}"] = ["pending"]
+
+        executor.run_pending()
+        assert _states(db) == [PAYMENT_PAYING] * count
+        assert executor._free_slots == 0
+        assert node.pay_calls == []
+
+
+class TestSettlementIntegration:
+
+    def test_confirms_only_when_all_payments_settled(self, env, clock):
+        db, node, make_executor, _ = env
+        manager = SettlementManager(db, MagicMock())
+        manager.initialize_tables()
+        manager.payment_executor = make_executor()
+        rpc = MagicMock()
+        rpc.signmessage.return_value = {"zbase": "sig"}
+
+        contributions = [
+            {"peer_id": US, "capacity": 5_000_000, "uptime": 100, "fees_earned": 90_000,
+             "forward_count": 10, "rebalance_costs": 0},
+        ] + [
+            {"peer_id": _peer(i), "capacity": 5_000_000, "uptime": 100, "fees_earned": 0,
+             "forward_count": 10, "rebalance_costs": 0}
+            for i in range(3)
+        ]
+        plan = manager.compute_settlement_plan("2026-40", contributions)
+        proposal = {"proposal_id": PROPOSAL, "period": "2026-40", "plan_hash": plan["plan_hash"]}
+        expected = plan["expected_sent_sats"][US]
+        assert expected > 0
+
+        node.fail_pays = 1
+        result = asyncio.run(manager.execute_our_settlement(proposal, contributions, US, rpc))
+        assert result is None and not db.has_executed_settlement(PROPOSAL, US)
+
+        clock[0] += SettlementPaymentExecutor.MAX_RETRY_SECONDS * 2
+        result = asyncio.run(manager.execute_our_settlement(proposal, contributions, US, rpc))
+        assert result["total_sent_sats"] == expected
+        assert db.has_executed_settlement(PROPOSAL, US)
+        assert len(node.completed()) == len(node.pay_calls) - 1 == sum(
+            1 for p in plan["payments"] if p["from_peer"] == US)
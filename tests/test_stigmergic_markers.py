@@ -0,0 +1,185 @@
+"""
+Tests for the per-route stigmergic marker store.
+
+Covers:
+- Route aggregates and coordinated fees match a recomputation over the
+  decayed markers
+- Reads never compound decay (stored markers keep deposit strength)
+- Expiry through the time-ordered queue, per-route and route caps
+- Weight rebasing for long-lived routes
+- Snapshot round trip of deposit strengths
+"""
+
+import math
+import random
+import time
+
+import pytest
+
+from modules.fee_coordination import (
+    FLEET_FEE_FLOOR_PPM,
+    MARKER_HALF_LIFE_HOURS,
+    MARKER_MAX_PER_ROUTE,
+    MARKER_MIN_STRENGTH,
+    RouteMarker,
+    StigmergicCoordinator,
+)
+
+
+OUR = "02" + "0" * 64
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def coord():
+    coordinator = StigmergicCoordinator(database=None, plugin=None)
+    coordinator.set_our_pubkey(OUR)
+    return coordinator
+
+
+def _strength(marker, now):
+    return marker.strength * 0.5 ** ((now - marker.timestamp) / 3600 / MARKER_HALF_LIFE_HOURS)
+
+
+def _reference_fee(deposits, now, default_fee):
+    """The per-marker fee computation, over correctly decayed strengths."""
+    live = [(m, _strength(m, now)) for m in deposits if _strength(m, now) > MARKER_MIN_STRENGTH]
+    if not live:
+        return default_fee, 0.3, None
+    successful = [(m, s) for m, s in live if m.success]
+    failed = [m for m, _ in live if not m.success]
+    total = sum(s for _, s in live)
+    weighted = (sum(s * m.fee_ppm for m, s in live) / total, sum(s for _, s in successful) / total)
+    if successful:
+        best, strength = max(successful, key=lambda ms: ms[1])
+        return max(FLEET_FEE_FLOOR_PPM, best.fee_ppm), min(0.9, 0.5 + strength * 0.1), weighted
+    avg_failed = sum(m.fee_ppm for m in failed) / len(failed)
+    return max(FLEET_FEE_FLOOR_PPM, int(avg_failed * 0.8)), 0.4, weighted
+
+
+class TestRouteAggregate:
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_recomputation(self, clock, coord, seed):
+        rng = random.Random(seed)
+        routes = [("peer1", "peer2"), ("peer1", "peer3"), ("peer4", "peer2")]
+        deposits = {r: [] for r in routes}
+        evictions = 0
+
+        for _ in range(400):
+            clock[0] += rng.choice([0, 300, 1800, 3600])
+            route = rng.choice(routes)
+            marker = coord.deposit_marker(*route, rng.randrange(10, 1500),
+                                          rng.random() < 0.6, rng.randrange(5_000, 3_000_000))
+            live = [m for m in deposits[route] + [marker]
+                    if _strength(m, clock[0]) > MARKER_MIN_STRENGTH]
+            if len(live) > MARKER_MAX_PER_ROUTE:
+                live.remove(min(live, key=lambda m: _strength(m, clock[0])))
+            deposits[route] = live
+            evictions += len(live) == MARKER_MAX_PER_ROUTE
+
+            for r in routes:
+                fee, confidence, weighted = _reference_fee(deposits[r], clock[0], 500)
+                assert coord.calculate_coordinated_fee(*r, 500) == (fee, pytest.approx(confidence))
+                aggregate = coord.get_route_aggregate(*r)
+                if weighted is None:
+                    assert aggregate is None
+                else:
+                    assert aggregate.weighted_fee_ppm == pytest.approx(weighted[0])
+                    assert aggregate.success_ratio == pytest.approx(weighted[1])
+        assert evictions  # The per-route cap was exercised
+
+    def test_reads_do_not_compound_decay(self, clock, coord):
+        coord.deposit_marker("peer1", "peer2", 600, True, 400_000)
+        clock[0] += MARKER_HALF_LIFE_HOURS * 3600
+        first = [m.strength for m in coord.read_markers("peer1", "peer2")]
+        for _ in range(10):
+            coord.read_markers("peer1", "peer2")
+            coord.get_all_markers()
+        assert [m.strength for m in coord.read_markers("peer1", "peer2")] == first
+        assert first == [pytest.approx(2.0)]
+        assert coord.get_route_aggregate("peer1", "peer2").best_success_strength == \
+            pytest.approx(2.0)
+
+
+class TestExpiryAndCaps:
+
+    def test_expired_markers_and_routes_removed(self, clock, coord):
+        coord.deposit_marker("peer1", "peer2", 600, True, 100_000)    # strength 1.0
+        coord.deposit_marker("peer1", "peer2", 400, False, 800_000)   # strength 8.0
+        coord.deposit_marker("peer1", "peer2", 700, True, 5_000)      # Too weak to store
+        assert len(coord.read_markers("peer1", "peer2")) == 2
+
+        # 1.0 expires after log2(10) half-lives, 8.0 after log2(80)
+        clock[0] += math.log2(10) * MARKER_HALF_LIFE_HOURS * 3600 + 1
+        assert [m.fee_ppm for m in coord.read_markers("peer1", "peer2")] == [400]
+        assert coord.calculate_coordinated_fee("peer1", "peer2", 500) == (320, 0.4)
+
+        clock[0] += 3 * MARKER_HALF_LIFE_HOURS * 3600
+        assert coord.read_markers("peer1", "peer2") == []
+        assert coord._markers == {} and coord._marker_count == 0
+
+    def test_per_route_cap_evicts_weakest(self, clock, coord):
+        coord.deposit_marker("peer1", "peer2", 900, True, 50_000_000)
+        for i in range(MARKER_MAX_PER_ROUTE + 20):
+            coord.deposit_marker("peer1", "peer2", 100 + i, False, 200_000)
+        markers = coord.read_markers("peer1", "peer2")
+        assert len(markers) == MARKER_MAX_PER_ROUTE
+        assert markers[0].fee_ppm == 900
+        assert len(coord._expiry_queue) <= 2 * coord._marker_count + 64
+
+    def test_marker_evicted_by_route_cap_not_reported_stored(self, clock, coord):
+        for i in range(MARKER_MAX_PER_ROUTE):
+            coord.deposit_marker("peer1", "peer2", 100 + i, True, 500_000)
+
+        def marker(strength):
+            return RouteMarker(depositor=OUR, source_peer_id="peer1",
+                               destination_peer_id="peer2", fee_ppm=800, success=True,
+                               volume_sats=10_000, timestamp=clock[0], strength=strength)
+
+        assert coord._store_marker(marker(1.0)) is False
+        assert coord._store_marker(marker(9.0)) is True
+        assert coord._marker_count == MARKER_MAX_PER_ROUTE
+        assert 800 in [m.fee_ppm for m in coord.read_markers("peer1", "peer2")]
+
+    def test_route_cap_evicts_least_recent(self, clock, coord, monkeypatch):
+        monkeypatch.setattr("modules.fee_coordination.MARKER_MAX_ROUTES", 3)
+        for dest in ("a", "b", "c"):
+            coord.deposit_marker("peer1", dest, 500, True, 100_000)
+        coord.deposit_marker("peer1", "a", 500, True, 100_000)   # Refresh route a
+        coord.deposit_marker("peer1", "d", 500, True, 100_000)
+        assert set(coord._markers) == {("peer1", "a"), ("peer1", "c"), ("peer1", "d")}
+        assert coord._marker_count == 4
+
+    def test_long_lived_route_rebased(self, clock, coord):
+        deposits = []
+        for _ in range(200):  # 100 days, far beyond the rebase horizon
+            clock[0] += 12 * 3600
+            deposits.append(coord.deposit_marker("peer1", "peer2", 300, True, 2_000_000))
+        aggregate = coord.get_route_aggregate("peer1", "peer2")
+        live = [_strength(m, clock[0]) for m in deposits]
+        live = [s for s in live if s > MARKER_MIN_STRENGTH]
+        assert aggregate.marker_count == len(live)
+        assert aggregate.total_strength == pytest.approx(sum(live))
+
+
+class TestMarkerSnapshot:
+
+    def test_round_trip_keeps_deposit_strength(self, clock, coord):
+        coord.deposit_marker("peer1", "peer2", 600, True, 300_000)
+        coord.deposit_marker("peer3", "peer2", 200, False, 150_000)
+        clock[0] += 10 * 3600
+        columns = coord.export_snapshot_state()
+        assert sorted(columns["strength"]) == [1.5, 3.0]
+
+        restored = StigmergicCoordinator(database=None, plugin=None)
+        assert restored.restore_snapshot_state(columns) == 2
+        clock[0] += 10 * 3600
+        assert [m.to_dict() for m in restored.get_all_markers()] == \
+            [m.to_dict() for m in coord.get_all_markers()]
@@ -56,7 +56,9 @@ class MockRpc:
     def __init__(self):
         self.channels = []
 
-    def listpeerchannels(self):
+    def listpeerchannels(self, id=None):
+        if id is not None:
+            return {"channels": [c for c in self.channels if c.get("peer_id") == id]}
         return {"channels": self.channels}
 
 
@@ -474,6 +476,132 @@ class TestYieldMetricsManager:
         assert summary.total_capacity_sats == 30_000_000  # 10M + 20M
 
 
+class CountingRpc(MockRpc):
+    """Mock RPC that counts calls per method."""
+
+    def __init__(self, blockheight=800_000):
+        super().__init__()
+        self.calls = {}
+        self.blockheight = blockheight
+        self.nodes = {}
+
+    def _count(self, method):
+        self.calls[method] = self.calls.get(method, 0) + 1
+
+    def listpeerchannels(self, id=None):
+        self._count("listpeerchannels")
+        return super().listpeerchannels(id=id)
+
+    def listnodes(self, id=None):
+        self._count("listnodes")
+        if id is not None:
+            node = self.nodes.get(id)
+            return {"nodes": [node] if node else []}
+        return {"nodes": list(self.nodes.values())}
+
+    def getinfo(self):
+        self._count("getinfo")
+        return {"blockheight": self.blockheight}
+
+
+def _make_channels(rpc, count):
+    for i in range(count):
+        peer_id = "02" + f"{i:064x}"
+        rpc.channels.append({
+            "short_channel_id": f"{700_000 + i}x1x0",
+            "peer_id": peer_id,
+            "total_msat": 10_000_000_000,
+            "to_us_msat": 5_000_000_000,
+            "state": "CHANNELD_NORMAL",
+        })
+        if i % 2 == 0:
+            rpc.nodes[peer_id] = {"nodeid": peer_id, "alias": f"node{i}"}
+
+
+class TestYieldMetricsRpcCaching:
+    """Per-channel RPCs are replaced by cached/bulk lookups."""
+
+    def test_many_channels_use_constant_rpcs(self):
+        plugin = MockPlugin()
+        plugin.rpc = CountingRpc()
+        _make_channels(plugin.rpc, 500)
+
+        mgr = YieldMetricsManager(database=MockDatabase(), plugin=plugin)
+        metrics = mgr.get_channel_yield_metrics()
+
+        assert len(metrics) == 500
+        assert plugin.rpc.calls == {"listpeerchannels": 1, "listnodes": 1, "getinfo": 1}
+        by_id = {m.channel_id: m for m in metrics}
+        assert by_id["700000x1x0"].peer_alias == "node0"
+        assert by_id["700001x1x0"].peer_alias is None
+        assert by_id["700000x1x0"].channel_age_days == 100_000 // 144
+
+        # Second call: aliases (including negative entries) and height cached
+        mgr.get_channel_yield_metrics()
+        assert plugin.rpc.calls == {"listpeerchannels": 2, "listnodes": 1, "getinfo": 1}
+
+    def test_bulk_fetch_caches_only_requested_aliases(self):
+        plugin = MockPlugin()
+        plugin.rpc = CountingRpc()
+        _make_channels(plugin.rpc, 50)
+        for i in range(1000):
+            node_id = "03" + f"{i:064x}"
+            plugin.rpc.nodes[node_id] = {"nodeid": node_id, "alias": f"stranger{i}"}
+
+        mgr = YieldMetricsManager(database=MockDatabase(), plugin=plugin)
+        mgr.get_channel_yield_metrics()
+
+        assert plugin.rpc.calls["listnodes"] == 1
+        assert len(mgr._alias_cache) == 50
+
+    def test_few_misses_looked_up_individually(self):
+        plugin = MockPlugin()
+        plugin.rpc = CountingRpc()
+        _make_channels(plugin.rpc, 3)
+
+        mgr = YieldMetricsManager(database=MockDatabase(), plugin=plugin)
+        metrics = mgr.get_channel_yield_metrics()
+
+        assert len(metrics) == 3
+        assert plugin.rpc.calls["listnodes"] == 3
+        mgr.get_channel_yield_metrics()
+        assert plugin.rpc.calls["listnodes"] == 3
+
+    def test_single_channel_uses_peer_filter(self):
+        plugin = MockPlugin()
+        plugin.rpc = CountingRpc()
+        _make_channels(plugin.rpc, 50)
+
+        mgr = YieldMetricsManager(database=MockDatabase(), plugin=plugin)
+        listed = []
+        original = plugin.rpc.listpeerchannels
+
+        def tracking(id=None):
+            listed.append(id)
+            return original(id=id)
+        plugin.rpc.listpeerchannels = tracking
+
+        # Unknown SCID peer: full listing, which learns the mapping
+        assert len(mgr.get_channel_yield_metrics(channel_id="700007x1x0")) == 1
+        assert listed == [None]
+
+        metrics = mgr.get_channel_yield_metrics(channel_id="700007x1x0")
+        assert len(metrics) == 1
+        assert metrics[0].peer_id == "02" + f"{7:064x}"
+        assert listed == [None, "02" + f"{7:064x}"]
+
+    def test_channel_age_from_scid(self):
+        plugin = MockPlugin()
+        plugin.rpc = CountingRpc(blockheight=800_144)
+        mgr = YieldMetricsManager(database=MockDatabase(), plugin=plugin)
+
+        assert mgr._get_channel_age_days("800000x1x0") == 1
+        assert mgr._get_channel_age_days("800000:1:0") == 1
+        assert mgr._get_channel_age_days("900000x1x0") == 0
+        assert mgr._get_channel_age_days("bogus") == 0
+        assert plugin.rpc.calls == {"getinfo": 1}
+
+
 class TestConstants:
     """Test constant values."""
 
@@ -17,11 +17,25 @@ Usage:
     # Query trends
     velocity = db.get_channel_velocity("alice", "243x1x0")
     trends = db.get_fleet_trends(days=7)
+
+    # Several writes in one transaction
+    with db.batch():
+        db.record_fleet_snapshot(report)
+        db.record_channel_states(report)
+
+    # From asyncio code, run work off the event loop
+    adb = AsyncAdvisorDB(db)
+    trends = await adb.get_fleet_trends(days=7)
 """
 
+import asyncio
+import contextvars
+import functools
 import hashlib
 import json
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -33,7 +47,7 @@ from typing import Any, Dict, List, Optional, Tuple
 # Database Schema
 # =============================================================================
 
-SCHEMA_VERSION = 4
+SCHEMA_VERSION = 7
 
 SCHEMA = """
 -- Schema version tracking
@@ -134,6 +148,23 @@ CREATE TABLE IF NOT EXISTS channel_velocity (
 
     PRIMARY KEY (node_name, channel_id)
 );
+-- Depleting/filling channels ordered by urgency (only one of the two is set)
+CREATE INDEX IF NOT EXISTS idx_channel_velocity_critical
+    ON channel_velocity(COALESCE(hours_until_depleted, hours_until_full));
+
+-- channel_history readings inside the velocity window, clustered by channel
+CREATE TABLE IF NOT EXISTS channel_velocity_window (
+    node_name TEXT NOT NULL,
+    channel_id TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    history_id INTEGER NOT NULL,
+    local_sats INTEGER,
+    balance_ratio REAL,
+    capacity_sats INTEGER,
+    PRIMARY KEY (node_name, channel_id, timestamp, history_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_channel_velocity_window_time
+    ON channel_velocity_window(timestamp);
 
 -- AI decision audit trail
 CREATE TABLE IF NOT EXISTS ai_decisions (
@@ -305,8 +336,119 @@ CREATE TABLE IF NOT EXISTS daily_budgets (
     rebalance_fees_spent_sats INTEGER DEFAULT 0,
     updated_at INTEGER
 );
+
+-- =============================================================================
+-- Forward Index (Schema Version 5)
+-- =============================================================================
+
+-- Per-node listforwards high-water mark (created_index already consumed)
+CREATE TABLE IF NOT EXISTS forward_index_state (
+    node_name TEXT PRIMARY KEY,
+    created_index INTEGER NOT NULL DEFAULT 0,
+    forwards_indexed INTEGER NOT NULL DEFAULT 0,
+    updated_at INTEGER
+);
+
+-- Forwards below the high-water mark that were still in flight
+CREATE TABLE IF NOT EXISTS forward_index_pending (
+    node_name TEXT NOT NULL,
+    created_index INTEGER NOT NULL,
+    first_seen INTEGER NOT NULL,
+    PRIMARY KEY (node_name, created_index)
+);
+
+-- Settled forwards aggregated per out channel per time bucket
+CREATE TABLE IF NOT EXISTS forward_buckets (
+    node_name TEXT NOT NULL,
+    channel_id TEXT NOT NULL,          -- out channel ('' if unknown)
+    bucket_start INTEGER NOT NULL,     -- resolved_time rounded down to the bucket
+    forward_count INTEGER NOT NULL DEFAULT 0,
+    volume_msat INTEGER NOT NULL DEFAULT 0,
+    revenue_msat INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (node_name, bucket_start, channel_id)
+);
+
+-- =============================================================================
+-- Time-Series Rollups (Schema Version 7)
+-- =============================================================================
+-- Maintained incrementally as raw rows are recorded; resolution is 'hour'
+-- or 'day'. open_* / close_* hold the first / last sample of the bucket.
+
+CREATE TABLE IF NOT EXISTS channel_history_rollup (
+    resolution TEXT NOT NULL,
+    node_name TEXT NOT NULL,
+    channel_id TEXT NOT NULL,
+    bucket_start INTEGER NOT NULL,
+    samples INTEGER NOT NULL,
+    first_ts INTEGER NOT NULL,
+    last_ts INTEGER NOT NULL,
+    peer_id TEXT,
+    capacity_sats INTEGER,
+    open_local_sats INTEGER,
+    close_local_sats INTEGER,
+    min_local_sats INTEGER,
+    max_local_sats INTEGER,
+    sum_local_sats INTEGER,
+    sum_balance_ratio REAL,
+    close_balance_ratio REAL,
+    close_fee_ppm INTEGER,
+    close_forward_count INTEGER,
+    close_flow_state TEXT,
+    PRIMARY KEY (resolution, node_name, channel_id, bucket_start)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS fleet_snapshot_rollup (
+    resolution TEXT NOT NULL,
+    bucket_start INTEGER NOT NULL,
+    samples INTEGER NOT NULL,
+    first_ts INTEGER NOT NULL,
+    last_ts INTEGER NOT NULL,
+    open_total_nodes INTEGER,
+    close_total_nodes INTEGER,
+    open_nodes_healthy INTEGER,
+    close_nodes_healthy INTEGER,
+    open_total_channels INTEGER,
+    close_total_channels INTEGER,
+    open_total_capacity_sats INTEGER,
+    close_total_capacity_sats INTEGER,
+    open_total_revenue_sats INTEGER,
+    close_total_revenue_sats INTEGER,
+    close_net_profit_sats INTEGER,
+    PRIMARY KEY (resolution, bucket_start)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS goat_feeder_rollup (
+    resolution TEXT NOT NULL,
+    node_name TEXT NOT NULL,
+    bucket_start INTEGER NOT NULL,
+    samples INTEGER NOT NULL,
+    revenue_sats INTEGER NOT NULL,
+    revenue_count INTEGER NOT NULL,
+    expense_sats INTEGER NOT NULL,
+    expense_count INTEGER NOT NULL,
+    net_profit_sats INTEGER NOT NULL,
+    PRIMARY KEY (resolution, node_name, bucket_start)
+) WITHOUT ROWID;
 """
 
+# Rollup tiers: bucket width and default retention (days) per tier.
+# Raw rows older than the raw tier survive only as rollups.
+ROLLUP_BUCKET_SECONDS = {"hour": 3600, "day": 86400}
+DEFAULT_RETENTION_DAYS = {"raw": 30, "hour": 180, "day": 1825}
+RAW_QUERY_MAX_HOURS = 48          # Longer history/trend queries read rollups
+
+# Readings used for balance velocity
+VELOCITY_WINDOW_HOURS = 6
+
+# Connection pool and async facade
+MAX_IDLE_CONNECTIONS = 8          # Pooled connections kept open between operations
+STATEMENT_CACHE_SIZE = 256        # Prepared statements cached per connection
+ASYNC_DB_WORKERS = 4              # Executor threads behind AsyncAdvisorDB
+
+# Forward index bucket width and retention
+FORWARD_BUCKET_SECONDS = 3600
+FORWARD_BUCKET_RETENTION_DAYS = 365
+
 
 # =============================================================================
 # Data Classes
@@ -443,15 +585,42 @@ class GoatFeederSnapshot:
 # Database Class
 # =============================================================================
 
+class _PooledConnection(sqlite3.Connection):
+    """Connection whose commit() is deferred while a batch is open."""
+
+    batch_depth = 0
+
+    def commit(self):
+        if self.batch_depth:
+            return
+        super().commit()
+
+
 class AdvisorDB:
     """AI Advisor database for historical tracking and trend analysis."""
 
-    def __init__(self, db_path: str = None):
-        """Initialize database connection."""
+    def __init__(self, db_path: str = None, retention_days: Dict[str, int] = None):
+        """
+        Initialize database connection.
+
+        Args:
+            db_path: SQLite file (default ~/.lightning/advisor.db)
+            retention_days: Per-tier retention overrides for
+                cleanup_old_data(), keys 'raw', 'hour', 'day'
+        """
         if db_path is None:
             db_path = str(Path.home() / ".lightning" / "advisor.db")
 
         self.db_path = db_path
+        self.retention_days = dict(DEFAULT_RETENTION_DAYS, **(retention_days or {}))
+
+        # Idle connections; each is checked out by one operation at a time
+        self._pool: List[_PooledConnection] = []
+        self._pool_lock = threading.Lock()
+        # Connection of the batch() open in the current thread/task, if any
+        self._batch_conn: contextvars.ContextVar = contextvars.ContextVar(
+            f"advisor_db_batch_{id(self)}", default=None
+        )
 
         # Ensure directory exists
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
@@ -459,20 +628,84 @@ class AdvisorDB:
         # Initialize schema
         self._init_schema()
 
-    @contextmanager
-    def _get_conn(self):
-        """Get a fresh database connection per operation (async-safe)."""
-        conn = sqlite3.connect(self.db_path, timeout=10)
+    def _connect(self) -> _PooledConnection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=10,
+            factory=_PooledConnection,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def _get_conn(self):
+        """
+        Check out a pooled connection for one operation.
+
+        Operations never share a connection concurrently, so this is safe
+        from multiple threads; reusing connections keeps sqlite's prepared
+        statement cache warm. Inside batch() the batch's connection is
+        returned and committing is left to the batch.
+        """
+        batch_conn = self._batch_conn.get()
+        if batch_conn is not None:
+            yield batch_conn
+            return
+
+        with self._pool_lock:
+            conn = self._pool.pop() if self._pool else None
+        if conn is None:
+            conn = self._connect()
+
+        reusable = True
         try:
             yield conn
             conn.commit()
         except Exception:
-            conn.rollback()
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                reusable = False
             raise
         finally:
+            with self._pool_lock:
+                if reusable and len(self._pool) < MAX_IDLE_CONNECTIONS:
+                    self._pool.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+
+    @contextmanager
+    def batch(self):
+        """
+        Run several recording calls in a single transaction.
+
+        Every AdvisorDB method called in the block (from the same thread or
+        asyncio task) uses one connection; the transaction commits when the
+        outermost block exits and rolls back if it raises.
+        """
+        if self._batch_conn.get() is not None:
+            yield
+            return
+
+        with self._get_conn() as conn:
+            conn.batch_depth += 1
+            token = self._batch_conn.set(conn)
+            try:
+                yield
+            finally:
+                self._batch_conn.reset(token)
+                conn.batch_depth -= 1
+
+    def close(self) -> None:
+        """Close pooled connections (the database stays usable)."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, []
+        for conn in pool:
             conn.close()
 
     def _init_schema(self):
@@ -490,6 +723,14 @@ class AdvisorDB:
             if current_version < SCHEMA_VERSION:
                 # Apply schema
                 conn.executescript(SCHEMA)
+                if current_version < 6:
+                    # Seed the velocity window from existing history
+                    self._append_velocity_window(conn, after_id=0)
+                if current_version < 7:
+                    # Roll up existing raw history before it ages out
+                    self._rollup_new_rows(conn, {
+                        "channel_history": 0, "fleet_snapshots": 0, "goat_feeder_snapshots": 0
+                    })
                 conn.execute(
                     "INSERT OR REPLACE INTO schema_version (version, applied_at) VALUES (?, ?)",
                     (SCHEMA_VERSION, int(datetime.now().timestamp()))
@@ -545,6 +786,7 @@ class AdvisorDB:
                 summary.get("total_pending_actions", 0),
                 json.dumps(report)
             ))
+            self._rollup_new_rows(conn, {"fleet_snapshots": cursor.lastrowid - 1})
             conn.commit()
             return cursor.lastrowid
 
@@ -554,6 +796,7 @@ class AdvisorDB:
         count = 0
 
         with self._get_conn() as conn:
+            last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM channel_history").fetchone()[0]
             for node_name, node_data in report.get("nodes", {}).items():
                 if not node_data.get("healthy"):
                     continue
@@ -588,6 +831,8 @@ class AdvisorDB:
                     ))
                     count += 1
 
+            self._append_velocity_window(conn, after_id=last_id)
+            self._rollup_new_rows(conn, {"channel_history": last_id})
             conn.commit()
 
         # Update velocity calculations
@@ -595,46 +840,79 @@ class AdvisorDB:
 
         return count
 
-    def _update_channel_velocities(self):
-        """Recalculate channel velocities based on recent history."""
-        # Use last 6 hours of data for velocity calculation
-        cutoff = int((datetime.now() - timedelta(hours=6)).timestamp())
+    def _append_velocity_window(self, conn, after_id: int) -> int:
+        """
+        Copy channel_history rows with id > after_id that fall inside the
+        velocity window into channel_velocity_window.
 
-        with self._get_conn() as conn:
-            # Get distinct channels with recent data
-            channels = conn.execute("""
-                SELECT DISTINCT node_name, channel_id
-                FROM channel_history
-                WHERE timestamp > ?
-            """, (cutoff,)).fetchall()
+        Returns:
+            Number of readings added
+        """
+        cutoff = int((datetime.now() - timedelta(hours=VELOCITY_WINDOW_HOURS)).timestamp())
+        cursor = conn.execute("""
+            INSERT OR IGNORE INTO channel_velocity_window (
+                node_name, channel_id, timestamp, history_id,
+                local_sats, balance_ratio, capacity_sats
+            )
+            SELECT node_name, channel_id, timestamp, id,
+                   local_sats, balance_ratio, capacity_sats
+            FROM channel_history
+            WHERE id > ? AND timestamp > ?
+        """, (after_id, cutoff))
+        return cursor.rowcount
 
-            for row in channels:
-                node_name, channel_id = row['node_name'], row['channel_id']
+    def _update_channel_velocities(self):
+        """
+        Recalculate channel velocities based on recent history.
 
-                # Get oldest and newest readings
-                readings = conn.execute("""
-                    SELECT timestamp, local_sats, balance_ratio, capacity_sats
-                    FROM channel_history
-                    WHERE node_name = ? AND channel_id = ?
-                    AND timestamp > ?
-                    ORDER BY timestamp
-                """, (node_name, channel_id, cutoff)).fetchall()
+        Reads only channel_velocity_window (the last VELOCITY_WINDOW_HOURS
+        of readings, clustered by channel) in one grouped pass: oldest and
+        newest reading plus sample count per channel. Results are upserted
+        in bulk into the materialized channel_velocity table.
+        """
+        cutoff = int((datetime.now() - timedelta(hours=VELOCITY_WINDOW_HOURS)).timestamp())
+        now = int(datetime.now().timestamp())
 
-                if len(readings) < 2:
-                    continue
+        with self._get_conn() as conn:
+            conn.execute(
+                "DELETE FROM channel_velocity_window WHERE timestamp <= ?", (cutoff,)
+            )
 
-                oldest = readings[0]
-                newest = readings[-1]
+            # SQLite bare columns: with MAX()/MIN() the other selected
+            # columns come from the newest/oldest row of each group
+            rows = conn.execute("""
+                SELECT n.node_name, n.channel_id, n.readings,
+                       n.timestamp, n.local_sats, n.balance_ratio, n.capacity_sats,
+                       o.oldest_ts, o.oldest_local, o.oldest_ratio
+                FROM (
+                    SELECT node_name, channel_id, COUNT(*) AS readings,
+                           MAX(timestamp) AS timestamp,
+                           local_sats, balance_ratio, capacity_sats
+                    FROM channel_velocity_window
+                    GROUP BY node_name, channel_id
+                    HAVING COUNT(*) >= 2
+                ) AS n
+                JOIN (
+                    SELECT node_name, channel_id,
+                           MIN(timestamp) AS oldest_ts,
+                           local_sats AS oldest_local,
+                           balance_ratio AS oldest_ratio
+                    FROM channel_velocity_window
+                    GROUP BY node_name, channel_id
+                ) AS o USING (node_name, channel_id)
+            """).fetchall()
 
-                time_diff_hours = (newest['timestamp'] - oldest['timestamp']) / 3600.0
+            updates = []
+            for row in rows:
+                time_diff_hours = (row['timestamp'] - row['oldest_ts']) / 3600.0
                 if time_diff_hours < 0.1:  # Less than 6 minutes
                     continue
 
                 # Calculate velocity
-                sats_change = newest['local_sats'] - oldest['local_sats']
+                sats_change = row['local_sats'] - row['oldest_local']
                 velocity_sats = sats_change / time_diff_hours
 
-                ratio_change = newest['balance_ratio'] - oldest['balance_ratio']
+                ratio_change = row['balance_ratio'] - row['oldest_ratio']
                 velocity_pct = (ratio_change * 100) / time_diff_hours
 
                 # Determine trend
@@ -650,38 +928,51 @@ class AdvisorDB:
                 hours_full = None
 
                 if trend == "depleting" and velocity_sats < 0:
-                    hours_depleted = newest['local_sats'] / abs(velocity_sats)
+                    hours_depleted = row['local_sats'] / abs(velocity_sats)
                 elif trend == "filling" and velocity_sats > 0:
-                    remote = newest['capacity_sats'] - newest['local_sats']
+                    remote = row['capacity_sats'] - row['local_sats']
                     hours_full = remote / velocity_sats
 
                 # Confidence based on data points
-                confidence = min(1.0, len(readings) / 10.0)
+                confidence = min(1.0, row['readings'] / 10.0)
 
-                # Upsert velocity record
-                conn.execute("""
-                    INSERT OR REPLACE INTO channel_velocity (
-                        node_name, channel_id, updated_at,
-                        current_local_sats, current_balance_ratio,
-                        balance_velocity_sats_per_hour, balance_velocity_pct_per_hour,
-                        hours_until_depleted, hours_until_full,
-                        predicted_depletion_time,
-                        trend, trend_confidence
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    node_name, channel_id,
-                    int(datetime.now().timestamp()),
-                    newest['local_sats'],
-                    newest['balance_ratio'],
+                updates.append((
+                    row['node_name'], row['channel_id'],
+                    now,
+                    row['local_sats'],
+                    row['balance_ratio'],
                     velocity_sats,
                     velocity_pct,
                     hours_depleted,
                     hours_full,
-                    int(datetime.now().timestamp() + hours_depleted * 3600) if hours_depleted else None,
+                    int(now + hours_depleted * 3600) if hours_depleted else None,
                     trend,
                     confidence
                 ))
 
+            # Upsert velocity records
+            conn.executemany("""
+                INSERT INTO channel_velocity (
+                    node_name, channel_id, updated_at,
+                    current_local_sats, current_balance_ratio,
+                    balance_velocity_sats_per_hour, balance_velocity_pct_per_hour,
+                    hours_until_depleted, hours_until_full,
+                    predicted_depletion_time,
+                    trend, trend_confidence
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(node_name, channel_id) DO UPDATE SET
+                    updated_at = excluded.updated_at,
+                    current_local_sats = excluded.current_local_sats,
+                    current_balance_ratio = excluded.current_balance_ratio,
+                    balance_velocity_sats_per_hour = excluded.balance_velocity_sats_per_hour,
+                    balance_velocity_pct_per_hour = excluded.balance_velocity_pct_per_hour,
+                    hours_until_depleted = excluded.hours_until_depleted,
+                    hours_until_full = excluded.hours_until_full,
+                    predicted_depletion_time = excluded.predicted_depletion_time,
+                    trend = excluded.trend,
+                    trend_confidence = excluded.trend_confidence
+            """, updates)
+
             conn.commit()
 
     # =========================================================================
@@ -717,12 +1008,13 @@ class AdvisorDB:
         results = []
 
         with self._get_conn() as conn:
+            # Served by idx_channel_velocity_critical; a velocity row has
+            # at most one of hours_until_depleted / hours_until_full set
             rows = conn.execute("""
                 SELECT * FROM channel_velocity
-                WHERE (hours_until_depleted IS NOT NULL AND hours_until_depleted < ?)
-                   OR (hours_until_full IS NOT NULL AND hours_until_full < ?)
+                WHERE COALESCE(hours_until_depleted, hours_until_full) < ?
                 ORDER BY COALESCE(hours_until_depleted, hours_until_full)
-            """, (hours_threshold, hours_threshold)).fetchall()
+            """, (hours_threshold,)).fetchall()
 
             for row in rows:
                 results.append(ChannelVelocity(
@@ -741,17 +1033,57 @@ class AdvisorDB:
         return results
 
     def get_channel_history(self, node_name: str, channel_id: str,
-                            hours: int = 24) -> List[Dict]:
-        """Get historical data for a channel."""
+                            hours: int = 24, resolution: str = "auto") -> List[Dict]:
+        """
+        Get historical data for a channel.
+
+        Windows up to RAW_QUERY_MAX_HOURS return raw samples. Longer windows
+        return one row per hourly (or, beyond the hourly retention, daily)
+        rollup bucket, shaped like a raw row from the bucket's last sample
+        (timestamp, local_sats, balance_ratio, fee_ppm, forward_count,
+        flow_state) plus samples and avg/min/max_local_sats.
+
+        Args:
+            node_name: Node name
+            channel_id: Channel SCID
+            hours: Window length
+            resolution: 'auto', 'raw', 'hour' or 'day'
+
+        Returns:
+            Rows ordered oldest first
+        """
         cutoff = int((datetime.now() - timedelta(hours=hours)).timestamp())
+        if resolution == "auto":
+            resolution = self._resolution_for_hours(hours)
 
         with self._get_conn() as conn:
+            if resolution == "raw":
+                rows = conn.execute("""
+                    SELECT * FROM channel_history
+                    WHERE node_name = ? AND channel_id = ?
+                    AND timestamp > ?
+                    ORDER BY timestamp
+                """, (node_name, channel_id, cutoff)).fetchall()
+                return [dict(row) for row in rows]
+
             rows = conn.execute("""
-                SELECT * FROM channel_history
-                WHERE node_name = ? AND channel_id = ?
-                AND timestamp > ?
-                ORDER BY timestamp
-            """, (node_name, channel_id, cutoff)).fetchall()
+                SELECT
+                    resolution, bucket_start, samples,
+                    last_ts AS timestamp, node_name, channel_id, peer_id,
+                    capacity_sats,
+                    close_local_sats AS local_sats,
+                    capacity_sats - close_local_sats AS remote_sats,
+                    close_balance_ratio AS balance_ratio,
+                    close_flow_state AS flow_state,
+                    close_forward_count AS forward_count,
+                    close_fee_ppm AS fee_ppm,
+                    CAST(sum_local_sats AS REAL) / samples AS avg_local_sats,
+                    min_local_sats, max_local_sats
+                FROM channel_history_rollup
+                WHERE resolution = ? AND node_name = ? AND channel_id = ?
+                AND last_ts > ?
+                ORDER BY bucket_start
+            """, (resolution, node_name, channel_id, cutoff)).fetchall()
 
             return [dict(row) for row in rows]
 
@@ -759,20 +1091,28 @@ class AdvisorDB:
         """Get fleet-wide trends over specified period."""
         now = datetime.now()
         cutoff = int((now - timedelta(days=days)).timestamp())
+        resolution = self._resolution_for_hours(days * 24)
 
         with self._get_conn() as conn:
-            # Get oldest and newest snapshots in period
-            oldest = conn.execute("""
-                SELECT * FROM fleet_snapshots
-                WHERE timestamp > ?
-                ORDER BY timestamp ASC LIMIT 1
-            """, (cutoff,)).fetchone()
-
             newest = conn.execute("""
                 SELECT * FROM fleet_snapshots
                 ORDER BY timestamp DESC LIMIT 1
             """).fetchone()
 
+            # Oldest point in period; long periods read the rollups so that
+            # history past the raw retention still counts
+            oldest = None
+            if resolution != "raw":
+                oldest = self._oldest_fleet_rollup(conn, resolution, cutoff)
+                if newest is None:
+                    newest = self._newest_fleet_rollup(conn, resolution)
+            if oldest is None:
+                oldest = conn.execute("""
+                    SELECT * FROM fleet_snapshots
+                    WHERE timestamp > ?
+                    ORDER BY timestamp ASC LIMIT 1
+                """, (cutoff,)).fetchone()
+
             if not oldest or not newest:
                 return None
 
@@ -832,6 +1172,276 @@ class AdvisorDB:
 
             return [dict(row) for row in rows]
 
+    # =========================================================================
+    # Time-Series Rollups
+    # =========================================================================
+
+    def _resolution_for_hours(self, hours: float) -> str:
+        """Pick the tier that answers a window of `hours`: raw, hour or day."""
+        if hours <= RAW_QUERY_MAX_HOURS:
+            return "raw"
+        if hours <= self.retention_days["hour"] * 24:
+            return "hour"
+        return "day"
+
+    def _rollup_new_rows(self, conn, after_ids: Dict[str, int]) -> None:
+        """
+        Fold raw rows with id > after_id into the hourly and daily rollups.
+
+        Called in the same transaction as the raw insert, so rollups never
+        miss or double count a row.
+
+        Args:
+            conn: Open connection
+            after_ids: {raw table name: last id already rolled up}
+        """
+        rollups = {
+            "channel_history": self._rollup_channel_history,
+            "fleet_snapshots": self._rollup_fleet_snapshots,
+            "goat_feeder_snapshots": self._rollup_goat_feeder,
+        }
+        for table, after_id in after_ids.items():
+            for resolution, width in ROLLUP_BUCKET_SECONDS.items():
+                rollups[table](conn, resolution, width, after_id)
+
+    def _rollup_channel_history(self, conn, resolution: str, width: int, after_id: int) -> None:
+        # a: bucket aggregates, o / c: first / last sample (bare columns of MIN / MAX)
+        conn.execute("""
+            INSERT INTO channel_history_rollup (
+                resolution, node_name, channel_id, bucket_start,
+                samples, first_ts, last_ts, peer_id, capacity_sats,
+                open_local_sats, close_local_sats, min_local_sats, max_local_sats,
+                sum_local_sats, sum_balance_ratio, close_balance_ratio,
+                close_fee_ppm, close_forward_count, close_flow_state
+            )
+            SELECT ?1, node_name, channel_id, bucket_start,
+                   a.samples, a.first_ts, a.last_ts, c.peer_id, c.capacity_sats,
+                   o.local_sats, c.local_sats, a.min_local, a.max_local,
+                   a.sum_local, a.sum_ratio, c.balance_ratio,
+                   c.fee_ppm, c.forward_count, c.flow_state
+            FROM (
+                SELECT node_name, channel_id, timestamp / ?2 * ?2 AS bucket_start,
+                       COUNT(*) AS samples, MIN(timestamp) AS first_ts, MAX(timestamp) AS last_ts,
+                       MIN(local_sats) AS min_local, MAX(local_sats) AS max_local,
+                       SUM(local_sats) AS sum_local, SUM(balance_ratio) AS sum_ratio
+                FROM channel_history WHERE id > ?3
+                GROUP BY node_name, channel_id, bucket_start
+            ) a
+            JOIN (
+                SELECT node_name, channel_id, timestamp / ?2 * ?2 AS bucket_start,
+                       MIN(timestamp), local_sats
+                FROM channel_history WHERE id > ?3
+                GROUP BY node_name, channel_id, bucket_start
+            ) o USING (node_name, channel_id, bucket_start)
+            JOIN (
+                SELECT node_name, channel_id, timestamp / ?2 * ?2 AS bucket_start,
+                       MAX(timestamp), peer_id, capacity_sats, local_sats, balance_ratio,
+                       fee_ppm, forward_count, flow_state
+                FROM channel_history WHERE id > ?3
+                GROUP BY node_name, channel_id, bucket_start
+            ) c USING (node_name, channel_id, bucket_start)
+            WHERE 1
+            ON CONFLICT (resolution, node_name, channel_id, bucket_start) DO UPDATE SET
+                samples = samples + excluded.samples,
+                open_local_sats = CASE WHEN excluded.first_ts < first_ts
+                    THEN excluded.open_local_sats ELSE open_local_sats END,
+                first_ts = MIN(first_ts, excluded.first_ts),
+                peer_id = CASE WHEN excluded.last_ts >= last_ts THEN excluded.peer_id ELSE peer_id END,
+                capacity_sats = CASE WHEN excluded.last_ts >= last_ts
+                    THEN excluded.capacity_sats ELSE capacity_sats END,
+                close_local_sats = CASE WHEN excluded.last_ts >= last_ts
+                    THEN excluded.close_local_sats ELSE close_local_sats END,
+                close_balance_ratio = CASE WHEN excluded.last_ts >= last_ts
+                    THEN excluded.close_balance_ratio ELSE close_balance_ratio END,
+                close_fee_ppm = CASE WHEN excluded.last_ts >= last_ts
+                    THEN excluded.close_fee_ppm ELSE close_fee_ppm END,
+                close_forward_count = CASE WHEN excluded.last_ts >= last_ts
+                    THEN excluded.close_forward_count ELSE close_forward_count END,
+                close_flow_state = CASE WHEN excluded.last_ts >= last_ts
+                    THEN excluded.close_flow_state ELSE close_flow_state END,
+                last_ts = MAX(last_ts, excluded.last_ts),
+                min_local_sats = MIN(min_local_sats, excluded.min_local_sats),
+                max_local_sats = MAX(max_local_sats, excluded.max_local_sats),
+                sum_local_sats = sum_local_sats + excluded.sum_local_sats,
+                sum_balance_ratio = sum_balance_ratio + excluded.sum_balance_ratio
+        """, (resolution, width, after_id))
+
+    def _rollup_fleet_snapshots(self, conn, resolution: str, width: int, after_id: int) -> None:
+        conn.execute("""
+            INSERT INTO fleet_snapshot_rollup (
+                resolution, bucket_start, samples, first_ts, last_ts,
+                open_total_nodes, close_total_nodes,
+                open_nodes_healthy, close_nodes_healthy,
+                open_total_channels, close_total_channels,
+                open_total_capacity_sats, close_total_capacity_sats,
+                open_total_revenue_sats, close_total_revenue_sats,
+                close_net_profit_sats
+            )
+            SELECT ?1, bucket_start, a.samples, a.first_ts, a.last_ts,
+                   o.total_nodes, c.total_nodes,
+                   o.nodes_healthy, c.nodes_healthy,
+                   o.total_channels, c.total_channels,
+                   o.total_capacity_sats, c.total_capacity_sats,
+                   o.total_revenue_sats, c.total_revenue_sats,
+                   c.net_profit_sats
+            FROM (
+                SELECT timestamp / ?2 * ?2 AS bucket_start, COUNT(*) AS samples,
+                       MIN(timestamp) AS first_ts, MAX(timestamp) AS last_ts
+                FROM fleet_snapshots WHERE id > ?3
+                GROUP BY bucket_start
+            ) a
+            JOIN (
+                SELECT timestamp / ?2 * ?2 AS bucket_start, MIN(timestamp),
+                       total_nodes, nodes_healthy, total_channels,
+                       total_capacity_sats, total_revenue_sats
+                FROM fleet_snapshots WHERE id > ?3
+                GROUP BY bucket_start
+            ) o USING (bucket_start)
+            JOIN (
+                SELECT timestamp / ?2 * ?2 AS bucket_start, MAX(timestamp),
+                       total_nodes, nodes_healthy, total_channels,
+                       total_capacity_sats, total_revenue_sats, net_profit_sats
+                FROM fleet_snapshots WHERE id > ?3
+                GROUP BY bucket_start
+            ) c USING (bucket_start)
+            WHERE 1
+            ON CONFLICT (resolution, bucket_start) DO UPDATE SET
+                samples = samples + excluded.samples,
+                open_total_nodes = CASE WHEN excluded.first_ts < first_ts
+                    THEN excluded.open_total_nodes ELSE open_total_nodes END,
+                open_nodes_healthy = CASE WHEN excluded.first_ts < first_ts
+                    THEN excluded.open_nodes_healthy ELSE open_nodes_healthy END,
+                open_total_channels = CASE WHEN excluded.first_ts < first_ts
+                    THEN excluded.open_total_channels ELSE open_total_channels END,
+                open_total_capacity_sats = CASE WHEN excluded.first_ts < first_ts
+                    THEN excluded.open_total_capacity_sats ELSE open_total_capacity_sats END,
+                open_total_revenue_sats = CASE WHEN excluded.first_ts < first_ts
+                    THEN excluded.open_total_revenue_sats ELSE open_total_revenue_sats END,
+                first_ts = MIN(first_ts, excluded.first_ts),
+                close_total_nodes = CASE WHEN excluded.last_ts >= last_ts
+                    THEN excluded.close_total_nodes ELSE close_total_nodes END,
+                close_nodes_healthy = CASE WHEN excluded.last_ts >= last_ts
+                    THEN excluded.close_nodes_healthy ELSE close_nodes_healthy END,
+                close_total_channels = CASE WHEN excluded.last_ts >= last_ts
+                    THEN excluded.close_total_channels ELSE close_total_channels END,
+                close_total_capacity_sats = CASE WHEN excluded.last_ts >= last_ts
+                    THEN excluded.close_total_capacity_sats ELSE close_total_capacity_sats END,
+                close_total_revenue_sats = CASE WHEN excluded.last_ts >= last_ts
+                    THEN excluded.close_total_revenue_sats ELSE close_total_revenue_sats END,
+                close_net_profit_sats = CASE WHEN excluded.last_ts >= last_ts
+                    THEN excluded.close_net_profit_sats ELSE close_net_profit_sats END,
+                last_ts = MAX(last_ts, excluded.last_ts)
+        """, (resolution, width, after_id))
+
+    def _rollup_goat_feeder(self, conn, resolution: str, width: int, after_id: int) -> None:
+        conn.execute("""
+            INSERT INTO goat_feeder_rollup (
+                resolution, node_name, bucket_start, samples,
+                revenue_sats, revenue_count, expense_sats, expense_count, net_profit_sats
+            )
+            SELECT ?1, node_name, timestamp / ?2 * ?2 AS bucket_start, COUNT(*),
+                   SUM(revenue_sats), SUM(revenue_count),
+                   SUM(expense_sats), SUM(expense_count), SUM(net_profit_sats)
+            FROM goat_feeder_snapshots WHERE id > ?3
+            GROUP BY node_name, bucket_start
+            ON CONFLICT (resolution, node_name, bucket_start) DO UPDATE SET
+                samples = samples + excluded.samples,
+                revenue_sats = revenue_sats + excluded.revenue_sats,
+                revenue_count = revenue_count + excluded.revenue_count,
+                expense_sats = expense_sats + excluded.expense_sats,
+                expense_count = expense_count + excluded.expense_count,
+                net_profit_sats = net_profit_sats + excluded.net_profit_sats
+        """, (resolution, width, after_id))
+
+    def _oldest_fleet_rollup(self, conn, resolution: str, cutoff: int) -> Optional[Dict]:
+        """
+        First fleet state after cutoff from the rollups, shaped like a
+        fleet_snapshots row. Exact when the bucket starts after cutoff,
+        otherwise the bucket's last sample (within one bucket width).
+        """
+        row = conn.execute("""
+            SELECT * FROM fleet_snapshot_rollup
+            WHERE resolution = ? AND last_ts > ?
+            ORDER BY bucket_start ASC LIMIT 1
+        """, (resolution, cutoff)).fetchone()
+        if not row:
+            return None
+        side = "open" if row["first_ts"] > cutoff else "close"
+        return {
+            "timestamp": row["first_ts"] if side == "open" else row["last_ts"],
+            "total_nodes": row[f"{side}_total_nodes"],
+            "nodes_healthy": row[f"{side}_nodes_healthy"],
+            "total_channels": row[f"{side}_total_channels"],
+            "total_capacity_sats": row[f"{side}_total_capacity_sats"],
+            "total_revenue_sats": row[f"{side}_total_revenue_sats"],
+        }
+
+    def _newest_fleet_rollup(self, conn, resolution: str) -> Optional[Dict]:
+        row = conn.execute("""
+            SELECT * FROM fleet_snapshot_rollup
+            WHERE resolution = ?
+            ORDER BY bucket_start DESC LIMIT 1
+        """, (resolution,)).fetchone()
+        if not row:
+            return None
+        return {
+            "timestamp": row["last_ts"],
+            "total_nodes": row["close_total_nodes"],
+            "nodes_healthy": row["close_nodes_healthy"],
+            "total_channels": row["close_total_channels"],
+            "total_capacity_sats": row["close_total_capacity_sats"],
+            "total_revenue_sats": row["close_total_revenue_sats"],
+        }
+
+    def _goat_feeder_sums(self, conn, node_name: Optional[str], start: int, end: int,
+                          tiers: Tuple[str, ...]) -> Dict[str, Optional[int]]:
+        """
+        Sum goat feeder snapshots with start <= timestamp < end.
+
+        Whole buckets of the coarsest tier are read from the rollups; the
+        partial edges recurse into the next finer tier and finally raw rows.
+
+        Returns:
+            Dict of revenue, revenue_count, expense, expense_count, net_profit
+            (all None when no snapshot falls in the range)
+        """
+        keys = ("revenue", "revenue_count", "expense", "expense_count", "net_profit")
+        node_filter = "AND node_name = ?" if node_name else ""
+        node_args = (node_name,) if node_name else ()
+
+        if not tiers:
+            row = conn.execute(f"""
+                SELECT SUM(revenue_sats), SUM(revenue_count), SUM(expense_sats),
+                       SUM(expense_count), SUM(net_profit_sats)
+                FROM goat_feeder_snapshots
+                WHERE timestamp >= ? AND timestamp < ? {node_filter}
+            """, (start, end) + node_args).fetchone()
+            return dict(zip(keys, row))
+
+        width = ROLLUP_BUCKET_SECONDS[tiers[0]]
+        first = -(-start // width) * width
+        last = end // width * width
+        if first >= last:
+            return self._goat_feeder_sums(conn, node_name, start, end, tiers[1:])
+
+        row = conn.execute(f"""
+            SELECT SUM(revenue_sats), SUM(revenue_count), SUM(expense_sats),
+                   SUM(expense_count), SUM(net_profit_sats)
+            FROM goat_feeder_rollup
+            WHERE resolution = ? AND bucket_start >= ? AND bucket_start < ? {node_filter}
+        """, (tiers[0], first, last) + node_args).fetchone()
+        parts = [dict(zip(keys, row))]
+        if start < first:
+            parts.append(self._goat_feeder_sums(conn, node_name, start, first, tiers[1:]))
+        if last < end:
+            parts.append(self._goat_feeder_sums(conn, node_name, last, end, tiers[1:]))
+
+        totals: Dict[str, Optional[int]] = {}
+        for key in keys:
+            values = [p[key] for p in parts if p[key] is not None]
+            totals[key] = sum(values) if values else None
+        return totals
+
     # =========================================================================
     # Decision Tracking
     # =========================================================================
@@ -871,13 +1481,38 @@ class AdvisorDB:
 
             return [dict(row) for row in rows]
 
+    def get_recent_decisions(self, limit: int = 20) -> List[Dict]:
+        """Get the most recent decisions, newest first."""
+        with self._get_conn() as conn:
+            rows = conn.execute("""
+                SELECT id, timestamp, decision_type, node_name, channel_id, peer_id,
+                       recommendation, reasoning, confidence, status
+                FROM ai_decisions
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """, (limit,)).fetchall()
+
+            return [dict(row) for row in rows]
+
     # =========================================================================
     # Maintenance
     # =========================================================================
 
-    def cleanup_old_data(self, days_to_keep: int = 30):
-        """Remove old historical data to manage database size."""
-        cutoff = int((datetime.now() - timedelta(days=days_to_keep)).timestamp())
+    def cleanup_old_data(self, days_to_keep: int = None):
+        """
+        Remove old historical data to manage database size.
+
+        Raw rows older than the raw retention are dropped; they remain
+        available at coarser resolution in the hourly and daily rollups,
+        which are pruned by their own retention (see retention_days).
+
+        Args:
+            days_to_keep: Raw retention override (default retention_days['raw'])
+        """
+        if days_to_keep is None:
+            days_to_keep = self.retention_days["raw"]
+        now = datetime.now()
+        cutoff = int((now - timedelta(days=days_to_keep)).timestamp())
 
         with self._get_conn() as conn:
             # Keep daily snapshots longer, remove hourly after cutoff
@@ -891,6 +1526,24 @@ class AdvisorDB:
                 WHERE timestamp < ?
             """, (cutoff,))
 
+            # Forward buckets back long-range period comparisons
+            bucket_cutoff = int((datetime.now() - timedelta(
+                days=max(days_to_keep, FORWARD_BUCKET_RETENTION_DAYS))).timestamp())
+            conn.execute("""
+                DELETE FROM forward_buckets
+                WHERE bucket_start < ?
+            """, (bucket_cutoff,))
+
+            for resolution in ROLLUP_BUCKET_SECONDS:
+                rollup_cutoff = int((now - timedelta(
+                    days=self.retention_days[resolution])).timestamp())
+                for table in ("channel_history_rollup", "fleet_snapshot_rollup",
+                              "goat_feeder_rollup"):
+                    conn.execute(f"""
+                        DELETE FROM {table}
+                        WHERE resolution = ? AND bucket_start < ?
+                    """, (resolution, rollup_cutoff))
+
             conn.commit()
 
     def get_stats(self) -> Dict[str, Any]:
@@ -1526,6 +2179,7 @@ class AdvisorDB:
                 net_profit,
                 profitable
             ))
+            self._rollup_new_rows(conn, {"goat_feeder_snapshots": cursor.lastrowid - 1})
             conn.commit()
             return cursor.lastrowid
 
@@ -1586,48 +2240,14 @@ class AdvisorDB:
         cutoff = int((now - timedelta(days=days)).timestamp())
         prev_cutoff = int((now - timedelta(days=days * 2)).timestamp())
 
-        with self._get_conn() as conn:
-            # Build query based on node filter
-            if node_name:
-                current = conn.execute("""
-                    SELECT
-                        SUM(revenue_sats) as revenue,
-                        SUM(revenue_count) as revenue_count,
-                        SUM(expense_sats) as expense,
-                        SUM(expense_count) as expense_count,
-                        SUM(net_profit_sats) as net_profit
-                    FROM goat_feeder_snapshots
-                    WHERE node_name = ? AND timestamp > ?
-                """, (node_name, cutoff)).fetchone()
-
-                previous = conn.execute("""
-                    SELECT
-                        SUM(revenue_sats) as revenue,
-                        SUM(expense_sats) as expense,
-                        SUM(net_profit_sats) as net_profit
-                    FROM goat_feeder_snapshots
-                    WHERE node_name = ? AND timestamp > ? AND timestamp <= ?
-                """, (node_name, prev_cutoff, cutoff)).fetchone()
-            else:
-                current = conn.execute("""
-                    SELECT
-                        SUM(revenue_sats) as revenue,
-                        SUM(revenue_count) as revenue_count,
-                        SUM(expense_sats) as expense,
-                        SUM(expense_count) as expense_count,
-                        SUM(net_profit_sats) as net_profit
-                    FROM goat_feeder_snapshots
-                    WHERE timestamp > ?
-                """, (cutoff,)).fetchone()
+        # Long periods read whole rollup buckets and only touch raw rows
+        # at the sub-hour edges
+        tiers = ("day", "hour") if self._resolution_for_hours(days * 24) != "raw" else ()
+        now_ts = int(now.timestamp())
 
-                previous = conn.execute("""
-                    SELECT
-                        SUM(revenue_sats) as revenue,
-                        SUM(expense_sats) as expense,
-                        SUM(net_profit_sats) as net_profit
-                    FROM goat_feeder_snapshots
-                    WHERE timestamp > ? AND timestamp <= ?
-                """, (prev_cutoff, cutoff)).fetchone()
+        with self._get_conn() as conn:
+            current = self._goat_feeder_sums(conn, node_name, cutoff + 1, now_ts + 1, tiers)
+            previous = self._goat_feeder_sums(conn, node_name, prev_cutoff + 1, cutoff + 1, tiers)
 
             if not current or current['revenue'] is None:
                 return None
@@ -2004,6 +2624,165 @@ class AdvisorDB:
             ))
             conn.commit()
 
+    # =========================================================================
+    # Forward Index
+    # =========================================================================
+
+    def get_forward_index_state(self, node_name: str) -> Dict[str, Any]:
+        """
+        Get the forward index high-water mark and in-flight forwards.
+
+        Returns:
+            Dict with created_index, forwards_indexed, updated_at and the
+            pending {created_index: first_seen} map
+        """
+        with self._get_conn() as conn:
+            row = conn.execute(
+                "SELECT * FROM forward_index_state WHERE node_name = ?",
+                (node_name,)
+            ).fetchone()
+            pending = conn.execute(
+                "SELECT created_index, first_seen FROM forward_index_pending WHERE node_name = ?",
+                (node_name,)
+            ).fetchall()
+
+        state = dict(row) if row else {
+            "node_name": node_name,
+            "created_index": 0,
+            "forwards_indexed": 0,
+            "updated_at": None,
+        }
+        state["pending"] = {r["created_index"]: r["first_seen"] for r in pending}
+        return state
+
+    def apply_forward_index_batch(self, node_name: str, expected_index: int,
+                                  new_index: int,
+                                  buckets: Dict[Tuple[str, int], Tuple[int, int, int]],
+                                  pending_add: Dict[int, int] = None,
+                                  pending_remove: List[int] = None) -> bool:
+        """
+        Atomically add aggregated forwards and advance the high-water mark.
+
+        The mark is compared-and-set: if another writer already advanced it
+        past expected_index, nothing is written and False is returned, so
+        the same page is never counted twice.
+
+        Args:
+            node_name: Node the forwards belong to
+            expected_index: created_index the caller started paging from
+            new_index: created_index of the last forward consumed
+            buckets: {(channel_id, bucket_start): (count, volume_msat, revenue_msat)}
+            pending_add: In-flight forwards to re-check {created_index: first_seen}
+            pending_remove: Pending forwards that resolved or expired
+
+        Returns:
+            True if applied
+        """
+        now = int(datetime.now().timestamp())
+        with self._get_conn() as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT created_index FROM forward_index_state WHERE node_name = ?",
+                (node_name,)
+            ).fetchone()
+            current = row["created_index"] if row else 0
+            if current != expected_index:
+                return False
+
+            conn.executemany("""
+                INSERT INTO forward_buckets (
+                    node_name, channel_id, bucket_start,
+                    forward_count, volume_msat, revenue_msat
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(node_name, bucket_start, channel_id) DO UPDATE SET
+                    forward_count = forward_count + excluded.forward_count,
+                    volume_msat = volume_msat + excluded.volume_msat,
+                    revenue_msat = revenue_msat + excluded.revenue_msat
+            """, [
+                (node_name, channel_id, bucket_start, count, volume, revenue)
+                for (channel_id, bucket_start), (count, volume, revenue) in buckets.items()
+            ])
+
+            if pending_remove:
+                conn.executemany(
+                    "DELETE FROM forward_index_pending WHERE node_name = ? AND created_index = ?",
+                    [(node_name, idx) for idx in pending_remove]
+                )
+            if pending_add:
+                conn.executemany("""
+                    INSERT OR IGNORE INTO forward_index_pending (node_name, created_index, first_seen)
+                    VALUES (?, ?, ?)
+                """, [(node_name, idx, ts) for idx, ts in pending_add.items()])
+
+            added = sum(count for count, _, _ in buckets.values())
+            conn.execute("""
+                INSERT INTO forward_index_state (node_name, created_index, forwards_indexed, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(node_name) DO UPDATE SET
+                    created_index = excluded.created_index,
+                    forwards_indexed = forwards_indexed + excluded.forwards_indexed,
+                    updated_at = excluded.updated_at
+            """, (node_name, new_index, added, now))
+            conn.commit()
+            return True
+
+    def get_forward_window_stats(self, node_name: str, start_ts: int,
+                                 end_ts: int) -> Dict[str, Any]:
+        """
+        Aggregate indexed forwards resolved in [start_ts, end_ts].
+
+        Answered from buckets, so the window start is rounded down to the
+        bucket boundary (FORWARD_BUCKET_SECONDS).
+
+        Returns:
+            Same shape as the MCP server's _forward_stats(): forward_count,
+            total_volume_msat, total_revenue_msat, avg_fee_ppm, per_channel
+        """
+        bucket_from = start_ts - (start_ts % FORWARD_BUCKET_SECONDS)
+        with self._get_conn() as conn:
+            rows = conn.execute("""
+                SELECT channel_id,
+                       SUM(forward_count) as count,
+                       SUM(volume_msat) as volume_msat,
+                       SUM(revenue_msat) as revenue_msat
+                FROM forward_buckets
+                WHERE node_name = ? AND bucket_start >= ? AND bucket_start <= ?
+                GROUP BY channel_id
+            """, (node_name, bucket_from, end_ts)).fetchall()
+
+        forward_count = 0
+        total_volume_msat = 0
+        total_revenue_msat = 0
+        per_channel: Dict[str, Dict[str, int]] = {}
+        for row in rows:
+            forward_count += row["count"]
+            total_volume_msat += row["volume_msat"]
+            total_revenue_msat += row["revenue_msat"]
+            if row["channel_id"]:
+                per_channel[row["channel_id"]] = {
+                    "revenue_msat": row["revenue_msat"],
+                    "volume_msat": row["volume_msat"],
+                    "count": row["count"],
+                }
+
+        avg_fee_ppm = int((total_revenue_msat * 1_000_000) / total_volume_msat) if total_volume_msat else 0
+        return {
+            "forward_count": forward_count,
+            "total_volume_msat": total_volume_msat,
+            "total_revenue_msat": total_revenue_msat,
+            "avg_fee_ppm": avg_fee_ppm,
+            "per_channel": per_channel,
+        }
+
+    def reset_forward_index(self, node_name: str) -> None:
+        """Drop all indexed forwards for a node (next sync rebuilds it)."""
+        with self._get_conn() as conn:
+            conn.execute("DELETE FROM forward_buckets WHERE node_name = ?", (node_name,))
+            conn.execute("DELETE FROM forward_index_pending WHERE node_name = ?", (node_name,))
+            conn.execute("DELETE FROM forward_index_state WHERE node_name = ?", (node_name,))
+            conn.commit()
+
     # =========================================================================
     # Generic Metadata (for tracking onboarded members, etc.)
     # =========================================================================
@@ -2075,3 +2854,58 @@ class AdvisorDB:
         """
         key = f"onboarded_{member_pubkey[:16]}"
         return self.get_metadata(key) is not None
+
+
+# =============================================================================
+# Async Facade
+# =============================================================================
+
+class AsyncAdvisorDB:
+    """
+    Awaitable wrapper around AdvisorDB for asyncio callers.
+
+    Every public AdvisorDB method is exposed as a coroutine that runs in a
+    small thread pool, so long writes no longer block the event loop:
+
+        adb = AsyncAdvisorDB(db)
+        await adb.record_decision(...)
+        await adb.run_batch(lambda db: (db.record_fleet_snapshot(r),
+                                        db.record_channel_states(r)))
+    """
+
+    def __init__(self, db: AdvisorDB, max_workers: int = ASYNC_DB_WORKERS):
+        self.db = db
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="advisor-db"
+        )
+
+    async def run(self, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) in the executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs)
+        )
+
+    async def run_batch(self, fn):
+        """Run fn(db) in the executor inside a single transaction."""
+        def _in_batch():
+            with self.db.batch():
+                return fn(self.db)
+        return await self.run(_in_batch)
+
+    def __getattr__(self, name: str):
+        attr = getattr(self.db, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        async def _call(*args, **kwargs):
+            return await self.run(attr, *args, **kwargs)
+
+        _call.__name__ = name
+        _call.__doc__ = attr.__doc__
+        return _call
+
+    def shutdown(self) -> None:
+        """Stop the executor and close pooled connections."""
+        self._executor.shutdown(wait=True)
+        self.db.close()
@@ -0,0 +1,208 @@
+"""
+Per-cycle node data snapshot for the Proactive Advisor.
+
+Every advisor cycle reads the same node data from many places: state
+analysis, goal checks, ~17 opportunity scanners and action execution.
+A CycleSnapshot is built once per node per cycle and shared by all of
+them, so each underlying MCP call and DB lookup runs at most once.
+
+- fetch_sources() runs each distinct MCP call once, concurrently, under a
+  per-call timeout, and records how long each took
+- CycleSnapshot is a read-only mapping over the fetched (and derived)
+  state, with memoized DB lookups and per-fetch timing instrumentation
+
+Usage:
+    from cycle_snapshot import CycleSnapshot, fetch_sources
+
+    results, timings = await fetch_sources(mcp, {"channels": ("hive_channels", {"node": n})})
+    snapshot = CycleSnapshot(n, {"channels": results["channels"]}, db=db, fetch_timings=timings)
+    history = snapshot.channel_history("123x1x0", hours=168)
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("cycle_snapshot")
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_FETCH_TIMEOUT = 15  # seconds per individual MCP call
+
+DB_CHANNEL_HISTORY = "db:get_channel_history"  # fetch name for channel history lookups
+DB_METADATA = "db:get_metadata"                # fetch name for metadata lookups
+
+
+# =============================================================================
+# Fetching
+# =============================================================================
+
+def _record_timing(
+    timings: Dict[str, Dict[str, Any]],
+    name: str,
+    seconds: float,
+    ok: bool = True
+) -> None:
+    """Accumulate one fetch into a timings dict keyed by fetch name."""
+    entry = timings.setdefault(name, {"calls": 0, "seconds": 0.0, "errors": 0})
+    entry["calls"] += 1
+    entry["seconds"] = round(entry["seconds"] + seconds, 6)
+    if not ok:
+        entry["errors"] += 1
+
+
+async def fetch_sources(
+    mcp,
+    sources: Dict[str, Tuple[str, Dict[str, Any]]],
+    timeout: float = DEFAULT_FETCH_TIMEOUT
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """
+    Fetch named data sources concurrently, calling each distinct RPC once.
+
+    Sources that resolve to the same method and params share one call.
+    A call that fails or times out yields {} for every key that uses it.
+
+    Args:
+        mcp: Client with an async call(method, params)
+        sources: Mapping of state key -> (method, params)
+        timeout: Per-call timeout in seconds
+
+    Returns:
+        Tuple of (results keyed by state key, timings keyed by method)
+    """
+    unique: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+    key_to_call: Dict[str, str] = {}
+    for key, (method, params) in sources.items():
+        call_id = f"{method}:{json.dumps(params, sort_keys=True, default=str)}"
+        unique.setdefault(call_id, (method, params))
+        key_to_call[key] = call_id
+
+    timings: Dict[str, Dict[str, Any]] = {}
+
+    async def run(call_id: str, method: str, params: Dict[str, Any]) -> Tuple[str, Any]:
+        start = time.perf_counter()
+        ok = False
+        try:
+            result = await asyncio.wait_for(mcp.call(method, params), timeout=timeout)
+            ok = True
+            return call_id, result
+        except asyncio.TimeoutError:
+            logger.debug(f"Timeout on {method}")
+            return call_id, {}
+        except Exception:
+            return call_id, {}
+        finally:
+            _record_timing(timings, method, time.perf_counter() - start, ok)
+
+    gathered = await asyncio.gather(
+        *[run(call_id, method, params) for call_id, (method, params) in unique.items()]
+    )
+    by_call = dict(gathered)
+    results = {key: by_call[call_id] for key, call_id in key_to_call.items()}
+    return results, timings
+
+
+# =============================================================================
+# Snapshot
+# =============================================================================
+
+class CycleSnapshot(Mapping):
+    """
+    Immutable view of one node's data for one advisor cycle.
+
+    Behaves like the read-only state dict the scanners already consume
+    (snapshot.get("channels", [])). Values are shared between readers,
+    so callers must copy before modifying them. DB lookups made through
+    the snapshot are memoized for the life of the cycle.
+    """
+
+    def __init__(
+        self,
+        node_name: str,
+        data: Dict[str, Any],
+        db=None,
+        fetch_timings: Optional[Dict[str, Dict[str, Any]]] = None
+    ):
+        """
+        Create a snapshot.
+
+        Args:
+            node_name: Node the data belongs to
+            data: State keyed by source name
+            db: Optional AdvisorDB used for memoized lookups
+            fetch_timings: Timings of the fetches that produced data
+        """
+        self.node_name = node_name
+        self.created_at = time.time()
+        self._data = MappingProxyType(dict(data))
+        self._db = db
+        self._memo: Dict[Tuple, Any] = {}
+        self.fetch_timings: Dict[str, Dict[str, Any]] = {
+            name: dict(entry) for name, entry in (fetch_timings or {}).items()
+        }
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"CycleSnapshot(node={self.node_name!r}, keys={sorted(self._data)})"
+
+    def _memoized(self, name: str, key: Tuple, fetch: Callable[[], Any]) -> Any:
+        """Run a lookup once per snapshot and time the first (real) call."""
+        memo_key = (name,) + key
+        if memo_key in self._memo:
+            return self._memo[memo_key]
+        start = time.perf_counter()
+        try:
+            value = fetch()
+        except Exception:
+            _record_timing(self.fetch_timings, name, time.perf_counter() - start, ok=False)
+            raise
+        _record_timing(self.fetch_timings, name, time.perf_counter() - start)
+        self._memo[memo_key] = value
+        return value
+
+    def channel_history(self, channel_id: str, hours: int = 24) -> List[Dict[str, Any]]:
+        """
+        Channel history for this node, fetched at most once per cycle.
+
+        Args:
+            channel_id: Channel short ID
+            hours: Window in hours
+
+        Returns:
+            History rows as returned by AdvisorDB.get_channel_history()
+        """
+        if self._db is None:
+            return []
+        return self._memoized(
+            DB_CHANNEL_HISTORY, (channel_id, hours),
+            lambda: self._db.get_channel_history(self.node_name, channel_id, hours=hours)
+        )
+
+    def metadata(self, key: str) -> Optional[Any]:
+        """
+        Advisor metadata value, fetched at most once per cycle.
+
+        Args:
+            key: Metadata key
+
+        Returns:
+            Value or None if not found
+        """
+        if self._db is None:
+            return None
+        return self._memoized(DB_METADATA, (key,), lambda: self._db.get_metadata(key))
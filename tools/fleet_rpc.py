@@ -0,0 +1,251 @@
+"""
+Fleet RPC layer for the MCP server.
+
+- fan_out(): run one coroutine per node concurrently under a single overall
+  deadline and return whatever finished, with a per-node status. A slow or
+  hung node no longer holds every fleet-wide tool hostage.
+- ResponseCache: short-TTL cache keyed by (node, method, params) for
+  read-only RPCs, so the same listpeerchannels / hive-status issued several
+  times within one advisor cycle reaches the node once. Concurrent identical
+  requests share a single in-flight call. Any non-read-only call on a node
+  drops that node's cached entries so tools never act on pre-write state.
+  Every caller gets its own deep copy, so handlers may annotate responses
+  without leaking into other tools.
+"""
+
+import asyncio
+import copy
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger("mcp-hive")
+
+# Fan-out and cache defaults
+FLEET_DEADLINE_SECONDS = 30.0      # Overall deadline for one fleet-wide request
+CACHE_TTL_SECONDS = 15.0           # Roughly one advisor cycle
+MAX_CACHE_ENTRIES = 2048
+
+# Read-only RPCs whose responses may be served from cache
+CACHEABLE_METHODS = frozenset({
+    "getinfo",
+    "listpeers",
+    "listpeerchannels",
+    "listchannels",
+    "listfunds",
+    "listnodes",
+    "hive-status",
+    "hive-members",
+    "hive-pending-actions",
+    "hive-topology",
+    "revenue-status",
+    "revenue-dashboard",
+    "revenue-profitability",
+})
+
+
+def _cache_key(node_name: str, method: str, params: Optional[Dict]) -> Tuple[str, str, str]:
+    return (node_name, method, json.dumps(params or {}, sort_keys=True, default=str))
+
+
+class ResponseCache:
+    """TTL cache of read-only RPC responses with in-flight coalescing."""
+
+    def __init__(self, ttl_seconds: float = CACHE_TTL_SECONDS,
+                 max_entries: int = MAX_CACHE_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple[str, str, str], Tuple[float, Any]] = {}
+        self._inflight: Dict[Tuple[str, str, str], asyncio.Future] = {}
+        # Bumped by invalidate() so fetches started before a write are not
+        # stored after it (per node, plus one for invalidating everything)
+        self._generations: Dict[str, int] = {}
+        self._global_generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def call(self, node_name: str, method: str, params: Optional[Dict],
+                   fetch: Callable[[], Awaitable[Dict]]) -> Dict:
+        """
+        Serve a call from cache or run fetch() once for all concurrent callers.
+
+        Error responses are returned but never cached. Methods outside
+        CACHEABLE_METHODS always run and invalidate the node's entries.
+        Cache hits and coalesced callers receive a deep copy; the cache
+        keeps a private copy of what it stores. A result whose node was
+        invalidated while it was being fetched is returned but not stored.
+        """
+        if method not in CACHEABLE_METHODS:
+            self.invalidate(node_name)
+            return await fetch()
+
+        key = _cache_key(node_name, method, params)
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry and entry[0] > now:
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.hits += 1
+            return copy.deepcopy(await asyncio.shield(inflight))
+
+        self.misses += 1
+        generation = self._generation(node_name)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not logged
+            future.exception()
+            raise
+        else:
+            # Snapshot before handing the result back: the fetching caller
+            # may mutate it as soon as it resumes
+            shared = copy.deepcopy(result)
+            future.set_result(shared)
+            if (self._generation(node_name) == generation
+                    and not (isinstance(result, dict) and "error" in result)):
+                if len(self._entries) >= self.max_entries:
+                    self._evict(now)
+                self._entries[key] = (time.monotonic() + self.ttl_seconds, shared)
+            return result
+        finally:
+            # invalidate() may already have replaced this fetch
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def _generation(self, node_name: str) -> Tuple[int, int]:
+        return self._global_generation, self._generations.get(node_name, 0)
+
+    def _evict(self, now: float) -> None:
+        expired = [k for k, (expires, _) in self._entries.items() if expires <= now]
+        for k in expired:
+            del self._entries[k]
+        if len(self._entries) >= self.max_entries:
+            # Drop the oldest half (dicts keep insertion order)
+            for k in list(self._entries)[:len(self._entries) // 2]:
+                del self._entries[k]
+
+    def invalidate(self, node_name: Optional[str] = None) -> None:
+        """
+        Drop cached entries for one node (or all nodes).
+
+        Fetches already in flight for the node still answer their callers,
+        but new callers no longer join them and their results are not stored.
+        """
+        if node_name is None:
+            self._global_generation += 1
+            self._entries.clear()
+            self._inflight.clear()
+            return
+        self._generations[node_name] = self._generations.get(node_name, 0) + 1
+        for k in [k for k in self._entries if k[0] == node_name]:
+            del self._entries[k]
+        for k in [k for k in self._inflight if k[0] == node_name]:
+            del self._inflight[k]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+@dataclass
+class FleetResult:
+    """Outcome of a fleet-wide fan-out."""
+    results: Dict[str, Any] = field(default_factory=dict)
+    status: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    elapsed_ms: int = 0
+    deadline_seconds: float = 0.0
+
+    @property
+    def complete(self) -> bool:
+        return all(s["status"] == "ok" for s in self.status.values())
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "complete": self.complete,
+            "elapsed_ms": self.elapsed_ms,
+            "deadline_seconds": self.deadline_seconds,
+            "nodes": self.status,
+        }
+
+
+async def fan_out(nodes: Dict[str, Any], fn: Callable[[Any], Awaitable[Any]],
+                  deadline: float = FLEET_DEADLINE_SECONDS,
+                  semaphores: Optional[Dict[str, asyncio.Semaphore]] = None) -> FleetResult:
+    """
+    Run fn(node) for every node concurrently under one overall deadline.
+
+    Nodes that raise get {"error": ...}; nodes still running at the deadline
+    are cancelled and get {"error": "Timeout after Ns"}. Results keep the
+    node order of `nodes`.
+
+    Args:
+        nodes: {name: NodeConnection}
+        fn: Coroutine function taking a node
+        deadline: Seconds for the whole fan-out
+        semaphores: Optional per-node concurrency limits
+
+    Returns:
+        FleetResult with per-node results and status
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    finished_at: Dict[str, float] = {}
+
+    async def run_one(name: str, node: Any) -> Any:
+        sem = (semaphores or {}).get(name)
+        try:
+            if sem:
+                async with sem:
+                    return await fn(node)
+            return await fn(node)
+        finally:
+            finished_at[name] = loop.time()
+
+    tasks = {name: asyncio.ensure_future(run_one(name, node)) for name, node in nodes.items()}
+    if tasks:
+        await asyncio.wait(tasks.values(), timeout=deadline)
+
+    outcome = FleetResult(deadline_seconds=deadline)
+    for name, task in tasks.items():
+        if not task.done():
+            task.cancel()
+            logger.warning(f"Fleet call on {name} exceeded {deadline}s deadline")
+            outcome.results[name] = {"error": f"Timeout after {deadline}s"}
+            outcome.status[name] = {"status": "timeout", "latency_ms": int(deadline * 1000)}
+            continue
+
+        latency_ms = int((finished_at.get(name, loop.time()) - start) * 1000)
+        if task.cancelled():
+            outcome.results[name] = {"error": "Cancelled"}
+            outcome.status[name] = {"status": "error", "latency_ms": latency_ms, "error": "Cancelled"}
+        elif task.exception() is not None:
+            error = str(task.exception())
+            logger.error(f"Fleet call on {name} failed: {error}")
+            outcome.results[name] = {"error": error}
+            outcome.status[name] = {"status": "error", "latency_ms": latency_ms, "error": error}
+        else:
+            result = task.result()
+            outcome.results[name] = result
+            if isinstance(result, dict) and "error" in result:
+                outcome.status[name] = {"status": "error", "latency_ms": latency_ms,
+                                        "error": str(result["error"])}
+            else:
+                outcome.status[name] = {"status": "ok", "latency_ms": latency_ms}
+
+    outcome.elapsed_ms = int((loop.time() - start) * 1000)
+    return outcome
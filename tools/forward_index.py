@@ -0,0 +1,194 @@
+"""
+Incremental forward index for the MCP server.
+
+Fleet snapshots, anomaly scans and period comparisons used to pull the full
+``listforwards`` history from every node on every call. This index keeps a
+per-node high-water mark on ``created_index`` and pages only new forwards
+(``listforwards index=created start=N limit=M``, CLN >= 23.11), folding
+settled forwards into hourly per-channel buckets in the advisor database.
+Window queries are then answered with one aggregate query.
+
+Forwards that are still ``offered`` when first seen are kept in a small
+pending set and re-checked individually on later syncs until they settle,
+fail, or expire.
+
+Nodes whose CLN does not support created_index paging report an error from
+sync(); callers fall back to the full listforwards scan.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from advisor_db import AdvisorDB, FORWARD_BUCKET_SECONDS
+from mcp_hive_server_helpers import extract_msat
+
+logger = logging.getLogger("mcp-hive")
+
+# Paging and pending-forward limits
+FORWARD_PAGE_LIMIT = 1000            # Forwards per listforwards page
+MAX_PAGES_PER_SYNC = 500             # Bound a single catch-up (500k forwards)
+PENDING_MAX_AGE_SECONDS = 86400      # Drop in-flight forwards not resolved in a day
+MAX_PENDING_CHECKS_PER_SYNC = 200    # Individual re-checks per sync
+
+
+def _coerce_ts(value: Any) -> int:
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(float(value))
+        except ValueError:
+            return 0
+    return 0
+
+
+def _bucket_forward(fwd: Dict, buckets: Dict[Tuple[str, int], List[int]]) -> bool:
+    """
+    Add a settled forward to the bucket accumulator.
+
+    Volume and revenue follow the MCP server's _forward_stats(): volume is
+    out_msat (or in_msat), revenue is in - out when both are known.
+
+    Returns:
+        False if the forward has no usable resolved time
+    """
+    resolved = _coerce_ts(fwd.get("resolved_time") or fwd.get("resolved_at") or 0)
+    if resolved <= 0:
+        return False
+
+    in_msat = extract_msat(fwd.get("in_msat"))
+    out_msat = extract_msat(fwd.get("out_msat"))
+    volume_msat = out_msat if out_msat else in_msat
+    revenue_msat = max(0, in_msat - out_msat) if in_msat and out_msat else 0
+    out_channel = fwd.get("out_channel") or fwd.get("out_channel_id") or fwd.get("out_scid") or ""
+
+    key = (out_channel, resolved - (resolved % FORWARD_BUCKET_SECONDS))
+    entry = buckets.setdefault(key, [0, 0, 0])
+    entry[0] += 1
+    entry[1] += volume_msat
+    entry[2] += revenue_msat
+    return True
+
+
+class ForwardIndex:
+    """
+    Per-node incremental index of settled forwards.
+
+    One sync runs per node at a time; the database compare-and-set on the
+    high-water mark additionally protects against a second server process
+    sharing the same advisor database.
+    """
+
+    def __init__(self, db: AdvisorDB, page_limit: int = FORWARD_PAGE_LIMIT):
+        self.db = db
+        self.page_limit = page_limit
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def _lock(self, node_name: str) -> asyncio.Lock:
+        lock = self._locks.get(node_name)
+        if lock is None:
+            lock = self._locks[node_name] = asyncio.Lock()
+        return lock
+
+    async def sync(self, node: Any) -> Dict[str, Any]:
+        """
+        Fetch forwards created since the high-water mark and index them.
+
+        Args:
+            node: NodeConnection (anything with .name and async .call())
+
+        Returns:
+            Dict with new/settled/pending counts and the new mark, or
+            {"error": ...} if the node cannot be paged by created_index
+        """
+        async with self._lock(node.name):
+            state = await asyncio.to_thread(self.db.get_forward_index_state, node.name)
+            start_index = state["created_index"]
+            now = int(time.time())
+
+            buckets: Dict[Tuple[str, int], List[int]] = {}
+            pending_add: Dict[int, int] = {}
+            pending_remove: List[int] = []
+            fetched = 0
+
+            # Re-check forwards that were in flight on earlier syncs
+            for idx, first_seen in sorted(state["pending"].items())[:MAX_PENDING_CHECKS_PER_SYNC]:
+                result = await node.call("listforwards", {"index": "created", "start": idx, "limit": 1})
+                if "error" in result:
+                    return {"error": result["error"]}
+                fwd = next(
+                    (f for f in result.get("forwards", []) if f.get("created_index") == idx),
+                    None
+                )
+                status = fwd.get("status") if fwd else None
+                if status == "offered" and now - first_seen < PENDING_MAX_AGE_SECONDS:
+                    continue
+                if status == "settled":
+                    _bucket_forward(fwd, buckets)
+                pending_remove.append(idx)
+
+            # Page new forwards
+            last_index = start_index
+            for _ in range(MAX_PAGES_PER_SYNC):
+                result = await node.call("listforwards", {
+                    "index": "created",
+                    "start": last_index + 1,
+                    "limit": self.page_limit,
+                })
+                if "error" in result:
+                    return {"error": result["error"]}
+                page = result.get("forwards", [])
+                for fwd in page:
+                    created = fwd.get("created_index")
+                    if not isinstance(created, int):
+                        return {"error": "listforwards does not report created_index"}
+                    if created <= last_index:
+                        continue
+                    last_index = created
+                    fetched += 1
+                    status = fwd.get("status")
+                    if status == "settled":
+                        _bucket_forward(fwd, buckets)
+                    elif status == "offered":
+                        pending_add[created] = now
+                if len(page) < self.page_limit:
+                    break
+
+            applied = await asyncio.to_thread(
+                self.db.apply_forward_index_batch,
+                node.name, start_index, last_index,
+                {key: tuple(v) for key, v in buckets.items()},
+                pending_add, pending_remove
+            )
+            if not applied:
+                # Another writer advanced the mark; its data is already indexed
+                logger.info(f"Forward index for {node.name} advanced concurrently; skipped batch")
+
+            return {
+                "node": node.name,
+                "applied": applied,
+                "fetched": fetched,
+                "settled_indexed": sum(v[0] for v in buckets.values()),
+                "pending": len(state["pending"]) - len(pending_remove) + len(pending_add),
+                "created_index": last_index if applied else None,
+            }
+
+    async def window_stats(self, node: Any,
+                           windows: List[Tuple[int, int]]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Sync the node, then aggregate each (start_ts, end_ts) window.
+
+        Returns:
+            One _forward_stats()-shaped dict per window, or None if the node
+            could not be synced (caller should fall back to listforwards)
+        """
+        result = await self.sync(node)
+        if "error" in result:
+            logger.debug(f"Forward index unavailable for {node.name}: {result['error']}")
+            return None
+        return [
+            await asyncio.to_thread(self.db.get_forward_window_stats, node.name, start, end)
+            for start, end in windows
+        ]
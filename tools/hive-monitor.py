@@ -15,13 +15,23 @@ Usage:
     # Generate daily report
     ./hive-monitor.py --config nodes.json report --output report.json
 
+    # Record raw polls, then replay them through the alert rules
+    ./hive-monitor.py --config nodes.json monitor --poll-log polls.jsonl
+    ./hive-monitor.py replay polls.jsonl
+
     # Run with cron for daily reports (add to crontab):
     # 0 9 * * * /path/to/hive-monitor.py --config /path/to/nodes.json report --output /path/to/reports/$(date +%%Y-%%m-%%d).json
 
+Node transports (nodes.json "mode", globally or per node):
+    docker - docker exec lightning-cli per call (default)
+    exec   - one persistent docker exec socat session per node
+    socket - local lightning-rpc unix socket ("socket_path")
+
 Environment:
     HIVE_NODES_CONFIG - Path to nodes.json (alternative to --config)
     HIVE_MONITOR_INTERVAL - Polling interval in seconds (default: 60)
     HIVE_REPORTS_DIR - Directory for daily reports (default: ./reports)
+    HIVE_MONITOR_STATE_DIR - Alert history and last node state (default: ./monitor-state)
 """
 
 import argparse
@@ -29,7 +39,6 @@ import asyncio
 import json
 import logging
 import os
-import subprocess
 import sys
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
@@ -38,6 +47,9 @@ from typing import Any, Dict, List, Optional, Set
 import signal
 
 # Local imports
+from monitor_state import POLLED_METHODS, AlertStore, NodeStateTracker, PollLog, replay_poll_log
+from monitor_transport import FleetPoller, SubprocessTransport, Transport, make_transport
+
 try:
     from advisor_db import AdvisorDB
 except ImportError:
@@ -59,49 +71,29 @@ logger = logging.getLogger("hive-monitor")
 
 @dataclass
 class NodeConnection:
-    """Connection to a CLN node via docker exec (for Polar)."""
+    """
+    Connection to a CLN node.
+
+    Calls go through a pluggable transport (see monitor_transport); the
+    default is docker exec lightning-cli per call (for Polar).
+    """
     name: str
-    docker_container: str
+    docker_container: str = ""
     lightning_dir: str = "/home/clightning/.lightning"
     network: str = "regtest"
+    transport: Optional[Transport] = None
 
     def call(self, method: str, params: Dict = None) -> Dict:
-        """Call CLN via docker exec."""
-        cmd = [
-            "docker", "exec", self.docker_container,
-            "lightning-cli",
-            f"--lightning-dir={self.lightning_dir}",
-            f"--network={self.network}",
-            method
-        ]
-
-        if params:
-            for key, value in params.items():
-                if isinstance(value, bool):
-                    cmd.append(f"{key}={'true' if value else 'false'}")
-                elif isinstance(value, (int, float)):
-                    cmd.append(f"{key}={value}")
-                elif isinstance(value, str):
-                    cmd.append(f"{key}={value}")
-                else:
-                    cmd.append(f"{key}={json.dumps(value)}")
-
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
+        """Call CLN through the node's transport."""
+        if self.transport is None:
+            self.transport = SubprocessTransport(
+                self.docker_container, self.lightning_dir, self.network
             )
-            if result.returncode != 0:
-                return {"error": result.stderr.strip()}
-            return json.loads(result.stdout) if result.stdout.strip() else {}
-        except subprocess.TimeoutExpired:
-            return {"error": "Command timed out"}
-        except json.JSONDecodeError as e:
-            return {"error": f"Invalid JSON response: {e}"}
-        except Exception as e:
-            return {"error": str(e)}
+        return self.transport.call(method, params)
+
+    def close(self) -> None:
+        if self.transport is not None:
+            self.transport.close()
 
 
 def load_nodes(config_path: str) -> Dict[str, NodeConnection]:
@@ -114,11 +106,14 @@ def load_nodes(config_path: str) -> Dict[str, NodeConnection]:
     lightning_dir = config.get("lightning_dir", "/home/clightning/.lightning")
 
     for node_config in config.get("nodes", []):
+        node_config = dict(node_config)
+        node_config.setdefault("mode", config.get("mode", "docker"))
         node = NodeConnection(
             name=node_config["name"],
-            docker_container=node_config["docker_container"],
+            docker_container=node_config.get("docker_container", ""),
             lightning_dir=lightning_dir,
-            network=network
+            network=network,
+            transport=make_transport(node_config, lightning_dir, network)
         )
         nodes[node.name] = node
 
@@ -167,11 +162,24 @@ class Alert:
 class FleetMonitor:
     """Monitors a fleet of Hive nodes."""
 
-    def __init__(self, nodes: Dict[str, NodeConnection], db_path: str = None):
+    def __init__(self, nodes: Dict[str, NodeConnection], db_path: str = None,
+                 poller: FleetPoller = None, state_dir: str = None,
+                 poll_log: str = None):
+        """
+        Args:
+            nodes: Node connections by name
+            db_path: Advisor database path
+            poller: Concurrent poller (default FleetPoller())
+            state_dir: Persist alert history and last node state here
+            poll_log: Record raw poll responses to this JSON-lines file
+        """
         self.nodes = nodes
         self.state: Dict[str, NodeState] = {}
         self.alerts: List[Alert] = []
         self.report_data: Dict[str, Any] = {}
+        self.poller = poller or FleetPoller()
+        self.tracker = NodeStateTracker(store=AlertStore(state_dir) if state_dir else None)
+        self.poll_log = PollLog(poll_log) if poll_log else None
 
         # Initialize advisor database for historical tracking
         self.db = None
@@ -214,6 +222,17 @@ class FleetMonitor:
         state = self.state[name]
         state.last_check = datetime.now()
 
+        responses = {method: node.call(method, params) for method, params in POLLED_METHODS}
+        if self.poll_log:
+            self.poll_log.append(name, responses, state.last_check.timestamp())
+
+        return self._process_poll(name, responses)
+
+    def _process_poll(self, name: str, responses: Dict[str, Dict]) -> Dict[str, Any]:
+        """Update node state from one poll and raise alerts for what changed."""
+        state = self.state[name]
+        snapshot, _, alerts = self.tracker.observe(name, responses, state.last_check.timestamp())
+
         result = {
             "name": name,
             "timestamp": state.last_check.isoformat(),
@@ -222,79 +241,73 @@ class FleetMonitor:
             "errors": []
         }
 
-        # Check hive status
-        hive_status = node.call("hive-status")
-        if "error" in hive_status:
-            result["errors"].append(f"hive-status: {hive_status['error']}")
-            state.is_healthy = False
-            state.last_error = hive_status['error']
+        # Hive status
+        state.is_healthy = snapshot.reachable
+        if not snapshot.reachable:
+            result["errors"].append(f"hive-status: {snapshot.error}")
+            state.last_error = snapshot.error
         else:
-            state.is_healthy = True
-            state.governance_mode = hive_status.get("governance_mode", "unknown")
-            result["hive"]["status"] = hive_status
-
-        # Check pending actions
-        pending = node.call("hive-pending-actions", {"status": "pending"})
-        if "error" not in pending:
-            actions = pending.get("actions", [])
-            current_ids = {a.get("id") for a in actions}
-
-            # Alert on new pending actions
-            new_ids = current_ids - state.pending_action_ids
-            for action in actions:
-                if action.get("id") in new_ids:
-                    self.add_alert(
-                        node=name,
-                        alert_type="pending_action",
-                        severity="warning",
-                        message=f"New pending action: {action.get('action_type')} (ID: {action.get('id')})",
-                        details=action
-                    )
-
-            state.pending_action_ids = current_ids
-            result["hive"]["pending_actions"] = len(actions)
-
-        # Check revenue-ops status
-        rev_status = node.call("revenue-status")
-        if "error" not in rev_status:
-            result["revenue_ops"]["status"] = rev_status
-
-        # Check revenue-ops dashboard
-        dashboard = node.call("revenue-dashboard", {"window_days": 1})
-        if "error" not in dashboard:
-            result["revenue_ops"]["dashboard_1d"] = dashboard
-
-        # Get channel info
-        funds = node.call("listfunds")
-        if "error" not in funds:
-            channels = funds.get("channels", [])
-            state.channel_count = len(channels)
-            state.total_capacity_sats = sum(
-                c.get("amount_msat", 0) // 1000 for c in channels
-            )
-            outputs = funds.get("outputs", [])
-            state.onchain_sats = sum(
-                o.get("amount_msat", 0) // 1000
-                for o in outputs if o.get("status") == "confirmed"
-            )
+            state.governance_mode = snapshot.governance_mode
+            result["hive"]["status"] = responses["hive-status"]
+
+        # Pending actions
+        if snapshot.pending_actions is not None:
+            state.pending_action_ids = {a.get("id") for a in snapshot.pending_actions.values()}
+            result["hive"]["pending_actions"] = len(snapshot.pending_actions)
+
+        # Revenue-ops status and dashboard
+        if "error" not in responses["revenue-status"]:
+            result["revenue_ops"]["status"] = responses["revenue-status"]
+        if "error" not in responses["revenue-dashboard"]:
+            result["revenue_ops"]["dashboard_1d"] = responses["revenue-dashboard"]
+        if snapshot.revenue is not None:
+            state.daily_revenue_sats = snapshot.revenue["gross_revenue_sats"]
+            state.daily_costs_sats = snapshot.revenue["opex_sats"]
+
+        # Channel and on-chain funds
+        if snapshot.channels is not None:
+            state.channel_count = len(snapshot.channels)
+            state.total_capacity_sats = snapshot.total_capacity_sats
+            state.onchain_sats = snapshot.onchain_sats
             result["funds"] = {
                 "channel_count": state.channel_count,
                 "total_capacity_sats": state.total_capacity_sats,
                 "onchain_sats": state.onchain_sats
             }
 
+        for alert in alerts:
+            self.add_alert(
+                node=name,
+                alert_type=alert.alert_type,
+                severity=alert.severity,
+                message=alert.message,
+                details=alert.details
+            )
+
         return result
 
     def check_all_nodes(self) -> Dict[str, Any]:
-        """Check all nodes in the fleet."""
-        results = {}
-        for name in self.nodes:
-            try:
-                results[name] = self.check_node(name)
-            except Exception as e:
-                logger.error(f"Error checking {name}: {e}")
-                results[name] = {"error": str(e)}
-        return results
+        """
+        Check all nodes in the fleet concurrently.
+
+        Unreachable nodes are backed off by the poller and reported as
+        skipped until their next retry.
+        """
+        return self.poller.poll(self.nodes, self._poll_node)
+
+    def _poll_node(self, name: str) -> Dict[str, Any]:
+        result = self.check_node(name)
+        state = self.state[name]
+        if not state.is_healthy:
+            # Lets the poller back off an unreachable node
+            result["error"] = state.last_error
+        return result
+
+    def close(self) -> None:
+        """Stop the poller and close node transports."""
+        self.poller.shutdown()
+        for node in self.nodes.values():
+            node.close()
 
     def _get_hive_topology(self) -> Dict[str, Any]:
         """Get hive membership and topology from a healthy node."""
@@ -787,7 +800,11 @@ def cmd_monitor(args):
         logger.error("No nodes configured")
         sys.exit(1)
 
-    monitor = FleetMonitor(nodes)
+    monitor = FleetMonitor(
+        nodes,
+        state_dir=args.state_dir or os.environ.get("HIVE_MONITOR_STATE_DIR", "./monitor-state"),
+        poll_log=args.poll_log
+    )
     daemon = MonitorDaemon(
         monitor,
         interval=args.interval or int(os.environ.get("HIVE_MONITOR_INTERVAL", 60))
@@ -807,6 +824,7 @@ def cmd_monitor(args):
     try:
         loop.run_until_complete(daemon.run())
     finally:
+        monitor.close()
         loop.close()
 
 
@@ -831,6 +849,7 @@ def cmd_report(args):
     # Generate report
     logger.info("Generating report...")
     report = monitor.generate_daily_report()
+    monitor.close()
 
     # Output
     if args.output:
@@ -853,9 +872,19 @@ def cmd_check(args):
     nodes = load_nodes(config_path)
     monitor = FleetMonitor(nodes)
     results = monitor.check_all_nodes()
+    monitor.close()
     print(json.dumps(results, indent=2))
 
 
+def cmd_replay(args):
+    """Replay a recorded poll log through the alert rules."""
+    alerts = replay_poll_log(PollLog.read(args.poll_log))
+    print(json.dumps([
+        dict(asdict(a), timestamp=datetime.fromtimestamp(a.timestamp).isoformat())
+        for a in alerts
+    ], indent=2))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Hive Fleet Monitor - Real-time monitoring and reports"
@@ -868,6 +897,9 @@ def main():
     monitor_parser = subparsers.add_parser("monitor", help="Run continuous monitoring daemon")
     monitor_parser.add_argument("--interval", "-i", type=int, default=60,
                                 help="Check interval in seconds (default: 60)")
+    monitor_parser.add_argument("--state-dir",
+                                help="Alert history directory (default: $HIVE_MONITOR_STATE_DIR or ./monitor-state)")
+    monitor_parser.add_argument("--poll-log", help="Record raw poll responses to this JSON-lines file")
 
     # report command
     report_parser = subparsers.add_parser("report", help="Generate a daily report")
@@ -876,6 +908,10 @@ def main():
     # check command
     check_parser = subparsers.add_parser("check", help="Quick status check")
 
+    # replay command
+    replay_parser = subparsers.add_parser("replay", help="Replay a recorded poll log through the alert rules")
+    replay_parser.add_argument("poll_log", help="Poll log written by monitor --poll-log")
+
     args = parser.parse_args()
 
     if args.command == "monitor":
@@ -884,6 +920,8 @@ def main():
         cmd_report(args)
     elif args.command == "check":
         cmd_check(args)
+    elif args.command == "replay":
+        cmd_replay(args)
     else:
         parser.print_help()
 
@@ -63,7 +63,9 @@ from urllib.parse import urlparse
 
 # Add tools directory to path for advisor_db import
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from advisor_db import AdvisorDB
+from advisor_db import AdvisorDB, AsyncAdvisorDB
+from fleet_rpc import FLEET_DEADLINE_SECONDS, FleetResult, ResponseCache, fan_out
+from forward_index import ForwardIndex
 
 # MCP SDK imports
 try:
@@ -225,6 +227,8 @@ class NodeConnection:
     docker_container: Optional[str] = None
     lightning_dir: str = "/home/clightning/.lightning"
     network: str = "regtest"
+    # Shared read-only response cache (set by HiveFleet)
+    cache: Optional[ResponseCache] = None
 
     async def connect(self):
         """Initialize the HTTP client (if using REST)."""
@@ -267,11 +271,20 @@ class NodeConnection:
         if self.client:
             await self.client.aclose()
 
-    async def call(self, method: str, params: Dict = None) -> Dict:
+    async def call(self, method: str, params: Dict = None, use_cache: bool = True) -> Dict:
         """Call a CLN RPC method via REST or docker exec."""
         if not _check_method_allowed(method):
             return {"error": f"Method '{method}' not in allowlist"}
 
+        if self.cache is not None and use_cache:
+            return await self.cache.call(
+                self.name, method, params,
+                lambda: self._call_uncached(method, params)
+            )
+        return await self._call_uncached(method, params)
+
+    async def _call_uncached(self, method: str, params: Dict = None) -> Dict:
+        """Call a CLN RPC method, bypassing the response cache."""
         # Docker exec mode (for Polar)
         if self.docker_container:
             return await self._call_docker(method, params)
@@ -353,6 +366,7 @@ class HiveFleet:
         self.nodes: Dict[str, NodeConnection] = {}
         self._node_semaphores: Dict[str, asyncio.Semaphore] = {}
         self._max_concurrent_per_node = 5
+        self.cache = ResponseCache()
 
     def load_config(self, config_path: str):
         """Load node configuration from JSON file.
@@ -405,6 +419,7 @@ class HiveFleet:
                     rune=node_config.get("rune"),
                     ca_cert=node_config.get("ca_cert")
                 )
+            node.cache = self.cache
             self.nodes[node.name] = node
             self._node_semaphores[node.name] = asyncio.Semaphore(self._max_concurrent_per_node)
 
@@ -427,28 +442,21 @@ class HiveFleet:
         """Get a node by name."""
         return self.nodes.get(name)
 
-    async def call_all(self, method: str, params: Dict = None, timeout: float = 30.0) -> Dict[str, Any]:
+    async def run_all(self, fn, deadline: float = FLEET_DEADLINE_SECONDS) -> FleetResult:
+        """
+        Run fn(node) on all nodes concurrently under one overall deadline.
+
+        Returns partial results: nodes that fail or miss the deadline get
+        an {"error": ...} result and a per-node status entry.
+        """
+        return await fan_out(self.nodes, fn, deadline=deadline, semaphores=self._node_semaphores)
+
+    async def call_all(self, method: str, params: Dict = None, timeout: float = FLEET_DEADLINE_SECONDS) -> Dict[str, Any]:
         """Call an RPC method on all nodes in parallel."""
-        async def call_with_timeout(name: str, node: NodeConnection) -> tuple:
-            sem = self._node_semaphores.get(name)
-            try:
-                if sem:
-                    async with sem:
-                        result = await asyncio.wait_for(node.call(method, params), timeout=timeout)
-                else:
-                    result = await asyncio.wait_for(node.call(method, params), timeout=timeout)
-                return (name, result)
-            except asyncio.TimeoutError:
-                logger.warning(f"Timeout calling {method} on {name}")
-                return (name, {"error": f"Timeout after {timeout}s"})
-            except Exception as e:
-                logger.error(f"Error calling {method} on {name}: {e}")
-                return (name, {"error": str(e)})
+        outcome = await self.run_all(lambda node: node.call(method, params), deadline=timeout)
+        return outcome.results
+
 
-        tasks = [call_with_timeout(name, node) for name, node in self.nodes.items()]
-        results_list = await asyncio.gather(*tasks)
-        return dict(results_list)
-    
     async def health_check(self, timeout: float = 5.0) -> Dict[str, Any]:
         """Quick health check on all nodes - returns status without heavy operations."""
         async def check_node(name: str, node: NodeConnection) -> tuple:
@@ -480,6 +488,8 @@ fleet = HiveFleet()
 # Global advisor database instance
 ADVISOR_DB_PATH = os.environ.get('ADVISOR_DB_PATH', str(Path.home() / ".lightning" / "advisor.db"))
 advisor_db: Optional[AdvisorDB] = None
+async_advisor_db: Optional[AsyncAdvisorDB] = None
+forward_index: Optional[ForwardIndex] = None
 
 
 # =============================================================================
@@ -3693,6 +3703,28 @@ def _forward_stats(forwards: List[Dict], start_ts: int, end_ts: int) -> Dict[str
     }
 
 
+async def _forward_window_stats(node: NodeConnection,
+                                windows: List[tuple]) -> List[Dict[str, Any]]:
+    """
+    Forward stats for each (start_ts, end_ts) window.
+
+    Served from the incremental forward index (only new forwards are
+    fetched). Falls back to a full listforwards scan when the node cannot
+    be paged by created_index.
+    """
+    try:
+        stats = await ensure_forward_index().window_stats(node, windows)
+    except Exception as e:
+        logger.warning(f"Forward index failed for {node.name}: {e}")
+        stats = None
+    if stats is not None:
+        return stats
+
+    forwards = await node.call("listforwards", {"status": "settled"})
+    forwards_list = forwards.get("forwards", [])
+    return [_forward_stats(forwards_list, start, end) for start, end in windows]
+
+
 def _flow_profile(channel: Dict) -> Dict[str, Any]:
     in_fulfilled = channel.get("in_payments_fulfilled", 0)
     out_fulfilled = channel.get("out_payments_fulfilled", 0)
@@ -3739,12 +3771,8 @@ async def _node_fleet_snapshot(node: NodeConnection) -> Dict[str, Any]:
     channels_result = await node.call("listpeerchannels")
     pending = await node.call("hive-pending-actions")
 
-    # Routing stats (24h) from listforwards
-    forwards = await node.call("listforwards", {"status": "settled"})
-    forward_count = 0
-    total_volume_msat = 0
-    total_revenue_msat = 0
-    stats_24h = _forward_stats(forwards.get("forwards", []), since_24h, now)
+    # Routing stats (24h) from the forward index
+    stats_24h = (await _forward_window_stats(node, [(since_24h, now)]))[0]
     forward_count = stats_24h["forward_count"]
     total_volume_msat = stats_24h["total_volume_msat"]
     total_revenue_msat = stats_24h["total_revenue_msat"]
@@ -3843,18 +3871,7 @@ async def handle_fleet_snapshot(args: Dict) -> Dict:
             return {"error": f"Unknown node: {node_name}"}
         return await _node_fleet_snapshot(node)
 
-    tasks = []
-    for node in fleet.nodes.values():
-        tasks.append(_node_fleet_snapshot(node))
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    snapshots = {}
-    for idx, result in enumerate(results):
-        node = list(fleet.nodes.values())[idx]
-        if isinstance(result, Exception):
-            snapshots[node.name] = {"error": str(result)}
-        else:
-            snapshots[node.name] = result
-    return snapshots
+    return (await fleet.run_all(_node_fleet_snapshot)).results
 
 
 async def _node_anomalies(node: NodeConnection) -> Dict[str, Any]:
@@ -3864,10 +3881,9 @@ async def _node_anomalies(node: NodeConnection) -> Dict[str, Any]:
     now = int(time.time())
 
     # Revenue velocity drop: last 24h vs 7-day daily average
-    forwards = await node.call("listforwards", {"status": "settled"})
-    forwards_list = forwards.get("forwards", [])
-    last_24h = _forward_stats(forwards_list, now - 86400, now)
-    last_7d = _forward_stats(forwards_list, now - (7 * 86400), now)
+    last_24h, last_7d = await _forward_window_stats(
+        node, [(now - 86400, now), (now - (7 * 86400), now)]
+    )
     avg_daily_revenue = last_7d["total_revenue_msat"] / 7 if last_7d["total_revenue_msat"] else 0
 
     if avg_daily_revenue > 0 and last_24h["total_revenue_msat"] < avg_daily_revenue * 0.5:
@@ -3885,13 +3901,17 @@ async def _node_anomalies(node: NodeConnection) -> Dict[str, Any]:
 
     # Drain patterns: channels losing >10% balance per day (requires advisor DB velocity)
     try:
-        db = ensure_advisor_db()
+        adb = ensure_async_advisor_db()
         channels = await node.call("listpeerchannels")
+        scids = [ch.get("short_channel_id") for ch in channels.get("channels", [])]
+        velocities = await adb.run(
+            lambda: {scid: adb.db.get_channel_velocity(node.name, scid) for scid in scids if scid}
+        )
         for ch in channels.get("channels", []):
             scid = ch.get("short_channel_id")
             if not scid:
                 continue
-            velocity = db.get_channel_velocity(node.name, scid)
+            velocity = velocities.get(scid)
             if not velocity:
                 continue
             # 10% per day ~= 0.4167% per hour
@@ -3948,16 +3968,7 @@ async def handle_anomalies(args: Dict) -> Dict:
             return {"error": f"Unknown node: {node_name}"}
         return await _node_anomalies(node)
 
-    tasks = [ _node_anomalies(node) for node in fleet.nodes.values() ]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    output = {}
-    for idx, result in enumerate(results):
-        node = list(fleet.nodes.values())[idx]
-        if isinstance(result, Exception):
-            output[node.name] = {"error": str(result)}
-        else:
-            output[node.name] = result
-    return output
+    return (await fleet.run_all(_node_anomalies)).results
 
 
 async def handle_compare_periods(args: Dict) -> Dict:
@@ -3979,11 +3990,7 @@ async def handle_compare_periods(args: Dict) -> Dict:
     p2_end = now - (offset_days * 86400)
     p2_start = p2_end - (period2_days * 86400)
 
-    forwards = await node.call("listforwards", {"status": "settled"})
-    forwards_list = forwards.get("forwards", [])
-
-    p1 = _forward_stats(forwards_list, p1_start, p1_end)
-    p2 = _forward_stats(forwards_list, p2_start, p2_end)
+    p1, p2 = await _forward_window_stats(node, [(p1_start, p1_end), (p2_start, p2_end)])
 
     def metric_compare(key: str) -> Dict[str, Any]:
         v1 = p1.get(key, 0)
@@ -4098,8 +4105,8 @@ async def handle_channel_deep_dive(args: Dict) -> Dict:
     flow = _flow_profile(target_channel)
     velocity = None
     try:
-        db = ensure_advisor_db()
-        velocity = db.get_channel_velocity(node_name, channel_id)
+        db = ensure_async_advisor_db()
+        velocity = await db.get_channel_velocity(node_name, channel_id)
     except Exception:
         velocity = None
 
@@ -4253,16 +4260,7 @@ async def handle_recommended_actions(args: Dict) -> Dict:
             return {"error": f"Unknown node: {node_name}"}
         return await _node_recommended_actions(node, limit)
 
-    tasks = [_node_recommended_actions(node, limit) for node in fleet.nodes.values()]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    output = {}
-    for idx, result in enumerate(results):
-        node = list(fleet.nodes.values())[idx]
-        if isinstance(result, Exception):
-            output[node.name] = {"error": str(result)}
-        else:
-            output[node.name] = result
-    return output
+    return (await fleet.run_all(lambda node: _node_recommended_actions(node, limit))).results
 
 
 async def _node_peer_search(node: NodeConnection, query: str) -> Dict[str, Any]:
@@ -4340,16 +4338,7 @@ async def handle_peer_search(args: Dict) -> Dict:
             return {"error": f"Unknown node: {node_name}"}
         return await _node_peer_search(node, query)
 
-    tasks = [_node_peer_search(node, query) for node in fleet.nodes.values()]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    output = {}
-    for idx, result in enumerate(results):
-        node = list(fleet.nodes.values())[idx]
-        if isinstance(result, Exception):
-            output[node.name] = {"error": str(result)}
-        else:
-            output[node.name] = result
-    return output
+    return (await fleet.run_all(lambda node: _node_peer_search(node, query))).results
 
 
 async def handle_pending_actions(args: Dict) -> Dict:
@@ -4434,7 +4423,7 @@ async def handle_onboard_new_members(args: Dict) -> Dict:
         return {"error": f"Unknown node: {node_name}"}
 
     # Initialize advisor DB for onboarding tracking (uses configured ADVISOR_DB_PATH)
-    db = ensure_advisor_db()
+    db = ensure_async_advisor_db()
 
     # Gather required data
     try:
@@ -4494,7 +4483,7 @@ async def handle_onboard_new_members(args: Dict) -> Dict:
             continue
 
         # Check if already onboarded
-        if db.is_member_onboarded(member_pubkey):
+        if await db.is_member_onboarded(member_pubkey):
             already_onboarded.append({
                 "pubkey": member_pubkey[:16] + "...",
                 "alias": member_alias,
@@ -4584,7 +4573,7 @@ async def handle_onboard_new_members(args: Dict) -> Dict:
 
         # Mark as onboarded (unless dry run)
         if not dry_run:
-            db.mark_member_onboarded(member_pubkey)
+            await db.mark_member_onboarded(member_pubkey)
 
     return {
         "node": node_name,
@@ -5587,11 +5576,11 @@ async def read_resource(uri: str) -> str:
 
             if resource_type == "status":
                 # Get status from all nodes
-                results = {}
-                for name, node in fleet.nodes.items():
-                    status = await node.call("hive-status")
-                    info = await node.call("getinfo")
-                    results[name] = {
+                async def node_status(node: NodeConnection) -> Dict:
+                    status, info = await asyncio.gather(
+                        node.call("hive-status"), node.call("getinfo")
+                    )
+                    return {
                         "hive_status": status,
                         "node_info": {
                             "alias": info.get("alias", "unknown"),
@@ -5599,14 +5588,16 @@ async def read_resource(uri: str) -> str:
                             "blockheight": info.get("blockheight", 0)
                         }
                     }
+
+                results = (await fleet.run_all(node_status)).results
                 return json.dumps(results, indent=2)
 
             elif resource_type == "pending-actions":
                 # Get all pending actions
                 results = {}
                 total_pending = 0
-                for name, node in fleet.nodes.items():
-                    pending = await node.call("hive-pending-actions")
+                all_pending = await fleet.call_all("hive-pending-actions")
+                for name, pending in all_pending.items():
                     actions = pending.get("actions", [])
                     results[name] = {
                         "count": len(actions),
@@ -5631,10 +5622,20 @@ async def read_resource(uri: str) -> str:
                     "nodes": {}
                 }
 
-                for name, node in fleet.nodes.items():
-                    status = await node.call("hive-status")
-                    funds = await node.call("listfunds")
-                    pending = await node.call("hive-pending-actions")
+                async def node_summary(node: NodeConnection) -> tuple:
+                    return await asyncio.gather(
+                        node.call("hive-status"),
+                        node.call("listfunds"),
+                        node.call("hive-pending-actions"),
+                    )
+
+                outcome = await fleet.run_all(node_summary)
+                for name, result in outcome.results.items():
+                    if isinstance(result, dict):
+                        # Failed or timed out node
+                        status, funds, pending = result, {}, {}
+                    else:
+                        status, funds, pending = result
 
                     channels = funds.get("channels", [])
                     outputs = funds.get("outputs", [])
@@ -5916,8 +5917,8 @@ async def handle_revenue_dashboard(args: Dict) -> Dict:
 
     # Record goat feeder snapshot to advisor database for historical tracking
     try:
-        db = ensure_advisor_db()
-        db.record_goat_feeder_snapshot(
+        db = ensure_async_advisor_db()
+        await db.record_goat_feeder_snapshot(
             node_name=node_name,
             window_days=window_days,
             revenue_sats=goat_revenue,
@@ -6411,8 +6412,8 @@ async def handle_goat_feeder_history(args: Dict) -> Dict:
     node_name = args.get("node")
     days = args.get("days", 30)
 
-    db = ensure_advisor_db()
-    history = db.get_goat_feeder_history(node_name=node_name, days=days)
+    db = ensure_async_advisor_db()
+    history = await db.get_goat_feeder_history(node_name=node_name, days=days)
 
     if not history:
         return {
@@ -6437,7 +6438,7 @@ async def handle_goat_feeder_history(args: Dict) -> Dict:
             for s in history
         ],
         "count": len(history),
-        "summary": db.get_goat_feeder_summary(node_name=node_name)
+        "summary": await db.get_goat_feeder_summary(node_name=node_name)
     }
 
 
@@ -6446,8 +6447,8 @@ async def handle_goat_feeder_trends(args: Dict) -> Dict:
     node_name = args.get("node")
     days = args.get("days", 7)
 
-    db = ensure_advisor_db()
-    trends = db.get_goat_feeder_trends(node_name=node_name, days=days)
+    db = ensure_async_advisor_db()
+    trends = await db.get_goat_feeder_trends(node_name=node_name, days=days)
 
     if not trends:
         return {
@@ -6471,6 +6472,22 @@ def ensure_advisor_db() -> AdvisorDB:
     return advisor_db
 
 
+def ensure_async_advisor_db() -> AsyncAdvisorDB:
+    """Advisor database facade that runs queries off the event loop."""
+    global async_advisor_db
+    if async_advisor_db is None:
+        async_advisor_db = AsyncAdvisorDB(ensure_advisor_db())
+    return async_advisor_db
+
+
+def ensure_forward_index() -> ForwardIndex:
+    """Ensure the incremental forward index is initialized."""
+    global forward_index
+    if forward_index is None:
+        forward_index = ForwardIndex(ensure_advisor_db())
+    return forward_index
+
+
 async def handle_advisor_record_snapshot(args: Dict) -> Dict:
     """Record current fleet state to the advisor database."""
     node_name = args.get("node")
@@ -6480,8 +6497,6 @@ async def handle_advisor_record_snapshot(args: Dict) -> Dict:
     if not node:
         return {"error": f"Unknown node: {node_name}"}
 
-    db = ensure_advisor_db()
-
     # Gather data from the node
     try:
         hive_status = await node.call("hive-status")
@@ -6584,9 +6599,13 @@ async def handle_advisor_record_snapshot(args: Dict) -> Dict:
             elif ch_detail["needs_outbound"]:
                 report["fleet_summary"]["channel_health"]["needs_outbound"] += 1
 
-        # Record to database
-        snapshot_id = db.record_fleet_snapshot(report, snapshot_type)
-        channels_recorded = db.record_channel_states(report)
+        # Record to database (one transaction, off the event loop)
+        snapshot_id, channels_recorded = await ensure_async_advisor_db().run_batch(
+            lambda batch_db: (
+                batch_db.record_fleet_snapshot(report, snapshot_type),
+                batch_db.record_channel_states(report),
+            )
+        )
 
         return {
             "success": True,
@@ -6605,13 +6624,13 @@ async def handle_advisor_get_trends(args: Dict) -> Dict:
     """Get fleet-wide trend analysis."""
     days = args.get("days", 7)
 
-    db = ensure_advisor_db()
+    db = ensure_async_advisor_db()
 
-    trends = db.get_fleet_trends(days)
+    trends = await db.get_fleet_trends(days)
     if not trends:
         return {
             "message": "Not enough historical data for trend analysis. Record more snapshots over time.",
-            "snapshots_available": len(db.get_recent_snapshots(100))
+            "snapshots_available": len(await db.get_recent_snapshots(100))
         }
 
     return {
@@ -6629,9 +6648,9 @@ async def handle_advisor_get_velocities(args: Dict) -> Dict:
     """Get channels with critical velocity."""
     hours_threshold = args.get("hours_threshold", 24)
 
-    db = ensure_advisor_db()
+    db = ensure_async_advisor_db()
 
-    critical_channels = db.get_critical_channels(hours_threshold)
+    critical_channels = await db.get_critical_channels(hours_threshold)
 
     if not critical_channels:
         return {
@@ -6666,10 +6685,10 @@ async def handle_advisor_get_channel_history(args: Dict) -> Dict:
     channel_id = args.get("channel_id")
     hours = args.get("hours", 24)
 
-    db = ensure_advisor_db()
+    db = ensure_async_advisor_db()
 
-    history = db.get_channel_history(node_name, channel_id, hours)
-    velocity = db.get_channel_velocity(node_name, channel_id)
+    history = await db.get_channel_history(node_name, channel_id, hours)
+    velocity = await db.get_channel_velocity(node_name, channel_id)
 
     result = {
         "node": node_name,
@@ -6710,9 +6729,9 @@ async def handle_advisor_record_decision(args: Dict) -> Dict:
     peer_id = args.get("peer_id")
     confidence = args.get("confidence")
 
-    db = ensure_advisor_db()
+    db = ensure_async_advisor_db()
 
-    decision_id = db.record_decision(
+    decision_id = await db.record_decision(
         decision_type=decision_type,
         node_name=node_name,
         recommendation=recommendation,
@@ -6734,17 +6753,9 @@ async def handle_advisor_get_recent_decisions(args: Dict) -> Dict:
     """Get recent AI decisions from the audit trail."""
     limit = args.get("limit", 20)
 
-    db = ensure_advisor_db()
+    db = ensure_async_advisor_db()
 
-    # Get recent decisions
-    with db._get_conn() as conn:
-        rows = conn.execute("""
-            SELECT id, timestamp, decision_type, node_name, channel_id, peer_id,
-                   recommendation, reasoning, confidence, status
-            FROM ai_decisions
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, (limit,)).fetchall()
+    rows = await db.get_recent_decisions(limit)
 
     decisions = []
     for row in rows:
@@ -6769,9 +6780,9 @@ async def handle_advisor_get_recent_decisions(args: Dict) -> Dict:
 
 async def handle_advisor_db_stats(args: Dict) -> Dict:
     """Get advisor database statistics."""
-    db = ensure_advisor_db()
+    db = ensure_async_advisor_db()
 
-    stats = db.get_stats()
+    stats = await db.get_stats()
     stats["database_path"] = ADVISOR_DB_PATH
 
     return stats
@@ -6779,10 +6790,10 @@ async def handle_advisor_db_stats(args: Dict) -> Dict:
 
 async def handle_advisor_get_context_brief(args: Dict) -> Dict:
     """Get pre-run context summary for AI advisor."""
-    db = ensure_advisor_db()
+    db = ensure_async_advisor_db()
     days = args.get("days", 7)
 
-    brief = db.get_context_brief(days)
+    brief = await db.get_context_brief(days)
 
     # Serialize dataclass to dict
     return {
@@ -6805,7 +6816,7 @@ async def handle_advisor_get_context_brief(args: Dict) -> Dict:
 
 async def handle_advisor_check_alert(args: Dict) -> Dict:
     """Check if an alert should be raised (deduplication)."""
-    db = ensure_advisor_db()
+    db = ensure_async_advisor_db()
 
     alert_type = args.get("alert_type")
     node_name = args.get("node")
@@ -6814,7 +6825,7 @@ async def handle_advisor_check_alert(args: Dict) -> Dict:
     if not alert_type or not node_name:
         return {"error": "alert_type and node are required"}
 
-    status = db.check_alert(alert_type, node_name, channel_id)
+    status = await db.check_alert(alert_type, node_name, channel_id)
 
     return {
         "alert_type": status.alert_type,
@@ -6832,7 +6843,7 @@ async def handle_advisor_check_alert(args: Dict) -> Dict:
 
 async def handle_advisor_record_alert(args: Dict) -> Dict:
     """Record an alert (handles dedup automatically)."""
-    db = ensure_advisor_db()
+    db = ensure_async_advisor_db()
 
     alert_type = args.get("alert_type")
     node_name = args.get("node")
@@ -6844,7 +6855,7 @@ async def handle_advisor_record_alert(args: Dict) -> Dict:
     if not alert_type or not node_name:
         return {"error": "alert_type and node are required"}
 
-    status = db.record_alert(alert_type, node_name, channel_id, peer_id, severity, message)
+    status = await db.record_alert(alert_type, node_name, channel_id, peer_id, severity, message)
 
     return {
         "recorded": True,
@@ -6857,7 +6868,7 @@ async def handle_advisor_record_alert(args: Dict) -> Dict:
 
 async def handle_advisor_resolve_alert(args: Dict) -> Dict:
     """Mark an alert as resolved."""
-    db = ensure_advisor_db()
+    db = ensure_async_advisor_db()
 
     alert_type = args.get("alert_type")
     node_name = args.get("node")
@@ -6867,7 +6878,7 @@ async def handle_advisor_resolve_alert(args: Dict) -> Dict:
     if not alert_type or not node_name:
         return {"error": "alert_type and node are required"}
 
-    resolved = db.resolve_alert(alert_type, node_name, channel_id, resolution_action)
+    resolved = await db.resolve_alert(alert_type, node_name, channel_id, resolution_action)
 
     return {
         "resolved": resolved,
@@ -6887,13 +6898,13 @@ async def handle_advisor_get_peer_intel(args: Dict) -> Dict:
 
     This provides comprehensive peer evaluation for channel open decisions.
     """
-    db = ensure_advisor_db()
+    db = ensure_async_advisor_db()
 
     peer_id = args.get("peer_id")
 
     if peer_id:
         # Get local experience data
-        intel = db.get_peer_intelligence(peer_id)
+        intel = await db.get_peer_intelligence(peer_id)
 
         local_data = {}
         if intel:
@@ -7004,7 +7015,7 @@ async def handle_advisor_get_peer_intel(args: Dict) -> Dict:
         }
     else:
         # Return all peers (local data only)
-        all_intel = db.get_all_peer_intelligence()
+        all_intel = await db.get_all_peer_intelligence()
         return {
             "count": len(all_intel),
             "peers": [{
@@ -7023,12 +7034,12 @@ async def handle_advisor_get_peer_intel(args: Dict) -> Dict:
 
 async def handle_advisor_measure_outcomes(args: Dict) -> Dict:
     """Measure outcomes for past decisions."""
-    db = ensure_advisor_db()
+    db = ensure_async_advisor_db()
 
     min_hours = args.get("min_hours", 24)
     max_hours = args.get("max_hours", 72)
 
-    outcomes = db.measure_decision_outcomes(min_hours, max_hours)
+    outcomes = await db.measure_decision_outcomes(min_hours, max_hours)
 
     return {
         "measured_count": len(outcomes),
@@ -7045,20 +7056,36 @@ _proactive_advisor = None
 _goal_manager = None
 _learning_engine = None
 _opportunity_scanner = None
+_proactive_advisor_lock = threading.Lock()
 
 
-def _get_proactive_advisor():
-    """Lazy-load proactive advisor components."""
-    global _proactive_advisor, _goal_manager, _learning_engine, _opportunity_scanner
+async def _get_proactive_advisor():
+    """
+    Lazy-load proactive advisor components.
 
+    The components read goals, learned parameters and budgets from the
+    advisor database when constructed, so they are built in the database
+    executor rather than on the event loop.
+    """
     if _proactive_advisor is None:
+        adb = ensure_async_advisor_db()
+        await adb.run(_build_proactive_advisor, adb.db)
+    return _proactive_advisor
+
+
+def _build_proactive_advisor(db: AdvisorDB) -> None:
+    """Construct the proactive advisor components (blocking)."""
+    global _proactive_advisor, _goal_manager, _learning_engine, _opportunity_scanner
+
+    with _proactive_advisor_lock:
+        if _proactive_advisor is not None:
+            return
         try:
             from goal_manager import GoalManager
             from learning_engine import LearningEngine
             from opportunity_scanner import OpportunityScanner
             from proactive_advisor import ProactiveAdvisor
 
-            db = ensure_advisor_db()
             _goal_manager = GoalManager(db)
             _learning_engine = LearningEngine(db)
 
@@ -7097,9 +7124,6 @@ def _get_proactive_advisor():
 
         except ImportError as e:
             logger.error(f"Failed to import proactive advisor modules: {e}")
-            return None
-
-    return _proactive_advisor
 
 
 async def handle_advisor_run_cycle(args: Dict) -> Dict:
@@ -7108,7 +7132,7 @@ async def handle_advisor_run_cycle(args: Dict) -> Dict:
     if not node_name:
         return {"error": "node is required"}
 
-    advisor = _get_proactive_advisor()
+    advisor = await _get_proactive_advisor()
     if not advisor:
         return {"error": "Proactive advisor modules not available"}
 
@@ -7122,7 +7146,7 @@ async def handle_advisor_run_cycle(args: Dict) -> Dict:
 
 async def handle_advisor_run_cycle_all(args: Dict) -> Dict:
     """Run proactive advisor cycle on ALL nodes in the fleet in parallel."""
-    advisor = _get_proactive_advisor()
+    advisor = await _get_proactive_advisor()
     if not advisor:
         return {"error": "Proactive advisor modules not available"}
 
@@ -7193,10 +7217,10 @@ async def handle_advisor_run_cycle_all(args: Dict) -> Dict:
 
 async def handle_advisor_get_goals(args: Dict) -> Dict:
     """Get current advisor goals."""
-    db = ensure_advisor_db()
+    db = ensure_async_advisor_db()
     status = args.get("status")
 
-    goals = db.get_goals(status=status)
+    goals = await db.get_goals(status=status)
 
     return {
         "count": len(goals),
@@ -7208,7 +7232,7 @@ async def handle_advisor_set_goal(args: Dict) -> Dict:
     """Set or update an advisor goal."""
     import time as time_module
 
-    db = ensure_advisor_db()
+    db = ensure_async_advisor_db()
 
     goal_type = args.get("goal_type")
     target_metric = args.get("target_metric")
@@ -7231,7 +7255,7 @@ async def handle_advisor_set_goal(args: Dict) -> Dict:
         "status": "active"
     }
 
-    db.save_goal(goal)
+    await db.save_goal(goal)
 
     return {
         "success": True,
@@ -7242,11 +7266,11 @@ async def handle_advisor_set_goal(args: Dict) -> Dict:
 
 async def handle_advisor_get_learning(args: Dict) -> Dict:
     """Get learned parameters."""
-    advisor = _get_proactive_advisor()
+    advisor = await _get_proactive_advisor()
     if not advisor:
         # Fallback to raw database query
-        db = ensure_advisor_db()
-        params = db.get_learning_params()
+        db = ensure_async_advisor_db()
+        params = await db.get_learning_params()
         return {
             "action_type_confidence": params.get("action_type_confidence", {}),
             "opportunity_success_rates": params.get("opportunity_success_rates", {}),
@@ -7263,7 +7287,7 @@ async def handle_advisor_get_status(args: Dict) -> Dict:
     if not node_name:
         return {"error": "node is required"}
 
-    advisor = _get_proactive_advisor()
+    advisor = await _get_proactive_advisor()
     if not advisor:
         return {"error": "Proactive advisor modules not available"}
 
@@ -7275,12 +7299,12 @@ async def handle_advisor_get_status(args: Dict) -> Dict:
 
 async def handle_advisor_get_cycle_history(args: Dict) -> Dict:
     """Get history of advisor cycles."""
-    db = ensure_advisor_db()
+    db = ensure_async_advisor_db()
 
     node_name = args.get("node")
     limit = args.get("limit", 10)
 
-    cycles = db.get_recent_cycles(node_name, limit)
+    cycles = await db.get_recent_cycles(node_name, limit)
 
     return {
         "count": len(cycles),
@@ -7294,7 +7318,7 @@ async def handle_advisor_scan_opportunities(args: Dict) -> Dict:
     if not node_name:
         return {"error": "node is required"}
 
-    advisor = _get_proactive_advisor()
+    advisor = await _get_proactive_advisor()
     if not advisor:
         return {"error": "Proactive advisor modules not available"}
 
@@ -7318,7 +7342,8 @@ async def handle_advisor_scan_opportunities(args: Dict) -> Dict:
             "queue_for_review": len(queue),
             "require_approval": len(require),
             "opportunities": [opp.to_dict() for opp in scored[:20]],  # Top 20
-            "state_summary": state.get("summary", {})
+            "state_summary": state.get("summary", {}),
+            "timings": advisor.scanner.last_scan_timings
         }
     except Exception as e:
         logger.exception("Error scanning opportunities")
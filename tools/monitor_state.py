@@ -0,0 +1,615 @@
+"""
+Node state diffing and change-driven alerting for hive-monitor.
+
+Each poll's raw RPC responses are reduced to a NodeSnapshot. Consecutive
+snapshots of a node are compared into typed DiffEvents (channels opened or
+closed, capacity, on-chain funds, governance mode, pending actions, revenue
+metrics, reachability), and alert rules are declared against those events:
+
+- AlertRule fires on matching events. Alerts are deduplicated per
+  (rule, node, key) while active, can require the event on several
+  consecutive polls before raising (hysteresis), are cleared by other
+  event kinds, and respect a per-key cooldown.
+- ThresholdRule watches a snapshot metric with separate raise and clear
+  levels so a value hovering at the limit does not flap.
+
+AlertStore persists raised/resolved alerts as JSON lines plus the last
+snapshot per node, so a restarted monitor neither forgets active alerts
+nor re-announces everything it already reported. PollLog records the raw
+responses of every poll; replay_poll_log() runs a recording through a
+fresh tracker, which is how alert rules are tested.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger("hive-monitor")
+
+# Diff event kinds
+NODE_UNREACHABLE = "node_unreachable"      # Emitted on every poll while down
+NODE_RECOVERED = "node_recovered"
+CHANNEL_OPENED = "channel_opened"
+CHANNEL_CLOSED = "channel_closed"
+CAPACITY_CHANGED = "capacity_changed"
+ONCHAIN_CHANGED = "onchain_changed"
+GOVERNANCE_CHANGED = "governance_changed"
+ACTION_ADDED = "pending_action_added"
+ACTION_RESOLVED = "pending_action_resolved"
+REVENUE_CHANGED = "revenue_changed"
+
+# Default rule thresholds
+CAPACITY_DROP_PCT = 10.0              # Alert when total capacity falls by more
+ONCHAIN_LOW_SATS = 100_000            # Raise below this on-chain balance
+ONCHAIN_RECOVERED_SATS = 200_000      # ...and clear only above this
+
+# Methods polled per node (order matters for the per-node RPC sequence)
+POLLED_METHODS: Tuple[Tuple[str, Optional[Dict]], ...] = (
+    ("hive-status", None),
+    ("hive-pending-actions", {"status": "pending"}),
+    ("revenue-status", None),
+    ("revenue-dashboard", {"window_days": 1}),
+    ("listfunds", None),
+)
+
+
+# =============================================================================
+# Snapshots and diffs
+# =============================================================================
+
+@dataclass
+class NodeSnapshot:
+    """
+    Structured state of one node at one poll.
+
+    Facets whose RPC failed are None and are skipped when diffing.
+    """
+    name: str
+    timestamp: float
+    reachable: bool
+    error: str = ""
+    governance_mode: Optional[str] = None
+    channels: Optional[Dict[str, int]] = None          # scid -> capacity sats
+    onchain_sats: Optional[int] = None
+    pending_actions: Optional[Dict[str, Dict]] = None  # str(id) -> action
+    revenue: Optional[Dict[str, float]] = None
+
+    @property
+    def total_capacity_sats(self) -> Optional[int]:
+        return sum(self.channels.values()) if self.channels is not None else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NodeSnapshot":
+        return cls(**data)
+
+
+def _ok(response: Any) -> bool:
+    return isinstance(response, dict) and "error" not in response
+
+
+def snapshot_from_responses(name: str, responses: Dict[str, Dict],
+                            timestamp: float) -> NodeSnapshot:
+    """
+    Build a NodeSnapshot from one poll's raw RPC responses.
+
+    Args:
+        name: Node name
+        responses: {method: response} for POLLED_METHODS
+        timestamp: Poll time (unix seconds)
+    """
+    hive_status = responses.get("hive-status", {})
+    snapshot = NodeSnapshot(name=name, timestamp=timestamp, reachable=_ok(hive_status))
+    if not snapshot.reachable:
+        snapshot.error = str((hive_status or {}).get("error", "no response"))
+        return snapshot
+
+    snapshot.governance_mode = hive_status.get("governance_mode", "unknown")
+
+    pending = responses.get("hive-pending-actions")
+    if _ok(pending):
+        snapshot.pending_actions = {
+            str(a.get("id")): a for a in pending.get("actions", [])
+        }
+
+    funds = responses.get("listfunds")
+    if _ok(funds):
+        snapshot.channels = {
+            str(c.get("short_channel_id") or c.get("channel_id") or i): c.get("amount_msat", 0) // 1000
+            for i, c in enumerate(funds.get("channels", []))
+        }
+        snapshot.onchain_sats = sum(
+            o.get("amount_msat", 0) // 1000
+            for o in funds.get("outputs", []) if o.get("status") == "confirmed"
+        )
+
+    dashboard = responses.get("revenue-dashboard")
+    if _ok(dashboard):
+        period = dashboard.get("period", {})
+        health = dashboard.get("financial_health", {})
+        snapshot.revenue = {
+            "gross_revenue_sats": period.get("gross_revenue_sats", 0),
+            "opex_sats": period.get("opex_sats", 0),
+            "net_profit_sats": health.get("net_profit_sats", 0),
+            "bleeder_count": dashboard.get("bleeder_count", 0),
+        }
+
+    return snapshot
+
+
+@dataclass
+class DiffEvent:
+    """One typed change between two snapshots of a node."""
+    kind: str
+    node: str
+    key: str = ""          # Channel, action ID or metric name
+    old: Any = None
+    new: Any = None
+    details: Dict = field(default_factory=dict)
+
+
+def diff_snapshots(old: Optional[NodeSnapshot], new: NodeSnapshot) -> List[DiffEvent]:
+    """
+    Compare two snapshots of the same node.
+
+    With no previous snapshot only the pending actions are reported as
+    added (they need attention regardless of history); channels and
+    metrics become the baseline.
+    """
+    node = new.name
+    if not new.reachable:
+        return [DiffEvent(NODE_UNREACHABLE, node, old=None, new=new.error)]
+
+    events: List[DiffEvent] = []
+    if old is not None and not old.reachable:
+        events.append(DiffEvent(NODE_RECOVERED, node, old=old.error))
+
+    if new.pending_actions is not None:
+        previous = (old.pending_actions if old is not None else None) or {}
+        for action_id, action in new.pending_actions.items():
+            if action_id not in previous:
+                events.append(DiffEvent(ACTION_ADDED, node, action_id, new=action, details=action))
+        for action_id, action in previous.items():
+            if action_id not in new.pending_actions:
+                events.append(DiffEvent(ACTION_RESOLVED, node, action_id, old=action, details=action))
+
+    if old is None:
+        return events
+
+    if new.governance_mode is not None and old.governance_mode is not None \
+            and new.governance_mode != old.governance_mode:
+        events.append(DiffEvent(GOVERNANCE_CHANGED, node, old=old.governance_mode,
+                                new=new.governance_mode))
+
+    if new.channels is not None and old.channels is not None:
+        for scid in sorted(new.channels.keys() - old.channels.keys()):
+            events.append(DiffEvent(CHANNEL_OPENED, node, scid, new=new.channels[scid]))
+        for scid in sorted(old.channels.keys() - new.channels.keys()):
+            events.append(DiffEvent(CHANNEL_CLOSED, node, scid, old=old.channels[scid]))
+        if new.total_capacity_sats != old.total_capacity_sats:
+            events.append(DiffEvent(CAPACITY_CHANGED, node, old=old.total_capacity_sats,
+                                    new=new.total_capacity_sats))
+
+    if new.onchain_sats is not None and old.onchain_sats is not None \
+            and new.onchain_sats != old.onchain_sats:
+        events.append(DiffEvent(ONCHAIN_CHANGED, node, old=old.onchain_sats, new=new.onchain_sats))
+
+    if new.revenue is not None and old.revenue is not None:
+        for metric, value in new.revenue.items():
+            if old.revenue.get(metric) != value:
+                events.append(DiffEvent(REVENUE_CHANGED, node, metric,
+                                        old=old.revenue.get(metric), new=value))
+
+    return events
+
+
+def _merge_known(old: Optional[NodeSnapshot], new: NodeSnapshot) -> NodeSnapshot:
+    """Carry facets whose RPC failed this poll over from the previous snapshot."""
+    if old is None or not new.reachable:
+        return new if old is None else NodeSnapshot(
+            **dict(old.to_dict(), timestamp=new.timestamp, reachable=False, error=new.error)
+        )
+    merged = new.to_dict()
+    for name, value in merged.items():
+        if value is None:
+            merged[name] = getattr(old, name)
+    return NodeSnapshot.from_dict(merged)
+
+
+# =============================================================================
+# Alert rules
+# =============================================================================
+
+@dataclass
+class AlertRule:
+    """
+    Alert raised by diff events.
+
+    Args:
+        name: Alert type reported to operators
+        kinds: DiffEvent kinds that trigger the rule
+        severity: info, warning or critical
+        message: message(event) -> str
+        when: Optional predicate on the event
+        clears: Event kinds that resolve an active alert with the same key
+        raise_after: Consecutive polls with a matching event before raising
+        cooldown_seconds: Minimum time between raises for the same key
+    """
+    name: str
+    kinds: Tuple[str, ...]
+    severity: str
+    message: Callable[[DiffEvent], str]
+    when: Optional[Callable[[DiffEvent], bool]] = None
+    clears: Tuple[str, ...] = ()
+    raise_after: int = 1
+    cooldown_seconds: float = 0.0
+
+    def matches(self, event: DiffEvent) -> bool:
+        return event.kind in self.kinds and (self.when is None or self.when(event))
+
+
+@dataclass
+class ThresholdRule:
+    """
+    Level alert on a snapshot metric with a hysteresis band.
+
+    Raises when metric < below for raise_after consecutive polls and
+    clears only once metric >= clear_at.
+    """
+    name: str
+    metric: Callable[[NodeSnapshot], Optional[float]]
+    below: float
+    clear_at: float
+    severity: str
+    message: Callable[[float], str]
+    raise_after: int = 1
+    cooldown_seconds: float = 0.0
+
+
+def default_rules() -> List[Any]:
+    """Alert rules used by hive-monitor."""
+    return [
+        AlertRule(
+            name="pending_action",
+            kinds=(ACTION_ADDED,),
+            severity="warning",
+            message=lambda e: f"New pending action: {e.new.get('action_type')} (ID: {e.new.get('id')})",
+            clears=(ACTION_RESOLVED,),
+        ),
+        AlertRule(
+            name="node_unreachable",
+            kinds=(NODE_UNREACHABLE,),
+            severity="critical",
+            message=lambda e: f"Node unreachable: {e.new}",
+            clears=(NODE_RECOVERED,),
+            raise_after=2,
+            cooldown_seconds=3600,
+        ),
+        AlertRule(
+            name="governance_mode_changed",
+            kinds=(GOVERNANCE_CHANGED,),
+            severity="warning",
+            message=lambda e: f"Governance mode changed: {e.old} -> {e.new}",
+        ),
+        AlertRule(
+            name="channel_closed",
+            kinds=(CHANNEL_CLOSED,),
+            severity="warning",
+            message=lambda e: f"Channel {e.key} closed ({e.old:,} sats)",
+        ),
+        AlertRule(
+            name="channel_opened",
+            kinds=(CHANNEL_OPENED,),
+            severity="info",
+            message=lambda e: f"Channel {e.key} opened ({e.new:,} sats)",
+        ),
+        AlertRule(
+            name="capacity_drop",
+            kinds=(CAPACITY_CHANGED,),
+            severity="warning",
+            message=lambda e: f"Total capacity dropped from {e.old:,} to {e.new:,} sats",
+            when=lambda e: e.old > 0 and (e.old - e.new) / e.old * 100 > CAPACITY_DROP_PCT,
+            cooldown_seconds=3600,
+        ),
+        AlertRule(
+            name="new_bleeders",
+            kinds=(REVENUE_CHANGED,),
+            severity="warning",
+            message=lambda e: f"{e.new} channel(s) now losing money on rebalancing (was {e.old})",
+            when=lambda e: e.key == "bleeder_count" and (e.new or 0) > (e.old or 0),
+            cooldown_seconds=6 * 3600,
+        ),
+        ThresholdRule(
+            name="onchain_low",
+            metric=lambda s: s.onchain_sats,
+            below=ONCHAIN_LOW_SATS,
+            clear_at=ONCHAIN_RECOVERED_SATS,
+            severity="warning",
+            message=lambda v: f"On-chain balance low: {int(v):,} sats",
+            raise_after=2,
+            cooldown_seconds=6 * 3600,
+        ),
+    ]
+
+
+@dataclass
+class RaisedAlert:
+    """An alert (or resolution) produced by the engine."""
+    timestamp: float
+    node: str
+    alert_type: str
+    severity: str
+    message: str
+    key: str = ""
+    resolved: bool = False
+    details: Dict = field(default_factory=dict)
+
+
+@dataclass
+class _RuleState:
+    streak: int = 0
+    active: bool = False
+    last_raised: float = float("-inf")
+
+
+class AlertEngine:
+    """Evaluate rules against diff events and snapshots, keeping per-key state."""
+
+    def __init__(self, rules: List[Any] = None):
+        self.rules = rules if rules is not None else default_rules()
+        self._state: Dict[Tuple[str, str, str], _RuleState] = {}
+
+    def _get(self, rule: str, node: str, key: str) -> _RuleState:
+        return self._state.setdefault((rule, node, key), _RuleState())
+
+    def evaluate(self, snapshot: NodeSnapshot, events: List[DiffEvent]) -> List[RaisedAlert]:
+        """Run all rules for one node poll."""
+        now = snapshot.timestamp
+        alerts: List[RaisedAlert] = []
+        for rule in self.rules:
+            if isinstance(rule, ThresholdRule):
+                alert = self._evaluate_threshold(rule, snapshot, now)
+                if alert:
+                    alerts.append(alert)
+                continue
+
+            matched = set()
+            for event in events:
+                if rule.matches(event):
+                    matched.add(event.key)
+                    alert = self._raise(rule, event, now)
+                    if alert:
+                        alerts.append(alert)
+                elif event.kind in rule.clears:
+                    alert = self._clear(rule.name, event.node, event.key, now)
+                    if alert:
+                        alerts.append(alert)
+
+            if rule.raise_after > 1:
+                # A poll without the event breaks the streak
+                for (name, node, key), state in self._state.items():
+                    if name == rule.name and node == snapshot.name and key not in matched:
+                        state.streak = 0
+        return alerts
+
+    def _raise(self, rule: AlertRule, event: DiffEvent, now: float) -> Optional[RaisedAlert]:
+        state = self._get(rule.name, event.node, event.key)
+        state.streak += 1
+        if state.active or state.streak < rule.raise_after:
+            return None
+        if now - state.last_raised < rule.cooldown_seconds:
+            return None
+        state.active = bool(rule.clears)  # Rules without clears are one-shot
+        state.last_raised = now
+        return RaisedAlert(now, event.node, rule.name, rule.severity, rule.message(event),
+                           key=event.key, details=dict(event.details))
+
+    def _clear(self, rule_name: str, node: str, key: str, now: float) -> Optional[RaisedAlert]:
+        state = self._state.get((rule_name, node, key))
+        if state is None or not state.active:
+            return None
+        state.active = False
+        state.streak = 0
+        return RaisedAlert(now, node, rule_name, "info", f"Resolved: {rule_name}",
+                           key=key, resolved=True)
+
+    def _evaluate_threshold(self, rule: ThresholdRule, snapshot: NodeSnapshot,
+                            now: float) -> Optional[RaisedAlert]:
+        value = rule.metric(snapshot) if snapshot.reachable else None
+        if value is None:
+            return None
+        state = self._get(rule.name, snapshot.name, "")
+        if state.active:
+            if value >= rule.clear_at:
+                return self._clear(rule.name, snapshot.name, "", now)
+            return None
+        if value >= rule.below:
+            state.streak = 0
+            return None
+        state.streak += 1
+        if state.streak < rule.raise_after or now - state.last_raised < rule.cooldown_seconds:
+            return None
+        state.active = True
+        state.last_raised = now
+        return RaisedAlert(now, snapshot.name, rule.name, rule.severity, rule.message(value),
+                           details={"value": value})
+
+    def restore(self, alert: RaisedAlert) -> None:
+        """Re-apply a persisted alert to the dedup/cooldown state."""
+        state = self._get(alert.alert_type, alert.node, alert.key)
+        if alert.resolved:
+            state.active = False
+            return
+        rule = next((r for r in self.rules if r.name == alert.alert_type), None)
+        state.active = rule is not None and (isinstance(rule, ThresholdRule) or bool(rule.clears))
+        state.last_raised = alert.timestamp
+
+    def active_alerts(self) -> List[Tuple[str, str, str]]:
+        return sorted(k for k, s in self._state.items() if s.active)
+
+    def export_state(self) -> List[List[Any]]:
+        """Rule state (streaks, active flags, last raise) as JSON-able rows."""
+        return [
+            [rule, node, key, st.streak, st.active,
+             None if st.last_raised == float("-inf") else st.last_raised]
+            for (rule, node, key), st in self._state.items()
+            if st.streak or st.active or st.last_raised != float("-inf")
+        ]
+
+    def load_state(self, rows: List[List[Any]]) -> None:
+        for rule, node, key, streak, active, last_raised in rows:
+            self._state[(rule, node, key)] = _RuleState(
+                streak, active, float("-inf") if last_raised is None else last_raised
+            )
+
+
+# =============================================================================
+# Persistence and replay
+# =============================================================================
+
+class AlertStore:
+    """
+    Alert history (JSON lines) plus last snapshots and rule state.
+
+    Files in state_dir: alerts.jsonl, state.json. The history alone is
+    enough to restore active alerts and cooldowns if state.json is lost.
+    """
+
+    def __init__(self, state_dir: str):
+        self.state_dir = state_dir
+        os.makedirs(state_dir, exist_ok=True)
+        self.alerts_path = os.path.join(state_dir, "alerts.jsonl")
+        self.state_path = os.path.join(state_dir, "state.json")
+
+    def append(self, alerts: Iterable[RaisedAlert]) -> None:
+        lines = [json.dumps(asdict(a), default=str) for a in alerts]
+        if lines:
+            with open(self.alerts_path, "a") as f:
+                f.write("\n".join(lines) + "\n")
+
+    def load_alerts(self) -> List[RaisedAlert]:
+        if not os.path.exists(self.alerts_path):
+            return []
+        alerts = []
+        with open(self.alerts_path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    alerts.append(RaisedAlert(**json.loads(line)))
+                except (ValueError, TypeError):
+                    logger.warning("Skipping unreadable alert history line")
+        return alerts
+
+    def save_state(self, snapshots: Dict[str, NodeSnapshot], rules: List[List[Any]]) -> None:
+        tmp = self.state_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({
+                "snapshots": {name: s.to_dict() for name, s in snapshots.items()},
+                "rules": rules,
+            }, f)
+        os.replace(tmp, self.state_path)
+
+    def load_state(self) -> Tuple[Dict[str, NodeSnapshot], Optional[List[List[Any]]]]:
+        """
+        Returns:
+            (snapshots by node, rule state rows or None if no state file)
+        """
+        if not os.path.exists(self.state_path):
+            return {}, None
+        try:
+            with open(self.state_path) as f:
+                data = json.load(f)
+            snapshots = {name: NodeSnapshot.from_dict(s) for name, s in data["snapshots"].items()}
+            return snapshots, data["rules"]
+        except (ValueError, TypeError, KeyError):
+            logger.warning("Ignoring unreadable monitor state file")
+            return {}, None
+
+
+class PollLog:
+    """Append-only JSON-lines record of raw per-node poll responses."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def append(self, node: str, responses: Dict[str, Dict], timestamp: float) -> None:
+        line = json.dumps({"ts": timestamp, "node": node, "responses": responses}, default=str)
+        with self._lock, open(self.path, "a") as f:
+            f.write(line + "\n")
+
+    @staticmethod
+    def read(path: str) -> List[Dict[str, Any]]:
+        with open(path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+
+class NodeStateTracker:
+    """
+    Per-node snapshot history, diffing and alert evaluation.
+
+    Args:
+        rules: Alert rules (default_rules() if None)
+        store: Optional AlertStore for persistence across restarts
+    """
+
+    def __init__(self, rules: List[Any] = None, store: AlertStore = None):
+        self.engine = AlertEngine(rules)
+        self.store = store
+        self.snapshots: Dict[str, NodeSnapshot] = {}
+        self._lock = threading.Lock()
+        if store is not None:
+            self.snapshots, rules_state = store.load_state()
+            if rules_state is not None:
+                self.engine.load_state(rules_state)
+            else:
+                for alert in store.load_alerts():
+                    self.engine.restore(alert)
+
+    def observe(self, node: str, responses: Dict[str, Dict],
+                timestamp: float = None) -> Tuple[NodeSnapshot, List[DiffEvent], List[RaisedAlert]]:
+        """
+        Process one node poll.
+
+        Returns:
+            (snapshot, diff events, alerts raised or resolved)
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            snapshot = snapshot_from_responses(node, responses, timestamp)
+            previous = self.snapshots.get(node)
+            events = diff_snapshots(previous, snapshot)
+            alerts = self.engine.evaluate(snapshot, events)
+            self.snapshots[node] = _merge_known(previous, snapshot)
+            if self.store is not None:
+                self.store.append(alerts)
+                self.store.save_state(self.snapshots, self.engine.export_state())
+        return snapshot, events, alerts
+
+
+def replay_poll_log(records: Iterable[Dict[str, Any]], rules: List[Any] = None,
+                    store: AlertStore = None) -> List[RaisedAlert]:
+    """
+    Feed recorded polls through a fresh tracker.
+
+    Args:
+        records: PollLog.read() output (or equivalent dicts)
+        rules: Alert rules (default_rules() if None)
+        store: Optional AlertStore to start from / persist to
+
+    Returns:
+        All alerts in the order they were produced
+    """
+    tracker = NodeStateTracker(rules, store)
+    alerts: List[RaisedAlert] = []
+    for record in records:
+        alerts.extend(tracker.observe(record["node"], record["responses"], record["ts"])[2])
+    return alerts
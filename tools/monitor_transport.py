@@ -0,0 +1,448 @@
+"""
+Node transports and concurrent polling for hive-monitor.
+
+hive-monitor used to check nodes one after another, and every RPC spawned
+its own ``docker exec lightning-cli`` process. This module separates how a
+node is reached from how the fleet is polled:
+
+Transports (all expose ``call(method, params) -> Dict`` and ``close()``):
+- SubprocessTransport: one ``docker exec lightning-cli`` per call (the
+  original behaviour, no requirements on the container)
+- UnixSocketTransport: persistent JSON-RPC connection to ``lightning-rpc``
+  when the monitor runs on the node's host
+- ExecSessionTransport: one long-lived ``docker exec -i ... socat`` session
+  per node, speaking JSON-RPC over its stdin/stdout
+- FakeTransport: scripted responses for tests
+
+FleetPoller checks all nodes concurrently on a worker pool with a per-node
+timeout. Nodes that fail or time out are backed off exponentially so one
+unreachable node does not cost a timeout on every interval, and a node
+whose previous check is still running is never polled twice.
+"""
+
+import json
+import logging
+import os
+import selectors
+import socket
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger("hive-monitor")
+
+# Transport defaults
+RPC_TIMEOUT_SECONDS = 30           # Per-call timeout
+MAX_RESPONSE_BYTES = 64 * 1024 * 1024
+
+# Poller defaults
+POLL_WORKERS = 8                   # Nodes checked concurrently
+NODE_TIMEOUT_SECONDS = 45          # Budget for one node's full check
+BACKOFF_BASE_SECONDS = 60          # First retry delay after a failed check
+BACKOFF_MAX_SECONDS = 1800         # Cap for the exponential backoff
+
+
+class Transport:
+    """Base class for node transports."""
+
+    def call(self, method: str, params: Dict = None) -> Dict:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any persistent connection (transport stays usable)."""
+
+
+# =============================================================================
+# Subprocess (docker exec lightning-cli per call)
+# =============================================================================
+
+class SubprocessTransport(Transport):
+    """One ``docker exec lightning-cli`` process per call."""
+
+    def __init__(self, docker_container: str,
+                 lightning_dir: str = "/home/clightning/.lightning",
+                 network: str = "regtest", timeout: float = RPC_TIMEOUT_SECONDS):
+        self.docker_container = docker_container
+        self.lightning_dir = lightning_dir
+        self.network = network
+        self.timeout = timeout
+
+    def call(self, method: str, params: Dict = None) -> Dict:
+        """Call CLN via docker exec."""
+        cmd = [
+            "docker", "exec", self.docker_container,
+            "lightning-cli",
+            f"--lightning-dir={self.lightning_dir}",
+            f"--network={self.network}",
+            method
+        ]
+
+        if params:
+            for key, value in params.items():
+                if isinstance(value, bool):
+                    cmd.append(f"{key}={'true' if value else 'false'}")
+                elif isinstance(value, (int, float)):
+                    cmd.append(f"{key}={value}")
+                elif isinstance(value, str):
+                    cmd.append(f"{key}={value}")
+                else:
+                    cmd.append(f"{key}={json.dumps(value)}")
+
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=self.timeout
+            )
+            if result.returncode != 0:
+                return {"error": result.stderr.strip()}
+            return json.loads(result.stdout) if result.stdout.strip() else {}
+        except subprocess.TimeoutExpired:
+            return {"error": "Command timed out"}
+        except json.JSONDecodeError as e:
+            return {"error": f"Invalid JSON response: {e}"}
+        except Exception as e:
+            return {"error": str(e)}
+
+
+# =============================================================================
+# Persistent JSON-RPC (unix socket / exec session)
+# =============================================================================
+
+class _JsonRpcStream(Transport):
+    """
+    JSON-RPC 2.0 over a persistent byte stream.
+
+    Subclasses implement _open(), _send(), _recv() and _close_stream().
+    One request is in flight per stream; a broken stream is reopened on
+    the next call.
+    """
+
+    def __init__(self, timeout: float = RPC_TIMEOUT_SECONDS):
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._open_stream = False
+        self._next_id = 0
+        self._buffer = b""
+
+    def call(self, method: str, params: Dict = None) -> Dict:
+        with self._lock:
+            self._next_id += 1
+            request = {"jsonrpc": "2.0", "id": self._next_id, "method": method,
+                       "params": params or {}}
+            try:
+                if not self._open_stream:
+                    self._open()
+                    self._open_stream = True
+                    self._buffer = b""
+                self._send(json.dumps(request).encode())
+                response = self._read_response()
+            except Exception as e:
+                self._reset()
+                return {"error": str(e) or type(e).__name__}
+            if not isinstance(response, dict) or response.get("id") != request["id"]:
+                self._reset()
+                return {"error": "JSON-RPC response id mismatch"}
+
+        if "error" in response:
+            error = response["error"]
+            return {"error": error.get("message", str(error)) if isinstance(error, dict) else str(error)}
+        return response.get("result", {})
+
+    def _read_response(self) -> Dict:
+        decoder = json.JSONDecoder()
+        deadline = time.monotonic() + self.timeout
+        while True:
+            text = self._buffer.strip()
+            # Only try to parse once the buffer could hold a whole object
+            if text.endswith(b"}"):
+                try:
+                    decoded = text.decode()
+                    obj, end = decoder.raw_decode(decoded)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    pass    # Incomplete response, keep reading
+                else:
+                    self._buffer = decoded[end:].encode()
+                    return obj
+            if len(self._buffer) > MAX_RESPONSE_BYTES:
+                raise ValueError("JSON-RPC response too large")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("Command timed out")
+            chunk = self._recv(remaining)
+            if not chunk:
+                raise ConnectionError("Connection closed by node")
+            self._buffer += chunk
+
+    def _reset(self) -> None:
+        try:
+            self._close_stream()
+        except Exception:
+            pass
+        self._open_stream = False
+        self._buffer = b""
+
+    def close(self) -> None:
+        with self._lock:
+            self._reset()
+
+    def _open(self) -> None:
+        raise NotImplementedError
+
+    def _send(self, data: bytes) -> None:
+        raise NotImplementedError
+
+    def _recv(self, timeout: float) -> bytes:
+        raise NotImplementedError
+
+    def _close_stream(self) -> None:
+        raise NotImplementedError
+
+
+class UnixSocketTransport(_JsonRpcStream):
+    """Persistent connection to a node's ``lightning-rpc`` unix socket."""
+
+    def __init__(self, socket_path: str, timeout: float = RPC_TIMEOUT_SECONDS):
+        super().__init__(timeout)
+        self.socket_path = socket_path
+        self._sock: Optional[socket.socket] = None
+
+    def _open(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self._sock = sock
+
+    def _send(self, data: bytes) -> None:
+        self._sock.sendall(data)
+
+    def _recv(self, timeout: float) -> bytes:
+        self._sock.settimeout(timeout)
+        return self._sock.recv(65536)
+
+    def _close_stream(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+
+class ExecSessionTransport(_JsonRpcStream):
+    """
+    Long-lived ``docker exec -i <container> socat`` session per node.
+
+    Bridges stdin/stdout to the node's ``lightning-rpc`` socket, so each
+    call costs one JSON-RPC round trip instead of a process spawn.
+    Requires socat inside the container.
+    """
+
+    def __init__(self, docker_container: str,
+                 lightning_dir: str = "/home/clightning/.lightning",
+                 network: str = "regtest", timeout: float = RPC_TIMEOUT_SECONDS):
+        super().__init__(timeout)
+        self.docker_container = docker_container
+        self.socket_path = f"{lightning_dir}/{network}/lightning-rpc"
+        self._proc: Optional[subprocess.Popen] = None
+
+    def _command(self) -> List[str]:
+        return ["docker", "exec", "-i", self.docker_container,
+                "socat", "-", f"UNIX-CONNECT:{self.socket_path}"]
+
+    def _open(self) -> None:
+        self._proc = subprocess.Popen(
+            self._command(), stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+
+    def _send(self, data: bytes) -> None:
+        self._proc.stdin.write(data)
+        self._proc.stdin.flush()
+
+    def _recv(self, timeout: float) -> bytes:
+        with selectors.DefaultSelector() as sel:
+            sel.register(self._proc.stdout, selectors.EVENT_READ)
+            if not sel.select(timeout):
+                raise TimeoutError("Command timed out")
+        return os.read(self._proc.stdout.fileno(), 65536)
+
+    def _close_stream(self) -> None:
+        if self._proc is not None:
+            proc, self._proc = self._proc, None
+            proc.kill()
+            proc.wait()
+
+
+# =============================================================================
+# Fake (tests)
+# =============================================================================
+
+class FakeTransport(Transport):
+    """
+    Scripted transport for tests.
+
+    Args:
+        responses: {method: response dict or callable(params) -> dict}
+        delay: Seconds each call takes
+        fail: Return {"error": ...} for every call
+    """
+
+    def __init__(self, responses: Dict[str, Any] = None, delay: float = 0.0,
+                 fail: bool = False):
+        self.responses = responses or {}
+        self.delay = delay
+        self.fail = fail
+        self.calls: List[tuple] = []
+        self.closed = False
+
+    def call(self, method: str, params: Dict = None) -> Dict:
+        self.calls.append((method, params))
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            return {"error": "connection refused"}
+        response = self.responses.get(method, {})
+        return response(params) if callable(response) else response
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def make_transport(node_config: Dict[str, Any], lightning_dir: str,
+                   network: str) -> Transport:
+    """
+    Build a transport from a nodes.json entry.
+
+    ``mode`` selects it: "docker" (default, lightning-cli per call),
+    "exec" (persistent docker exec session) or "socket" (local unix
+    socket, ``socket_path`` or <lightning_dir>/<network>/lightning-rpc).
+    """
+    mode = node_config.get("mode", "docker")
+    if mode == "socket":
+        path = node_config.get("socket_path") or f"{lightning_dir}/{network}/lightning-rpc"
+        return UnixSocketTransport(path)
+    if mode == "exec":
+        return ExecSessionTransport(node_config["docker_container"], lightning_dir, network)
+    if mode == "docker":
+        return SubprocessTransport(node_config["docker_container"], lightning_dir, network)
+    raise ValueError(f"Unknown transport mode '{mode}' for node {node_config.get('name')}")
+
+
+# =============================================================================
+# Concurrent polling with backoff
+# =============================================================================
+
+@dataclass
+class NodeHealth:
+    """Poll health for one node."""
+    consecutive_failures: int = 0
+    next_poll_at: float = 0.0
+    last_latency_ms: int = 0
+    last_error: str = ""
+
+
+class FleetPoller:
+    """
+    Run one check per node concurrently with per-node timeouts and backoff.
+
+    Args:
+        max_workers: Nodes checked at the same time
+        node_timeout: Seconds to wait for one node's check
+        backoff_base: Delay after the first failure (doubles per failure)
+        backoff_max: Upper bound for the delay
+        clock: time source (tests)
+    """
+
+    def __init__(self, max_workers: int = POLL_WORKERS,
+                 node_timeout: float = NODE_TIMEOUT_SECONDS,
+                 backoff_base: float = BACKOFF_BASE_SECONDS,
+                 backoff_max: float = BACKOFF_MAX_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.node_timeout = node_timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.clock = clock
+        self.health: Dict[str, NodeHealth] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="hive-monitor-poll")
+        self._running: Dict[str, Any] = {}
+
+    def poll(self, names: Iterable[str], check: Callable[[str], Dict]) -> Dict[str, Dict]:
+        """
+        Check every due node concurrently.
+
+        A check that raises, returns {"error": ...} or misses node_timeout
+        counts as a failure and schedules the node's next poll with
+        exponential backoff. Nodes in backoff (or whose previous check is
+        still running) are skipped and reported with "skipped".
+
+        Args:
+            names: Node names to poll
+            check: check(name) -> result dict, run on a worker thread
+
+        Returns:
+            {name: result}, in the order of `names`
+        """
+        now = self.clock()
+        start = time.monotonic()
+        results: Dict[str, Dict] = {}
+        submitted = {}
+
+        for name in names:
+            health = self.health.setdefault(name, NodeHealth())
+            running = self._running.get(name)
+            if running is not None and not running.done():
+                results[name] = {"skipped": "previous check still running"}
+                continue
+            if health.next_poll_at > now:
+                results[name] = {
+                    "skipped": "backoff",
+                    "retry_in_seconds": round(health.next_poll_at - now, 1),
+                    "last_error": health.last_error,
+                }
+                continue
+            future = self._executor.submit(self._timed, check, name)
+            self._running[name] = future
+            submitted[name] = future
+            results[name] = None
+
+        for name, future in submitted.items():
+            remaining = max(0.0, self.node_timeout - (time.monotonic() - start))
+            try:
+                result, latency_ms = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                result, latency_ms = {"error": f"Timeout after {self.node_timeout}s"}, int(self.node_timeout * 1000)
+            except Exception as e:
+                logger.error(f"Error checking {name}: {e}")
+                result, latency_ms = {"error": str(e)}, int((time.monotonic() - start) * 1000)
+            self._record(name, result, latency_ms)
+            results[name] = result
+
+        return results
+
+    @staticmethod
+    def _timed(check: Callable[[str], Dict], name: str):
+        start = time.monotonic()
+        result = check(name)
+        return result, int((time.monotonic() - start) * 1000)
+
+    def _record(self, name: str, result: Dict, latency_ms: int) -> None:
+        health = self.health[name]
+        health.last_latency_ms = latency_ms
+        error = result.get("error") if isinstance(result, dict) else None
+        if error:
+            health.consecutive_failures += 1
+            health.last_error = str(error)
+            delay = min(self.backoff_max,
+                        self.backoff_base * 2 ** (health.consecutive_failures - 1))
+            health.next_poll_at = self.clock() + delay
+            logger.warning(f"[{name}] check failed ({error}); next attempt in {delay:.0f}s")
+        else:
+            health.consecutive_failures = 0
+            health.last_error = ""
+            health.next_poll_at = 0.0
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
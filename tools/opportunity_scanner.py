@@ -23,6 +23,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 
+from cycle_snapshot import DB_CHANNEL_HISTORY, DB_METADATA, CycleSnapshot
+
 
 # =============================================================================
 # Enums and Constants
@@ -114,6 +116,45 @@ SAFETY_CONSTRAINTS = {
 }
 
 
+# Data each scanner reads from the cycle snapshot, in scan order. Keys are
+# state keys built by ProactiveAdvisor._analyze_node_state(); "db:" entries
+# are memoized AdvisorDB lookups made through the snapshot.
+SCANNER_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    # Core scanners
+    "velocity_alerts": ("velocities",),
+    "profitability": ("profitability", "channels", "dashboard"),
+    "time_based_fees": ("channels", DB_CHANNEL_HISTORY),
+    "anticipatory_liquidity": ("context",),
+    "imbalanced_channels": ("channels",),
+    "config_opportunities": ("summary", "dashboard"),
+    # Fleet coordination scanners (Phase 2)
+    "defense_warnings": ("defense_status",),
+    "internal_competition": ("internal_competition",),
+    # Cost reduction scanners (Phase 3)
+    "circular_flows": ("circular_flows",),
+    "rebalance_recommendations": ("rebalance_recommendations",),
+    # Strategic positioning scanners (Phase 4)
+    "positioning_opportunities": ("positioning", "flow_recommendations"),
+    "competitor_opportunities": ("competitor_analysis",),
+    "rationalization": ("close_recommendations",),
+    # Collective warning scanners
+    "ban_candidates": ("ban_candidates",),
+    # New member onboarding scanner
+    "new_member_opportunities": (
+        "hive_members", "node_info", "channels", "positioning", DB_METADATA
+    ),
+    # Routing intelligence scanner (pheromones + stigmergic markers)
+    "routing_intelligence": (
+        "pheromone_levels", "stigmergic_markers", "routing_intelligence", "channels"
+    ),
+    # Fleet consensus scanner (Phase 14.2 - shared intelligence)
+    "fleet_consensus": (
+        "fleet_corridor_consensus", "fleet_close_proposals", "defense_status",
+        "channels", "our_pubkey"
+    ),
+}
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
@@ -205,6 +246,8 @@ class OpportunityScanner:
         """
         self.mcp = mcp_client
         self.db = db
+        # Per-scanner and per-fetch timings of the most recent scan_all()
+        self.last_scan_timings: Dict[str, Dict[str, Any]] = {}
 
     async def scan_all(
         self,
@@ -223,56 +266,85 @@ class OpportunityScanner:
 
         Args:
             node_name: Node to scan
-            state: Current node state from analyze_node_state()
+            state: CycleSnapshot (or plain state dict) from analyze_node_state()
 
         Returns:
             List of Opportunity objects, sorted by priority
         """
         opportunities = []
 
+        # One immutable snapshot per cycle: every scanner reads the same data
+        # and DB lookups made through it run once
+        snapshot = state if isinstance(state, CycleSnapshot) else CycleSnapshot(
+            node_name, state, db=self.db
+        )
+
         # Scan each data source in parallel
+        names = list(SCANNER_DEPENDENCIES)
         results = await asyncio.gather(
-            # Core scanners
-            self._scan_velocity_alerts(node_name, state),
-            self._scan_profitability(node_name, state),
-            self._scan_time_based_fees(node_name, state),
-            self._scan_anticipatory_liquidity(node_name, state),
-            self._scan_imbalanced_channels(node_name, state),
-            self._scan_config_opportunities(node_name, state),
-            # Fleet coordination scanners (Phase 2)
-            self._scan_defense_warnings(node_name, state),
-            self._scan_internal_competition(node_name, state),
-            # Cost reduction scanners (Phase 3)
-            self._scan_circular_flows(node_name, state),
-            self._scan_rebalance_recommendations(node_name, state),
-            # Strategic positioning scanners (Phase 4)
-            self._scan_positioning_opportunities(node_name, state),
-            self._scan_competitor_opportunities(node_name, state),
-            self._scan_rationalization(node_name, state),
-            # Collective warning scanners
-            self._scan_ban_candidates(node_name, state),
-            # New member onboarding scanner
-            self._scan_new_member_opportunities(node_name, state),
-            # Routing intelligence scanner (pheromones + stigmergic markers)
-            self._scan_routing_intelligence(node_name, state),
-            # Fleet consensus scanner (Phase 14.2 - shared intelligence)
-            self._scan_fleet_consensus(node_name, state),
+            *[self._timed_scan(name, node_name, snapshot) for name in names],
             return_exceptions=True
         )
 
         # Collect all opportunities
-        for result in results:
-            if isinstance(result, Exception):
-                # Log but don't fail
+        scanner_timings = {}
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                scanner_timings[name] = {"error": str(result)}
                 continue
-            if result:
-                opportunities.extend(result)
+            timing, found = result
+            scanner_timings[name] = timing
+            if found:
+                opportunities.extend(found)
+
+        self.last_scan_timings = {
+            "scanners": scanner_timings,
+            "fetches": {k: dict(v) for k, v in snapshot.fetch_timings.items()},
+        }
 
         # Sort by priority
         opportunities.sort(key=lambda x: x.priority_score, reverse=True)
 
         return opportunities
 
+    async def _timed_scan(
+        self,
+        name: str,
+        node_name: str,
+        snapshot: CycleSnapshot
+    ) -> Tuple[Dict[str, Any], List[Opportunity]]:
+        """Run one scanner, recording its duration and outcome."""
+        scan = getattr(self, f"_scan_{name}")
+        start = time.perf_counter()
+        timing: Dict[str, Any] = {"depends_on": list(SCANNER_DEPENDENCIES[name])}
+        found: List[Opportunity] = []
+        try:
+            found = await scan(node_name, snapshot) or []
+        except Exception as e:
+            # Log but don't fail
+            timing["error"] = str(e)
+        timing["seconds"] = round(time.perf_counter() - start, 6)
+        timing["opportunities"] = len(found)
+        return timing, found
+
+    def _channel_history(
+        self,
+        node_name: str,
+        state: Dict[str, Any],
+        channel_id: str,
+        hours: int
+    ) -> List[Dict[str, Any]]:
+        """Channel history via the cycle snapshot when available."""
+        if isinstance(state, CycleSnapshot) and state.node_name == node_name:
+            return state.channel_history(channel_id, hours=hours)
+        return self.db.get_channel_history(node_name, channel_id, hours=hours)
+
+    def _metadata(self, state: Dict[str, Any], key: str) -> Optional[Any]:
+        """Advisor metadata via the cycle snapshot when available."""
+        if isinstance(state, CycleSnapshot):
+            return state.metadata(key)
+        return self.db.get_metadata(key)
+
     async def _scan_velocity_alerts(
         self,
         node_name: str,
@@ -446,7 +518,7 @@ class OpportunityScanner:
                 continue
 
             # Get channel history to detect patterns
-            history = self.db.get_channel_history(node_name, channel_id, hours=168)  # 1 week
+            history = self._channel_history(node_name, state, channel_id, hours=168)  # 1 week
 
             if len(history) < 24:  # Need at least 24 data points
                 continue
@@ -1187,7 +1259,7 @@ class OpportunityScanner:
 
             # Check if already onboarded (using advisor DB)
             onboard_key = f"onboarded_{member_pubkey[:16]}"
-            if self.db.get_metadata(onboard_key):
+            if self._metadata(state, onboard_key):
                 continue
 
             # Check if we already have a channel to this member
@@ -23,7 +23,6 @@ Usage:
     result = await advisor.run_cycle("mainnet")
 """
 
-import asyncio
 import json
 import logging
 import os
@@ -93,6 +92,7 @@ def setup_file_logging(log_file: str = None, level: int = logging.INFO) -> None:
     logger.addHandler(console_handler)
 
     logger.info(f"Logging initialized: {log_file}")
+from cycle_snapshot import CycleSnapshot, fetch_sources
 from learning_engine import LearningEngine, ActionOutcome
 from opportunity_scanner import (
     OpportunityScanner,
@@ -172,6 +172,9 @@ class CycleResult:
     # Planning
     next_cycle_priorities: List[str] = field(default_factory=list)
 
+    # Instrumentation: per-fetch and per-scanner timings
+    timings: Dict[str, Any] = field(default_factory=dict)
+
     # Errors
     errors: List[str] = field(default_factory=list)
 
@@ -198,6 +201,7 @@ class CycleResult:
             "settlement_executed": self.settlement_executed,
             "settlement_result": self.settlement_result,
             "next_cycle_priorities": self.next_cycle_priorities,
+            "timings": self.timings,
             "errors": self.errors
         }
 
@@ -255,6 +259,9 @@ class ProactiveAdvisor:
         self.learning_engine = LearningEngine(db)
         self.scanner = OpportunityScanner(mcp_client, db)
 
+        # Snapshot of the node data for the cycle in progress
+        self._cycle_snapshot: Optional[CycleSnapshot] = None
+
         # Daily budget tracking (resets at midnight UTC)
         self._daily_budget = self._load_or_create_budget()
 
@@ -316,6 +323,7 @@ class ProactiveAdvisor:
             # Phase 2: Comprehensive state analysis
             logger.info("[Phase 2] Analyzing node state...")
             state = await self._analyze_node_state(node_name)
+            self._cycle_snapshot = state
             result.node_state_summary = state.get("summary", {})
             summary = result.node_state_summary
             logger.info(f"  Capacity: {summary.get('total_capacity_sats', 0):,} sats")
@@ -342,6 +350,15 @@ class ProactiveAdvisor:
             logger.info("[Phase 4] Scanning for opportunities...")
             opportunities = await self.scanner.scan_all(node_name, state)
             result.opportunities_found = len(opportunities)
+            result.timings = self.scanner.last_scan_timings
+            slowest = sorted(
+                result.timings.get("scanners", {}).items(),
+                key=lambda item: item[1].get("seconds", 0),
+                reverse=True
+            )[:3]
+            logger.info("  Slowest scanners: " + ", ".join(
+                f"{name} {t.get('seconds', 0) * 1000:.0f}ms" for name, t in slowest
+            ))
 
             # Count by type
             for opp in opportunities:
@@ -421,6 +438,8 @@ class ProactiveAdvisor:
         except Exception as e:
             logger.error(f"Cycle failed with error: {e}", exc_info=True)
             result.errors.append(str(e))
+        finally:
+            self._cycle_snapshot = None
 
         result.duration_seconds = time.time() - cycle_start
 
@@ -593,7 +612,7 @@ class ProactiveAdvisor:
                 "reason": f"Check failed: {str(e)}"
             }
 
-    async def _analyze_node_state(self, node_name: str) -> Dict[str, Any]:
+    async def _analyze_node_state(self, node_name: str) -> CycleSnapshot:
         """
         Comprehensive node state analysis with full intelligence gathering.
 
@@ -604,6 +623,9 @@ class ProactiveAdvisor:
         - Strategic: positioning_summary, yield_summary
         - Cost reduction: rebalance_recommendations, circular_flow_status
         - Collective warnings: ban_candidates
+
+        Returns:
+            Immutable CycleSnapshot shared by every phase of the cycle
         """
         # Define all data sources to gather concurrently
         calls = {
@@ -648,24 +670,11 @@ class ProactiveAdvisor:
 
         PER_CALL_TIMEOUT = 15  # seconds per individual call
 
-        async def safe_call(key: str, method: str, params: Dict) -> tuple:
-            try:
-                result = await asyncio.wait_for(
-                    self.mcp.call(method, params),
-                    timeout=PER_CALL_TIMEOUT
-                )
-                return (key, result)
-            except asyncio.TimeoutError:
-                logger.debug(f"  Timeout on {method} for {node_name}")
-                return (key, {})
-            except Exception:
-                return (key, {})
-
-        # Run all calls concurrently
-        gathered = await asyncio.gather(
-            *[safe_call(k, method, params) for k, (method, params) in calls.items()]
+        # Each distinct RPC runs once for the whole cycle; scanners, goal
+        # checks and action execution read the resulting snapshot
+        results, fetch_timings = await fetch_sources(
+            self.mcp, calls, timeout=PER_CALL_TIMEOUT
         )
-        results = dict(gathered)
 
         # Calculate summary metrics
         channels = results.get("channels", {}).get("channels", [])
@@ -743,7 +752,7 @@ class ProactiveAdvisor:
                     "value_scores": [corridor.get("value_score", 0.5)],
                 }
 
-        return {
+        return CycleSnapshot(node_name, {
             "summary": {
                 "total_capacity_sats": total_capacity,
                 "channel_count": len(channels),
@@ -798,7 +807,7 @@ class ProactiveAdvisor:
             "fleet_close_proposals": fleet_close_proposals,
             "fleet_corridor_consensus": fleet_corridor_consensus,
             "our_pubkey": our_pubkey,
-        }
+        }, db=self.db, fetch_timings=fetch_timings)
 
     async def _check_goals(
         self,
@@ -1031,13 +1040,18 @@ class ProactiveAdvisor:
         current_state = opp.current_state or {}
         current_fee = current_state.get("fee_ppm", 0)
 
-        # If fee not in current_state, fetch from revenue-ops
+        # If fee not in current_state, use this cycle's channel list
+        # (fetched once in _analyze_node_state) or fetch from revenue-ops
         if current_fee == 0:
             try:
-                channels = await self.mcp.call(
-                    "hive_channels",
-                    {"node": node_name}
-                )
+                snapshot = self._cycle_snapshot
+                if snapshot is not None and snapshot.node_name == node_name:
+                    channels = {"channels": snapshot.get("channels", [])}
+                else:
+                    channels = await self.mcp.call(
+                        "hive_channels",
+                        {"node": node_name}
+                    )
                 for ch in channels.get("channels", []):
                     if ch.get("channel_id") == opp.channel_id or ch.get("scid") == opp.channel_id:
                         current_fee = ch.get("fee_ppm", 0)